@@ -50,12 +50,12 @@ from .clif_orchestrator import ClifOrchestrator
 
 # Re-export commonly used utility functions at package root
 from .utils.stitching_encounters import stitch_encounters
-from .utils.waterfall import process_resp_support_waterfall
-from .utils.wide_dataset import create_wide_dataset, convert_wide_to_hourly
+from .utils.waterfall import process_resp_support_waterfall, process_resp_support_waterfall_sharded
+from .utils.wide_dataset import create_wide_dataset, convert_wide_to_hourly, iter_wide_partitions, load_wide_dataset, refresh_wide_dataset
 from .utils.comorbidity import calculate_cci
 from .utils.outlier_handler import apply_outlier_handling, get_outlier_summary
 from .utils.config import load_config
-from .utils.io import load_data
+from .utils.io import load_data, convert_to_ipc
 from .utils.logging_config import setup_logging, get_logger
 from .utils.crosswalk import (
     crosswalk_table_2_1_to_3_0,
@@ -65,8 +65,9 @@ from .utils.crosswalk import (
 )
 
 # SOFA-2 scoring
-from .utils.sofa2 import calculate_sofa2, calculate_sofa2_daily, SOFA2Config
+from .utils.sofa2 import calculate_sofa2, calculate_sofa2_daily, calculate_sofa2_daily_incremental, SOFA2Config
 from .utils._duckdb_config import DuckDBResourceConfig
+from .utils._duckdb_helpers import configure_duckdb
 # Re-export Polars-based utilities at package root
 from .utils.sofa_polars import compute_sofa_polars
 from .utils.datetime_polars import (
@@ -136,21 +137,28 @@ __all__ = [
     # Utility functions
     "stitch_encounters",
     "process_resp_support_waterfall",
+    "process_resp_support_waterfall_sharded",
     "create_wide_dataset",
     "convert_wide_to_hourly",
+    "iter_wide_partitions",
+    "load_wide_dataset",
+    "refresh_wide_dataset",
     "calculate_cci",
     "apply_outlier_handling",
     "get_outlier_summary",
     "load_config",
     "load_data",
+    "convert_to_ipc",
     "setup_logging",
     "get_logger",
     # SOFA-2 scoring
     "calculate_sofa2",
     "calculate_sofa2_daily",
+    "calculate_sofa2_daily_incremental",
     "SOFA2Config",
     # DuckDB resource config
     "DuckDBResourceConfig",
+    "configure_duckdb",
     "crosswalk_table_2_1_to_3_0",
     "crosswalk_file_2_1_to_3_0",
     "normalize_category_value",
@@ -6,9 +6,11 @@ all CLIF table objects with consistent configuration.
 """
 
 import os
+import time
 import logging
 import pandas as pd
 import psutil
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from typing import Optional, List, Dict, Any, Union, Tuple
 
 from .tables.patient import Patient
@@ -55,9 +57,18 @@ from .tables.airway import Airway
 from .tables.patient_attributes import PatientAttributes
 from .tables.ed_encounter import EdEncounter
 from .utils.config import get_config_or_params
+from .utils.io import (
+    Cohort,
+    _cast_id_cols_to_string,
+    _resolve_table_path,
+    convert_datetime_columns_to_site_tz,
+)
+from .utils._duckdb_config import _parse_memory_size
+from .utils._duckdb_helpers import _default_cursor, get_duckdb_config
+from .utils.table_cache import TableCache
 from .utils.stitching_encounters import stitch_encounters
 from .utils.logging_config import setup_logging
-from .schemas import DEFAULT_CLIF_VERSION
+from .schemas import DEFAULT_CLIF_VERSION, load_schema
 
 
 TABLE_CLASSES = {
@@ -107,6 +118,34 @@ TABLE_CLASSES = {
 }
 
 
+# Rough in-memory size of a loaded table relative to its on-disk size, used to
+# keep concurrent loads in initialize() within the memory budget
+_LOAD_MEMORY_FACTOR = {'parquet': 5.0, 'csv': 2.0}
+
+
+def _on_disk_size(path: str) -> int:
+    """Size in bytes of a table file or partitioned dataset directory."""
+    if os.path.isfile(path):
+        return os.path.getsize(path)
+    total = 0
+    for root, _, files in os.walk(path):
+        total += sum(os.path.getsize(os.path.join(root, f)) for f in files)
+    return total
+
+
+def _load_on_own_cursor(load, table: str):
+    """Run ``load(table)`` on a private DuckDB cursor, closed once the table is loaded."""
+    with _default_cursor():
+        load(table)
+
+
+def _table_input(table_obj):
+    """The table's DataFrame if materialized, else a zero-copy DuckDB relation."""
+    if table_obj.is_materialized:
+        return table_obj.df
+    return table_obj.to_relation()
+
+
 class ClifOrchestrator:
     """
     Orchestrator class for managing multiple CLIF table objects.
@@ -130,8 +169,12 @@ class ClifOrchestrator:
         Whether to stitch encounters within time interval
     stitch_time_interval : int
         Hours between discharge and next admission to consider encounters linked
+    stitch_engine : str
+        Engine used by stitch_encounters: 'pandas', 'duckdb' or 'polars'
     encounter_mapping : pd.DataFrame
         Mapping of hospitalization_id to encounter_block (after stitching)
+    cohort : Cohort
+        Session-wide ID set semi-joined into every table load (see ``set_cohort``)
     patient : Patient
         Patient table object
     hospitalization : Hospitalization
@@ -170,6 +213,9 @@ class ClifOrchestrator:
         Code status table object
     wide_df : pd.DataFrame
         Wide dataset with time-series data (populated by create_wide_dataset)
+    wide_dataset_path : str
+        Manifest of the partitioned wide dataset written by
+        create_wide_dataset(output_format='parquet_dataset')
     """
     
     def __init__(
@@ -181,7 +227,11 @@ class ClifOrchestrator:
         output_directory: Optional[str] = None,
         stitch_encounter: bool = False,
         stitch_time_interval: int = 6,
-        clif_version: Optional[str] = None
+        clif_version: Optional[str] = None,
+        backend: str = 'pandas',
+        cache: bool = False,
+        cache_max_size: str = '20GB',
+        stitch_engine: str = 'pandas'
     ):
         """
         Initialize the ClifOrchestrator.
@@ -208,6 +258,21 @@ class ClifOrchestrator:
             CLIF schema version for all loaded tables (e.g. "2.1", "3.0").
             Overrides any ``clif_version`` in the config file. If neither is
             set, the package default (2.1) is used.
+        backend : {'pandas', 'arrow', 'relation'}, optional
+            How loaded tables hold their data (see ``BaseTable.from_file``).
+            With ``'arrow'`` or ``'relation'`` a table's ``df`` stays unconverted
+            until first accessed, and the wide dataset and dose-unit conversion
+            read the Arrow data / relation directly. Default ``'pandas'``.
+        cache : bool, optional
+            Cache loaded tables under ``<output_directory>/.clifpy_cache`` as
+            memory-mappable Arrow IPC files and reuse them while the source
+            files and load arguments are unchanged (see ``BaseTable.from_file``).
+            Default False.
+        cache_max_size : str, optional
+            LRU size cap of the table cache. Default ``'20GB'``.
+        stitch_engine : str, optional
+            How encounter blocks are computed when stitching: 'pandas'
+            (default), 'duckdb' or 'polars'. Results are identical.
                 
         Notes
         -----
@@ -233,6 +298,7 @@ class ClifOrchestrator:
 
         # Resolve CLIF version: explicit param > config file > package default
         self.clif_version = clif_version or config.get('clif_version', DEFAULT_CLIF_VERSION)
+        self.backend = backend
 
         # Set output directory
         self.output_directory = config.get('output_directory')
@@ -243,13 +309,26 @@ class ClifOrchestrator:
         # Initialize centralized logging
         setup_logging(output_directory=self.output_directory)
 
+        # Optional on-disk cache of loaded tables, shared by every load_table call
+        self.table_cache: Optional[TableCache] = (
+            TableCache(os.path.join(self.output_directory, '.clifpy_cache'), cache_max_size)
+            if cache else None
+        )
+
         # Get logger for orchestrator
         self.logger = logging.getLogger('clifpy.ClifOrchestrator')
 
         # Set stitching parameters
         self.stitch_encounter = stitch_encounter
         self.stitch_time_interval = stitch_time_interval
+        self.stitch_engine = stitch_engine
         self.encounter_mapping = None
+
+        # Session cohort, applied to every load_table call (see set_cohort)
+        self.cohort: Optional[Cohort] = None
+
+        # Wall-clock seconds of the last load of each table
+        self.load_timings: Dict[str, float] = {}
         
         # Initialize all table attributes to None
         self.patient: Patient = None
@@ -298,6 +377,7 @@ class ClifOrchestrator:
 
         # Initialize wide dataset property
         self.wide_df: Optional[pd.DataFrame] = None
+        self.wide_dataset_path: Optional[str] = None
 
         self.logger.info('ClifOrchestrator initialized')
     
@@ -317,6 +397,56 @@ class ClifOrchestrator:
             Configured instance
         """
         return cls(config_path=config_path)
+
+    def set_cohort(
+        self,
+        ids: Any,
+        column: str = 'hospitalization_id'
+    ) -> Optional[Cohort]:
+        """
+        Restrict every subsequent table load in this session to a cohort.
+
+        The IDs are registered with DuckDB once and semi-joined into each load
+        of a table that has ``column``, instead of inlining the ID list into the
+        SQL of every scan. An explicit filter on ``column`` passed to
+        ``load_table`` takes precedence.
+
+        Parameters
+        ----------
+        ids : list, pd.Series, pd.DataFrame, Cohort or None
+            Cohort IDs. ``None`` clears the cohort.
+        column : str, optional
+            ID column to filter on. Default ``'hospitalization_id'``.
+
+        Returns
+        -------
+        Cohort or None
+            The registered cohort.
+        """
+        if self.cohort is not None:
+            self.cohort.release()
+        if ids is None:
+            self.cohort = None
+            return None
+        self.cohort = ids if isinstance(ids, Cohort) and ids.column == column else Cohort(ids, column)
+        self.logger.info(f"Session cohort set: {len(self.cohort)} {column} values")
+        return self.cohort
+
+    def _with_cohort(
+        self,
+        table_name: str,
+        filters: Optional[Dict[str, Any]]
+    ) -> Optional[Dict[str, Any]]:
+        """Add the session cohort to ``filters`` if the table has the cohort column."""
+        if self.cohort is None:
+            return filters
+        column = self.cohort.column
+        if filters and column in filters:
+            return filters
+        schema = load_schema(table_name, self.clif_version)
+        if not schema or column not in {c['name'] for c in schema.get('columns', [])}:
+            return filters
+        return {**(filters or {}), column: self.cohort}
     
     def load_table(
         self,
@@ -337,7 +467,9 @@ class ClifOrchestrator:
         columns : List[str], optional
             Specific columns to load
         filters : Dict, optional
-            Filters to apply when loading
+            Filters to apply when loading (see ``BaseTable.from_file`` for the
+            supported range / comparison / semi-join spec). The session cohort
+            (``set_cohort``) is added unless ``filters`` already constrains its column.
             
         Returns
         -------
@@ -348,6 +480,8 @@ class ClifOrchestrator:
             raise ValueError(f"Unknown table: {table_name}. Available tables: {list(TABLE_CLASSES.keys())}")
         
         table_class = TABLE_CLASSES[table_name]
+        filters = self._with_cohort(table_name, filters)
+        start = time.perf_counter()
         table_object = table_class.from_file(
             data_directory=self.data_directory,
             filetype=self.filetype,
@@ -356,8 +490,12 @@ class ClifOrchestrator:
             sample_size=sample_size,
             columns=columns,
             filters=filters,
-            clif_version=self.clif_version
+            clif_version=self.clif_version,
+            backend=self.backend,
+            cache=self.table_cache or False
         )
+        self.load_timings[table_name] = time.perf_counter() - start
+        self.logger.info(f"Loaded {table_name} in {self.load_timings[table_name]:.1f}s")
         setattr(self, table_name, table_object)
         return table_object
     
@@ -366,7 +504,9 @@ class ClifOrchestrator:
         tables: Optional[List[str]] = None,
         sample_size: Optional[int] = None,
         columns: Optional[Dict[str, List[str]]] = None,
-        filters: Optional[Dict[str, Dict[str, Any]]] = None
+        filters: Optional[Dict[str, Dict[str, Any]]] = None,
+        max_workers: int = 1,
+        memory_budget: Optional[str] = None
     ):
         """
         Initialize specified tables with optional filtering and column selection.
@@ -380,24 +520,90 @@ class ClifOrchestrator:
         columns : Dict[str, List[str]], optional
             Dictionary mapping table names to lists of columns to load.
         filters : Dict[str, Dict], optional
-            Dictionary mapping table names to filter dictionaries.
+            Dictionary mapping table names to filter dictionaries, e.g.
+            ``{'labs': {'lab_value_numeric': {'>': 0}, 'hospitalization_id': cohort_df}}``.
+        max_workers : int, optional
+            Number of tables to load concurrently on a thread pool (DuckDB and
+            Arrow release the GIL while scanning and decoding). Default 1 loads
+            sequentially. Ignored with ``backend='relation'``, whose relations
+            must stay on DuckDB's default connection.
+        memory_budget : str, optional
+            Cap on the estimated memory of tables being loaded at the same time
+            (e.g. ``'16GB'``), estimated from each table's on-disk size. A table
+            that would exceed it waits for running loads to finish; one table
+            is always allowed. Defaults to the package DuckDB ``memory_limit``
+            (``configure_duckdb``) if set, else 70% of available RAM. Only used
+            when ``max_workers > 1``.
+
+        Notes
+        -----
+        Per-table load times are logged and kept in ``self.load_timings``.
         """
         if tables is None:
             tables = ['patient']
-        
-        for table in tables:
+
+        def load(table):
             # Get table-specific columns and filters if provided
             table_columns = columns.get(table) if columns else None
             table_filters = filters.get(table) if filters else None
-            
-            try:
-                self.load_table(table, sample_size, table_columns, table_filters)
-            except ValueError as e:
-                self.logger.warning(f"{e}")
+            self.load_table(table, sample_size, table_columns, table_filters)
+
+        if max_workers <= 1 or len(tables) <= 1 or self.backend == 'relation':
+            for table in tables:
+                try:
+                    load(table)
+                except ValueError as e:
+                    self.logger.warning(f"{e}")
+        else:
+            self._load_concurrently(tables, load, max_workers, memory_budget)
+
+        if self.load_timings:
+            timings = ", ".join(f"{t}={self.load_timings[t]:.1f}s" for t in tables if t in self.load_timings)
+            self.logger.info(f"Table load times: {timings}")
         
         # Perform encounter stitching if enabled
         if self.stitch_encounter:
             self.run_stitch_encounters()
+
+    def _load_concurrently(self, tables: List[str], load, max_workers: int, memory_budget: Optional[str]):
+        """Run ``load`` for each table on a thread pool, within the memory budget."""
+        if memory_budget is not None:
+            budget = _parse_memory_size(memory_budget)
+        elif get_duckdb_config() is not None and get_duckdb_config().memory_limit:
+            budget = _parse_memory_size(get_duckdb_config().memory_limit)
+        else:
+            budget = int(psutil.virtual_memory().available * 0.7)
+
+        factor = _LOAD_MEMORY_FACTOR.get(self.filetype, 5.0)
+        estimates = {}
+        for table in tables:
+            try:
+                path = _resolve_table_path(self.data_directory, table, self.filetype)
+                estimates[table] = int(_on_disk_size(path) * factor)
+            except (FileNotFoundError, OSError):
+                estimates[table] = 0  # load_table reports the missing file
+
+        self.logger.info(
+            f"Loading {len(tables)} tables with {max_workers} workers "
+            f"(memory budget {budget / 1024**3:.1f} GB)"
+        )
+        pending = list(tables)
+        running = {}
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='clifpy-load') as pool:
+            while pending or running:
+                while pending and len(running) < max_workers:
+                    in_use = sum(estimates[t] for t in running.values())
+                    if running and in_use + estimates[pending[0]] > budget:
+                        break
+                    table = pending.pop(0)
+                    running[pool.submit(_load_on_own_cursor, load, table)] = table
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    table = running.pop(future)
+                    try:
+                        future.result()
+                    except ValueError as e:
+                        self.logger.warning(f"{e}")
     
     def run_stitch_encounters(self):
         # automatically load whichever of hospitalization / adt is missing,
@@ -412,7 +618,8 @@ class ClifOrchestrator:
             hospitalization_stitched, adt_stitched, encounter_mapping = stitch_encounters(
                 self.hospitalization.df,
                 self.adt.df,
-                time_interval=self.stitch_time_interval
+                time_interval=self.stitch_time_interval,
+                engine=self.stitch_engine
             )
 
             # Update the dataframes in place
@@ -505,7 +712,10 @@ class ClifOrchestrator:
         batch_size: int = 1000,
         memory_limit: Optional[str] = None,
         threads: Optional[int] = None,
-        show_progress: bool = True
+        show_progress: bool = True,
+        max_workers: int = 1,
+        max_retries: int = 2,
+        time_resolution: str = 'minute'
     ) -> None:
         """
         Create wide time-series dataset using DuckDB for high performance.
@@ -568,7 +778,12 @@ class ClifOrchestrator:
             When encounter stitching is enabled, can also include 'encounter_block' column.
             Used to filter data to specific time windows per patient.
         output_format : str, default='dataframe'
-            Format for output data. Options: 'dataframe', 'csv', 'parquet'.
+            Format for output data. Options: 'dataframe', 'csv', 'parquet', 'parquet_dataset'.
+            'parquet_dataset' streams each batch to a parquet partition under
+            ``<output_directory>/<output_filename>/`` with a ``_manifest.json``, so
+            memory stays bounded by one batch. The manifest path is stored in
+            `wide_dataset_path` (``wide_df`` stays None) and is used by
+            `convert_wide_to_hourly` and `compute_sofa_scores`.
         save_to_data_location : bool, default=False
             If True, save output file to the data directory specified in orchestrator config.
         output_filename : str, optional
@@ -584,12 +799,22 @@ class ClifOrchestrator:
             Number of threads for DuckDB to use. If None, uses all available cores.
         show_progress : bool, default=True
             If True, display progress bars during processing.
+        max_workers : int, default=1
+            Number of batches to build concurrently in worker processes. Each worker
+            gets ``1/max_workers`` of memory_limit / threads (or of the package-wide
+            DuckDB config, else the system) and only its batch's rows.
+        max_retries : int, default=2
+            Times a failed batch is retried before the call fails.
+        time_resolution : str, default='minute'
+            Granularity at which values from different tables are matched to the
+            same event: 'minute', 'second', or 'none' (exact timestamps).
             
         Returns
         -------
         None
             The wide dataset is stored in the `wide_df` property of the orchestrator instance.
-            Access the result via `orchestrator.wide_df` after calling this method.
+            Access the result via `orchestrator.wide_df` after calling this method
+            (`orchestrator.wide_dataset_path` for output_format='parquet_dataset').
             
         Notes
         -----
@@ -672,7 +897,7 @@ class ClifOrchestrator:
 
         filters = None
         if hospitalization_ids:
-            filters = {'hospitalization_id': hospitalization_ids}
+            filters = {'hospitalization_id': Cohort(hospitalization_ids)}
 
         self.logger.info("Phase 3: Table Loading")
 
@@ -704,65 +929,7 @@ class ClifOrchestrator:
         # Check if patient_assessments needs assessment_value column
         if (tables_to_load and 'patient_assessments' in tables_to_load) or \
            (category_filters and 'patient_assessments' in category_filters):
-            if self.patient_assessments is not None and hasattr(self.patient_assessments, 'df'):
-                df = self.patient_assessments.df
-                if 'numerical_value' in df.columns and 'categorical_value' in df.columns:
-                    if 'assessment_value' not in df.columns:
-
-                        self.logger.info("  === SPECIAL: PATIENT ASSESSMENTS PROCESSING ===")
-                        self.logger.info("       - Merging numerical_value and categorical_value columns")
-                        try:
-                            import polars as pl
-                            self.logger.debug("       - Using Polars for performance optimization")
-
-                            # Convert to Polars for efficient processing
-                            df_pl = pl.from_pandas(df)
-
-                            # Check data integrity using Polars
-                            both_filled = df_pl.filter(
-                                (pl.col('numerical_value').is_not_null()) &
-                                (pl.col('categorical_value').is_not_null())
-                            )
-                            both_filled_count = len(both_filled)
-
-                            if both_filled_count > 0:
-                                self.logger.warning(f"       - Found {both_filled_count} rows with both numerical and categorical values - numerical values will take precedence")
-
-                            # Create assessment_value using Polars coalesce (much faster than pandas fillna)
-                            df_pl = df_pl.with_columns(
-                                pl.coalesce([
-                                    pl.col('numerical_value'),
-                                    pl.col('categorical_value')
-                                ]).cast(pl.Utf8).alias('assessment_value')
-                            )
-
-                            # Calculate statistics efficiently with Polars
-                            num_count = df_pl.select(pl.col('numerical_value').is_not_null().sum()).item()
-                            cat_count = df_pl.select(pl.col('categorical_value').is_not_null().sum()).item()
-                            total_count = df_pl.select(pl.col('assessment_value').is_not_null().sum()).item()
-
-                            # Convert back to pandas for compatibility
-                            self.patient_assessments.df = df_pl.to_pandas()
-
-                            self.logger.info(f"       - Created assessment_value column: {num_count} numerical, {cat_count} categorical, {total_count} total non-null")
-                            self.logger.debug(f"       -   Stored as string type for processing compatibility")
-
-                        except ImportError:
-                            self.logger.warning("       - Polars not installed. Using pandas (slower)")
-                            # Fallback to pandas
-                            both_filled = df[(df['numerical_value'].notna()) &
-                                            (df['categorical_value'].notna())]
-                            if len(both_filled) > 0:
-                                self.logger.warning(f"       - Found {len(both_filled)} rows with both numerical and categorical values")
-
-                            df['assessment_value'] = df['numerical_value'].fillna(df['categorical_value'])
-                            df['assessment_value'] = df['assessment_value'].astype(str)
-
-                            num_count = df['numerical_value'].notna().sum()
-                            cat_count = df['categorical_value'].notna().sum()
-                            total_count = df['assessment_value'].notna().sum()
-
-                            self.logger.info(f"       - Created assessment_value column: {num_count} numerical, {cat_count} categorical, {total_count} total non-null")
+            self._add_assessment_value()
 
         self.logger.info("Phase 4: Calling Wide Dataset Utility")
 
@@ -774,7 +941,7 @@ class ClifOrchestrator:
         self.logger.debug(f"       - Show progress: {show_progress}")
 
         # Call utility function with self as clif_instance and store result in wide_df property
-        self.wide_df = _create_wide(
+        result = _create_wide(
             clif_instance=self,
             optional_tables=tables_to_load,
             category_filters=category_filters,
@@ -788,9 +955,24 @@ class ClifOrchestrator:
             batch_size=batch_size,
             memory_limit=memory_limit,
             threads=threads,
-            show_progress=show_progress
+            show_progress=show_progress,
+            max_workers=max_workers,
+            max_retries=max_retries,
+            time_resolution=time_resolution
         )
 
+        if output_format == 'parquet_dataset':
+            # Encounter blocks were added per partition; assessment dtype
+            # optimization needs the whole column and is skipped
+            self.wide_dataset_path = result
+            self.wide_df = None
+            self.logger.info(f"  6.1: Partitioned wide dataset stored at {result}")
+            self.logger.info("=" * 50)
+            self.logger.info("✅ WIDE DATASET CREATION COMPLETED")
+            self.logger.info("=" * 50)
+            return
+        self.wide_df = result
+
         self.logger.info("Phase 5: Post-Processing")
 
         # Add encounter_block column if encounter mapping exists and not already present
@@ -925,16 +1107,171 @@ class ClifOrchestrator:
         self.logger.info("✅ WIDE DATASET CREATION COMPLETED")
         self.logger.info("=" * 50)
 
+    def refresh_wide_dataset(
+        self,
+        dataset: Optional[str] = None,
+        hospitalization_ids: Optional[List[str]] = None,
+        memory_limit: Optional[str] = None,
+        threads: Optional[int] = None,
+        show_progress: bool = True,
+        max_workers: int = 1,
+        max_retries: int = 2
+    ) -> List[str]:
+        """
+        Incrementally refresh a partitioned wide dataset with newly arrived data.
+
+        Rebuilds only the hospitalizations that are new or have rows later than
+        their per-table watermark, using the category filters, time resolution
+        and batch size the dataset was created with, and merges them into the
+        existing partitions (see `clifpy.utils.wide_dataset.refresh_wide_dataset`).
+        Tables the dataset was built from are loaded if needed.
+
+        Parameters
+        ----------
+        dataset : str, optional
+            Dataset directory or manifest path (default: `wide_dataset_path`).
+        hospitalization_ids : List[str], optional
+            Hospitalizations to check (default: the dataset's own, plus new
+            ones when it was built for all hospitalizations).
+        memory_limit : str, optional
+            DuckDB memory limit for the rebuild (e.g., '8GB').
+        threads : int, optional
+            Number of threads for DuckDB to use.
+        show_progress : bool, default=True
+            If True, display progress bars while rebuilding.
+        max_workers : int, default=1
+            Number of rebuild batches to run concurrently in worker processes.
+        max_retries : int, default=2
+            Times a failed batch is retried before the call fails.
+
+        Returns
+        -------
+        List[str]
+            The rebuilt hospitalization IDs. Recompute hourly windows for just
+            these with ``load_wide_dataset(co.wide_dataset_path, ids=refreshed)``.
+
+        Examples
+        --------
+        Nightly refresh, then recompute hourly features for what changed::
+
+            co.create_wide_dataset(category_filters=filters, output_format='parquet_dataset')
+            # ... later, with the new data loaded ...
+            refreshed = co.refresh_wide_dataset()
+            changed = co.convert_wide_to_hourly(
+                config, wide_df=load_wide_dataset(co.wide_dataset_path, ids=refreshed)
+            )
+            hourly = pd.concat([hourly[~hourly['hospitalization_id'].isin(refreshed)], changed])
+        """
+        from clifpy.utils.wide_dataset import (
+            WIDE_MANIFEST_FILENAME, read_wide_manifest, refresh_wide_dataset as _refresh
+        )
+
+        dataset = dataset or self.wide_dataset_path
+        if dataset is None:
+            raise ValueError(
+                "No wide dataset to refresh. Run create_wide_dataset(output_format='parquet_dataset') "
+                "first or pass dataset."
+            )
+        manifest = read_wide_manifest(dataset)
+        category_filters = manifest.get('build', {}).get('category_filters', {})
+
+        for table_name in ['patient', 'hospitalization', 'adt'] + list(category_filters):
+            if getattr(self, table_name, None) is None:
+                self.logger.info(f"Loading {table_name} table")
+                self.load_table(table_name)
+        if 'patient_assessments' in category_filters:
+            self._add_assessment_value()
+
+        refreshed = _refresh(
+            self, dataset,
+            hospitalization_ids=hospitalization_ids,
+            memory_limit=memory_limit,
+            threads=threads,
+            show_progress=show_progress,
+            max_workers=max_workers,
+            max_retries=max_retries,
+        )
+        self.wide_dataset_path = os.path.join(manifest['directory'], WIDE_MANIFEST_FILENAME)
+        self.wide_df = None
+        return refreshed
+
+    def _add_assessment_value(self) -> None:
+        """Merge patient_assessments numerical/categorical values into ``assessment_value``."""
+        if self.patient_assessments is not None and hasattr(self.patient_assessments, 'df'):
+            df = self.patient_assessments.df
+            if 'numerical_value' in df.columns and 'categorical_value' in df.columns:
+                if 'assessment_value' not in df.columns:
+
+                    self.logger.info("  === SPECIAL: PATIENT ASSESSMENTS PROCESSING ===")
+                    self.logger.info("       - Merging numerical_value and categorical_value columns")
+                    try:
+                        import polars as pl
+                        self.logger.debug("       - Using Polars for performance optimization")
+
+                        # Convert to Polars for efficient processing
+                        df_pl = pl.from_pandas(df)
+
+                        # Check data integrity using Polars
+                        both_filled = df_pl.filter(
+                            (pl.col('numerical_value').is_not_null()) &
+                            (pl.col('categorical_value').is_not_null())
+                        )
+                        both_filled_count = len(both_filled)
+
+                        if both_filled_count > 0:
+                            self.logger.warning(f"       - Found {both_filled_count} rows with both numerical and categorical values - numerical values will take precedence")
+
+                        # Create assessment_value using Polars coalesce (much faster than pandas fillna)
+                        df_pl = df_pl.with_columns(
+                            pl.coalesce([
+                                pl.col('numerical_value'),
+                                pl.col('categorical_value')
+                            ]).cast(pl.Utf8).alias('assessment_value')
+                        )
+
+                        # Calculate statistics efficiently with Polars
+                        num_count = df_pl.select(pl.col('numerical_value').is_not_null().sum()).item()
+                        cat_count = df_pl.select(pl.col('categorical_value').is_not_null().sum()).item()
+                        total_count = df_pl.select(pl.col('assessment_value').is_not_null().sum()).item()
+
+                        # Convert back to pandas for compatibility
+                        self.patient_assessments.df = df_pl.to_pandas()
+
+                        self.logger.info(f"       - Created assessment_value column: {num_count} numerical, {cat_count} categorical, {total_count} total non-null")
+                        self.logger.debug(f"       -   Stored as string type for processing compatibility")
+
+                    except ImportError:
+                        self.logger.warning("       - Polars not installed. Using pandas (slower)")
+                        # Fallback to pandas
+                        both_filled = df[(df['numerical_value'].notna()) &
+                                        (df['categorical_value'].notna())]
+                        if len(both_filled) > 0:
+                            self.logger.warning(f"       - Found {len(both_filled)} rows with both numerical and categorical values")
+
+                        df['assessment_value'] = df['numerical_value'].fillna(df['categorical_value'])
+                        df['assessment_value'] = df['assessment_value'].astype(str)
+
+                        num_count = df['numerical_value'].notna().sum()
+                        cat_count = df['categorical_value'].notna().sum()
+                        total_count = df['assessment_value'].notna().sum()
+
+                        self.logger.info(f"       - Created assessment_value column: {num_count} numerical, {cat_count} categorical, {total_count} total non-null")
+
     def convert_wide_to_hourly(
         self,
         aggregation_config: Dict[str, List[str]],
-        wide_df: Optional[pd.DataFrame] = None,
+        wide_df: Optional[Union[pd.DataFrame, str]] = None,
         id_name: str = 'hospitalization_id',
         hourly_window: int = 1,
         fill_gaps: bool = False,
         memory_limit: str = '4GB',
         temp_directory: Optional[str] = None,
-        batch_size: Optional[int] = None
+        batch_size: Optional[int] = None,
+        max_workers: int = 1,
+        max_retries: int = 2,
+        backend: str = 'pandas',
+        window_step: Optional[int] = None,
+        window_alignment: str = 'event'
     ) -> pd.DataFrame:
         """
         Convert wide dataset to temporal aggregation using DuckDB with event-based windowing.
@@ -953,8 +1290,9 @@ class ClifOrchestrator:
                 'boolean': ['norepinephrine'],
                 'one_hot_encode': ['device_category']
             }
-        wide_df : pd.DataFrame, optional
-            Wide dataset DataFrame. If None, uses the stored wide_df from create_wide_dataset()
+        wide_df : pd.DataFrame or str, optional
+            Wide dataset DataFrame, or the path of a partitioned wide dataset. If None,
+            uses the stored wide_df (or wide_dataset_path) from create_wide_dataset()
         id_name : str, default='hospitalization_id'
             Column name to use for grouping aggregation. Options:
             - 'hospitalization_id': Group by individual hospitalizations (default)
@@ -972,11 +1310,23 @@ class ClifOrchestrator:
             Directory for DuckDB temp files
         batch_size : int, optional
             Process in batches if specified
+        max_workers : int, default=1
+            Number of batches to aggregate concurrently in worker processes
+        max_retries : int, default=2
+            Times a failed batch is retried before the call fails
+        backend : {'pandas', 'arrow'}, default='pandas'
+            'arrow' returns a ``pyarrow.Table`` straight from DuckDB
+        window_step : int, optional
+            Hours between window ends; smaller than hourly_window (and dividing
+            it) gives sliding windows, e.g. 24h windows every hour
+        window_alignment : {'event', 'calendar'}, default='event'
+            Start windows at each group's first event, or on wall-clock
+            boundaries (top of the hour / midnight)
 
         Returns
         -------
-        pd.DataFrame
-            Aggregated DataFrame with columns:
+        pd.DataFrame or pyarrow.Table
+            Aggregated data with columns:
             - window_number: Sequential window index (0-indexed)
             - window_start_dttm: Window start timestamp
             - window_end_dttm: Window end timestamp
@@ -1004,6 +1354,15 @@ class ClifOrchestrator:
             # - fill_gaps=False creates 3 rows (0, 1, 5)
             # - fill_gaps=True creates 6 rows (0, 1, 2, 3, 4, 5) with NaN in 2-4
 
+        Trailing 24-hour features every hour, on calendar hours::
+
+            hourly_df = co.convert_wide_to_hourly(
+                aggregation_config=config,
+                hourly_window=24,
+                window_step=1,
+                window_alignment='calendar'
+            )
+
         Using encounter blocks after stitching::
 
             co.run_stitch_encounters()
@@ -1026,13 +1385,13 @@ class ClifOrchestrator:
 
         # Use provided wide_df or fall back to stored one
         if wide_df is None:
-            if self.wide_df is None:
+            if self.wide_df is None and self.wide_dataset_path is None:
                 raise ValueError(
                     "No wide dataset found. Please either:\n"
                     "1. Run create_wide_dataset() first, OR\n"
                     "2. Provide a wide_df parameter"
                 )
-            wide_df = self.wide_df
+            wide_df = self.wide_df if self.wide_df is not None else self.wide_dataset_path
 
         return convert_wide_to_hourly(
             wide_df=wide_df,
@@ -1042,7 +1401,12 @@ class ClifOrchestrator:
             fill_gaps=fill_gaps,
             memory_limit=memory_limit,
             temp_directory=temp_directory,
-            batch_size=batch_size
+            batch_size=batch_size,
+            max_workers=max_workers,
+            max_retries=max_retries,
+            backend=backend,
+            window_step=window_step,
+            window_alignment=window_alignment
         )
     
     def get_sys_resource_info(self, print_summary: bool = True) -> Dict[str, Any]:
@@ -1175,33 +1539,41 @@ class ClifOrchestrator:
                 self.load_table('medication_admin_continuous')
             self.logger.debug("medication_admin_continuous table loaded successfully")
 
+        # Arrow / relation-backed tables are passed to the converter as a relation
+        med_input = _table_input(self.medication_admin_continuous)
+
         # Determine hospitalization_ids for vitals loading if not provided
-        if hospitalization_ids is None and self.medication_admin_continuous is not None:
-            hospitalization_ids = self.medication_admin_continuous.df['hospitalization_id'].unique().tolist()
+        if hospitalization_ids is None:
+            hospitalization_ids = Cohort(med_input).to_list()
             self.logger.debug(f"Extracted {len(hospitalization_ids)} unique hospitalization_id(s) from medication data")
 
         # Load vitals df with filters for weight_kg only
         if vitals_df is None:
             self.logger.debug("No vitals_df provided, loading filtered vitals table")
-            if (self.vitals is None) or (self.vitals.df is None):
+            if (self.vitals is None) or (self.vitals.is_materialized and self.vitals.df is None):
                 self.logger.info(f"Loading vitals table for {len(hospitalization_ids)} hospitalization(s), vital_category='weight_kg'")
                 self.load_table('vitals', filters={'hospitalization_id': hospitalization_ids, 'vital_category': ['weight_kg']})
-            vitals_df = self.vitals.df
+            vitals_df = _table_input(self.vitals)
             self.logger.debug(f"Using vitals data with shape: {vitals_df.shape}")
         else:
             self.logger.debug(f"Using provided vitals_df with shape: {vitals_df.shape}")
 
         # Call the conversion function with all parameters
         self.logger.info("Starting dose unit conversion")
-        self.logger.debug(f"Input DataFrame shape: {self.medication_admin_continuous.df.shape}")
+        self.logger.debug(f"Input DataFrame shape: {med_input.shape}")
 
         converted_df, counts_df = convert_dose_units_by_med_category(
-            self.medication_admin_continuous.df,
+            med_input,
             vitals_df=vitals_df,
             preferred_units=preferred_units,
             show_intermediate=show_intermediate,
             override=override
         )
+        if not isinstance(med_input, pd.DataFrame):
+            # relation input renders in UTC; match the eager table's site-tz labels
+            converted_df = convert_datetime_columns_to_site_tz(
+                _cast_id_cols_to_string(converted_df), self.timezone, verbose=False
+            )
 
         self.logger.info("Dose unit conversion completed")
         self.logger.debug(f"Output DataFrame shape: {converted_df.shape}")
@@ -1270,33 +1642,41 @@ class ClifOrchestrator:
                 self.load_table('medication_admin_intermittent')
             self.logger.debug("medication_admin_intermittent table loaded successfully")
 
+        # Arrow / relation-backed tables are passed to the converter as a relation
+        med_input = _table_input(self.medication_admin_intermittent)
+
         # Determine hospitalization_ids for vitals loading if not provided
         if hospitalization_ids is None:
-            hospitalization_ids = self.medication_admin_intermittent.df['hospitalization_id'].unique().tolist()
+            hospitalization_ids = Cohort(med_input).to_list()
             self.logger.debug(f"Extracted {len(hospitalization_ids)} unique hospitalization_id(s) from medication data")
 
         # Load vitals df with filters for weight_kg only
         if vitals_df is None:
             self.logger.debug("No vitals_df provided, loading filtered vitals table")
-            if (self.vitals is None) or (self.vitals.df is None):
+            if (self.vitals is None) or (self.vitals.is_materialized and self.vitals.df is None):
                 self.logger.info(f"Loading vitals table for {len(hospitalization_ids)} hospitalization(s), vital_category='weight_kg'")
                 self.load_table('vitals', filters={'hospitalization_id': hospitalization_ids, 'vital_category': ['weight_kg']})
-            vitals_df = self.vitals.df
+            vitals_df = _table_input(self.vitals)
             self.logger.debug(f"Using vitals data with shape: {vitals_df.shape}")
         else:
             self.logger.debug(f"Using provided vitals_df with shape: {vitals_df.shape}")
 
         # Call the conversion function with all parameters
         self.logger.info("Starting dose unit conversion")
-        self.logger.debug(f"Input DataFrame shape: {self.medication_admin_intermittent.df.shape}")
+        self.logger.debug(f"Input DataFrame shape: {med_input.shape}")
 
         converted_df, counts_df = convert_dose_units_by_med_category(
-            self.medication_admin_intermittent.df,
+            med_input,
             vitals_df=vitals_df,
             preferred_units=preferred_units,
             show_intermediate=show_intermediate,
             override=override
         )
+        if not isinstance(med_input, pd.DataFrame):
+            # relation input renders in UTC; match the eager table's site-tz labels
+            converted_df = convert_datetime_columns_to_site_tz(
+                _cast_id_cols_to_string(converted_df), self.timezone, verbose=False
+            )
 
         self.logger.info("Dose unit conversion completed")
         self.logger.debug(f"Output DataFrame shape: {converted_df.shape}")
@@ -1314,7 +1694,7 @@ class ClifOrchestrator:
 
     def compute_sofa_scores(
         self,
-        wide_df: Optional[pd.DataFrame] = None,
+        wide_df: Optional[Union[pd.DataFrame, str]] = None,
         cohort_df: Optional[pd.DataFrame] = None,
         extremal_type: str = 'worst',
         id_name: str = 'encounter_block',
@@ -1326,7 +1706,10 @@ class ClifOrchestrator:
         Compute SOFA (Sequential Organ Failure Assessment) scores.
 
         Parameters:
-            wide_df: Optional wide dataset. If not provided, uses self.wide_df or creates one
+            wide_df: Optional wide dataset, or the path of a partitioned wide dataset
+                (create_wide_dataset(output_format='parquet_dataset')), which is scored
+                one partition at a time. If not provided, uses self.wide_df
+                (or self.wide_dataset_path) or creates one
             cohort_df: Optional DataFrame with columns [id_name, 'start_time', 'end_time']
                       to further filter observations by time windows
             extremal_type: 'worst' (default) or 'latest' (future feature)
@@ -1388,6 +1771,9 @@ class ClifOrchestrator:
         elif hasattr(self, 'wide_df') and self.wide_df is not None:
             self.logger.debug("Using existing self.wide_df")
             df = self.wide_df
+        elif self.wide_dataset_path is not None:
+            self.logger.debug(f"Using partitioned wide dataset at {self.wide_dataset_path}")
+            df = self.wide_dataset_path
         else:
             self.logger.info("No wide dataset available, creating one...")
             # Create wide dataset with required categories for SOFA
@@ -1400,7 +1786,15 @@ class ClifOrchestrator:
             df = self.wide_df
             self.logger.debug(f"Created wide dataset with shape: {df.shape}")
 
-        if id_name not in df.columns:
+        if isinstance(df, str):
+            from .utils.wide_dataset import read_wide_manifest
+            if id_name not in read_wide_manifest(df)['columns']:
+                raise ValueError(
+                    f"id_name '{id_name}' not found in the partitioned wide dataset. "
+                    "Run run_stitch_encounters() before create_wide_dataset() so encounter "
+                    "blocks are written with each partition."
+                )
+        elif id_name not in df.columns:
             if self.encounter_mapping is None:
                 self.logger.info("Encounter mapping not found, running stitch_encounters()")
                 try:
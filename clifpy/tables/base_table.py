@@ -11,11 +11,22 @@ import pandas as pd
 import polars as pl
 import yaml
 import numpy as np
-from typing import Optional, List, Dict, Any, Tuple
+import pyarrow as pa
+from duckdb import DuckDBPyRelation
+from typing import Optional, List, Dict, Any, Tuple, Union
 from pathlib import Path
 from datetime import datetime
 
-from ..utils.io import load_data
+from ..utils.io import (
+    load_data,
+    _cast_id_cols_to_string,
+    _cast_id_cols_to_string_arrow,
+    _read_ipc,
+    _resolve_table_path,
+    convert_datetime_columns_to_site_tz,
+)
+from ..utils.table_cache import TableCache
+from ..utils._duckdb_helpers import _default_connection
 from ..utils import validator
 from ..utils.outlier_handler import _load_outlier_config
 from ..utils.config import get_config_or_params
@@ -43,7 +54,9 @@ class BaseTable:
     table_name : str
         Name of the table (from class name)
     df : pd.DataFrame
-        The loaded data
+        The loaded data. For tables loaded with ``backend='arrow'`` or
+        ``backend='relation'`` this is materialized on first access; use
+        `to_arrow` / `to_relation` to consume the data without a pandas copy.
     schema : dict
         The YAML schema for this table
     errors : List[dict]
@@ -58,7 +71,7 @@ class BaseTable:
         filetype: str,
         timezone: str,
         output_directory: Optional[str] = None,
-        data: Optional[pd.DataFrame] = None,
+        data: Optional[Union[pd.DataFrame, pa.Table, DuckDBPyRelation]] = None,
         clif_version: str = DEFAULT_CLIF_VERSION
     ):
         """
@@ -75,8 +88,9 @@ class BaseTable:
         output_directory : str, optional
             Directory for saving output files and logs.
             If not provided, creates an 'output' directory in the current working directory.
-        data : pd.DataFrame, optional
-            Pre-loaded data to use instead of loading from file
+        data : pd.DataFrame, pa.Table or DuckDBPyRelation, optional
+            Pre-loaded data to use instead of loading from file. Arrow tables
+            and DuckDB relations are kept as-is until ``df`` is accessed.
         clif_version : str, optional
             CLIF schema version to validate against (e.g. "2.1", "3.0").
             Defaults to the package default (2.1).
@@ -100,8 +114,10 @@ class BaseTable:
         # Example: Adt -> adt, RespiratorySupport -> respiratory_support
         self.table_name = ''.join(['_' + c.lower() if c.isupper() else c for c in self.__class__.__name__]).lstrip('_')
 
-        # Initialize data and validation state
-        self.df: Optional[pd.DataFrame] = data
+        # Initialize data and validation state (see the ``df`` property)
+        self._df: Optional[pd.DataFrame] = None
+        self._lazy_data: Optional[Union[pa.Table, DuckDBPyRelation]] = None
+        self.df = data
         self.errors: List[Dict[str, Any]] = []
         self.schema: Optional[Dict[str, Any]] = None
         self.outlier_config: Optional[Dict[str, Any]] = None
@@ -117,6 +133,62 @@ class BaseTable:
         self._load_outlier_config()
         
 
+    @property
+    def df(self) -> Optional[pd.DataFrame]:
+        """The table as a pandas DataFrame.
+
+        Arrow / relation-backed tables are converted on first access (ID
+        columns cast to string, ``*_dttm`` relabeled to ``timezone``, as on the
+        eager load path) and the lazy copy is dropped.
+        """
+        if self._df is None and self._lazy_data is not None:
+            self.logger.debug("Materializing lazy table data as pandas")
+            df = self.to_arrow().to_pandas()
+            df = _cast_id_cols_to_string(df)
+            if self.timezone:
+                df = convert_datetime_columns_to_site_tz(df, self.timezone, verbose=False)
+            self._df = df
+            self._lazy_data = None
+        return self._df
+
+    @df.setter
+    def df(self, data) -> None:
+        if isinstance(data, (pa.Table, DuckDBPyRelation)):
+            self._df, self._lazy_data = None, data
+        else:
+            self._df, self._lazy_data = data, None
+
+    @property
+    def is_materialized(self) -> bool:
+        """False while the data is still held as an Arrow table or DuckDB relation."""
+        return self._lazy_data is None
+
+    def to_arrow(self) -> Optional[pa.Table]:
+        """Return the data as an Arrow table without materializing pandas.
+
+        Zero-copy for ``backend='arrow'``; a relation is fetched (not cached);
+        a pandas-backed table is converted.
+        """
+        data = self._lazy_data
+        if data is None:
+            return None if self._df is None else pa.Table.from_pandas(self._df, preserve_index=False)
+        if isinstance(data, DuckDBPyRelation):
+            return _cast_id_cols_to_string_arrow(data.fetch_arrow_table())
+        return data
+
+    def to_relation(self) -> Optional[DuckDBPyRelation]:
+        """Return the data as a relation on DuckDB's default connection.
+
+        Arrow and pandas data are scanned in place (no copy into DuckDB).
+        """
+        data = self._lazy_data
+        if isinstance(data, DuckDBPyRelation):
+            return data
+        con = _default_connection(timezone=None)
+        if data is not None:
+            return con.from_arrow(data)
+        return None if self._df is None else con.from_df(self._df)
+
     def _setup_logging(self):
         """Set up table-specific logging (supplementary to centralized logs)."""
         # Get logger from centralized system
@@ -190,7 +262,9 @@ class BaseTable:
         columns: Optional[List[str]] = None,
         filters: Optional[Dict[str, Any]] = None,
         verbose: bool = False,
-        clif_version: Optional[str] = None
+        clif_version: Optional[str] = None,
+        backend: str = 'pandas',
+        cache: Union[bool, TableCache] = False
     ) -> 'BaseTable':
         """
         Load data from file and create a table instance.
@@ -212,12 +286,33 @@ class BaseTable:
         columns : List[str], optional
             Specific columns to load
         filters : Dict, optional
-            Filters to apply when loading
+            Filters to apply when loading, pushed into the scan. Supports
+            equality, ``IN`` lists, operator dicts (``{'>': 5}``,
+            ``{'between': (lo, hi)}``, ``{'not_in': [...]}``, ``{'is_null': False}``,
+            ``{'within': windows}``) and cohort DataFrames for semi-joins.
+            See :func:`clifpy.utils.io.load_parquet_with_tz`.
         verbose : bool, optional
             If True, show detailed loading messages. Default is False
         clif_version : str, optional
             CLIF schema version to validate against. Overrides any ``clif_version``
             in the config file. If neither is set, the package default (2.1) is used.
+        backend : {'pandas', 'arrow', 'relation'}, optional
+            How ``df`` is held after loading. ``'pandas'`` (default) loads a
+            DataFrame eagerly. ``'arrow'`` keeps an Arrow table (roughly half
+            the memory of the pandas copy for string-heavy tables) and
+            ``'relation'`` keeps an unevaluated DuckDB relation over the file
+            (parquet / Arrow IPC; CSV falls back to ``'arrow'``). With
+            ``filetype='arrow'`` the ``'arrow'`` backend maps the file without
+            copying when no filters or sample size are given. Either is converted
+            to pandas the first time ``df`` is accessed; ``to_arrow`` and
+            ``to_relation`` read it without that copy.
+        cache : bool or TableCache, optional
+            Reuse the loaded (ID-cast, tz-relabeled) table across sessions from
+            an Arrow IPC cache, memory-mapped on a hit. ``True`` uses
+            ``<output_directory>/.clifpy_cache`` with a 20GB LRU cap; pass a
+            `clifpy.utils.table_cache.TableCache` for another location or cap.
+            Entries are invalidated when the source file changes. Not used with
+            ``backend='relation'``. Default False.
 
         Notes
         -----
@@ -247,17 +342,65 @@ class BaseTable:
         # Derive snake_case table name from PascalCase class name
         table_name = ''.join(['_' + c.lower() if c.isupper() else c for c in cls.__name__]).lstrip('_')
 
+        if backend not in ('pandas', 'arrow', 'relation'):
+            raise ValueError(f"Unknown backend: {backend}. Expected 'pandas', 'arrow' or 'relation'")
+        if backend == 'relation' and config['filetype'] == 'csv':
+            backend = 'arrow'
+
+        # Cache lookup: keyed by source path/size/mtime and every load argument
+        table_cache, cache_key = None, None
+        if cache and backend != 'relation':
+            if isinstance(cache, TableCache):
+                table_cache = cache
+            else:
+                cache_root = config.get('output_directory') or output_directory or os.path.join(os.getcwd(), 'output')
+                table_cache = TableCache(os.path.join(cache_root, '.clifpy_cache'))
+            try:
+                source_path = _resolve_table_path(config['data_directory'], table_name, config['filetype'])
+            except FileNotFoundError:
+                source_path = None  # load_data raises the user-facing error
+            if source_path is not None:
+                cache_key = table_cache.key(
+                    source_path,
+                    table_name=table_name,
+                    columns=columns,
+                    filters=filters,
+                    sample_size=sample_size,
+                    site_tz=config['timezone'],
+                    clif_version=resolved_version,
+                    backend=backend,
+                )
+        data = table_cache.get(cache_key, as_pandas=(backend == 'pandas')) if cache_key else None
+        cache_hit = data is not None
+
         # Load data using existing io utility
-        data = load_data(
-            table_name,
-            config['data_directory'],
-            config['filetype'],
+        load_kwargs = dict(
             sample_size=sample_size,
             columns=columns,
             filters=filters,
             site_tz=config['timezone'],
             verbose=verbose
         )
+        if cache_hit:
+            logging.getLogger(f'clifpy.tables.{table_name}').info(f"Loaded {table_name} from cache")
+        elif backend == 'pandas':
+            data = load_data(table_name, config['data_directory'], config['filetype'], **load_kwargs)
+        elif backend == 'relation':
+            data = load_data(
+                table_name, config['data_directory'], config['filetype'], return_rel=True, **load_kwargs
+            )
+        elif config['filetype'] == 'arrow' and not filters and not sample_size:
+            # Memory-mapped IPC needs no scan: keep the mapped columns as-is
+            data = _read_ipc(_resolve_table_path(config['data_directory'], table_name, 'arrow'))
+            data = _cast_id_cols_to_string_arrow(data.select(columns) if columns else data)
+        else:
+            rel = load_data(table_name, config['data_directory'], config['filetype'], lazy=True, **load_kwargs)
+            try:
+                data = _cast_id_cols_to_string_arrow(rel.fetch_arrow_table())
+            finally:
+                rel.close()
+        if cache_key and not cache_hit:
+            table_cache.put(cache_key, data)
 
         # Create instance with loaded data
         return cls(
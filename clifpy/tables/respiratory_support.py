@@ -1,7 +1,7 @@
 from typing import Optional, Union
 import pandas as pd
 from .base_table import BaseTable
-from ..utils.waterfall import process_resp_support_waterfall
+from ..utils.waterfall import process_resp_support_waterfall, process_resp_support_waterfall_sharded
 
 
 class RespiratorySupport(BaseTable):
@@ -53,8 +53,12 @@ class RespiratorySupport(BaseTable):
     id_col: str = "hospitalization_id",
     bfill: bool = False,
     verbose: bool = True,
-    return_dataframe: bool = False
-) -> Union['RespiratorySupport', pd.DataFrame]:
+    return_dataframe: bool = False,
+    engine: str = "pandas",
+    output_dir: Optional[str] = None,
+    n_shards: int = 16,
+    max_workers: int = 1
+) -> Union['RespiratorySupport', pd.DataFrame, str]:
         """
         Clean + waterfall-fill the respiratory_support table.
 
@@ -68,11 +72,23 @@ class RespiratorySupport(BaseTable):
             Print progress messages
         return_dataframe : bool
             If True, returns DataFrame instead of RespiratorySupport instance
+        engine : str
+            'pandas' (reference, default) or 'duckdb' (window-function engine
+            with identical output, for large tables)
+        output_dir : str, optional
+            Run sharded by hospitalization and write the result to this
+            directory as partitioned parquet instead of returning it; see
+            `process_resp_support_waterfall_sharded`
+        n_shards : int
+            Number of hospitalization shards when output_dir is given
+        max_workers : int
+            Worker processes for the shards when output_dir is given
 
         Returns
         -------
         RespiratorySupport
-            New instance with processed data (or DataFrame if return_dataframe=True)
+            New instance with processed data (or DataFrame if return_dataframe=True,
+            or the manifest path if output_dir is given)
 
         Notes
         -----
@@ -99,12 +115,27 @@ class RespiratorySupport(BaseTable):
                 # tz-naive; leave as-is (function expects UTC semantics already)
                 original_tz = None
 
+        # --- Sharded run: stream to parquet, converting back to the original tz per shard
+        if output_dir is not None:
+            return process_resp_support_waterfall_sharded(
+                df_copy,
+                output_dir,
+                id_col=id_col,
+                bfill=bfill,
+                engine=engine,
+                n_shards=n_shards,
+                max_workers=max_workers,
+                timezone=str(original_tz) if original_tz is not None else None,
+                verbose=verbose
+            )
+
         # --- Run the waterfall (expects UTC)
         processed_df = process_resp_support_waterfall(
             df_copy,
             id_col=id_col,
             bfill=bfill,
-            verbose=verbose
+            verbose=verbose,
+            engine=engine
         )
 
         # --- Convert back to original tz if we had one
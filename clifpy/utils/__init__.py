@@ -1,6 +1,6 @@
 from .config import load_config, get_config_or_params, create_example_config
-from .io import load_data, convert_datetime_columns_to_site_tz, LazyRelation, fetch_lazy_result, close_lazy_relation
-from .wide_dataset import create_wide_dataset, convert_wide_to_hourly
+from .io import load_data, convert_datetime_columns_to_site_tz, LazyRelation, fetch_lazy_result, close_lazy_relation, Cohort, convert_to_ipc
+from .wide_dataset import create_wide_dataset, convert_wide_to_hourly, iter_wide_partitions, load_wide_dataset, refresh_wide_dataset
 from .outlier_handler import apply_outlier_handling, get_outlier_summary
 from .comorbidity import calculate_cci
 
@@ -51,7 +51,7 @@ from .report_generator import (
 
 # TODO: re-enable when clifpy/utils/unit_variants.py is committed (WIP in stash@{0})
 # from .unit_variants import load_labs_schema_units, get_variants_for_category, normalize_unit
-from .waterfall import process_resp_support_waterfall
+from .waterfall import process_resp_support_waterfall, process_resp_support_waterfall_sharded, waterfall_table_stats
 from .stitching_encounters import stitch_encounters
 from .sofa import compute_sofa, _compute_sofa_from_extremal_values, _agg_extremal_values_by_id
 from .ase import compute_ase
@@ -63,9 +63,14 @@ __all__ = [
       'LazyRelation',
       'fetch_lazy_result',
       'close_lazy_relation',
+      'Cohort',
+      'convert_to_ipc',
       # wide_dataset
       'create_wide_dataset',
       'convert_wide_to_hourly',
+      'iter_wide_partitions',
+      'load_wide_dataset',
+      'refresh_wide_dataset',
       # outlier_handler
       'apply_outlier_handling',
       'get_outlier_summary',
@@ -77,6 +82,8 @@ __all__ = [
       'create_example_config',
       # waterfall
       'process_resp_support_waterfall',
+      'process_resp_support_waterfall_sharded',
+      'waterfall_table_stats',
       # stitching_encounters
       'stitch_encounters',
       # sofa
@@ -0,0 +1,163 @@
+"""Run independent batches in order or in a process pool, retrying failures.
+
+The wide dataset and hourly aggregation split their cohort into batches that
+share nothing, so they can run in separate processes. Each worker process gets
+its own DuckDB database with an even share of the memory / thread / spill
+budget (`DuckDBResourceConfig.per_worker`), because every DuckDB instance
+otherwise sizes itself as if it owned the machine.
+
+A batch that raises is retried up to ``max_retries`` times and then fails the
+whole run; batches are never dropped silently. Results are yielded as
+``(batch_index, result)`` in completion order; callers reorder by index.
+
+Functions
+---------
+- `run_batches(func, payloads, ...)`: the runner.
+"""
+from __future__ import annotations
+
+import logging
+import multiprocessing
+import os
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import fields, replace
+from typing import Any, Callable, Iterable, Iterator, Tuple
+
+from ._duckdb_config import DuckDBResourceConfig
+from ._duckdb_helpers import configure_duckdb, get_duckdb_config
+
+logger = logging.getLogger('clifpy.utils.batch_runner')
+
+
+def _effective_config(config: DuckDBResourceConfig | None) -> DuckDBResourceConfig:
+    """Per-call limits layered over the package-wide ones (`configure_duckdb`)."""
+    base = get_duckdb_config() or DuckDBResourceConfig()
+    if config is None:
+        return base
+    return DuckDBResourceConfig(**{
+        f.name: getattr(config, f.name) if getattr(config, f.name) is not None else getattr(base, f.name)
+        for f in fields(DuckDBResourceConfig)
+    })
+
+
+def _init_worker(config: DuckDBResourceConfig) -> None:
+    """Process-pool initializer: apply this worker's share of the limits."""
+    if config.temp_directory is not None:
+        # DuckDB spill files are not namespaced per process
+        config = replace(config, temp_directory=os.path.join(config.temp_directory, f'clifpy_worker_{os.getpid()}'))
+    configure_duckdb(config)
+
+
+def _new_executor(max_workers: int, worker_config: DuckDBResourceConfig) -> ProcessPoolExecutor:
+    # spawn, not fork: forking a process with live DuckDB threads can deadlock
+    return ProcessPoolExecutor(
+        max_workers=max_workers,
+        mp_context=multiprocessing.get_context('spawn'),
+        initializer=_init_worker,
+        initargs=(worker_config,),
+    )
+
+
+def _failed(label: str, index: int, attempts: int, error: BaseException) -> RuntimeError:
+    return RuntimeError(f"{label} {index + 1} failed after {attempts} attempts: {error}")
+
+
+def run_batches(
+    func: Callable[[Any], Any],
+    payloads: Iterable[Tuple[int, Any]],
+    max_workers: int = 1,
+    max_retries: int = 2,
+    config: DuckDBResourceConfig | None = None,
+    label: str = 'Batch',
+) -> Iterator[Tuple[int, Any]]:
+    """Yield ``(index, func(payload))`` for every ``(index, payload)``.
+
+    Parameters
+    ----------
+    func : callable
+        Batch function. With ``max_workers > 1`` it must be a module-level
+        function and payloads / results must be picklable.
+    payloads : iterable of (int, Any)
+        Consumed lazily, so only the batches in flight are held in memory.
+    max_workers : int, optional
+        ``1`` (default) runs in this process, in order. More runs that many
+        worker processes, each with ``1/max_workers`` of the DuckDB budget.
+    max_retries : int, optional
+        Extra attempts per batch before the run fails. Default 2.
+    config : DuckDBResourceConfig, optional
+        Total budget to split across workers (layered over the package-wide
+        config).
+    label : str, optional
+        Name used in log and error messages.
+
+    Raises
+    ------
+    RuntimeError
+        When a batch still fails after ``max_retries`` retries.
+    """
+    if max_workers <= 1:
+        for index, payload in payloads:
+            for attempt in range(1, max_retries + 2):
+                try:
+                    result = func(payload)
+                    break
+                except Exception as e:
+                    if attempt > max_retries:
+                        raise _failed(label, index, attempt, e) from e
+                    logger.warning(f"{label} {index + 1} failed (attempt {attempt}): {e}; retrying")
+            yield index, result
+        return
+
+    worker_config = _effective_config(config).per_worker(max_workers)
+    logger.info(f"Running {label.lower()} jobs in {max_workers} processes "
+                f"(per worker: memory_limit={worker_config.memory_limit}, threads={worker_config.threads})")
+
+    payloads = iter(payloads)
+    exhausted = False
+    retry_queue = []   # (index, payload, attempt)
+    in_flight = {}     # future -> (index, payload, attempt)
+    executor = _new_executor(max_workers, worker_config)
+    try:
+        while True:
+            # Keep every worker busy plus one batch queued, and no more
+            while len(in_flight) <= max_workers:
+                if retry_queue:
+                    item = retry_queue.pop(0)
+                elif not exhausted:
+                    nxt = next(payloads, None)
+                    if nxt is None:
+                        exhausted = True
+                        continue
+                    item = (nxt[0], nxt[1], 1)
+                else:
+                    break
+                in_flight[executor.submit(func, item[1])] = item
+            if not in_flight:
+                break
+
+            done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            broken = False
+            for future in done:
+                index, payload, attempt = in_flight.pop(future)
+                try:
+                    result = future.result()
+                except Exception as e:
+                    broken = broken or isinstance(e, BrokenProcessPool)
+                    if attempt > max_retries:
+                        raise _failed(label, index, attempt, e) from e
+                    logger.warning(f"{label} {index + 1} failed (attempt {attempt}): {e}; retrying")
+                    retry_queue.append((index, payload, attempt + 1))
+                    continue
+                yield index, result
+
+            if broken:
+                # A worker died (e.g. killed for memory); the pool is unusable and
+                # takes every in-flight batch with it. Requeue those unpenalised.
+                logger.warning("Worker process died; restarting the process pool")
+                retry_queue.extend(in_flight.values())
+                in_flight.clear()
+                executor.shutdown(wait=False, cancel_futures=True)
+                executor = _new_executor(max_workers, worker_config)
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
@@ -33,8 +33,9 @@ class DuckDBResourceConfig:
         Default: None (unlimited).
     batch_size : int, optional
         Process cohort in chunks of this size to reduce peak memory.
-        Each batch reloads CLIF tables (I/O cost) but limits intermediate
-        result size. Default: None (process all at once).
+        Each batch reloads CLIF tables (I/O cost; see ``preload_clif`` in
+        calculate_sofa2() to scan them once) but limits intermediate result
+        size. Default: None (process all at once).
     threads : int, optional
         Number of threads for DuckDB parallel execution.
         Default: None (DuckDB uses all logical cores).
@@ -111,6 +112,54 @@ class DuckDBResourceConfig:
             temp_directory=temp_directory,
         )
 
+    def per_worker(self, n_workers: int) -> DuckDBResourceConfig:
+        """Split these limits evenly across ``n_workers`` concurrent processes.
+
+        Each DuckDB process otherwise assumes it owns the machine (~80% of RAM,
+        every core), so N workers with default limits oversubscribe both.
+        Unset memory / thread limits are derived from the system first (70% of
+        available RAM, all logical cores).
+
+        Parameters
+        ----------
+        n_workers : int
+            Number of worker processes sharing the budget.
+
+        Returns
+        -------
+        DuckDBResourceConfig
+            Config with memory, spill size and threads divided by ``n_workers``
+            (at least 64MB and 1 thread each).
+
+        Examples
+        --------
+        >>> DuckDBResourceConfig(memory_limit='16GB', threads=8).per_worker(4)
+        DuckDBResourceConfig(memory_limit='4096MB', temp_directory=None, max_temp_directory_size=None, batch_size=None, threads=2)
+        """
+        import os
+
+        n_workers = max(1, int(n_workers))
+        if self.memory_limit is not None:
+            memory_bytes = _parse_memory_size(self.memory_limit)
+        else:
+            import psutil
+            memory_bytes = int(psutil.virtual_memory().available * 0.7)
+        threads = self.threads if self.threads is not None else (os.cpu_count() or 1)
+
+        def split(size_bytes: int) -> str:
+            return f'{max(64, size_bytes // n_workers // 1024**2)}MB'
+
+        return DuckDBResourceConfig(
+            memory_limit=split(memory_bytes),
+            temp_directory=self.temp_directory,
+            max_temp_directory_size=(
+                split(_parse_memory_size(self.max_temp_directory_size))
+                if self.max_temp_directory_size is not None else None
+            ),
+            batch_size=self.batch_size,
+            threads=max(1, threads // n_workers),
+        )
+
     def summary(self) -> str:
         """Return a human-readable summary of this config."""
         lines = [
@@ -121,3 +170,17 @@ class DuckDBResourceConfig:
             f"threads:                  {self.threads or 'system default (all logical cores)'}",
         ]
         return '\n'.join(lines)
+
+
+_SIZE_UNITS = {'B': 1, 'KB': 1024, 'MB': 1024**2, 'GB': 1024**3, 'TB': 1024**4}
+
+
+def _parse_memory_size(size: str | int) -> int:
+    """Convert a DuckDB-style size (``'8GB'``, ``'512MB'``, or bytes) to bytes."""
+    if isinstance(size, (int, float)):
+        return int(size)
+    text = size.strip().upper().replace(' ', '').replace('IB', 'B')
+    for unit in ('TB', 'GB', 'MB', 'KB', 'B'):
+        if text.endswith(unit):
+            return int(float(text[:-len(unit)]) * _SIZE_UNITS[unit])
+    return int(float(text))
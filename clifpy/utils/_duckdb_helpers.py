@@ -1,20 +1,369 @@
-"""Shared DuckDB temp-table lifecycle helpers.
+"""Shared DuckDB connection, settings and temp-table lifecycle helpers.
 
-Used by compute-heavy pipelines (currently `clifpy.utils.unit_converter`; sofa2
-will migrate here in a separate pass) that promote pandas inputs into DuckDB
-temp tables (boundary 2a per `docs/duckdb_perf_guide.md`) and need a single
-process-wide registry to drop them at exit.
+Every clifpy module that talks to DuckDB draws its connections from here, so
+the package-wide resource limits (``configure_duckdb``) apply everywhere and
+per-call setup (``SET timezone``, ``pandas_analyze_sample``, connecting a
+fresh in-memory database) is paid once instead of on every load.
+
+Two kinds of connection are handed out:
+
+- **Default connection** (`_default_connection`): DuckDB's process-wide
+  default connection, used by the eager / ``return_rel`` loaders, sofa2 and the
+  unit converter so that relations returned by one can be consumed by another.
+  Session settings and resource limits are applied once. ``TimeZone`` is
+  re-pinned on every request because user code shares this connection and may
+  have changed it. Inside a `_default_cursor` scope (the orchestrator's
+  table-loading threads) the calling thread gets its own cursor on it instead.
+- **Pooled connections** (`_acquire_connection` / `_release_connection`, or the
+  `pooled_connection` context manager): private in-memory databases for
+  pipelines that create their own tables (ASE, wide dataset, waterfall
+  scaffold, DQA checks) and for ``LazyRelation``. Released connections are
+  wiped and kept idle for reuse, up to ``_POOL_MAX_IDLE``.
+
+Temp tables promoted on the default connection (boundary 2a per
+`docs/duckdb_perf_guide.md`) are tracked in a single process-wide registry and
+dropped at the end of the pipeline.
 
 Functions
 ---------
+- `configure_duckdb(config)`: set package-wide resource limits.
+- `get_duckdb_config()`: the active package-wide resource limits.
+- `pooled_connection(...)`: context manager around acquire / release.
+- `_default_cursor()`: give this thread a private cursor on the default connection.
+- `_with_duckdb_config(...)`: temporarily override limits on the default connection.
 - `_register_temp_table(name)`: track a temp table for later cleanup.
 - `_drop_temp_table(name)`: drop one specific table and remove from the registry.
 - `_cleanup_temp_tables()`: drop everything currently in the registry.
 """
 from __future__ import annotations
 
+import threading
+from contextlib import contextmanager
+from typing import Iterator
+
 import duckdb
 
+from clifpy.utils._duckdb_config import DuckDBResourceConfig
+
+
+# =============================================================================
+# Connection Manager
+# =============================================================================
+#
+# A single RLock guards the pool and the settings caches; connections
+# themselves are never shared between threads by the pool (each acquire hands
+# out a connection no one else holds).
+
+_LOCK = threading.RLock()
+
+_RESOURCE_CONFIG: DuckDBResourceConfig | None = None
+_CONFIG_VERSION = 0
+
+# Session settings the default connection runs with (the loaders' pandas scans)
+_DEFAULT_SESSION_SETTINGS = {'pandas_analyze_sample': '0'}
+
+# Idle pooled connections, and bookkeeping keyed by id(connection):
+# the TimeZone last set, the config version last applied, and the per-call
+# settings to RESET before the connection goes back to the pool
+_POOL: list[duckdb.DuckDBPyConnection] = []
+_POOL_MAX_IDLE = 4
+_TIMEZONES: dict[int, str] = {}
+_APPLIED_VERSION: dict[int, int] = {}
+_OVERRIDES: dict[int, list[str]] = {}
+
+# Cursor `_default_connection` returns on this thread while a
+# `_default_cursor` scope is open
+_THREAD_STATE = threading.local()
+
+
+def _resource_settings(config: DuckDBResourceConfig | None) -> dict[str, str]:
+    """Translate a resource config into DuckDB ``SET`` key/values (None fields skipped)."""
+    if config is None:
+        return {}
+    settings = {}
+    if config.memory_limit is not None:
+        settings['memory_limit'] = config.memory_limit
+    if config.temp_directory is not None:
+        settings['temp_directory'] = config.temp_directory
+    if config.max_temp_directory_size is not None:
+        settings['max_temp_directory_size'] = config.max_temp_directory_size
+    if config.threads is not None:
+        settings['threads'] = str(config.threads)
+    return settings
+
+
+def configure_duckdb(config: DuckDBResourceConfig | None) -> None:
+    """Set package-wide DuckDB resource limits.
+
+    Applied to the default connection and to every pooled connection the next
+    time each is handed out. ``None`` stops applying package limits; settings
+    already applied to a live connection are left as they are.
+
+    Parameters
+    ----------
+    config : DuckDBResourceConfig or None
+        Memory, spill and thread limits. ``batch_size`` is ignored here; it is
+        read by the pipelines that batch.
+
+    Examples
+    --------
+    >>> from clifpy import DuckDBResourceConfig, configure_duckdb
+    >>> configure_duckdb(DuckDBResourceConfig(memory_limit='8GB', threads=4))
+    """
+    global _RESOURCE_CONFIG, _CONFIG_VERSION
+    with _LOCK:
+        _RESOURCE_CONFIG = config
+        _CONFIG_VERSION += 1
+        # Idle connections were configured under the old limits
+        while _POOL:
+            con = _POOL.pop()
+            _forget(con)
+            try:
+                con.close()
+            except Exception:
+                pass
+
+
+def get_duckdb_config() -> DuckDBResourceConfig | None:
+    """Return the package-wide resource config set by `configure_duckdb`, if any."""
+    return _RESOURCE_CONFIG
+
+
+def _forget(con) -> None:
+    _TIMEZONES.pop(id(con), None)
+    _APPLIED_VERSION.pop(id(con), None)
+    _OVERRIDES.pop(id(con), None)
+
+
+def _apply_config(con, session_settings: dict[str, str] | None = None) -> None:
+    """Apply session settings and the package resource limits to ``con`` once per config."""
+    key = id(con)
+    if _APPLIED_VERSION.get(key) == _CONFIG_VERSION:
+        return
+    settings = {**(session_settings or {}), **_resource_settings(_RESOURCE_CONFIG)}
+    for name, value in settings.items():
+        con.execute(f"SET {name} = '{value}'")
+    _APPLIED_VERSION[key] = _CONFIG_VERSION
+
+
+def _set_timezone(con, timezone: str) -> None:
+    """``SET TimeZone`` on a pooled connection unless it is already pinned to ``timezone``.
+
+    Pooled connections are private, so the zone last set here is still the
+    zone in force (code that runs its own ``SET TimeZone`` on a borrowed
+    connection should go through here too).
+    """
+    key = id(con)
+    if _TIMEZONES.get(key) == timezone:
+        return
+    con.execute(f"SET TimeZone = '{timezone}'")
+    _TIMEZONES[key] = timezone
+
+
+def _default_connection(timezone: str | None = 'UTC') -> duckdb.DuckDBPyConnection:
+    """Return DuckDB's process-wide default connection, configured for clifpy.
+
+    Inside a `_default_cursor` scope this is that scope's cursor on the
+    default database instead.
+
+    Parameters
+    ----------
+    timezone : str or None, optional
+        Session ``TimeZone`` to pin. ``None`` leaves the current zone alone.
+    """
+    con = getattr(_THREAD_STATE, 'cursor', None)
+    if con is None:
+        default = duckdb.default_connection
+        con = default() if callable(default) else default
+    with _LOCK:
+        _apply_config(con, _DEFAULT_SESSION_SETTINGS)
+        if timezone is not None:
+            con.execute(f"SET TimeZone = '{timezone}'")
+    return con
+
+
+@contextmanager
+def _default_cursor() -> Iterator[duckdb.DuckDBPyConnection]:
+    """Route this thread's `_default_connection` calls to a private cursor.
+
+    For clifpy's own worker threads (``ClifOrchestrator.initialize``): one
+    DuckDB connection cannot run queries from several threads at once, so
+    each worker gets a cursor on the default database (same catalog, own
+    session). The cursor is closed on exit, so relations and temp tables
+    created on it do not outlive the scope.
+    """
+    default = duckdb.default_connection
+    con = default() if callable(default) else default
+    cursor = con.cursor()
+    previous = getattr(_THREAD_STATE, 'cursor', None)
+    _THREAD_STATE.cursor = cursor
+    try:
+        yield cursor
+    finally:
+        _THREAD_STATE.cursor = previous
+        with _LOCK:
+            _forget(cursor)
+        cursor.close()
+
+
+def _acquire_connection(
+    timezone: str | None = 'UTC',
+    config: DuckDBResourceConfig | None = None,
+    settings: dict[str, str] | None = None,
+) -> duckdb.DuckDBPyConnection:
+    """Take a private in-memory connection from the pool (or open one).
+
+    Parameters
+    ----------
+    timezone : str or None, optional
+        Session ``TimeZone``. Default ``'UTC'``.
+    config : DuckDBResourceConfig, optional
+        Per-call limits layered over the package config.
+    settings : dict, optional
+        Extra per-call ``SET`` key/values (e.g. ``preserve_insertion_order``).
+        Per-call limits and settings are ``RESET`` on release.
+
+    Returns
+    -------
+    duckdb.DuckDBPyConnection
+        Hand it back with `_release_connection` when done.
+    """
+    with _LOCK:
+        con = _POOL.pop() if _POOL else duckdb.connect(':memory:')
+        _apply_config(con)
+        if timezone is not None:
+            _set_timezone(con, timezone)
+        overrides = {**_resource_settings(config), **(settings or {})}
+        for name, value in overrides.items():
+            con.execute(f"SET {name} = '{value}'")
+        if overrides:
+            _OVERRIDES[id(con)] = list(overrides)
+    return con
+
+
+def _reset_connection(con) -> None:
+    """Drop every user table and view (including registered DataFrames) on ``con``."""
+    views = con.execute(
+        "SELECT schema_name, view_name FROM duckdb_views() WHERE NOT internal"
+    ).fetchall()
+    for schema, name in views:
+        con.execute(f'DROP VIEW IF EXISTS "{schema}"."{name}"')
+    tables = con.execute(
+        "SELECT schema_name, table_name FROM duckdb_tables() WHERE NOT internal"
+    ).fetchall()
+    for schema, name in tables:
+        con.execute(f'DROP TABLE IF EXISTS "{schema}"."{name}"')
+
+
+def _release_connection(con) -> None:
+    """Return a connection from `_acquire_connection` to the pool.
+
+    The connection is wiped and its per-call settings are reset first.
+    Connections that fail to reset, predate the current package config, or
+    exceed ``_POOL_MAX_IDLE`` are closed instead. Best-effort: never raises.
+    """
+    if con is None:
+        return
+    with _LOCK:
+        if any(idle is con for idle in _POOL):
+            return  # already released
+        reusable = (
+            _APPLIED_VERSION.get(id(con)) == _CONFIG_VERSION
+            and len(_POOL) < _POOL_MAX_IDLE
+        )
+        if reusable:
+            try:
+                _reset_connection(con)
+                overridden = _OVERRIDES.pop(id(con), [])
+                for name in overridden:
+                    con.execute(f"RESET {name}")
+                if overridden:
+                    # RESET restores DuckDB defaults; re-apply package limits on next acquire
+                    _APPLIED_VERSION.pop(id(con), None)
+                _POOL.append(con)
+                return
+            except Exception:
+                pass
+        _forget(con)
+    try:
+        con.close()
+    except Exception:
+        pass
+
+
+@contextmanager
+def pooled_connection(
+    timezone: str | None = 'UTC',
+    config: DuckDBResourceConfig | None = None,
+    settings: dict[str, str] | None = None,
+) -> Iterator[duckdb.DuckDBPyConnection]:
+    """Context manager yielding a pooled private connection.
+
+    Examples
+    --------
+    >>> with pooled_connection(timezone='US/Central') as con:
+    ...     con.register('df', df)
+    ...     out = con.execute('SELECT COUNT(*) FROM df').fetchone()
+    """
+    con = _acquire_connection(timezone=timezone, config=config, settings=settings)
+    try:
+        yield con
+    finally:
+        _release_connection(con)
+
+
+@contextmanager
+def _with_duckdb_config(
+    memory_limit: str | None = None,
+    temp_directory: str | None = None,
+    max_temp_directory_size: str | None = None,
+    threads: int | None = None,
+):
+    """Set DuckDB resource limits on the default connection, then restore.
+
+    Uses SET on the global DuckDB connection. Handles four layers:
+    - memory_limit: RAM cap for buffer manager (spills to disk when exceeded)
+    - temp_directory: where spill files go
+    - max_temp_directory_size: disk cap for spill files (clean error if exceeded)
+    - threads: parallel execution thread count
+
+    Only settings with non-None values are applied. When all are None, only
+    the package-wide limits (``configure_duckdb``) are in force.
+
+    Parameters
+    ----------
+    memory_limit : str, optional
+        DuckDB memory limit (e.g., '8GB', '16GB').
+    temp_directory : str, optional
+        Directory for DuckDB spill files.
+    max_temp_directory_size : str, optional
+        Max disk for spill files (e.g., '10GB').
+    threads : int, optional
+        Number of threads for parallel execution.
+    """
+    settings = _resource_settings(DuckDBResourceConfig(
+        memory_limit=memory_limit,
+        temp_directory=temp_directory,
+        max_temp_directory_size=max_temp_directory_size,
+        threads=threads,
+    ))
+
+    # package-wide limits first, so a no-override call still runs under them
+    con = _default_connection(timezone=None)
+    if not settings:
+        yield
+        return
+
+    saved = {}
+    for key, val in settings.items():
+        saved[key] = con.sql(f"SELECT current_setting('{key}')").fetchone()[0]
+        con.execute(f"SET {key} = '{val}'")
+    try:
+        yield
+    finally:
+        for key, old_val in saved.items():
+            con.execute(f"SET {key} = '{old_val}'")
+
 
 # =============================================================================
 # Temp Table Registry
@@ -35,29 +384,36 @@ def _register_temp_table(name: str) -> None:
 
     No-op if the name is already in the registry.
     """
-    if name not in _TEMP_TABLE_REGISTRY:
-        _TEMP_TABLE_REGISTRY.append(name)
+    with _LOCK:
+        if name not in _TEMP_TABLE_REGISTRY:
+            _TEMP_TABLE_REGISTRY.append(name)
 
 
 def _drop_temp_table(name: str) -> None:
     """Drop a specific temp table and remove it from the registry.
 
     Best-effort: silently ignores DuckDB errors and missing-name errors.
+    Drops on `_default_connection`, which inside a `_default_cursor` scope
+    is the scope's cursor, where temp tables created in the scope live.
     """
     try:
-        duckdb.execute(f"DROP TABLE IF EXISTS {name}")
+        _default_connection(timezone=None).execute(f"DROP TABLE IF EXISTS {name}")
     except Exception:
         pass
-    try:
-        _TEMP_TABLE_REGISTRY.remove(name)
-    except ValueError:
-        pass
+    with _LOCK:
+        try:
+            _TEMP_TABLE_REGISTRY.remove(name)
+        except ValueError:
+            pass
 
 
 def _cleanup_temp_tables() -> None:
     """Drop all registered temp tables. Best-effort; safe to call repeatedly."""
-    while _TEMP_TABLE_REGISTRY:
-        name = _TEMP_TABLE_REGISTRY.pop()
+    while True:
+        with _LOCK:
+            if not _TEMP_TABLE_REGISTRY:
+                return
+            name = _TEMP_TABLE_REGISTRY.pop()
         try:
             duckdb.execute(f"DROP TABLE IF EXISTS {name}")
         except Exception:
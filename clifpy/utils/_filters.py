@@ -0,0 +1,582 @@
+"""Structured row-filter spec for the ``load_data`` family.
+
+A ``filters`` dict maps column names to a filter value. The value decides the
+predicate:
+
+- scalar → ``col = value`` (legacy; value is quoted as a string literal)
+- list / tuple / set → ``col IN (...)`` (legacy; values quoted as strings)
+- pandas / Polars DataFrame or Series, Arrow table, DuckDB relation →
+  semi-join against that ID set (``col IN (SELECT ...)``) instead of an
+  inlined literal list
+- :class:`Cohort` → semi-join against an ID set that is registered once per
+  DuckDB connection and reused by every load that references it
+- dict of operators → one predicate per operator, AND-ed together:
+
+  ======================  ===============================================
+  ``'=='`` / ``'!='``     equality / inequality
+  ``'>'`` ``'>='``        comparisons (numbers, strings, datetimes)
+  ``'<'`` ``'<='``
+  ``'between'``           ``(low, high)`` inclusive range
+  ``'in'``                list → ``IN``; DataFrame/Series/relation → semi-join
+  ``'not_in'``            list → ``NOT IN``; DataFrame/... → anti-join
+  ``'is_null'``           ``True`` → ``IS NULL``; ``False`` → ``IS NOT NULL``
+  ``'within'``            per-ID time window: a DataFrame with
+                          ``[hospitalization_id, start_dttm, end_dttm]``;
+                          keeps rows whose ``col`` falls inside the window
+                          of the same hospitalization
+  ======================  ===============================================
+
+Examples
+--------
+>>> filters = {
+...     'lab_category': ['creatinine', 'sodium'],
+...     'lab_value_numeric': {'>': 0, '<=': 20},
+...     'lab_result_dttm': {'between': ('2023-01-01', '2023-06-30')},
+... }
+
+Lists of ``_SEMI_JOIN_MIN_VALUES`` or more values are also compiled to a
+semi-join against a registered Arrow table: a literal ``IN ('…', …)`` list of
+hundreds of thousands of IDs takes longer to parse and plan than the scan
+itself.
+
+The spec compiles to a DuckDB ``WHERE`` clause (:func:`_compile_filters_sql`),
+to DuckDB relation filters plus semi / anti joins (:func:`_apply_filters_duckdb`,
+for relations that outlive the call) and to Polars expressions plus join steps
+(:func:`_apply_filters_polars`), so
+both engines push the predicates into the parquet scan — hive partition keys
+prune directories and comparisons are checked against row-group min/max
+statistics before any rows are decoded.
+"""
+from __future__ import annotations
+
+import datetime as _dt
+import uuid
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import duckdb
+import pandas as pd
+
+_COMPARISON_OPS = {'==': '=', '!=': '<>', '>': '>', '>=': '>=', '<': '<', '<=': '<='}
+_SUPPORTED_OPS = set(_COMPARISON_OPS) | {'between', 'in', 'not_in', 'is_null', 'within'}
+
+# IN lists at least this long are semi-joined against a registered Arrow table
+_SEMI_JOIN_MIN_VALUES = 1000
+
+# Column names the 'within' operator expects on its window frame
+_WINDOW_KEY = 'hospitalization_id'
+_WINDOW_START = 'start_dttm'
+_WINDOW_END = 'end_dttm'
+# ...renamed on registration so correlated references cannot bind to the window
+_W_KEY, _W_START, _W_END = '_clif_w_id', '_clif_w_start', '_clif_w_end'
+
+
+class Cohort:
+    """An ID set registered once per DuckDB connection and semi-joined by every load.
+
+    Passing ``filters={'hospitalization_id': ids}`` with a plain list inlines
+    every ID into the SQL text, and a DataFrame is re-converted and re-registered
+    on each call. A ``Cohort`` converts the IDs to a deduplicated Arrow table
+    once and registers it as a view the first time a connection sees it; later
+    loads on that connection reuse the view.
+
+    Parameters
+    ----------
+    ids : list, set, pandas/Polars Series or DataFrame, Arrow array/table, or DuckDB relation
+        The IDs. Frames must contain ``column`` or have a single column.
+    column : str, optional
+        Name of the ID column. Default ``'hospitalization_id'``.
+
+    Examples
+    --------
+    >>> cohort = Cohort(cohort_df['hospitalization_id'])
+    >>> labs = load_data('labs', filters={'hospitalization_id': cohort})
+    >>> vitals = load_data('vitals', filters={'hospitalization_id': cohort,
+    ...                                       'vital_category': ['map']})
+    >>> cohort.release()
+    """
+
+    def __init__(self, ids: Any, column: str = 'hospitalization_id'):
+        if isinstance(ids, Cohort):
+            ids = ids.table
+        elif _is_list_like(ids):
+            ids = pd.Series(list(ids), dtype=object)
+        self.column = column
+        self.table = _to_arrow(ids, column)
+        # id(connection) -> (connection, view name)
+        self._views: Dict[int, Tuple[Any, str]] = {}
+
+    def __len__(self) -> int:
+        return self.table.num_rows
+
+    def __repr__(self) -> str:
+        return f"Cohort({self.column!r}, n={len(self)})"
+
+    def to_list(self) -> List[Any]:
+        """Return the IDs as a Python list."""
+        return self.table.column(0).to_pylist()
+
+    def _view_on(self, con) -> str:
+        """Register the ID table on ``con`` (once) and return the view name."""
+        entry = self._views.get(id(con))
+        if entry is None or entry[0] is not con:
+            name = f"_clif_cohort_{uuid.uuid4().hex[:12]}"
+            con.register(name, self.table)
+            entry = (con, name)
+            self._views[id(con)] = entry
+        return entry[1]
+
+    def release(self, con=None) -> None:
+        """Unregister the cohort view from ``con``, or from every connection.
+
+        Best-effort: a closed connection simply drops its views.
+        """
+        keys = list(self._views) if con is None else [id(con)]
+        for key in keys:
+            entry = self._views.pop(key, None)
+            if entry is None:
+                continue
+            try:
+                entry[0].unregister(entry[1])
+            except Exception:
+                pass
+
+
+def _is_frame_like(value: Any) -> bool:
+    """True for tabular ID sets that should be semi-joined, not inlined."""
+    if isinstance(value, (pd.DataFrame, pd.Series, Cohort, duckdb.DuckDBPyRelation)):
+        return True
+    module = type(value).__module__ or ''
+    return module.startswith(('polars', 'pyarrow'))
+
+
+def _is_list_like(value: Any) -> bool:
+    return isinstance(value, (list, tuple, set, frozenset))
+
+
+def _quote(value: Any) -> str:
+    """Legacy string-literal quoting used by equality / IN filters."""
+    return "'" + str(value).replace("'", "''") + "'"
+
+
+def _sql_literal(value: Any) -> str:
+    """Render a Python value as a typed DuckDB literal for operator filters.
+
+    Numbers stay numeric so DuckDB compares (and prunes row groups) without a
+    cast; datetimes are rendered ISO-8601 and implicitly cast to the column type.
+    """
+    if value is None:
+        return 'NULL'
+    if isinstance(value, bool):
+        return 'TRUE' if value else 'FALSE'
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return repr(value)
+    if hasattr(value, 'item') and not isinstance(value, (str, bytes)):
+        # numpy scalar
+        return _sql_literal(value.item())
+    if isinstance(value, (pd.Timestamp, _dt.datetime, _dt.date)):
+        return _quote(value.isoformat(sep=' ') if isinstance(value, _dt.datetime) else value.isoformat())
+    return _quote(value)
+
+
+def _to_arrow(value: Any, column: str):
+    """Convert a DataFrame/Series/relation to a one-column Arrow table named ``column``."""
+    import pyarrow as pa
+
+    module = type(value).__module__ or ''
+    if isinstance(value, Cohort):
+        table = value.table.rename_columns([column])
+    elif isinstance(value, pd.Series):
+        table = pa.table({column: value.dropna().unique()})
+    elif isinstance(value, pd.DataFrame):
+        key = _pick_key_column(list(value.columns), column)
+        table = pa.table({column: value[key].dropna().unique()})
+    elif module.startswith('polars'):
+        import polars as pl
+        if isinstance(value, pl.LazyFrame):
+            value = value.collect()
+        if isinstance(value, pl.Series):
+            series = value
+        else:
+            series = value.get_column(_pick_key_column(value.columns, column))
+        table = pa.table({column: series.drop_nulls().unique().to_arrow()})
+    elif isinstance(value, duckdb.DuckDBPyRelation):
+        key = _pick_key_column(list(value.columns), column)
+        table = value.select(f'"{key}"').distinct().fetch_arrow_table().rename_columns([column])
+    elif module.startswith('pyarrow'):
+        if isinstance(value, (pa.Array, pa.ChunkedArray)):
+            table = pa.table({column: value})
+        else:
+            key = _pick_key_column(value.column_names, column)
+            table = value.select([key]).rename_columns([column])
+    else:
+        raise TypeError(f"Unsupported semi-join filter type for '{column}': {type(value).__name__}")
+    return table
+
+
+def _pick_key_column(columns: List[str], column: str) -> str:
+    """Choose the key column in a semi-join frame: same name, else the only column."""
+    if column in columns:
+        return column
+    if len(columns) == 1:
+        return columns[0]
+    raise ValueError(
+        f"Semi-join filter for '{column}' needs a '{column}' column or a single-column "
+        f"frame; got columns {columns}"
+    )
+
+
+def _normalize_spec(column: str, value: Any) -> Dict[str, Any]:
+    """Turn any supported filter value into an operator dict."""
+    if isinstance(value, dict):
+        unknown = set(value) - _SUPPORTED_OPS
+        if unknown:
+            raise ValueError(
+                f"Unsupported filter operator(s) for '{column}': {sorted(unknown)}. "
+                f"Supported: {sorted(_SUPPORTED_OPS)}"
+            )
+        return value
+    if _is_frame_like(value):
+        return {'in': value}
+    if _is_list_like(value):
+        return {'_legacy_in': list(value)}
+    return {'_legacy_eq': value}
+
+
+def _compile_filters_sql(
+    filters: Optional[Dict[str, Any]],
+    register: Optional[Callable[[Any], str]] = None,
+    column_types: Optional[Dict[str, str]] = None,
+) -> List[str]:
+    """Compile a filter spec into DuckDB ``WHERE`` clauses (to be AND-ed).
+
+    Parameters
+    ----------
+    filters : dict, optional
+        Filter spec (see module docstring).
+    register : callable, optional
+        ``register(arrow_table) -> view_name``; exposes a semi-join / window
+        frame on the target connection. Required only when the spec contains
+        frame-valued filters.
+    column_types : dict, optional
+        ``{column: duckdb_type}`` of the scanned source. When given, semi-join
+        keys are ``TRY_CAST`` to the column type so e.g. string cohort IDs match
+        integer-typed parquet IDs.
+
+    Returns
+    -------
+    list of str
+        SQL predicates; empty when ``filters`` is empty.
+    """
+    clauses: List[str] = []
+    if not filters:
+        return clauses
+    column_types = column_types or {}
+
+    for column, value in filters.items():
+        spec = _normalize_spec(column, value)
+        for op, operand in spec.items():
+            if op == '_legacy_eq':
+                clauses.append(f"{column} = {_quote(operand)}")
+            elif op == '_legacy_in':
+                if register is not None and len(operand) >= _SEMI_JOIN_MIN_VALUES:
+                    # legacy values compare as strings; the key cast below restores the column type
+                    ids = pd.Series([str(v) for v in operand], dtype=object)
+                    clauses.append(_semi_join_sql(column, _to_arrow(ids, column), register, column_types))
+                else:
+                    clauses.append(f"{column} IN ({', '.join(_quote(v) for v in operand)})")
+            elif op in _COMPARISON_OPS:
+                clauses.append(f"{column} {_COMPARISON_OPS[op]} {_sql_literal(operand)}")
+            elif op == 'between':
+                low, high = operand
+                clauses.append(f"{column} BETWEEN {_sql_literal(low)} AND {_sql_literal(high)}")
+            elif op == 'is_null':
+                clauses.append(f"{column} IS NULL" if operand else f"{column} IS NOT NULL")
+            elif op in ('in', 'not_in'):
+                negate = 'NOT ' if op == 'not_in' else ''
+                values = list(operand) if _is_list_like(operand) else [operand]
+                if not _is_frame_like(operand) and (
+                    register is None or len(values) < _SEMI_JOIN_MIN_VALUES
+                ):
+                    clauses.append(
+                        f"{column} {negate}IN ({', '.join(_sql_literal(v) for v in values)})"
+                    )
+                    continue
+                if register is None:
+                    raise ValueError(f"Semi-join filter on '{column}' is not supported here")
+                if not _is_frame_like(operand):
+                    operand = pd.Series(values, dtype=object)
+                source = operand if isinstance(operand, Cohort) else _to_arrow(operand, column)
+                clauses.append(_semi_join_sql(column, source, register, column_types, negate))
+            elif op == 'within':
+                if register is None:
+                    raise ValueError(f"Window filter on '{column}' is not supported here")
+                view = register(_window_arrow(operand))
+                key = _W_KEY
+                if _WINDOW_KEY in column_types:
+                    key = f'TRY_CAST({_W_KEY} AS {column_types[_WINDOW_KEY]})'
+                clauses.append(
+                    f"EXISTS (SELECT 1 FROM {view} WHERE {key} = {_WINDOW_KEY} "
+                    f"AND {column} BETWEEN {_W_START} AND {_W_END})"
+                )
+    return clauses
+
+
+def _semi_join_sql(
+    column: str,
+    source: Any,
+    register: Callable[[Any], str],
+    column_types: Dict[str, str],
+    negate: str = '',
+) -> str:
+    """``col [NOT ]IN (SELECT key FROM view)`` over a registered Arrow table or :class:`Cohort`.
+
+    The key is ``TRY_CAST`` to the scanned column type when it is known.
+    """
+    view = register(source)
+    key_name = source.column if isinstance(source, Cohort) else column
+    key = f'"{key_name}"'
+    if column in column_types:
+        key = f'TRY_CAST("{key_name}" AS {column_types[column]})'
+    return f"{column} {negate}IN (SELECT {key} FROM {view})"
+
+
+def _window_arrow(frame: Any):
+    """Validate and convert a ``within`` window frame to Arrow (renamed columns)."""
+    import pyarrow as pa
+
+    cols = [_WINDOW_KEY, _WINDOW_START, _WINDOW_END]
+    module = type(frame).__module__ or ''
+    if isinstance(frame, pd.DataFrame):
+        columns = list(frame.columns)
+    elif module.startswith('polars'):
+        if hasattr(frame, 'collect'):
+            frame = frame.collect()
+        columns = frame.columns
+    elif isinstance(frame, duckdb.DuckDBPyRelation):
+        columns = list(frame.columns)
+    else:
+        raise TypeError(f"'within' filter expects a DataFrame or relation, got {type(frame).__name__}")
+
+    missing = [c for c in cols if c not in columns]
+    if missing:
+        raise ValueError(f"'within' filter frame must contain columns {cols}; missing {missing}")
+
+    if isinstance(frame, pd.DataFrame):
+        table = pa.Table.from_pandas(frame[cols], preserve_index=False)
+    elif module.startswith('polars'):
+        table = frame.select(cols).to_arrow()
+    else:
+        table = frame.select(*cols).fetch_arrow_table()
+    return table.rename_columns([_W_KEY, _W_START, _W_END])
+
+
+def _make_duckdb_registrar(con) -> Callable[[Any], str]:
+    """Return a ``register(arrow_table) -> name`` callback bound to ``con``.
+
+    ``con`` may be a ``DuckDBPyConnection`` or the ``duckdb`` module itself
+    (process-wide default connection). A :class:`Cohort` is registered once per
+    connection and its existing view is returned on later calls.
+    """
+    def register(table) -> str:
+        if isinstance(table, Cohort):
+            return table._view_on(con)
+        name = f"_clif_filter_{uuid.uuid4().hex[:12]}"
+        con.register(name, table)
+        return name
+    return register
+
+
+def _needs_registration(filters: Optional[Dict[str, Any]]) -> bool:
+    """True if any filter in the spec needs a registered view (semi-join or window)."""
+    if not filters:
+        return False
+    for column, value in filters.items():
+        spec = _normalize_spec(column, value)
+        if 'within' in spec:
+            return True
+        if len(spec.get('_legacy_in', ())) >= _SEMI_JOIN_MIN_VALUES:
+            return True
+        for op, operand in spec.items():
+            if op not in ('in', 'not_in'):
+                continue
+            if _is_frame_like(operand):
+                return True
+            if _is_list_like(operand) and len(operand) >= _SEMI_JOIN_MIN_VALUES:
+                return True
+    return False
+
+
+def _apply_filters_duckdb(rel, filters: Optional[Dict[str, Any]], con):
+    """Apply a filter spec to a DuckDB relation without registering views.
+
+    Scalar predicates are combined into a single ``filter``; frame-valued
+    ``in`` / ``not_in``, long lists and ``within`` become semi / anti joins
+    against relations over their Arrow tables (built on ``con``, the
+    connection ``rel`` lives on). The result holds that data by reference, so
+    it stays valid for as long as it, or any relation derived from it, is
+    kept. Rows match the ``WHERE`` clauses of :func:`_compile_filters_sql`,
+    including ``NOT IN``'s handling of NULLs.
+    """
+    if not filters:
+        return rel
+
+    column_types = {name: str(dtype) for name, dtype in zip(rel.columns, rel.types)}
+    clauses: List[str] = []
+    joins = []
+
+    for column, value in filters.items():
+        spec = _normalize_spec(column, value)
+        for op, operand in spec.items():
+            if op == '_legacy_in' and len(operand) >= _SEMI_JOIN_MIN_VALUES:
+                # legacy values compare as strings; the key cast below restores the column type
+                ids = pd.Series([str(v) for v in operand], dtype=object)
+                joins.append((column, _to_arrow(ids, column), 'semi'))
+            elif op in ('in', 'not_in') and (
+                _is_frame_like(operand)
+                or (_is_list_like(operand) and len(operand) >= _SEMI_JOIN_MIN_VALUES)
+            ):
+                if not _is_frame_like(operand):
+                    operand = pd.Series(list(operand), dtype=object)
+                joins.append((column, _to_arrow(operand, column), 'anti' if op == 'not_in' else 'semi'))
+            elif op == 'within':
+                joins.append((column, _window_arrow(operand), 'within'))
+            else:
+                single = value if op in ('_legacy_eq', '_legacy_in') else {op: operand}
+                clauses.extend(_compile_filters_sql({column: single}))
+
+    if clauses:
+        rel = rel.filter(' AND '.join(clauses))
+
+    for column, table, how in joins:
+        if how == 'within':
+            key = _W_KEY
+            if _WINDOW_KEY in column_types:
+                key = f'TRY_CAST({_W_KEY} AS {column_types[_WINDOW_KEY]})'
+            windows = con.from_arrow(table).select(f'{key} AS {_W_KEY}, {_W_START}, {_W_END}')
+            rel = rel.join(
+                windows,
+                f"{_WINDOW_KEY} = {_W_KEY} AND {column} BETWEEN {_W_START} AND {_W_END}",
+                how='semi',
+            )
+            continue
+        key = f'"{column}"'
+        if column in column_types:
+            key = f'TRY_CAST("{column}" AS {column_types[column]})'
+        keys = con.from_arrow(table).select(f'{key} AS _clif_key')
+        if how == 'anti':
+            # NOT IN keeps nothing once a key is NULL, and drops NULL values
+            # unless there are no keys at all; an anti join does neither
+            n_keys, n_null = keys.aggregate('count(*), count(*) - count(_clif_key)').fetchone()
+            if n_null:
+                rel = rel.filter('false')
+            elif n_keys:
+                rel = rel.filter(f'{column} IS NOT NULL')
+        rel = rel.join(keys, f'{column} = _clif_key', how=how)
+    return rel
+
+
+def _apply_filters_polars(lf, filters: Optional[Dict[str, Any]]):
+    """Apply a filter spec to a Polars ``LazyFrame``.
+
+    Scalar predicates are combined into a single ``filter`` (pushed into the
+    scan); frame-valued ``in`` / ``not_in`` become semi / anti joins and
+    ``within`` becomes a key join plus range check.
+    """
+    import polars as pl
+
+    if not filters:
+        return lf
+
+    schema = lf.collect_schema()
+    exprs = []
+    joins = []
+
+    for column, value in filters.items():
+        spec = _normalize_spec(column, value)
+        col = pl.col(column)
+        dtype = schema.get(column)
+        for op, operand in spec.items():
+            if op == '_legacy_eq':
+                exprs.append(col == operand)
+            elif op == '_legacy_in':
+                exprs.append(col.is_in(operand))
+            elif op == '==':
+                exprs.append(col == _pl_lit(operand, dtype))
+            elif op == '!=':
+                exprs.append(col != _pl_lit(operand, dtype))
+            elif op == '>':
+                exprs.append(col > _pl_lit(operand, dtype))
+            elif op == '>=':
+                exprs.append(col >= _pl_lit(operand, dtype))
+            elif op == '<':
+                exprs.append(col < _pl_lit(operand, dtype))
+            elif op == '<=':
+                exprs.append(col <= _pl_lit(operand, dtype))
+            elif op == 'between':
+                low, high = operand
+                exprs.append(col.is_between(_pl_lit(low, dtype), _pl_lit(high, dtype), closed='both'))
+            elif op == 'is_null':
+                exprs.append(col.is_null() if operand else col.is_not_null())
+            elif op in ('in', 'not_in'):
+                if _is_frame_like(operand):
+                    keys = pl.from_arrow(_to_arrow(operand, column))
+                    if column in schema:
+                        keys = keys.select(pl.col(column).cast(schema[column], strict=False))
+                    joins.append((column, keys.lazy(), 'semi' if op == 'in' else 'anti'))
+                else:
+                    values = list(operand) if _is_list_like(operand) else [operand]
+                    expr = col.is_in(values)
+                    exprs.append(~expr if op == 'not_in' else expr)
+            elif op == 'within':
+                joins.append((column, pl.from_arrow(_window_arrow(operand)).lazy(), 'within'))
+
+    if exprs:
+        combined = exprs[0]
+        for expr in exprs[1:]:
+            combined = combined & expr
+        lf = lf.filter(combined)
+
+    for column, other, how in joins:
+        if how in ('semi', 'anti'):
+            lf = lf.join(other, on=column, how=how)
+        else:
+            if _WINDOW_KEY in schema:
+                other = other.with_columns(
+                    pl.col(_W_KEY).cast(schema[_WINDOW_KEY], strict=False)
+                )
+            rows = (
+                lf.with_row_index('_clif_row')
+                .select('_clif_row', _WINDOW_KEY, column)
+                .join(other, left_on=_WINDOW_KEY, right_on=_W_KEY, how='inner')
+                .filter(pl.col(column).is_between(pl.col(_W_START), pl.col(_W_END)))
+                .select('_clif_row')
+                .unique()
+            )
+            lf = (
+                lf.with_row_index('_clif_row')
+                .join(rows, on='_clif_row', how='semi')
+                .drop('_clif_row')
+            )
+    return lf
+
+
+def _pl_lit(value: Any, dtype=None):
+    """Polars literal coerced to the column's temporal type.
+
+    ISO strings and naive datetimes compared against a tz-aware column are read
+    as UTC, matching DuckDB's ``SET timezone = 'UTC'`` session used by the
+    pandas loaders.
+    """
+    import polars as pl
+
+    if dtype is not None and isinstance(dtype, pl.Datetime) and not isinstance(value, (int, float)):
+        ts = pd.Timestamp(value)
+        if dtype.time_zone is not None:
+            ts = ts.tz_localize('UTC') if ts.tzinfo is None else ts
+            ts = ts.tz_convert(dtype.time_zone)
+        elif ts.tzinfo is not None:
+            ts = ts.tz_convert('UTC').tz_localize(None)
+        return pl.lit(ts.to_pydatetime(), dtype=dtype)
+    if isinstance(value, pd.Timestamp):
+        value = value.to_pydatetime()
+    return pl.lit(value)
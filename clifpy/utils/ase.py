@@ -58,6 +58,11 @@ from datetime import datetime, timedelta
 from pathlib import Path
 from typing import List, Optional, Dict, Tuple, Union
 
+from clifpy.utils.io import Cohort
+from clifpy.utils._batch_runner import run_batches
+from clifpy.utils._duckdb_config import DuckDBResourceConfig
+from clifpy.utils._duckdb_helpers import _acquire_connection, _release_connection, get_duckdb_config
+
 # CLIF imports - lazy loaded inside functions to avoid circular imports
 
 # ==============================================================================
@@ -841,7 +846,7 @@ def drop_tables(con: duckdb.DuckDBPyConnection, table_names: List[str]) -> None:
 
 def process_blood_cultures(
     con: duckdb.DuckDBPyConnection,
-    hospitalization_ids: List[str],
+    hospitalization_ids: Union[List[str], Cohort],
     config: Dict,
     verbose: bool = False
 ) -> None:
@@ -893,7 +898,7 @@ def process_blood_cultures(
 
 def calculate_qad(
     con: duckdb.DuckDBPyConnection,
-    hospitalization_ids: List[str],
+    hospitalization_ids: Union[List[str], Cohort],
     config: Dict,
     verbose: bool = False
 ) -> None:
@@ -994,7 +999,7 @@ def calculate_qad(
 
 def calculate_lab_dysfunction(
     con: duckdb.DuckDBPyConnection,
-    hospitalization_ids: List[str],
+    hospitalization_ids: Union[List[str], Cohort],
     config: Dict,
     include_lactate: bool = False,
     verbose: bool = False
@@ -1103,7 +1108,7 @@ def calculate_lab_dysfunction(
 
 def calculate_clinical_interventions(
     con: duckdb.DuckDBPyConnection,
-    hospitalization_ids: List[str],
+    hospitalization_ids: Union[List[str], Cohort],
     config: Dict,
     verbose: bool = False
 ) -> None:
@@ -1494,6 +1499,54 @@ def combine_components_for_ase(
 
     return ase_df
 
+def _rit_keep_mask(
+    hospitalization_ids: pd.Series,
+    onsets: pd.Series,
+    is_hospital: np.ndarray,
+    rit_days: int
+    ) -> np.ndarray:
+    """
+    Which sorted sepsis rows survive the Repeat Infection Timeframe.
+
+    Rows must be sorted by hospitalization, onset and bc_id. Per hospitalization
+    this is the scan "keep a hospital-onset row only if it is more than
+    ``rit_days`` whole days after the last kept onset; always keep
+    community-onset rows and rows without an onset", where every kept row with
+    an onset becomes the last kept onset. The scan is sequential within a
+    hospitalization but independent across them, so it steps through the
+    k-th row of every hospitalization at once: one vectorized step per row of
+    the longest hospitalization instead of one Python step per row.
+    """
+    n = len(onsets)
+    keep = np.ones(n, dtype=bool)
+    if n == 0:
+        return keep
+
+    codes = pd.factorize(hospitalization_ids, use_na_sentinel=False)[0]
+    starts = np.flatnonzero(np.r_[True, codes[1:] != codes[:-1]])
+    group = np.repeat(np.arange(len(starts)), np.diff(np.r_[starts, n]))
+    rank = np.arange(n) - starts[group]
+
+    onset = onsets.to_numpy(dtype="datetime64[ns]")
+    no_onset = np.isnat(onset)
+    onset_ns = onset.view("int64")
+    day_ns = 86_400 * 10**9
+
+    last = np.zeros(len(starts), dtype="int64")
+    has_last = np.zeros(len(starts), dtype=bool)
+    by_rank = np.argsort(rank, kind="stable")
+    bounds = np.r_[0, np.cumsum(np.bincount(rank))]
+    for r in range(len(bounds) - 1):
+        idx = by_rank[bounds[r]:bounds[r + 1]]
+        g = group[idx]
+        # Timedelta.days floors, as does integer division
+        far = ~has_last[g] | ((onset_ns[idx] - last[g]) // day_ns > rit_days)
+        keep[idx] = no_onset[idx] | ~is_hospital[idx] | far
+        moves = keep[idx] & ~no_onset[idx]
+        last[g[moves]] = onset_ns[idx[moves]]
+        has_last[g[moves]] = True
+    return keep
+
 def apply_rit_post_processing(
     df: pd.DataFrame,
     rit_days: int = 14,
@@ -1524,30 +1577,14 @@ def apply_rit_post_processing(
         (all_sepsis["days_since_prev"] > rit_days)  # >14 days gap
     )
 
-    # For hospital-onset, need cumulative tracking - use iterative marking
-    # Actually need more complex logic for "any prior" not just "immediate prior"
-    # Fall back to groupby().apply() which is faster than iterrows()
-
-    def filter_group(g):
-        g = g.sort_values(["ase_onset_w_lactate_dttm", "bc_id"])
-        keep_mask = []
-        last_onset = None
-        for _, row in g.iterrows():
-            onset = row["ase_onset_w_lactate_dttm"]
-            is_hospital = row["type"] == "hospital"
-            if pd.isna(onset) or not is_hospital:
-                keep_mask.append(True)
-                if not pd.isna(onset):
-                    last_onset = onset
-            else:
-                if last_onset is None or (onset - last_onset).days > rit_days:
-                    keep_mask.append(True)
-                    last_onset = onset
-                else:
-                    keep_mask.append(False)
-        return pd.Series(keep_mask, index=g.index)
-
-    keep_mask = all_sepsis.groupby("hospitalization_id", group_keys=False).apply(filter_group)
+    # For hospital-onset, the gap is to the last *kept* onset, not the
+    # immediately prior one, so suppression depends on earlier decisions
+    keep_mask = _rit_keep_mask(
+        all_sepsis["hospitalization_id"],
+        all_sepsis["ase_onset_w_lactate_dttm"],
+        all_sepsis["type"].eq("hospital").fillna(False).to_numpy(dtype=bool),
+        rit_days,
+    )
     sepsis_filtered = all_sepsis[keep_mask].copy()
 
     # Combine back
@@ -1576,6 +1613,262 @@ def apply_rit_post_processing(
 # 8. MAIN COMPUTE FUNCTION - MODIFIED FOR CLIFPY INTEGRATION
 # ==============================================================================
 
+def _compute_ase_on_connection(
+    con: duckdb.DuckDBPyConnection,
+    hospitalization_ids: List[str],
+    config: Dict,
+    apply_rit: bool,
+    rit_only_hospital_onset: bool,
+    include_lactate: bool,
+    verbose: bool
+) -> pd.DataFrame:
+    """Run the ASE pipeline for ``hospitalization_ids`` on one connection."""
+    # Register the cohort once; every table load below semi-joins against it
+    cohort = Cohort(hospitalization_ids)
+
+    # Component A: Presumed Infection
+    process_blood_cultures(con, cohort, config, verbose)
+    calculate_qad(con, cohort, config, verbose)
+    gc.collect()
+    # Component B: Organ Dysfunction
+    calculate_lab_dysfunction(con, cohort, config, include_lactate, verbose)
+    calculate_clinical_interventions(con, cohort, config, verbose)
+    cohort.release()
+    gc.collect()
+    # ASE Determination
+    ase_df = combine_components_for_ase(con, verbose)
+    gc.collect()
+    # Apply RIT if requested
+    if apply_rit:
+        if verbose:
+            print("\n=== Applying RIT Filter ===")
+        ase_df = apply_rit_post_processing(
+            ase_df,
+            rit_days=RIT_DAYS,
+            only_hospital_onset=rit_only_hospital_onset
+        )
+        if verbose:
+            sepsis_count = ase_df['sepsis'].sum()
+            print(f"  ASE episodes after RIT: {sepsis_count}")
+    else:
+        ase_df["episode_id"] = pd.NA
+        ase_df["episode_id"] = ase_df["episode_id"].astype("Int64")
+
+    # Add hospitalizations without blood cultures
+    no_bc_hosps = set(hospitalization_ids) - set(ase_df['hospitalization_id'].unique())
+    if no_bc_hosps:
+        # Create temp table for non-BC hospitalizations
+        no_bc_hosp_list = list(no_bc_hosps)
+        no_bc_hosp_df = pd.DataFrame({'hospitalization_id': no_bc_hosp_list})
+        con.register("no_bc_hosps", no_bc_hosp_df)
+
+        # Query clinical data for non-BC patients
+        no_bc_clinical = con.execute("""
+            -- Vasopressor (first new initiation, excluding OR)
+            WITH vaso AS (
+                SELECT
+                    m.hospitalization_id,
+                    MIN(m.admin_dttm) AS vasopressor_dttm,
+                    FIRST(m.med_category ORDER BY m.admin_dttm) AS vasopressor_name
+                FROM med_continuous m
+                LEFT JOIN adt a ON m.hospitalization_id = a.hospitalization_id
+                    AND m.admin_dttm >= a.in_dttm AND m.admin_dttm < a.out_dttm
+                WHERE m.hospitalization_id IN (SELECT hospitalization_id FROM no_bc_hosps)
+                  AND LOWER(m.med_group) = 'vasoactives'
+                  AND m.med_dose > 0
+                  AND (a.location_category IS NULL OR LOWER(a.location_category) != 'procedural')
+                GROUP BY m.hospitalization_id
+            ),
+
+            -- IMV (first episode)
+            imv AS (
+                SELECT
+                    hospitalization_id,
+                    MIN(recorded_dttm) AS imv_dttm
+                FROM respiratory
+                WHERE hospitalization_id IN (SELECT hospitalization_id FROM no_bc_hosps)
+                  AND LOWER(device_category) = 'imv'
+                GROUP BY hospitalization_id
+            ),
+
+            -- Labs
+            labs_agg AS (
+                SELECT
+                    hospitalization_id,
+                    MIN(CASE WHEN LOWER(lab_category) = 'lactate'
+                             AND COALESCE(lab_value_numeric, TRY_CAST(lab_value AS DOUBLE)) >= 2.0
+                        THEN COALESCE(lab_result_dttm, lab_order_dttm) END) AS lactate_dttm,
+                    MIN(CASE WHEN LOWER(lab_category) = 'platelet_count'
+                             AND COALESCE(lab_value_numeric, TRY_CAST(lab_value AS DOUBLE)) < 100
+                        THEN COALESCE(lab_result_dttm, lab_order_dttm) END) AS thrombocytopenia_dttm,
+                    MIN(CASE WHEN LOWER(lab_category) = 'bilirubin_total'
+                             AND COALESCE(lab_value_numeric, TRY_CAST(lab_value AS DOUBLE)) >= 2.0
+                        THEN COALESCE(lab_result_dttm, lab_order_dttm) END) AS hyperbilirubinemia_dttm
+                FROM labs
+                WHERE hospitalization_id IN (SELECT hospitalization_id FROM no_bc_hosps)
+                  AND LOWER(lab_category) IN ('lactate', 'platelet_count', 'bilirubin_total')
+                GROUP BY hospitalization_id
+            ),
+
+            -- ESRD (use the esrd_patients table that should still exist)
+            esrd AS (
+                SELECT DISTINCT hospitalization_id, 1 AS has_esrd
+                FROM esrd_patients
+                WHERE hospitalization_id IN (SELECT hospitalization_id FROM no_bc_hosps)
+            )
+
+            SELECT
+                h.hospitalization_id,
+                v.vasopressor_dttm,
+                v.vasopressor_name,
+                i.imv_dttm,
+                l.lactate_dttm,
+                l.thrombocytopenia_dttm,
+                l.hyperbilirubinemia_dttm,
+                COALESCE(e.has_esrd, 0) AS has_esrd
+            FROM no_bc_hosps h
+            LEFT JOIN vaso v ON h.hospitalization_id = v.hospitalization_id
+            LEFT JOIN imv i ON h.hospitalization_id = i.hospitalization_id
+            LEFT JOIN labs_agg l ON h.hospitalization_id = l.hospitalization_id
+            LEFT JOIN esrd e ON h.hospitalization_id = e.hospitalization_id
+        """).df()
+
+
+        # Create base dataframe for non-BC patients
+        no_bc_df = no_bc_clinical.copy()
+        no_bc_df['bc_id'] = pd.NA
+        no_bc_df['episode_id'] = pd.NA
+        no_bc_df['type'] = pd.NA
+        no_bc_df['presumed_infection'] = 0
+        no_bc_df['sepsis'] = 0
+        no_bc_df['sepsis_wo_lactate'] = 0
+        no_bc_df['no_sepsis_reason'] = 'no_blood_culture'
+
+        # Add remaining columns as NA
+        for col in ase_df.columns:
+            if col not in no_bc_df.columns:
+                no_bc_df[col] = pd.NA
+
+        ase_df = pd.concat([ase_df, no_bc_df], ignore_index=True)
+
+    # Standardize NA values in no_sepsis_reason
+    ase_df['no_sepsis_reason'] = ase_df['no_sepsis_reason'].replace({np.nan: pd.NA})
+
+    # Select and order final columns
+    final_columns = [
+        "hospitalization_id",
+        "bc_id",
+        "episode_id",
+        "type",
+        "presumed_infection",
+        "sepsis",
+        "sepsis_wo_lactate",
+        "no_sepsis_reason",
+        "blood_culture_dttm",
+        "total_qad",
+        "qad_start_date",
+        "qad_end_date",
+        "first_qad_dttm",
+        "presumed_infection_onset_dttm",
+        "ase_onset_w_lactate_dttm",
+        "ase_first_criteria_w_lactate",
+        "ase_onset_wo_lactate_dttm",
+        "ase_first_criteria_wo_lactate",
+        "vasopressor_dttm",
+        "vasopressor_name",
+        "imv_dttm",
+        "aki_dttm",
+        "hyperbilirubinemia_dttm",
+        "thrombocytopenia_dttm",
+        "lactate_dttm",
+        "has_esrd",
+        "anchor_meds_in_window",
+        "anchor_parenteral_meds_in_window",
+        "run_meds",
+        "final_qad_status"
+    ]
+
+    # Add missing columns with NA values if not present
+    for col in final_columns:
+        if col not in ase_df.columns:
+            ase_df[col] = pd.NA
+
+    # Select final columns
+    ase_results = ase_df[final_columns].copy()
+
+    return ase_results
+
+
+def _ase_batch_worker(payload: Dict) -> pd.DataFrame:
+    """Compute one batch of hospitalizations in a worker process.
+
+    The worker's share of the memory / thread / spill budget is already
+    applied (`run_batches`), so intermediates beyond its memory limit spill
+    to its own temp directory.
+    """
+    con = _acquire_connection(timezone=payload['config']['timezone'])
+    try:
+        return _compute_ase_on_connection(
+            con, payload['hospitalization_ids'], payload['config'], payload['apply_rit'],
+            payload['rit_only_hospital_onset'], payload['include_lactate'], verbose=False
+        )
+    finally:
+        _release_connection(con)
+        gc.collect()
+
+
+def _compute_ase_batched(
+    hospitalization_ids: List[str],
+    config: Dict,
+    cfg: DuckDBResourceConfig,
+    batch_size: int,
+    max_workers: int,
+    max_retries: int,
+    apply_rit: bool,
+    rit_only_hospital_onset: bool,
+    include_lactate: bool,
+    verbose: bool
+) -> pd.DataFrame:
+    """Split the hospitalizations into batches, compute each, concat in batch order.
+
+    Every step of ASE (and RIT) is per hospitalization, so batches share
+    nothing. With ``max_workers > 1`` they run in worker processes, each with
+    its own DuckDB instance and ``1/max_workers`` of ``cfg``.
+    """
+    batches = [hospitalization_ids[i:i + batch_size] for i in range(0, len(hospitalization_ids), batch_size)]
+    if verbose:
+        print(f"Batching: {len(hospitalization_ids)} hospitalizations -> "
+              f"{len(batches)} batches of <={batch_size} ({max_workers} worker(s))")
+
+    if max_workers > 1:
+        batch_func = _ase_batch_worker
+    else:
+        def batch_func(payload):
+            con = _acquire_connection(timezone=config['timezone'], config=cfg)
+            try:
+                return _compute_ase_on_connection(
+                    con, payload['hospitalization_ids'], config, apply_rit,
+                    rit_only_hospital_onset, include_lactate, verbose=False
+                )
+            finally:
+                _release_connection(con)
+                gc.collect()
+
+    payloads = (
+        (i, {
+            'hospitalization_ids': ids, 'config': config, 'apply_rit': apply_rit,
+            'rit_only_hospital_onset': rit_only_hospital_onset, 'include_lactate': include_lactate,
+        })
+        for i, ids in enumerate(batches)
+    )
+    results = {}
+    for i, batch_result in run_batches(batch_func, payloads, max_workers, max_retries, cfg, label='Batch'):
+        results[i] = batch_result
+        if verbose:
+            print(f"  Batch {i + 1}/{len(batches)} complete: {len(batch_result)} rows")
+    return pd.concat([results[i] for i in sorted(results)], ignore_index=True)
+
+
 def compute_ase(
     hospitalization_ids: Union[List[str], None] = None,
     config_path: Union[str, Path, None] = None,
@@ -1585,7 +1878,10 @@ def compute_ase(
     apply_rit: bool = True,
     rit_only_hospital_onset: bool = True,
     include_lactate: bool = False,
-    verbose: bool = True
+    verbose: bool = True,
+    duckdb_config: Optional[DuckDBResourceConfig] = None,
+    max_workers: int = 1,
+    max_retries: int = 2
 ) -> pd.DataFrame:
     """
     Compute CDC Adult Sepsis Event (ASE) for given hospitalizations.
@@ -1612,11 +1908,24 @@ def compute_ase(
         Include lactate ≥2.0 mmol/L as organ dysfunction criterion
     verbose : bool, default=True
         Show detailed progress messages and memory usage
+    duckdb_config : DuckDBResourceConfig, optional
+        DuckDB resource limits (memory, spill directory and size, threads,
+        batching), as for ``calculate_sofa2``. With ``batch_size`` set and
+        more hospitalizations than that, they are processed in batches whose
+        results are concatenated. Default: None (the package-wide limits from
+        ``configure_duckdb``, else DuckDB system defaults).
+    max_workers : int, default=1
+        Run batches in this many worker processes, each with its own DuckDB
+        instance and an even share of ``duckdb_config``. Only used when
+        batching.
+    max_retries : int, default=2
+        Extra attempts per failed batch before the run fails.
 
     Returns
     -------
     pd.DataFrame
-        ASE results with all required columns
+        ASE results with all required columns. When batched, rows are grouped
+        by batch.
     """
     from clifpy.tables import Hospitalization
     
@@ -1650,13 +1959,18 @@ def compute_ase(
         'timezone': timezone
     }
 
-    # Initialize DuckDB
-    con = duckdb.connect(':memory:')
-    con.execute(f"SET TimeZone = '{timezone}'")
+    # Resource limits: same resolution as calculate_sofa2
+    if duckdb_config is not None:
+        cfg = duckdb_config
+    elif get_duckdb_config() is not None:
+        # package-wide limits (configure_duckdb) are already in force
+        cfg = DuckDBResourceConfig(batch_size=get_duckdb_config().batch_size)
+    else:
+        cfg = DuckDBResourceConfig()
 
-    try:
-        # If no hospitalization IDs provided, load all
-        if hospitalization_ids is None:
+    if hospitalization_ids is None:
+        con = _acquire_connection(timezone=timezone, config=cfg)
+        try:
             hosp_all = load_and_register(
                 Hospitalization,
                 config,
@@ -1669,180 +1983,26 @@ def compute_ase(
             hospitalization_ids = hosp_all['hospitalization_id'].unique().tolist()
             drop_tables(con, ['hosp_all'])
             del hosp_all
-
-        # Component A: Presumed Infection
-        process_blood_cultures(con, hospitalization_ids, config, verbose)
-        calculate_qad(con, hospitalization_ids, config, verbose)
-        gc.collect()
-        # Component B: Organ Dysfunction
-        calculate_lab_dysfunction(con, hospitalization_ids, config, include_lactate, verbose)
-        calculate_clinical_interventions(con, hospitalization_ids, config, verbose)
-        gc.collect()
-        # ASE Determination
-        ase_df = combine_components_for_ase(con, verbose)
-        gc.collect()
-        # Apply RIT if requested
-        if apply_rit:
-            if verbose:
-                print("\n=== Applying RIT Filter ===")
-            ase_df = apply_rit_post_processing(
-                ase_df,
-                rit_days=RIT_DAYS,
-                only_hospital_onset=rit_only_hospital_onset
+        finally:
+            _release_connection(con)
+
+    batch_size = cfg.batch_size
+    if batch_size and len(hospitalization_ids) > batch_size:
+        ase_results = _compute_ase_batched(
+            hospitalization_ids, config, cfg, batch_size, max_workers, max_retries,
+            apply_rit, rit_only_hospital_onset, include_lactate, verbose
+        )
+    else:
+        # Initialize DuckDB (pooled private connection, package resource limits)
+        con = _acquire_connection(timezone=timezone, config=cfg)
+        try:
+            ase_results = _compute_ase_on_connection(
+                con, hospitalization_ids, config, apply_rit, rit_only_hospital_onset, include_lactate, verbose
             )
-            if verbose:
-                sepsis_count = ase_df['sepsis'].sum()
-                print(f"  ASE episodes after RIT: {sepsis_count}")
-        else:
-            ase_df["episode_id"] = pd.NA
-            ase_df["episode_id"] = ase_df["episode_id"].astype("Int64")
-
-        # Add hospitalizations without blood cultures
-        no_bc_hosps = set(hospitalization_ids) - set(ase_df['hospitalization_id'].unique())
-        if no_bc_hosps:
-            # Create temp table for non-BC hospitalizations
-            no_bc_hosp_list = list(no_bc_hosps)
-            no_bc_hosp_df = pd.DataFrame({'hospitalization_id': no_bc_hosp_list})
-            con.register("no_bc_hosps", no_bc_hosp_df)
-
-            # Query clinical data for non-BC patients
-            no_bc_clinical = con.execute("""
-                -- Vasopressor (first new initiation, excluding OR)
-                WITH vaso AS (
-                    SELECT
-                        m.hospitalization_id,
-                        MIN(m.admin_dttm) AS vasopressor_dttm,
-                        FIRST(m.med_category ORDER BY m.admin_dttm) AS vasopressor_name
-                    FROM med_continuous m
-                    LEFT JOIN adt a ON m.hospitalization_id = a.hospitalization_id
-                        AND m.admin_dttm >= a.in_dttm AND m.admin_dttm < a.out_dttm
-                    WHERE m.hospitalization_id IN (SELECT hospitalization_id FROM no_bc_hosps)
-                      AND LOWER(m.med_group) = 'vasoactives'
-                      AND m.med_dose > 0
-                      AND (a.location_category IS NULL OR LOWER(a.location_category) != 'procedural')
-                    GROUP BY m.hospitalization_id
-                ),
-
-                -- IMV (first episode)
-                imv AS (
-                    SELECT
-                        hospitalization_id,
-                        MIN(recorded_dttm) AS imv_dttm
-                    FROM respiratory
-                    WHERE hospitalization_id IN (SELECT hospitalization_id FROM no_bc_hosps)
-                      AND LOWER(device_category) = 'imv'
-                    GROUP BY hospitalization_id
-                ),
-
-                -- Labs
-                labs_agg AS (
-                    SELECT
-                        hospitalization_id,
-                        MIN(CASE WHEN LOWER(lab_category) = 'lactate'
-                                 AND COALESCE(lab_value_numeric, TRY_CAST(lab_value AS DOUBLE)) >= 2.0
-                            THEN COALESCE(lab_result_dttm, lab_order_dttm) END) AS lactate_dttm,
-                        MIN(CASE WHEN LOWER(lab_category) = 'platelet_count'
-                                 AND COALESCE(lab_value_numeric, TRY_CAST(lab_value AS DOUBLE)) < 100
-                            THEN COALESCE(lab_result_dttm, lab_order_dttm) END) AS thrombocytopenia_dttm,
-                        MIN(CASE WHEN LOWER(lab_category) = 'bilirubin_total'
-                                 AND COALESCE(lab_value_numeric, TRY_CAST(lab_value AS DOUBLE)) >= 2.0
-                            THEN COALESCE(lab_result_dttm, lab_order_dttm) END) AS hyperbilirubinemia_dttm
-                    FROM labs
-                    WHERE hospitalization_id IN (SELECT hospitalization_id FROM no_bc_hosps)
-                      AND LOWER(lab_category) IN ('lactate', 'platelet_count', 'bilirubin_total')
-                    GROUP BY hospitalization_id
-                ),
-
-                -- ESRD (use the esrd_patients table that should still exist)
-                esrd AS (
-                    SELECT DISTINCT hospitalization_id, 1 AS has_esrd
-                    FROM esrd_patients
-                    WHERE hospitalization_id IN (SELECT hospitalization_id FROM no_bc_hosps)
-                )
-
-                SELECT
-                    h.hospitalization_id,
-                    v.vasopressor_dttm,
-                    v.vasopressor_name,
-                    i.imv_dttm,
-                    l.lactate_dttm,
-                    l.thrombocytopenia_dttm,
-                    l.hyperbilirubinemia_dttm,
-                    COALESCE(e.has_esrd, 0) AS has_esrd
-                FROM no_bc_hosps h
-                LEFT JOIN vaso v ON h.hospitalization_id = v.hospitalization_id
-                LEFT JOIN imv i ON h.hospitalization_id = i.hospitalization_id
-                LEFT JOIN labs_agg l ON h.hospitalization_id = l.hospitalization_id
-                LEFT JOIN esrd e ON h.hospitalization_id = e.hospitalization_id
-            """).df()
-
-
-            # Create base dataframe for non-BC patients
-            no_bc_df = no_bc_clinical.copy()
-            no_bc_df['bc_id'] = pd.NA
-            no_bc_df['episode_id'] = pd.NA
-            no_bc_df['type'] = pd.NA
-            no_bc_df['presumed_infection'] = 0
-            no_bc_df['sepsis'] = 0
-            no_bc_df['sepsis_wo_lactate'] = 0
-            no_bc_df['no_sepsis_reason'] = 'no_blood_culture'
-
-            # Add remaining columns as NA
-            for col in ase_df.columns:
-                if col not in no_bc_df.columns:
-                    no_bc_df[col] = pd.NA
-
-            ase_df = pd.concat([ase_df, no_bc_df], ignore_index=True)
-
-        # Standardize NA values in no_sepsis_reason
-        ase_df['no_sepsis_reason'] = ase_df['no_sepsis_reason'].replace({np.nan: pd.NA})
-
-        # Select and order final columns
-        final_columns = [
-            "hospitalization_id",
-            "bc_id",
-            "episode_id",
-            "type",
-            "presumed_infection",
-            "sepsis",
-            "sepsis_wo_lactate",
-            "no_sepsis_reason",
-            "blood_culture_dttm",
-            "total_qad",
-            "qad_start_date",
-            "qad_end_date",
-            "first_qad_dttm",
-            "presumed_infection_onset_dttm",
-            "ase_onset_w_lactate_dttm",
-            "ase_first_criteria_w_lactate",
-            "ase_onset_wo_lactate_dttm",
-            "ase_first_criteria_wo_lactate",
-            "vasopressor_dttm",
-            "vasopressor_name",
-            "imv_dttm",
-            "aki_dttm",
-            "hyperbilirubinemia_dttm",
-            "thrombocytopenia_dttm",
-            "lactate_dttm",
-            "has_esrd",
-            "anchor_meds_in_window",
-            "anchor_parenteral_meds_in_window",
-            "run_meds",
-            "final_qad_status"
-        ]
-
-        # Add missing columns with NA values if not present
-        for col in final_columns:
-            if col not in ase_df.columns:
-                ase_df[col] = pd.NA
-
-        # Select final columns
-        ase_results = ase_df[final_columns].copy()
-
-    finally:
-        # Cleanups
-        con.close()
-        gc.collect()
+        finally:
+            # Cleanups: wipes the connection's tables and returns it to the pool
+            _release_connection(con)
+            gc.collect()
 
     if verbose:
         print(f"\n{'='*60}")
@@ -147,7 +147,7 @@ def load_config(config_path: Optional[str] = None) -> Dict[str, Any]:
         )
     
     # Validate filetype
-    supported_filetypes = ['csv', 'parquet']
+    supported_filetypes = ['csv', 'parquet', 'arrow']
     if config['filetype'] not in supported_filetypes:
         raise ValueError(
             f"Unsupported filetype '{config['filetype']}' in {config_path}\n"
@@ -383,12 +383,12 @@ def _sql_str(value: str) -> str:
 
 
 def _crosswalk_file_duckdb(input_path, output_path, table_name, crosswalk_path):
-    import duckdb
+    from ._duckdb_helpers import _acquire_connection, _release_connection
 
     crosswalk = load_crosswalk(crosswalk_path)
     permissible_30 = _permissible_map(load_schema(table_name, "3.0"))
 
-    con = duckdb.connect()
+    con = _acquire_connection(timezone=None)
     try:
         reader = (f"read_csv_auto({_sql_str(input_path)})" if _is_csv(input_path)
                   else f"read_parquet({_sql_str(input_path)})")
@@ -422,7 +422,7 @@ def _crosswalk_file_duckdb(input_path, output_path, table_name, crosswalk_path):
         con.execute(f"COPY (SELECT {select} FROM {reader}) TO {_sql_str(output_path)} ({fmt})")
         return report
     finally:
-        con.close()
+        _release_connection(con)
 
 
 def _crosswalk_file_pandas(input_path, output_path, table_name, chunk_size, crosswalk_path):
@@ -16,17 +16,28 @@ docs/tz_dx.md):
 
 - **lazy** (``LazyRelation``) — reads UTC on an isolated connection; convert via
   :func:`fetch_lazy_result` (pandas, tz-aware). ``site_tz=None`` → tz-aware UTC.
+
+Connections come from ``clifpy.utils._duckdb_helpers``: the default connection is
+pinned to UTC once (not re-``SET`` per load) and ``LazyRelation`` borrows a pooled
+private connection that ``close()`` hands back.
 """
 
 import pandas as pd
 import os
+import uuid
 import duckdb
 import pytz
 from typing import Dict, List, Optional, Any, Union, Literal, overload
 from duckdb import DuckDBPyRelation
 import yaml
+import json
 import logging
 from .config import get_config_or_params
+from ._duckdb_helpers import _acquire_connection, _default_connection, _release_connection
+from .table_cache import _source_fingerprint
+from ._filters import (
+    Cohort, _apply_filters_duckdb, _compile_filters_sql, _make_duckdb_registrar, _needs_registration
+)
 
 # Initialize logger for this module
 logger = logging.getLogger('clifpy.utils.io')
@@ -38,6 +49,8 @@ class LazyRelation:
 
     This class holds both the DuckDB relation and its connection, ensuring
     the connection isn't garbage collected while you're still using the relation.
+    The connection is borrowed from the package connection pool and handed
+    back (wiped) by ``close()``.
 
     All DuckDB relation methods are proxied through, so you can use it
     exactly like a regular DuckDB relation.
@@ -74,17 +87,14 @@ class LazyRelation:
         return attr
 
     def close(self):
-        """Close the underlying connection.
+        """Release the underlying connection back to the pool.
 
         Call this explicitly when you're done. Note: the connection is shared
         between this LazyRelation and any children produced by chained calls
         (e.g. ``rel.filter(...)``), so closing here invalidates all of them.
         """
         if self._connection:
-            try:
-                self._connection.close()
-            except Exception:
-                pass
+            _release_connection(self._connection)
             self._connection = None
 
     def __repr__(self):
@@ -113,6 +123,35 @@ def _cast_id_cols_to_string(df: pd.DataFrame) -> pd.DataFrame:
     return df
 
 
+def _cast_id_cols_to_string_arrow(table):
+    """Arrow counterpart of `_cast_id_cols_to_string`.
+
+    Only non-string ``*_id`` columns are rebuilt; the rest of the table is
+    passed through without copying.
+
+    Parameters
+    ----------
+    table : pa.Table
+        Input Arrow table.
+
+    Returns
+    -------
+    pa.Table
+        Table with ID columns as Arrow strings.
+    """
+    import pyarrow as pa
+
+    for i, field in enumerate(table.schema):
+        if not field.name.endswith("_id") or pa.types.is_string(field.type):
+            continue
+        column = table.column(i)
+        if pa.types.is_floating(field.type):
+            # Float IDs like 123456.0 → "123456"
+            column = column.cast(pa.int64())
+        table = table.set_column(i, field.name, column.cast(pa.string()))
+    return table
+
+
 def close_lazy_relation(rel: Union['LazyRelation', duckdb.DuckDBPyRelation]) -> None:
     """
     Close the connection associated with a lazy relation.
@@ -192,11 +231,118 @@ def load_config(file_path: str) -> Dict[str, Any]:
     return config
 
 
+def _resolve_table_path(table_path: str, table_name: str, table_format_type: str) -> str:
+    """Locate a CLIF table on disk as a single file or a partitioned dataset.
+
+    Resolution order:
+
+    1. ``clif_<table>.<ext>`` — a single file, or a directory of shards
+       (e.g. Spark/DuckDB ``COPY ... PARTITION_BY`` output named like a file).
+    2. ``clif_<table>/`` — a directory of shards, flat or hive-partitioned
+       (``clif_vitals/year=2023/part-0.parquet``).
+
+    Parameters
+    ----------
+    table_path : str
+        Directory containing the CLIF tables.
+    table_name : str
+        Table name without the ``clif_`` prefix (e.g. 'vitals').
+    table_format_type : str
+        File extension ('parquet', 'csv' or 'arrow').
+
+    Returns
+    -------
+    str
+        Path to the file or dataset directory.
+
+    Raises
+    ------
+    FileNotFoundError
+        If neither layout exists.
+    """
+    file_path = os.path.join(table_path, 'clif_' + table_name + '.' + table_format_type)
+    if os.path.exists(file_path):
+        return file_path
+
+    dataset_dir = os.path.join(table_path, 'clif_' + table_name)
+    if os.path.isdir(dataset_dir):
+        return dataset_dir
+
+    raise FileNotFoundError(f"The file {file_path} does not exist in the specified directory.")
+
+
+def _is_dataset_path(file_path: str) -> bool:
+    """True if ``file_path`` is a directory of shards or a glob pattern."""
+    return os.path.isdir(file_path) or any(ch in file_path for ch in '*?[')
+
+
+def _dataset_glob(file_path: str, table_format_type: str) -> str:
+    """Expand a dataset directory to a recursive glob over its shards.
+
+    Files and explicit glob patterns are returned unchanged.
+    """
+    if os.path.isdir(file_path):
+        return os.path.join(file_path, '**', f'*.{table_format_type}')
+    return file_path
+
+
+def _duckdb_scan_expr(file_path: str, table_format_type: str) -> str:
+    """Build the DuckDB table function that reads ``file_path``.
+
+    Single files keep the plain ``parquet_scan('...')`` / ``read_csv_auto('...')``
+    form. Datasets are scanned with ``hive_partitioning`` so that ``WHERE``
+    predicates on partition keys prune whole directories, and predicates on data
+    columns are checked against parquet row-group min/max statistics before any
+    row is decoded. ``union_by_name`` tolerates shards written with slightly
+    different column sets (e.g. a column added in a later extract).
+    """
+    reader = 'parquet_scan' if table_format_type == 'parquet' else 'read_csv_auto'
+    if not _is_dataset_path(file_path):
+        return f"{reader}('{file_path}')"
+    glob = _dataset_glob(file_path, table_format_type)
+    return f"{reader}('{glob}', hive_partitioning = true, union_by_name = true)"
+
+
+def _duckdb_filter_clauses(con, scan_expr: str, filters: Optional[Dict[str, Any]]):
+    """Compile ``filters`` to SQL predicates against ``scan_expr`` on ``con``.
+
+    Frame-valued filters (cohort semi-joins, ``within`` windows) and long ``IN``
+    lists are registered as views on ``con``; their keys are cast to the scanned
+    column types, which are read from the file footer only when such a filter is
+    present. A :class:`Cohort` keeps its view on ``con`` across calls and is not
+    returned for unregistration.
+
+    Returns
+    -------
+    tuple of (list of str, list of str)
+        The predicates to AND together, and the names of the per-call views
+        (unregister them once the query has been materialized).
+    """
+    registered: List[str] = []
+    if not filters:
+        return [], registered
+
+    register = None
+    column_types = None
+    if _needs_registration(filters):
+        schema = con.sql(f"SELECT * FROM {scan_expr}")
+        column_types = {name: str(dtype) for name, dtype in zip(schema.columns, schema.types)}
+        make_view = _make_duckdb_registrar(con)
+
+        def register(table):
+            name = make_view(table)
+            if not isinstance(table, Cohort):
+                registered.append(name)
+            return name
+
+    return _compile_filters_sql(filters, register, column_types), registered
+
+
 @overload
 def load_parquet_with_tz(
     file_path: str,
     columns: Optional[List[str]] = ...,
-    filters: Optional[Dict[str, Union[str, List[str]]]] = ...,
+    filters: Optional[Dict[str, Any]] = ...,
     sample_size: Optional[int] = ...,
     site_tz: Optional[str] = ...,
     verbose: bool = ...,
@@ -209,7 +355,7 @@ def load_parquet_with_tz(
 def load_parquet_with_tz(
     file_path: str,
     columns: Optional[List[str]] = ...,
-    filters: Optional[Dict[str, Union[str, List[str]]]] = ...,
+    filters: Optional[Dict[str, Any]] = ...,
     sample_size: Optional[int] = ...,
     site_tz: Optional[str] = ...,
     verbose: bool = ...,
@@ -222,7 +368,7 @@ def load_parquet_with_tz(
 def load_parquet_with_tz(
     file_path: str,
     columns: Optional[List[str]] = ...,
-    filters: Optional[Dict[str, Union[str, List[str]]]] = ...,
+    filters: Optional[Dict[str, Any]] = ...,
     sample_size: Optional[int] = ...,
     site_tz: Optional[str] = ...,
     verbose: bool = ...,
@@ -234,7 +380,7 @@ def load_parquet_with_tz(
 def load_parquet_with_tz(
     file_path: str,
     columns: Optional[List[str]] = None,
-    filters: Optional[Dict[str, Union[str, List[str]]]] = None,
+    filters: Optional[Dict[str, Any]] = None,
     sample_size: Optional[int] = None,
     site_tz: Optional[str] = None,
     verbose: bool = False,
@@ -247,17 +393,28 @@ def load_parquet_with_tz(
 
     - ``return_rel=True`` returns a bare ``DuckDBPyRelation`` from DuckDB's
       process-wide default connection. No cleanup needed.
-    - ``lazy=True`` returns a ``LazyRelation`` wrapping a per-call connection
-      (isolated lifetime). Call ``rel.close()`` when done.
+    - ``lazy=True`` returns a ``LazyRelation`` wrapping a pooled private
+      connection (isolated lifetime). Call ``rel.close()`` when done.
 
     Parameters
     ----------
     file_path : str
-        Path to the parquet file.
+        Path to the parquet file, a directory of parquet shards (flat or
+        hive-partitioned, e.g. ``clif_vitals/year=2023/part-0.parquet``), or a
+        glob pattern. Datasets are read with ``hive_partitioning`` so filters on
+        partition keys prune directories and filters on data columns skip row
+        groups via parquet min/max statistics.
     columns : list of str, optional
         List of column names to load.
     filters : dict, optional
-        Dictionary of filters to apply (column: value or column: [values]).
+        Filters keyed by column, compiled into the scan's ``WHERE`` clause:
+        ``value`` (equality), ``[values]`` (``IN``), an operator dict such as
+        ``{'>': 5}``, ``{'between': (lo, hi)}``, ``{'not_in': [...]}`` or
+        ``{'is_null': False}``, or a cohort DataFrame / Series / relation
+        (semi-join, no inlined ID list). Pass a :class:`Cohort` to register a
+        large ID set once and reuse it across loads. ``{'within': windows}`` keeps rows whose
+        timestamp falls inside the per-hospitalization
+        ``[start_dttm, end_dttm]`` window. See ``clifpy.utils._filters``.
     sample_size : int, optional
         Number of rows to load (LIMIT clause).
     site_tz : str, optional
@@ -273,7 +430,7 @@ def load_parquet_with_tz(
         If True, return a lazy ``DuckDBPyRelation`` from DuckDB's default
         connection. Default is False.
     lazy : bool, optional
-        If True, return a ``LazyRelation`` wrapping a per-call connection.
+        If True, return a ``LazyRelation`` wrapping a pooled private connection.
         Default is False.
 
     Returns
@@ -300,28 +457,31 @@ def load_parquet_with_tz(
         suffix = " (lazy)" if lazy else (" (return_rel)" if return_rel else "")
         logger.info(f"Loading {filename}{suffix}")
 
-    # ---- LazyRelation path: isolated per-call connection wrapped for lifetime safety ----
+    # ---- LazyRelation path: pooled private connection wrapped for lifetime safety ----
     if lazy:
-        con = duckdb.connect()
-        con.execute("SET timezone = 'UTC';")          # read & return in UTC
-        con.execute("SET pandas_analyze_sample=0;")   # avoid sampling issues
+        con = _acquire_connection(                    # read & return in UTC
+            timezone='UTC', settings={'pandas_analyze_sample': '0'}
+        )
 
         # Build the relation lazily using DuckDB's Relational API
-        rel = con.read_parquet(file_path)
+        if _is_dataset_path(file_path):
+            rel = con.read_parquet(
+                _dataset_glob(file_path, 'parquet'),
+                hive_partitioning=True,
+                union_by_name=True,
+            )
+        else:
+            rel = con.read_parquet(file_path)
+
+        # Apply filters (lazy) -- before projection so filter columns need not be selected
+        clauses, _ = _duckdb_filter_clauses(con, _duckdb_scan_expr(file_path, 'parquet'), filters)
+        for clause in clauses:
+            rel = rel.filter(clause)
 
         # Apply column selection (lazy)
         if columns:
             rel = rel.select(*columns)
 
-        # Apply filters (lazy)
-        if filters:
-            for col, val in filters.items():
-                if isinstance(val, list):
-                    vals = ", ".join([f"'{v}'" for v in val])
-                    rel = rel.filter(f"{col} IN ({vals})")
-                else:
-                    rel = rel.filter(f"{col} = '{val}'")
-
         # Apply limit (lazy)
         if sample_size:
             rel = rel.limit(sample_size)
@@ -329,8 +489,7 @@ def load_parquet_with_tz(
         return LazyRelation(rel, con)
 
     # ---- Default + return_rel path: SQL via process-wide default connection ----
-    duckdb.execute("SET timezone = 'UTC';")          # read & return in UTC
-    duckdb.execute("SET pandas_analyze_sample=0;")   # avoid sampling issues
+    con = _default_connection(timezone='UTC')        # read & return in UTC (pinned once)
 
     # Both paths select raw TIMESTAMPTZ columns -> tz-AWARE. The materialized path
     # relabels UTC -> site_tz in pandas below. The return_rel path returns a bare
@@ -338,27 +497,35 @@ def load_parquet_with_tz(
     # .df() -> aware-UTC, regardless of site_tz (relabel post-.df() if another zone is
     # needed -- a persistent per-site SET on the shared default connection would be
     # clobbered by the next load's UTC re-pin). See docs/tz_dx.md.
+    if return_rel:
+        # Frame filters are joined by reference rather than registered as views,
+        # so the relation does not depend on names another pipeline may drop
+        rel = con.sql(f"SELECT * FROM {_duckdb_scan_expr(file_path, 'parquet')}")
+        rel = _apply_filters_duckdb(rel, filters, con)
+        if columns:
+            rel = rel.select(*columns)
+        if sample_size:
+            rel = rel.limit(sample_size)
+        return rel  # lazy relation, no connection management
+
     sel = "*" if columns is None else ", ".join(columns)
 
-    query = f"SELECT {sel} FROM parquet_scan('{file_path}')"
+    query = f"SELECT {sel} FROM {_duckdb_scan_expr(file_path, 'parquet')}"
 
-    if filters:
-        clauses = []
-        for col, val in filters.items():
-            if isinstance(val, list):
-                vals = ", ".join([f"'{v}'" for v in val])
-                clauses.append(f"{col} IN ({vals})")
-            else:
-                clauses.append(f"{col} = '{val}'")
+    clauses, registered = _duckdb_filter_clauses(
+        con, _duckdb_scan_expr(file_path, 'parquet'), filters
+    )
+    if clauses:
         query += " WHERE " + " AND ".join(clauses)
 
     if sample_size:
         query += f" LIMIT {sample_size}"
 
-    if return_rel:
-        return duckdb.sql(query)  # lazy relation, no connection management
-
-    df = duckdb.sql(query).df()              # tz-aware UTC (default connection at UTC)
+    try:
+        df = con.sql(query).df()             # tz-aware UTC (default connection at UTC)
+    finally:
+        for name in registered:
+            con.unregister(name)
     df = _cast_id_cols_to_string(df)         # cast id columns to string
     if site_tz:
         # relabel UTC -> site_tz in pandas (instant-preserving, tz-aware)
@@ -366,6 +533,111 @@ def load_parquet_with_tz(
     return df
 
 
+def _read_ipc(file_path: str):
+    """Memory-map an Arrow IPC file, or every ``.arrow`` shard under a directory.
+
+    Nothing is decoded here: the returned table points into the mapped file(s),
+    so only the column buffers a later query touches are paged in.
+    """
+    import glob
+    import pyarrow as pa
+
+    if _is_dataset_path(file_path):
+        paths = sorted(glob.glob(_dataset_glob(file_path, 'arrow'), recursive=True))
+        if not paths:
+            raise FileNotFoundError(f"No .arrow files found under {file_path}")
+    else:
+        paths = [file_path]
+    tables = [pa.ipc.open_file(pa.memory_map(path, 'r')).read_all() for path in paths]
+    return tables[0] if len(tables) == 1 else pa.concat_tables(tables, promote_options='default')
+
+
+def load_ipc_with_tz(
+    file_path: str,
+    columns: Optional[List[str]] = None,
+    filters: Optional[Dict[str, Any]] = None,
+    sample_size: Optional[int] = None,
+    site_tz: Optional[str] = None,
+    verbose: bool = False,
+    return_rel: bool = False,
+    lazy: bool = False
+) -> Union[pd.DataFrame, DuckDBPyRelation, 'LazyRelation']:
+    """Load an Arrow IPC (Feather v2) table through a memory map.
+
+    Counterpart of :func:`load_parquet_with_tz` for tables written by
+    :func:`convert_to_ipc`. The file is memory-mapped and scanned in place by
+    DuckDB, so nothing is decompressed or decoded and load time follows the
+    columns the query touches rather than the file size. Filters, the
+    ``return_rel`` / ``lazy`` modes and the timezone contract are the same as
+    for parquet.
+
+    Parameters
+    ----------
+    file_path : str
+        Path to the ``.arrow`` file or a directory of ``.arrow`` shards.
+    columns, filters, sample_size, site_tz, verbose, return_rel, lazy
+        As for :func:`load_parquet_with_tz`.
+
+    Returns
+    -------
+    pd.DataFrame, DuckDBPyRelation, or LazyRelation
+        As for :func:`load_parquet_with_tz`.
+    """
+    if return_rel and lazy:
+        raise ValueError(
+            "return_rel and lazy are mutually exclusive. "
+            "Use return_rel=True for a bare DuckDBPyRelation (default connection), "
+            "or lazy=True for a LazyRelation wrapping an isolated connection."
+        )
+
+    filename = os.path.basename(file_path)
+    if verbose:
+        suffix = " (lazy)" if lazy else (" (return_rel)" if return_rel else "")
+        logger.info(f"Loading {filename}{suffix}")
+
+    table = _read_ipc(file_path)
+    if lazy:
+        con = _acquire_connection(timezone='UTC', settings={'pandas_analyze_sample': '0'})
+    else:
+        con = _default_connection(timezone='UTC')
+
+    if return_rel:
+        # The relation scans the mapped table and any filter frames by
+        # reference, so it needs no views that another pipeline could drop
+        rel = _apply_filters_duckdb(con.from_arrow(table), filters, con)
+        if columns:
+            rel = rel.select(*columns)
+        if sample_size:
+            rel = rel.limit(sample_size)
+        return rel
+
+    # The mapped table is registered as a view; DuckDB pushes the projection
+    # into the Arrow scan, so untouched columns are never paged in
+    source = f"_clif_ipc_{uuid.uuid4().hex[:12]}"
+    con.register(source, table)
+
+    sel = "*" if columns is None else ", ".join(columns)
+    query = f"SELECT {sel} FROM {source}"
+    clauses, registered = _duckdb_filter_clauses(con, source, filters)
+    if clauses:
+        query += " WHERE " + " AND ".join(clauses)
+    if sample_size:
+        query += f" LIMIT {sample_size}"
+
+    if lazy:
+        return LazyRelation(con.sql(query), con)   # views dropped on close()
+
+    try:
+        df = con.sql(query).df()             # tz-aware UTC (default connection at UTC)
+    finally:
+        for name in registered + [source]:
+            con.unregister(name)
+    df = _cast_id_cols_to_string(df)
+    if site_tz:
+        df = convert_datetime_columns_to_site_tz(df, site_tz, verbose)
+    return df
+
+
 @overload
 def load_data(
     table_name: str,
@@ -373,7 +645,7 @@ def load_data(
     table_format_type: Optional[str] = ...,
     sample_size: Optional[int] = ...,
     columns: Optional[List[str]] = ...,
-    filters: Optional[Dict[str, Union[str, List[str]]]] = ...,
+    filters: Optional[Dict[str, Any]] = ...,
     site_tz: Optional[str] = ...,
     verbose: bool = ...,
     return_rel: Literal[False] = ...,
@@ -389,7 +661,7 @@ def load_data(
     table_format_type: Optional[str] = ...,
     sample_size: Optional[int] = ...,
     columns: Optional[List[str]] = ...,
-    filters: Optional[Dict[str, Union[str, List[str]]]] = ...,
+    filters: Optional[Dict[str, Any]] = ...,
     site_tz: Optional[str] = ...,
     verbose: bool = ...,
     return_rel: Literal[True] = ...,
@@ -405,7 +677,7 @@ def load_data(
     table_format_type: Optional[str] = ...,
     sample_size: Optional[int] = ...,
     columns: Optional[List[str]] = ...,
-    filters: Optional[Dict[str, Union[str, List[str]]]] = ...,
+    filters: Optional[Dict[str, Any]] = ...,
     site_tz: Optional[str] = ...,
     verbose: bool = ...,
     return_rel: Literal[False] = ...,
@@ -420,7 +692,7 @@ def load_data(
     table_format_type: Optional[str] = None,
     sample_size: Optional[int] = None,
     columns: Optional[List[str]] = None,
-    filters: Optional[Dict[str, Union[str, List[str]]]] = None,
+    filters: Optional[Dict[str, Any]] = None,
     site_tz: Optional[str] = None,
     verbose: bool = False,
     return_rel: bool = False,
@@ -438,7 +710,7 @@ def load_data(
     - ``return_rel=True`` returns a bare ``DuckDBPyRelation`` from DuckDB's
       process-wide default connection. Parquet only — CSV will warn and fall
       back to a DataFrame.
-    - ``lazy=True`` returns a ``LazyRelation`` wrapping a per-call connection
+    - ``lazy=True`` returns a ``LazyRelation`` wrapping a pooled private connection
       (isolated lifetime). Supported for both parquet and CSV. Call
       ``rel.close()`` when done.
 
@@ -448,16 +720,23 @@ def load_data(
         The name of the table to load (e.g., 'vitals', 'labs', 'adt').
     table_path : str, optional
         Path to the directory containing the data file.
-        If None, loaded from config file's 'data_directory'.
+        If None, loaded from config file's 'data_directory'. The table may be a
+        single ``clif_<table>.<ext>`` file or a partitioned dataset directory
+        (``clif_<table>.<ext>/`` or ``clif_<table>/``, optionally
+        hive-partitioned); see :func:`_resolve_table_path`.
     table_format_type : str, optional
-        Format of the data file ('csv' or 'parquet').
+        Format of the data file ('csv', 'parquet', or 'arrow' for memory-mapped
+        Arrow IPC written by :func:`convert_to_ipc`).
         If None, loaded from config file's 'filetype'.
     sample_size : int, optional
         Number of rows to load.
     columns : list of str, optional
         List of column names to load.
     filters : dict, optional
-        Dictionary of filters to apply.
+        Row filters pushed into the scan -- equality, ``IN`` lists, comparison /
+        ``between`` / ``not_in`` / ``is_null`` operator dicts, cohort semi-joins
+        and ``within`` time windows (see :func:`load_parquet_with_tz`), e.g.
+        ``{'lab_value_numeric': {'>': 0}, 'hospitalization_id': cohort_df}``.
     site_tz : str, optional
         Target timezone for ``*_dttm`` columns (e.g., 'US/Eastern'). If None, loaded
         from config file's 'timezone'. Applied only on the materialized
@@ -470,9 +749,11 @@ def load_data(
     return_rel : bool, optional
         If True, return a lazy ``DuckDBPyRelation`` from DuckDB's default
         connection. Only supported for parquet files. CSV files will log a
-        warning and return a DataFrame instead. Default is False.
+        warning and return a DataFrame instead. Frame-valued filters are held
+        by the relation itself, so it stays valid for as long as it is kept.
+        Default is False.
     lazy : bool, optional
-        If True, return a ``LazyRelation`` wrapping a per-call connection
+        If True, return a ``LazyRelation`` wrapping a pooled private connection
         (isolated lifetime). Supported for both parquet and CSV. Call
         ``rel.close()`` when done. Default is False.
     config_path : str, optional
@@ -530,38 +811,35 @@ def load_data(
         if site_tz is None:
             site_tz = config.get('timezone')
 
-    file_path = os.path.join(table_path, 'clif_' + table_name + '.' + table_format_type)
-
-    if not os.path.exists(file_path):
-        raise FileNotFoundError(f"The file {file_path} does not exist in the specified directory.")
+    file_path = _resolve_table_path(table_path, table_name, table_format_type)
 
     if table_format_type == 'csv':
         if return_rel:
             logger.warning("return_rel=True is not supported for CSV files. Returning DataFrame instead.")
             return_rel = False
 
-        # CSV lazy path: per-call isolated connection wrapped in LazyRelation
+        # CSV lazy path: pooled private connection wrapped in LazyRelation
         if lazy:
             if verbose:
                 logger.info('Loading CSV file (lazy)')
-            con = duckdb.connect()
-            con.execute("SET timezone = 'UTC';")
-            con.execute("SET pandas_analyze_sample=0;")
+            con = _acquire_connection(timezone='UTC', settings={'pandas_analyze_sample': '0'})
+
+            if _is_dataset_path(file_path):
+                rel = con.read_csv(
+                    _dataset_glob(file_path, 'csv'),
+                    hive_partitioning=True,
+                    union_by_name=True,
+                )
+            else:
+                rel = con.read_csv(file_path)
 
-            rel = con.read_csv(file_path)
+            clauses, _ = _duckdb_filter_clauses(con, _duckdb_scan_expr(file_path, 'csv'), filters)
+            for clause in clauses:
+                rel = rel.filter(clause)
 
             if columns:
                 rel = rel.select(*columns)
 
-            if filters:
-                for column, values in filters.items():
-                    if isinstance(values, list):
-                        values_list = ', '.join(["'" + str(v).replace("'", "''") + "'" for v in values])
-                        rel = rel.filter(f"{column} IN ({values_list})")
-                    else:
-                        value = str(values).replace("'", "''")
-                        rel = rel.filter(f"{column} = '{value}'")
-
             if sample_size:
                 rel = rel.limit(sample_size)
 
@@ -570,36 +848,42 @@ def load_data(
         if verbose:
             logger.info('Loading CSV file')
         # For CSV, use DuckDB default connection with timezone conversion
-        duckdb.execute("SET timezone = 'UTC';")
-        duckdb.execute("SET pandas_analyze_sample=0;")
+        con = _default_connection(timezone='UTC')
 
         # Read raw UTC; relabel to site_tz in pandas below -> tz-aware (main's
         # contract; materialized path only -- CSV has no return_rel). See docs/tz_dx.md.
         select_clause = "*" if not columns else ", ".join(columns)
 
-        query = f"SELECT {select_clause} FROM read_csv_auto('{file_path}')"
+        query = f"SELECT {select_clause} FROM {_duckdb_scan_expr(file_path, 'csv')}"
 
         # Apply filters
-        if filters:
-            filter_clauses = []
-            for column, values in filters.items():
-                if isinstance(values, list):
-                    values_list = ', '.join(["'" + str(value).replace("'", "''") + "'" for value in values])
-                    filter_clauses.append(f"{column} IN ({values_list})")
-                else:
-                    value = str(values).replace("'", "''")
-                    filter_clauses.append(f"{column} = '{value}'")
-            if filter_clauses:
-                query += " WHERE " + " AND ".join(filter_clauses)
+        filter_clauses, registered = _duckdb_filter_clauses(
+            con, _duckdb_scan_expr(file_path, 'csv'), filters
+        )
+        if filter_clauses:
+            query += " WHERE " + " AND ".join(filter_clauses)
 
         if sample_size:
             query += f" LIMIT {sample_size}"
 
-        df = duckdb.sql(query).df()
+        try:
+            df = con.sql(query).df()
+        finally:
+            for name in registered:
+                con.unregister(name)
         if site_tz:
             # relabel UTC -> site_tz in pandas (instant-preserving, tz-aware)
             df = convert_datetime_columns_to_site_tz(df, site_tz, verbose)
 
+    elif table_format_type == 'arrow':
+        result = load_ipc_with_tz(
+            file_path, columns, filters, sample_size, site_tz, verbose,
+            return_rel=return_rel, lazy=lazy,
+        )
+        if return_rel or lazy:
+            return result
+        df = result
+
     elif table_format_type == 'parquet':
         # Pass through both lazy flags to load_parquet_with_tz
         result = load_parquet_with_tz(
@@ -611,7 +895,7 @@ def load_data(
         df = result
 
     else:
-        raise ValueError("Unsupported filetype. Only 'csv' and 'parquet' are supported.")
+        raise ValueError("Unsupported filetype. Only 'csv', 'parquet' and 'arrow' are supported.")
 
     filename = os.path.basename(file_path)
     if verbose:
@@ -724,3 +1008,122 @@ def convert_datetime_columns_to_site_tz(
                 logger.debug(f"Problem columns: {', '.join(problem_cols)}")
 
     return df
+
+
+_IPC_SOURCE_KEY = b'clifpy.source'
+
+
+def _ipc_source_fingerprint(path: str) -> Optional[bytes]:
+    """Source fingerprint stored in a converted ``.arrow`` file, or None if absent/unreadable."""
+    import pyarrow as pa
+
+    if not os.path.exists(path):
+        return None
+    try:
+        with pa.memory_map(path, 'r') as source:
+            metadata = pa.ipc.open_file(source).schema.metadata or {}
+    except (OSError, pa.ArrowInvalid):
+        return None
+    return metadata.get(_IPC_SOURCE_KEY)
+
+
+def convert_to_ipc(
+    tables: Optional[List[str]] = None,
+    data_directory: Optional[str] = None,
+    filetype: Optional[str] = None,
+    output_directory: Optional[str] = None,
+    overwrite: bool = False,
+    rows_per_batch: int = 1_000_000,
+    config_path: Optional[str] = None
+) -> Dict[str, str]:
+    """Write CLIF tables as uncompressed Arrow IPC files for memory-mapped loading.
+
+    A one-time conversion for tables that are opened repeatedly: the resulting
+    ``clif_<table>.arrow`` files load with ``filetype='arrow'`` (``load_data``,
+    ``load_data_polars``, ``BaseTable.from_file``, ``ClifOrchestrator``) by
+    memory-mapping instead of decoding parquet. Data is streamed through
+    DuckDB in record batches, so memory stays bounded by ``rows_per_batch``.
+    Timestamps are stored as they are read (``TIMESTAMPTZ`` as UTC), so every
+    load path returns the same values as from the source.
+
+    Parameters
+    ----------
+    tables : list of str, optional
+        Table names (e.g. ``['vitals', 'labs']``). Default: every ``clif_*``
+        table found in ``data_directory``.
+    data_directory : str, optional
+        Directory with the source tables. Default from config.
+    filetype : str, optional
+        Source format, ``'parquet'`` or ``'csv'``. Default from config.
+    output_directory : str, optional
+        Where to write the ``.arrow`` files. Default: ``data_directory``.
+    overwrite : bool, optional
+        Rewrite files that are up to date with their source. A file is up to
+        date when the size and mtime of every source file match the ones
+        recorded at conversion. Default False.
+    rows_per_batch : int, optional
+        Rows fetched from DuckDB per record batch. Default 1,000,000.
+    config_path : str, optional
+        Path to config file, used when ``data_directory`` / ``filetype`` are not given.
+
+    Returns
+    -------
+    dict
+        Table name -> path of the written (or up-to-date) ``.arrow`` file.
+
+    Examples
+    --------
+    >>> convert_to_ipc(['vitals', 'labs'], '/data/clif', 'parquet')
+    >>> vitals = load_data('vitals', '/data/clif', 'arrow')
+    """
+    import pyarrow as pa
+
+    if data_directory is None or filetype is None:
+        config = get_config_or_params(
+            config_path=config_path, data_directory=data_directory, filetype=filetype
+        )
+        data_directory = config['data_directory']
+        filetype = config['filetype']
+    if filetype not in ('parquet', 'csv'):
+        raise ValueError(f"Unsupported source filetype '{filetype}'. Only 'csv' and 'parquet' can be converted.")
+    output_directory = output_directory or data_directory
+    os.makedirs(output_directory, exist_ok=True)
+
+    if tables is None:
+        tables = sorted({
+            name[len('clif_'):].split('.')[0]
+            for name in os.listdir(data_directory)
+            if name.startswith('clif_') and (name.endswith('.' + filetype) or
+                                             os.path.isdir(os.path.join(data_directory, name)))
+        })
+
+    written = {}
+    for table_name in tables:
+        source = _resolve_table_path(data_directory, table_name, filetype)
+        target = os.path.join(output_directory, f'clif_{table_name}.arrow')
+        fingerprint = json.dumps(_source_fingerprint(source)).encode()
+        if not overwrite and _ipc_source_fingerprint(target) == fingerprint:
+            logger.info(f"{os.path.basename(target)} is up to date")
+            written[table_name] = target
+            continue
+
+        con = _acquire_connection(timezone='UTC')
+        tmp_target = f"{target}.{uuid.uuid4().hex}.tmp"
+        try:
+            reader = con.sql(
+                f"SELECT * FROM {_duckdb_scan_expr(source, filetype)}"
+            ).fetch_record_batch(rows_per_batch)
+            schema = reader.schema.with_metadata({
+                **(reader.schema.metadata or {}), _IPC_SOURCE_KEY: fingerprint,
+            })
+            with pa.OSFile(tmp_target, 'wb') as sink, pa.ipc.new_file(sink, schema) as writer:
+                for batch in reader:
+                    writer.write_batch(batch)
+            os.replace(tmp_target, target)
+        finally:
+            _release_connection(con)
+            if os.path.exists(tmp_target):
+                os.remove(tmp_target)
+        logger.info(f"Wrote {os.path.basename(target)}")
+        written[table_name] = target
+    return written
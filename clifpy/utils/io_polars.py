@@ -14,6 +14,8 @@ from typing import Optional, List, Dict, Union, Any
 import logging
 
 from .datetime_polars import standardize_datetime_columns
+from .io import _resolve_table_path, _is_dataset_path, _dataset_glob
+from ._filters import _apply_filters_polars
 
 logger = logging.getLogger('clifpy.utils.io_polars')
 
@@ -69,12 +71,18 @@ def load_parquet_polars(
     Parameters
     ----------
     file_path : str or Path
-        Path to the parquet file
+        Path to the parquet file, a directory of parquet shards (flat or
+        hive-partitioned, e.g. ``clif_vitals/year=2023/...``), or a glob.
     columns : list of str, optional
         List of column names to load. If None, loads all columns.
     filters : dict, optional
-        Dictionary of column filters to apply.
-        Example: {'hospitalization_id': ['H1', 'H2'], 'lab_category': 'creatinine'}
+        Dictionary of column filters to apply. Filters are pushed into the scan,
+        so hive partition keys prune directories and data columns are checked
+        against row-group statistics. Besides equality and ``IN`` lists, accepts
+        operator dicts (``{'>=': 5}``, ``{'between': (lo, hi)}``, ``{'not_in': [...]}``,
+        ``{'is_null': False}``, ``{'within': windows}``) and cohort frames, which
+        become semi-joins.
+        Example: {'hospitalization_id': ['H1', 'H2'], 'lab_value_numeric': {'>': 0}}
     sample_size : int, optional
         Number of rows to load (applies LIMIT)
     site_tz : str, optional
@@ -110,25 +118,19 @@ def load_parquet_polars(
         logger.info(f"Loading {filename}")
 
     # Start with lazy scan
-    if columns:
-        df = pl.scan_parquet(str(file_path)).select(columns)
+    if _is_dataset_path(str(file_path)):
+        df = pl.scan_parquet(
+            _dataset_glob(str(file_path), 'parquet'),
+            hive_partitioning=True,
+            missing_columns='insert',
+        )
     else:
         df = pl.scan_parquet(str(file_path))
+    # Apply filters (predicate pushdown; semi-joins for cohort frames)
+    df = _apply_filters_polars(df, filters)
 
-    # Apply filters (predicate pushdown)
-    if filters:
-        filter_exprs = []
-        for col, val in filters.items():
-            if isinstance(val, list):
-                filter_exprs.append(pl.col(col).is_in(val))
-            else:
-                filter_exprs.append(pl.col(col) == val)
-
-        if filter_exprs:
-            combined_filter = filter_exprs[0]
-            for expr in filter_exprs[1:]:
-                combined_filter = combined_filter & expr
-            df = df.filter(combined_filter)
+    if columns:
+        df = df.select(columns)
 
     # Apply sample size limit
     if sample_size:
@@ -170,7 +172,8 @@ def load_csv_polars(
     columns : list of str, optional
         List of column names to load. If None, loads all columns.
     filters : dict, optional
-        Dictionary of column filters to apply.
+        Dictionary of column filters to apply (same spec as
+        :func:`load_parquet_polars`).
     sample_size : int, optional
         Number of rows to load (applies LIMIT)
     site_tz : str, optional
@@ -192,26 +195,95 @@ def load_csv_polars(
         logger.info(f"Loading {filename}")
 
     # Start with lazy scan
-    df = pl.scan_csv(str(file_path))
+    if _is_dataset_path(str(file_path)):
+        df = pl.scan_csv(_dataset_glob(str(file_path), 'csv'))
+    else:
+        df = pl.scan_csv(str(file_path))
+
+    # Apply filters
+    df = _apply_filters_polars(df, filters)
 
     # Select columns if specified
     if columns:
         df = df.select(columns)
 
+    # Apply sample size limit
+    if sample_size:
+        df = df.limit(sample_size)
+
+    # Cast ID columns to Utf8
+    df = _cast_id_cols_to_utf8(df)
+
+    # Apply timezone conversion
+    if site_tz:
+        df = standardize_datetime_columns(df, target_timezone=site_tz)
+
+    if verbose:
+        logger.info(f"Data loaded successfully from {filename}")
+
+    if lazy:
+        return df
+    else:
+        return df.collect()
+
+
+def load_ipc_polars(
+    file_path: Union[str, Path],
+    columns: Optional[List[str]] = None,
+    filters: Optional[Dict[str, Any]] = None,
+    sample_size: Optional[int] = None,
+    site_tz: Optional[str] = None,
+    lazy: bool = True,
+    verbose: bool = False
+) -> Union[pl.DataFrame, pl.LazyFrame]:
+    """
+    Load an Arrow IPC (Feather v2) file using Polars, memory-mapped.
+
+    Only the selected columns are read from the map, so opening a converted
+    table (see :func:`clifpy.utils.io.convert_to_ipc`) costs roughly the size
+    of the columns used rather than the file.
+
+    Parameters
+    ----------
+    file_path : str or Path
+        Path to the ``.arrow`` file or a directory of ``.arrow`` shards
+    columns : list of str, optional
+        List of column names to load. If None, loads all columns.
+    filters : dict, optional
+        Dictionary of column filters to apply (same spec as
+        :func:`load_parquet_polars`).
+    sample_size : int, optional
+        Number of rows to load (applies LIMIT)
+    site_tz : str, optional
+        Target timezone for datetime conversion
+    lazy : bool, default=True
+        If True, returns LazyFrame for deferred execution.
+    verbose : bool, default=False
+        If True, log detailed loading messages.
+
+    Returns
+    -------
+    pl.DataFrame or pl.LazyFrame
+        Loaded data with optional filtering and timezone conversion
+    """
+    file_path = Path(file_path)
+    filename = file_path.name
+
+    if verbose:
+        logger.info(f"Loading {filename}")
+
+    # Start with lazy scan (polars memory-maps uncompressed IPC itself)
+    if _is_dataset_path(str(file_path)):
+        df = pl.scan_ipc(_dataset_glob(str(file_path), 'arrow'))
+    else:
+        df = pl.scan_ipc(str(file_path))
+
     # Apply filters
-    if filters:
-        filter_exprs = []
-        for col, val in filters.items():
-            if isinstance(val, list):
-                filter_exprs.append(pl.col(col).is_in(val))
-            else:
-                filter_exprs.append(pl.col(col) == val)
-
-        if filter_exprs:
-            combined_filter = filter_exprs[0]
-            for expr in filter_exprs[1:]:
-                combined_filter = combined_filter & expr
-            df = df.filter(combined_filter)
+    df = _apply_filters_polars(df, filters)
+
+    # Select columns if specified
+    if columns:
+        df = df.select(columns)
 
     # Apply sample size limit
     if sample_size:
@@ -255,15 +327,17 @@ def load_data_polars(
     table_name : str
         The name of the table to load (e.g., 'labs', 'vitals', 'respiratory_support')
     table_path : str or Path
-        Path to the directory containing the data file
+        Path to the directory containing the data file. The table may be a
+        single ``clif_<table>.<ext>`` file or a partitioned dataset directory
+        (``clif_<table>.<ext>/`` or ``clif_<table>/``).
     table_format_type : str
-        Format of the data file ('csv' or 'parquet')
+        Format of the data file ('csv', 'parquet' or 'arrow' for Arrow IPC)
     sample_size : int, optional
         Number of rows to load
     columns : list of str, optional
         List of column names to load
     filters : dict, optional
-        Dictionary of filters to apply.
+        Dictionary of filters to apply (same spec as :func:`load_parquet_polars`).
         Example: {'hospitalization_id': ['H1', 'H2']}
     site_tz : str, optional
         Timezone string for datetime conversion (e.g., 'US/Central')
@@ -306,11 +380,8 @@ def load_data_polars(
     ...     lazy=False  # Collect immediately
     ... )
     """
-    # Construct file path following CLIF naming convention
-    file_path = Path(table_path) / f"clif_{table_name}.{table_format_type}"
-
-    if not file_path.exists():
-        raise FileNotFoundError(f"The file {file_path} does not exist in the specified directory.")
+    # Resolve file or partitioned dataset following CLIF naming convention
+    file_path = Path(_resolve_table_path(str(table_path), table_name, table_format_type))
 
     if table_format_type == 'parquet':
         return load_parquet_polars(
@@ -332,8 +403,18 @@ def load_data_polars(
             lazy=lazy,
             verbose=verbose
         )
+    elif table_format_type == 'arrow':
+        return load_ipc_polars(
+            file_path,
+            columns=columns,
+            filters=filters,
+            sample_size=sample_size,
+            site_tz=site_tz,
+            lazy=lazy,
+            verbose=verbose
+        )
     else:
-        raise ValueError(f"Unsupported filetype '{table_format_type}'. Only 'csv' and 'parquet' are supported.")
+        raise ValueError(f"Unsupported filetype '{table_format_type}'. Only 'csv', 'parquet' and 'arrow' are supported.")
 
 
 def load_clif_table_polars(
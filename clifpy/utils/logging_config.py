@@ -14,9 +14,13 @@ import logging
 import platform
 import sys
 import os
+import threading
+from functools import wraps
 from pathlib import Path
 from typing import Optional
 
+_SETUP_LOCK = threading.Lock()
+
 
 # Emoji mapping for different log levels
 # ASCII-safe fallback for Windows console (cp1252 can't encode emoji)
@@ -50,6 +54,16 @@ class EmojiFormatter(logging.Formatter):
         return super().format(record)
 
 
+def _serialized(func):
+    """Hold ``_SETUP_LOCK`` while ``func`` runs (tables may be set up from several threads)."""
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        with _SETUP_LOCK:
+            return func(*args, **kwargs)
+    return wrapper
+
+
+@_serialized
 def setup_logging(
     output_directory: Optional[str] = None,
     level: int = logging.INFO,
@@ -13,6 +13,10 @@ from typing import Optional, List, Dict, Any
 from pathlib import Path
 import logging
 
+from clifpy.utils._duckdb_helpers import pooled_connection
+
+_ID_COLS = ['hospitalization_id', 'organism_id']
+
 
 def calculate_mdro_flags(
     culture,  # MicrobiologyCulture table object
@@ -101,11 +105,6 @@ def calculate_mdro_flags(
     ...     cohort=cohort_df
     ... )
     """
-    logger = logging.getLogger(__name__)
-
-    # -------------------------------------------------------------------------
-    # 1. Load Configuration
-    # -------------------------------------------------------------------------
     config = _load_mdro_config(config_path)
 
     if organism_name not in config['organisms']:
@@ -115,13 +114,94 @@ def calculate_mdro_flags(
             f"Available organisms: {available_organisms}"
         )
 
-    organism_config = config['organisms'][organism_name]
+    return _calculate_flags(
+        culture, susceptibility, config, [organism_name], cohort, hospitalization_ids
+    )[organism_name]
+
+
+def calculate_all_mdro_flags(
+    culture,  # MicrobiologyCulture table object
+    susceptibility,  # MicrobiologySusceptibility table object
+    organisms: Optional[List[str]] = None,
+    cohort: Optional[pd.DataFrame] = None,
+    hospitalization_ids: Optional[List[str]] = None,
+    config_path: Optional[str] = None
+) -> Dict[str, pd.DataFrame]:
+    """
+    Calculate MDRO flags for every configured organism in a single pass.
+
+    Culture and susceptibility are filtered and joined once for all
+    organisms, and the resistant-group / resistant-agent counts behind the
+    MDR, XDR, PDR and DTR flags are computed for every isolate of every
+    organism in one DuckDB aggregation. Each organism's result is the same
+    as `calculate_mdro_flags` returns for it.
+
+    Parameters
+    ----------
+    culture : MicrobiologyCulture
+        Microbiology culture table (see `calculate_mdro_flags`).
+    susceptibility : MicrobiologySusceptibility
+        Antimicrobial susceptibility table (see `calculate_mdro_flags`).
+    organisms : List[str], optional
+        Organisms to calculate, as named in the configuration. Default: all
+        organisms in the configuration.
+    cohort : pd.DataFrame, optional
+        DataFrame with columns: hospitalization_id, start_dttm, end_dttm.
+    hospitalization_ids : List[str], optional
+        Specific hospitalization IDs to filter for.
+    config_path : str, optional
+        Path to mdro.yaml configuration file. Default: clifpy/data/mdro.yaml
+
+    Returns
+    -------
+    Dict[str, pd.DataFrame]
+        Organism name -> wide DataFrame as returned by `calculate_mdro_flags`.
+
+    Raises
+    ------
+    ValueError
+        If an organism is not found in the configuration
+        If required columns are missing from input tables
+
+    Examples
+    --------
+    >>> flags = calculate_all_mdro_flags(culture, susceptibility)
+    >>> flags['pseudomonas_aeruginosa']['MDR'].sum()
+    """
+    config = _load_mdro_config(config_path)
+    if organisms is None:
+        organisms = list(config['organisms'])
+    unknown = [o for o in organisms if o not in config['organisms']]
+    if unknown:
+        available_organisms = ', '.join(config['organisms'].keys())
+        raise ValueError(
+            f"Organism(s) {unknown} not found in configuration. "
+            f"Available organisms: {available_organisms}"
+        )
+    return _calculate_flags(culture, susceptibility, config, organisms, cohort, hospitalization_ids)
+
+
+def _empty_result() -> pd.DataFrame:
+    return pd.DataFrame(columns=_ID_COLS)
+
+
+def _calculate_flags(
+    culture,
+    susceptibility,
+    config: Dict[str, Any],
+    organisms: List[str],
+    cohort: Optional[pd.DataFrame],
+    hospitalization_ids: Optional[List[str]]
+) -> Dict[str, pd.DataFrame]:
+    """Flag every isolate of ``organisms``; one result DataFrame per organism."""
+    logger = logging.getLogger(__name__)
+    results = {organism: _empty_result() for organism in organisms}
 
     # -------------------------------------------------------------------------
-    # 2. Extract DataFrames and Validate Columns
+    # 1. Extract DataFrames and Validate Columns
     # -------------------------------------------------------------------------
-    culture_df = culture.df.copy()
-    susceptibility_df = susceptibility.df.copy()
+    culture_df = culture.df
+    susceptibility_df = susceptibility.df
 
     # Validate required columns
     required_culture_cols = ['organism_id', 'hospitalization_id', 'organism_category']
@@ -139,15 +219,14 @@ def calculate_mdro_flags(
         )
 
     # -------------------------------------------------------------------------
-    # 3. Filter Culture Table First
+    # 2. Filter Culture Table First (all requested organisms at once)
     # -------------------------------------------------------------------------
-    # Start by filtering culture for the specified organism
-    culture_filtered = culture_df[culture_df['organism_category'] == organism_name].copy()
-    logger.info(f"Filtered culture to {organism_name}: {len(culture_filtered)} rows")
+    culture_filtered = culture_df[culture_df['organism_category'].isin(organisms)].copy()
+    logger.info(f"Filtered culture to {organisms}: {len(culture_filtered)} rows")
 
     if len(culture_filtered) == 0:
-        logger.warning(f"No data found for organism: {organism_name}")
-        return pd.DataFrame(columns=['hospitalization_id', 'organism_id'])
+        logger.warning(f"No data found for organism(s): {organisms}")
+        return results
 
     # Apply cohort filtering (if provided) - filters culture by date range
     if cohort is not None:
@@ -163,10 +242,10 @@ def calculate_mdro_flags(
 
     if len(culture_filtered) == 0:
         logger.warning("No data remaining after filtering")
-        return pd.DataFrame(columns=['hospitalization_id', 'organism_id'])
+        return results
 
     # -------------------------------------------------------------------------
-    # 4. LEFT JOIN with Susceptibility Data
+    # 3. LEFT JOIN with Susceptibility Data
     # -------------------------------------------------------------------------
     # Use LEFT JOIN to preserve all culture rows even without susceptibility data
     merged_df = pd.merge(
@@ -175,113 +254,204 @@ def calculate_mdro_flags(
         on='organism_id',
         how='left'
     )
-
     logger.info(f"Merged culture and susceptibility data: {len(merged_df)} rows")
 
-    # -------------------------------------------------------------------------
-    # 5. Identify Organisms Without Susceptibility Data
-    # -------------------------------------------------------------------------
     # Count organisms without any susceptibility testing
     organisms_without_susc = merged_df[merged_df['antimicrobial_category'].isna()]['organism_id'].nunique()
     if organisms_without_susc > 0:
         logger.info(f"{organisms_without_susc} organism(s) have no susceptibility testing data")
 
     # Filter to only rows with susceptibility data for MDRO calculation
-    merged_df = merged_df[merged_df['antimicrobial_category'].notna()].copy()
-
-    if len(merged_df) == 0:
-        logger.warning("No organisms with susceptibility data found")
-        return pd.DataFrame(columns=['hospitalization_id', 'organism_id'])
+    merged_df = merged_df[merged_df['antimicrobial_category'].notna()]
 
     # -------------------------------------------------------------------------
-    # 6. Map Antimicrobial Categories to Groups
+    # 4. Map Antimicrobial Categories to Groups and Flag Resistant Results
     # -------------------------------------------------------------------------
-    antimicrobial_groups = organism_config['antimicrobial_groups']
-    category_to_group = {}
-    for group_name, categories in antimicrobial_groups.items():
-        for category in categories:
-            category_to_group[category] = group_name
-
-    merged_df['antimicrobial_group'] = merged_df['antimicrobial_category'].map(category_to_group)
+    # One (organism, antimicrobial) -> group table; an agent listed in several
+    # groups belongs to the last one, as a per-organism dict would have it
+    group_rows, resistant_rows = [], []
+    for organism in organisms:
+        organism_config = config['organisms'][organism]
+        category_to_group = {}
+        for group_name, categories in organism_config['antimicrobial_groups'].items():
+            for category in categories:
+                category_to_group[category] = group_name
+        group_rows.extend((organism, c, g) for c, g in category_to_group.items())
+        resistant_rows.extend(
+            (organism, c) for c in organism_config.get('resistant_categories', ['non_susceptible', 'intermediate'])
+        )
+    group_map = pd.DataFrame(group_rows, columns=['organism_category', 'antimicrobial_category', 'antimicrobial_group'])
+    resistant_map = pd.DataFrame(resistant_rows, columns=['organism_category', 'susceptibility_category'])
 
-    # -------------------------------------------------------------------------
-    # 6a. Filter to Only Include Antimicrobials Defined in Config
-    # -------------------------------------------------------------------------
-    # Filter to keep ONLY antimicrobials defined in config
+    # Keep ONLY antimicrobials defined in config (inner join keeps row order)
     num_rows_before = len(merged_df)
-    merged_df = merged_df[merged_df['antimicrobial_group'].notna()].copy()
-    num_rows_after = len(merged_df)
-    logger.info(f"Filtered antimicrobials: {num_rows_before} -> {num_rows_after} rows ({num_rows_before - num_rows_after} excluded)")
+    merged_df = merged_df.merge(group_map, on=['organism_category', 'antimicrobial_category'], how='inner')
+    logger.info(f"Filtered antimicrobials: {num_rows_before} -> {len(merged_df)} rows "
+                f"({num_rows_before - len(merged_df)} excluded)")
 
-    # -------------------------------------------------------------------------
-    # 7. Identify Resistant Results
-    # -------------------------------------------------------------------------
-    resistant_categories = organism_config.get('resistant_categories', ['non_susceptible', 'intermediate'])
-    merged_df['is_resistant'] = merged_df['susceptibility_category'].isin(resistant_categories)
+    resistant_key = pd.MultiIndex.from_frame(resistant_map.drop_duplicates())
+    merged_df['is_resistant'] = pd.MultiIndex.from_frame(
+        merged_df[['organism_category', 'susceptibility_category']]
+    ).isin(resistant_key)
 
     # -------------------------------------------------------------------------
-    # 7a. Check for Missing Antimicrobials (Data Quality)
+    # 5. Resistance Counts for Every Isolate of Every Organism (set-based)
     # -------------------------------------------------------------------------
-    _check_missing_antimicrobials(merged_df, organism_config, organism_name)
+    merged_df['_isolate'] = merged_df.groupby(['organism_category'] + _ID_COLS, sort=False).ngroup()
+    counts = _isolate_resistance_counts(merged_df, config, organisms)
 
     # -------------------------------------------------------------------------
-    # 8. Calculate MDRO Flags for Each (hospitalization_id, organism_id)
+    # 6. Assemble Each Organism's Wide Result
     # -------------------------------------------------------------------------
-    results = []
-    resistance_defs = organism_config['resistance_definitions']
+    for organism in organisms:
+        organism_df = merged_df[merged_df['organism_category'] == organism]
+        if len(organism_df) == 0:
+            logger.warning(f"No organisms with susceptibility data found for {organism}")
+            continue
+        organism_config = config['organisms'][organism]
+        _check_missing_antimicrobials(organism_df, organism_config, organism)
+        results[organism] = _assemble_organism_result(organism_df, counts, organism_config)
+        logger.info(f"Calculated MDRO flags for {len(results[organism])} {organism} cultures")
 
-    for (hosp_id, org_id), group_data in merged_df.groupby(['hospitalization_id', 'organism_id']):
-        flags = _calculate_flags_for_organism(group_data, resistance_defs, antimicrobial_groups)
-        flags['hospitalization_id'] = hosp_id
-        flags['organism_id'] = org_id
-        results.append(flags)
+    return results
 
-    # -------------------------------------------------------------------------
-    # 9. Create Results DataFrame with Wide Format
-    # -------------------------------------------------------------------------
-    if not results:
-        return pd.DataFrame(columns=['hospitalization_id', 'organism_id'])
 
-    # Create flags DataFrame
-    flags_df = pd.DataFrame(results)
+def _isolate_resistance_counts(
+    merged_df: pd.DataFrame,
+    config: Dict[str, Any],
+    organisms: List[str]
+) -> pd.DataFrame:
+    """
+    Per-isolate counts behind every flag, for all organisms in one query.
+
+    Returns one row per ``_isolate`` with ``n_resistant_groups`` (distinct
+    groups with a resistant agent), ``n_resistant_agents`` (distinct resistant
+    agents) and one ``required:<flag column>`` count per
+    ``specific_agents_resistant`` flag (distinct resistant agents among that
+    flag's required agents).
+    """
+    required_rows = []
+    for organism in organisms:
+        for flag_def in config['organisms'][organism]['resistance_definitions'].values():
+            criteria = flag_def['criteria']
+            if criteria['type'] == 'specific_agents_resistant':
+                required_rows.extend(
+                    (organism, flag_def['column_name'], agent) for agent in set(criteria['required_agents'])
+                )
+    required = pd.DataFrame(required_rows, columns=['organism_category', 'column_name', 'antimicrobial_category'])
+    isolates = merged_df.loc[merged_df['_isolate'] >= 0,
+                             ['_isolate', 'organism_category', 'antimicrobial_category',
+                              'antimicrobial_group', 'is_resistant']]
+
+    with pooled_connection() as con:
+        con.register('_mdro_isolates', isolates)
+        con.register('_mdro_required', required)
+        try:
+            counts = con.execute("""
+                SELECT _isolate,
+                       COUNT(DISTINCT antimicrobial_group) FILTER (WHERE is_resistant) AS n_resistant_groups,
+                       COUNT(DISTINCT antimicrobial_category) FILTER (WHERE is_resistant) AS n_resistant_agents
+                FROM _mdro_isolates
+                GROUP BY _isolate
+            """).df()
+            required_counts = con.execute("""
+                SELECT i._isolate, r.column_name,
+                       COUNT(DISTINCT i.antimicrobial_category) AS n_required_resistant
+                FROM _mdro_isolates i
+                JOIN _mdro_required r
+                  ON i.organism_category = r.organism_category
+                 AND i.antimicrobial_category = r.antimicrobial_category
+                WHERE i.is_resistant
+                GROUP BY ALL
+            """).df()
+        finally:
+            con.unregister('_mdro_isolates')
+            con.unregister('_mdro_required')
+
+    counts = counts.set_index('_isolate')
+    if len(required_counts):
+        wide = required_counts.pivot(index='_isolate', columns='column_name', values='n_required_resistant')
+        counts = counts.join(wide.add_prefix('required:'))
+    return counts
+
+
+def _assemble_organism_result(
+    organism_df: pd.DataFrame,
+    counts: pd.DataFrame,
+    organism_config: Dict[str, Any]
+) -> pd.DataFrame:
+    """Flags, agent columns and group columns of one organism, in the output layout."""
+    antimicrobial_groups = organism_config['antimicrobial_groups']
+    resistant_categories = organism_config.get('resistant_categories', ['non_susceptible', 'intermediate'])
+
+    # One row per (hospitalization_id, organism_id), ordered like a sorted groupby
+    keys = (organism_df[_ID_COLS + ['_isolate']][organism_df['_isolate'] >= 0]
+            .drop_duplicates('_isolate')
+            .sort_values(_ID_COLS, kind='stable'))
+    isolate_counts = counts.reindex(keys['_isolate'])
+    n_resistant_groups = isolate_counts['n_resistant_groups'].fillna(0).to_numpy()
+    n_resistant_agents = isolate_counts['n_resistant_agents'].fillna(0).to_numpy()
+
+    all_defined_agents = set()
+    for agents in antimicrobial_groups.values():
+        all_defined_agents.update(agents)
+
+    flags_df = pd.DataFrame({
+        'hospitalization_id': keys['hospitalization_id'].tolist(),
+        'organism_id': keys['organism_id'].tolist(),
+    })
+    for flag_def in organism_config['resistance_definitions'].values():
+        criteria = flag_def['criteria']
+        criteria_type = criteria['type']
+        column_name = flag_def['column_name']
+
+        if criteria_type == 'min_groups_resistant':
+            # MDR: >= min_groups resistant
+            flag = n_resistant_groups >= criteria['min_groups']
+        elif criteria_type == 'max_groups_susceptible':
+            # XDR: resistant to all but <= max_groups_susceptible of the
+            # TOTAL defined groups, not just tested groups
+            flag = n_resistant_groups >= len(antimicrobial_groups) - criteria['max_groups_susceptible']
+        elif criteria_type == 'all_tested_resistant':
+            # PDR: ALL defined agents tested AND resistant; only defined agents
+            # remain after group mapping, so that is a count of resistant agents
+            flag = n_resistant_agents >= len(all_defined_agents)
+        elif criteria_type == 'specific_agents_resistant':
+            # DTR: ALL required agents tested AND resistant
+            column = f'required:{column_name}'
+            n_required = (isolate_counts[column].fillna(0).to_numpy()
+                          if column in isolate_counts.columns else np.zeros(len(keys)))
+            flag = n_required >= len(set(criteria['required_agents']))
+        else:
+            continue
+        flags_df[column_name] = flag.astype(int)
+
+    logger = logging.getLogger(__name__)
 
     # Create antimicrobial columns (wide format with individual susceptibility values)
-    antimicrobial_df = _pivot_susceptibility_data(merged_df, organism_config)
+    antimicrobial_df = _pivot_susceptibility_data(organism_df, organism_config)
     logger.info(f"Created {len(antimicrobial_df.columns) - 2} antimicrobial columns")
 
     # Create group columns (binary 0/1 for each antimicrobial group)
-    group_df = _create_group_columns(merged_df, antimicrobial_groups, resistant_categories)
+    group_df = _create_group_columns(organism_df, antimicrobial_groups, resistant_categories)
     logger.info(f"Created {len(group_df.columns) - 2} antimicrobial group columns")
 
     # Merge all components: flags + antimicrobial columns + group columns
-    result_df = flags_df.merge(
-        antimicrobial_df,
-        on=['hospitalization_id', 'organism_id'],
-        how='left'
-    )
-    result_df = result_df.merge(
-        group_df,
-        on=['hospitalization_id', 'organism_id'],
-        how='left'
-    )
+    result_df = flags_df.merge(antimicrobial_df, on=_ID_COLS, how='left')
+    result_df = result_df.merge(group_df, on=_ID_COLS, how='left')
 
     # Organize columns in logical order:
     # 1. IDs
     # 2. Antimicrobial columns (individual agents)
     # 3. Group columns
     # 4. MDRO flags
-    id_cols = ['hospitalization_id', 'organism_id']
-    flag_cols = [col for col in flags_df.columns if col not in id_cols]
-    group_cols = [col for col in group_df.columns if col not in id_cols]
-    antimicrobial_cols = [col for col in antimicrobial_df.columns if col not in id_cols]
+    flag_cols = [col for col in flags_df.columns if col not in _ID_COLS]
+    group_cols = [col for col in group_df.columns if col not in _ID_COLS]
+    antimicrobial_cols = [col for col in antimicrobial_df.columns if col not in _ID_COLS]
 
     # Final column order
-    column_order = id_cols + sorted(antimicrobial_cols) + sorted(group_cols) + sorted(flag_cols)
-    result_df = result_df[column_order]
-
-    logger.info(f"Calculated MDRO flags for {len(result_df)} organism cultures")
-
-    return result_df
+    column_order = _ID_COLS + sorted(antimicrobial_cols) + sorted(group_cols) + sorted(flag_cols)
+    return result_df[column_order]
 
 
 def _load_mdro_config(config_path: Optional[str] = None) -> Dict[str, Any]:
@@ -478,99 +648,12 @@ def _check_missing_antimicrobials(
         print()
 
 
-def _calculate_flags_for_organism(
-    group_data: pd.DataFrame,
-    resistance_defs: Dict[str, Any],
-    antimicrobial_groups: Dict[str, List[str]]
-) -> Dict[str, int]:
-    """
-    Calculate MDRO flags for a single organism culture.
-
-    Parameters
-    ----------
-    group_data : pd.DataFrame
-        Susceptibility data for one organism (all antimicrobials tested)
-    resistance_defs : dict
-        Resistance definitions from config
-    antimicrobial_groups : dict
-        Antimicrobial group definitions
-
-    Returns
-    -------
-    dict
-        Dictionary with flag column names as keys and 0/1 values
-    """
-    flags = {}
-
-    # Identify which groups have at least one resistant agent
-    resistant_data = group_data[group_data['is_resistant']].copy()
-
-    # Count resistant groups
-    resistant_groups = resistant_data['antimicrobial_group'].dropna().unique()
-    num_resistant_groups = len(resistant_groups)
-
-    # Total number of groups tested (not all groups may be tested)
-    tested_groups = group_data['antimicrobial_group'].dropna().unique()
-    num_tested_groups = len(tested_groups)
-
-    # Total number of agents tested
-    tested_agents = group_data['antimicrobial_category'].unique()
-    num_tested_agents = len(tested_agents)
-
-    # Number of resistant agents
-    resistant_agents = resistant_data['antimicrobial_category'].unique()
-    num_resistant_agents = len(resistant_agents)
-
-    # Calculate each flag
-    for flag_name, flag_def in resistance_defs.items():
-        criteria = flag_def['criteria']
-        criteria_type = criteria['type']
-        column_name = flag_def['column_name']
-
-        if criteria_type == 'min_groups_resistant':
-            # MDR: >= min_groups resistant
-            min_groups = criteria['min_groups']
-            flags[column_name] = 1 if num_resistant_groups >= min_groups else 0
-
-        elif criteria_type == 'max_groups_susceptible':
-            # XDR: resistant to all but <= max_groups_susceptible
-            # Based on TOTAL defined groups, not just tested groups
-            # For P. aeruginosa: 8 total groups, so XDR = resistant to ≥6 groups (8-2)
-            max_groups_susceptible = criteria['max_groups_susceptible']
-            total_defined_groups = len(antimicrobial_groups)
-            min_resistant_for_xdr = total_defined_groups - max_groups_susceptible
-            flags[column_name] = 1 if num_resistant_groups >= min_resistant_for_xdr else 0
-
-        elif criteria_type == 'all_tested_resistant':
-            # PDR: ALL defined agents must be tested AND all must be resistant
-            # Get all defined antimicrobials from config
-            all_defined_agents = set()
-            for group_name, agents in antimicrobial_groups.items():
-                all_defined_agents.update(agents)
-
-            # Check if ALL defined agents were tested
-            all_defined_tested = all_defined_agents.issubset(tested_agents)
-
-            # Check if ALL defined agents are resistant
-            all_defined_resistant = all_defined_agents.issubset(resistant_agents)
-
-            # PDR = 1 only if ALL defined agents are tested AND resistant
-            flags[column_name] = 1 if (all_defined_tested and all_defined_resistant) else 0
-
-        elif criteria_type == 'specific_agents_resistant':
-            # DTR: ALL required agents must be tested AND all must be resistant
-            required_agents = set(criteria['required_agents'])
-
-            # Check if ALL required agents were tested
-            all_required_tested = required_agents.issubset(tested_agents)
-
-            # Check if ALL required agents are resistant
-            all_required_resistant = required_agents.issubset(resistant_agents)
-
-            # DTR = 1 only if ALL required agents are tested AND resistant
-            flags[column_name] = 1 if (all_required_tested and all_required_resistant) else 0
-
-    return flags
+_SUSCEPTIBILITY_PRIORITY = {
+    'non_susceptible': 1,
+    'intermediate': 2,
+    'susceptible': 3,
+    'NA': 4
+}
 
 
 def _prioritize_susceptibility(susceptibility_value: str) -> int:
@@ -590,15 +673,8 @@ def _prioritize_susceptibility(susceptibility_value: str) -> int:
     int
         Priority rank (1 = highest priority/most resistant)
     """
-    priority_map = {
-        'non_susceptible': 1,
-        'intermediate': 2,
-        'susceptible': 3,
-        'NA': 4
-    }
-
     # Default to lowest priority for unknown values
-    return priority_map.get(susceptibility_value, 5)
+    return _SUSCEPTIBILITY_PRIORITY.get(susceptibility_value, 5)
 
 
 def _pivot_susceptibility_data(
@@ -629,7 +705,9 @@ def _pivot_susceptibility_data(
     """
     # Add priority column for handling duplicates
     merged_df = merged_df.copy()
-    merged_df['_priority'] = merged_df['susceptibility_category'].apply(_prioritize_susceptibility)
+    merged_df['_priority'] = (
+        merged_df['susceptibility_category'].astype(object).map(_SUSCEPTIBILITY_PRIORITY).fillna(5).astype(int)
+    )
 
     # Sort by priority (lower = more resistant) to handle duplicates
     merged_df = merged_df.sort_values('_priority')
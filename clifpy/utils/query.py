@@ -1,7 +1,7 @@
 import pandas as pd
 from typing import List, Dict
 import duckdb
-from .io import load_data, load_config
+from .io import Cohort, load_data, load_config
 
 
 # ref:
@@ -104,7 +104,7 @@ def lookup_extremal_values_in_long_table(
     config = load_config('config/config.yaml')
     df = load_data(
         table_name, config['tables_path'], config['filetype'], 
-        filters={'hospitalization_id': ids_w_dttm['hospitalization_id'].tolist()}
+        filters={'hospitalization_id': Cohort(ids_w_dttm['hospitalization_id'])}
         )
     
     categories_sql = ', '.join([f"'{cat}'" for cat in categories])
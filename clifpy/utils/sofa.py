@@ -1,8 +1,10 @@
 import pandas as pd
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Union
 import duckdb
 import logging
 
+from .wide_dataset import _is_wide_dataset_path, iter_wide_partitions, read_wide_manifest
+
 # Set up logging - use centralized logger
 logger = logging.getLogger('clifpy.utils.sofa')
 
@@ -212,8 +214,60 @@ def _fill_na_scores(
     sofa_df[subscore_columns] = sofa_df[subscore_columns].fillna(0)
     return sofa_df
 
-def compute_sofa(
+def _combine_extremal_values(
+    partial_df: pd.DataFrame,
+    id_name: str
+) -> pd.DataFrame:
+    """
+    Combine per-partition extremal values into one row per ID.
+
+    MAX/MIN are decomposable, so the worst value over a whole ID is the worst of
+    its per-partition worst values (an ID may span partitions when grouping by
+    encounter_block).
+    """
+    q = f"""
+    FROM partial_df
+    SELECT {id_name}
+        , MAX(COLUMNS({MAX_ITEMS}))
+        , MIN(COLUMNS({MIN_ITEMS}))
+        , device_rank: MIN(device_rank)
+    GROUP BY {id_name}
+    """
+    return duckdb.sql(q).df()
+
+def _prepare_wide_df(
     wide_df: pd.DataFrame,
+    cohort_df: Optional[pd.DataFrame],
+    id_name: str,
+    remove_outliers: bool
+) -> pd.DataFrame:
+    """Row-level steps ahead of aggregation: cohort windows, outliers, PaO2 imputation."""
+    if cohort_df is not None:
+        q = f"""
+        FROM wide_df w
+        INNER JOIN cohort_df c
+            ON w.{id_name} = c.{id_name}
+            AND c.start_time <= w.event_time
+            AND c.end_time >= w.event_time
+        SELECT w.*
+        """
+        wide_df = duckdb.sql(q).df()
+    
+    if remove_outliers:
+        q = f"""
+        FROM wide_df
+        SELECT * REPLACE (
+            CASE WHEN po2_arterial BETWEEN 0 AND 700 THEN po2_arterial END AS po2_arterial,
+            CASE WHEN fio2_set BETWEEN 0.21 AND 1 THEN fio2_set END AS fio2_set,
+            CASE WHEN spo2 BETWEEN 50 AND 100 THEN spo2 END AS spo2
+        )
+        """
+        wide_df = duckdb.sql(q).df()
+
+    return _impute_pao2_from_spo2(wide_df)
+
+def compute_sofa(
+    wide_df: Union[pd.DataFrame, str],
     cohort_df: Optional[pd.DataFrame] = None,
     extremal_type: str = 'worst',
     id_name: str = 'encounter_block',
@@ -227,7 +281,11 @@ def compute_sofa(
     (e.g., 'norepinephrine_mcg_kg_min' rather than raw 'norepinephrine').
 
     Parameters:
-        wide_df: Wide dataset containing all required SOFA variables
+        wide_df: Wide dataset containing all required SOFA variables, or the
+                 directory / manifest path of a partitioned wide dataset
+                 (create_wide_dataset(..., output_format='parquet_dataset')).
+                 A partitioned dataset is scored one partition at a time,
+                 reading only the SOFA columns.
         cohort_df: Optional DataFrame with columns [id_name, 'start_time', 'end_time']
                   to further filter observations by time windows
         extremal_type: 'worst' (default) or 'latest' (future feature)
@@ -244,45 +302,49 @@ def compute_sofa(
     if extremal_type not in ['worst', 'latest']:
         raise ValueError(f"extremal_type must be 'worst' or 'latest', got '{extremal_type}'")
 
-    if id_name not in wide_df.columns:
+    is_dataset = _is_wide_dataset_path(wide_df)
+    if is_dataset:
+        manifest = read_wide_manifest(wide_df)
+        available_columns = manifest['columns']
+    else:
+        available_columns = wide_df.columns
+
+    if id_name not in available_columns:
         raise ValueError(f"id_name '{id_name}' not found in wide_df columns")
 
-    # Apply cohort time filtering if provided
+    # Validate cohort time filtering if provided
     if cohort_df is not None:
         required_cols = [id_name, 'start_time', 'end_time']
         missing_cols = [col for col in required_cols if col not in cohort_df.columns]
         if missing_cols:
             raise ValueError(f"cohort_df must contain columns: {required_cols}. Missing: {missing_cols}")
-
-        q = f"""
-        FROM wide_df w
-        INNER JOIN cohort_df c
-            ON w.{id_name} = c.{id_name}
-            AND c.start_time <= w.event_time
-            AND c.end_time >= w.event_time
-        SELECT w.*
-        """
-        wide_df = duckdb.sql(q).df()
     
     if remove_outliers:
         logger.info("Removing outliers from wide dataset")
-        q = f"""
-        FROM wide_df
-        SELECT * REPLACE (
-            CASE WHEN po2_arterial BETWEEN 0 AND 700 THEN po2_arterial END AS po2_arterial,
-            CASE WHEN fio2_set BETWEEN 0.21 AND 1 THEN fio2_set END AS fio2_set,
-            CASE WHEN spo2 BETWEEN 50 AND 100 THEN spo2 END AS spo2
+
+    if is_dataset:
+        # Only the SOFA inputs are read; IDs absent from the whole dataset still fail loudly
+        sofa_columns = [id_name, 'event_time', 'device_category'] + [
+            col for col in MAX_ITEMS + MIN_ITEMS if col != 'pao2_imputed'
+        ]
+        columns = [col for col in dict.fromkeys(sofa_columns) if col in available_columns]
+        partials = [
+            _agg_extremal_values_by_id(
+                _prepare_wide_df(part, cohort_df, id_name, remove_outliers), extremal_type, id_name
+            )
+            for part in iter_wide_partitions(wide_df, columns)
+        ]
+        if not partials:
+            raise ValueError(f"No partitions in wide dataset {manifest['directory']}")
+        extremal_df = _combine_extremal_values(pd.concat(partials, ignore_index=True), id_name)
+    else:
+        extremal_df = _agg_extremal_values_by_id(
+            _prepare_wide_df(wide_df, cohort_df, id_name, remove_outliers), extremal_type, id_name
         )
-        """
-        wide_df = duckdb.sql(q).df()
-    
-    sofa_scores = (
-        _impute_pao2_from_spo2(wide_df)
-        .pipe(_agg_extremal_values_by_id, extremal_type, id_name)
-        .pipe(_compute_sofa_from_extremal_values, id_name)
-    )
+
+    sofa_scores = _compute_sofa_from_extremal_values(extremal_df, id_name)
 
     if fill_na_scores_with_zero:
         sofa_scores = _fill_na_scores(sofa_scores)
 
-    return sofa_scores
\ No newline at end of file
+    return sofa_scores
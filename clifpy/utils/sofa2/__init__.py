@@ -6,14 +6,16 @@ scores based on the updated SOFA-2 specification.
 Public API:
     calculate_sofa2: Calculate SOFA-2 scores for a cohort with time windows
     calculate_sofa2_daily: Calculate daily SOFA-2 scores with carry-forward logic
+    calculate_sofa2_daily_incremental: Update daily SOFA-2 scores, scoring only new days
     SOFA2Config: Configuration dataclass for customizing calculation parameters
 """
 
 from ._utils import SOFA2Config
-from ._core import calculate_sofa2, calculate_sofa2_daily
+from ._core import calculate_sofa2, calculate_sofa2_daily, calculate_sofa2_daily_incremental
 
 __all__ = [
     'calculate_sofa2',
     'calculate_sofa2_daily',
+    'calculate_sofa2_daily_incremental',
     'SOFA2Config',
 ]
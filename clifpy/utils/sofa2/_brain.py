@@ -22,10 +22,10 @@ Special rules:
 
 from __future__ import annotations
 
-import duckdb
 from duckdb import DuckDBPyRelation
 
-from ._utils import SOFA2Config, _flag_delirium_drug, _detect_sedation_episodes
+from ._utils import SOFA2Config, _arg_worst_sql, _flag_delirium_drug, _detect_sedation_episodes
+from ._perf import _con
 from clifpy.utils.logging_config import get_logger
 
 logger = get_logger('utils.sofa2.brain')
@@ -91,7 +91,7 @@ def _calculate_brain_subscore(
     )
 
     # Flag windows that have any sedation + episode boundary offsets
-    has_sedation_flag = duckdb.sql(f"""
+    has_sedation_flag = _con().sql(f"""
         FROM sedation_episodes
         SELECT
             {id_name}
@@ -106,7 +106,7 @@ def _calculate_brain_subscore(
     # Step 2: Get all GCS measurements within window (both gcs_total and gcs_motor)
     # =========================================================================
     logger.info("Collecting GCS measurements (gcs_total and gcs_motor) within windows...")
-    gcs_in_window = duckdb.sql(f"""
+    gcs_in_window = _con().sql(f"""
         FROM assessments_rel t
         JOIN cohort_rel c ON
             t.{id_name} = c.{id_name}
@@ -127,7 +127,7 @@ def _calculate_brain_subscore(
     # =========================================================================
     logger.info("Filtering GCS measurements to exclude those during sedation episodes...")
     # A GCS is invalid if it falls within ANY sedation episode's [sedation_start, sedation_end_extended]
-    gcs_with_validity = duckdb.sql(f"""
+    gcs_with_validity = _con().sql(f"""
         FROM gcs_in_window g
         LEFT JOIN sedation_episodes s ON
             g.{id_name} = s.{id_name}
@@ -146,7 +146,7 @@ def _calculate_brain_subscore(
     """)
 
     # Keep only valid GCS
-    valid_gcs = duckdb.sql("""
+    valid_gcs = _con().sql("""
         FROM gcs_with_validity
         SELECT *
         WHERE is_valid = 1
@@ -157,22 +157,23 @@ def _calculate_brain_subscore(
     # =========================================================================
     logger.info("Aggregating worst valid GCS...")
     logger.info(f"deprioritize_gcs_motor={cfg.deprioritize_gcs_motor}")
-    # Aggregate MIN for each type separately
-    gcs_agg_by_type = duckdb.sql(f"""
+    # Aggregate MIN for each type separately; ties on the worst value resolve
+    # to the earliest measurement, so the offset does not depend on row order
+    gcs_agg_by_type = _con().sql(f"""
         FROM valid_gcs
         SELECT
             {id_name}
             , start_dttm
             , MIN(gcs_value) FILTER (WHERE assessment_category = 'gcs_total') AS gcs_total_min
-            , ARG_MIN(dttm_offset, gcs_value) FILTER (WHERE assessment_category = 'gcs_total') AS gcs_total_dttm_offset
+            , {_arg_worst_sql('dttm_offset', 'gcs_value', 'dttm_offset')} FILTER (WHERE assessment_category = 'gcs_total') AS gcs_total_dttm_offset
             , MIN(gcs_value) FILTER (WHERE assessment_category = 'gcs_motor') AS gcs_motor_min
-            , ARG_MIN(dttm_offset, gcs_value) FILTER (WHERE assessment_category = 'gcs_motor') AS gcs_motor_dttm_offset
+            , {_arg_worst_sql('dttm_offset', 'gcs_value', 'dttm_offset')} FILTER (WHERE assessment_category = 'gcs_motor') AS gcs_motor_dttm_offset
         GROUP BY {id_name}, start_dttm
     """)
 
     if cfg.deprioritize_gcs_motor:
         # Fallback-only: prefer gcs_total, use gcs_motor only when gcs_total unavailable
-        gcs_combined = duckdb.sql(f"""
+        gcs_combined = _con().sql(f"""
             FROM gcs_agg_by_type
             SELECT
                 {id_name}
@@ -193,7 +194,7 @@ def _calculate_brain_subscore(
         """)
     else:
         # Both-source: pass through both values; scoring deferred to Step 6
-        gcs_combined = duckdb.sql(f"""
+        gcs_combined = _con().sql(f"""
             FROM gcs_agg_by_type
             SELECT
                 {id_name}
@@ -218,7 +219,7 @@ def _calculate_brain_subscore(
     logger.info("Calculating final brain subscore with footnotes c, d, e...")
     if cfg.deprioritize_gcs_motor:
         # Fallback-only: score based on pre-resolved gcs_min/gcs_type from Step 4
-        brain_score = duckdb.sql(f"""
+        brain_score = _con().sql(f"""
             FROM cohort_rel c
             LEFT JOIN gcs_combined g USING ({id_name}, start_dttm)
             LEFT JOIN has_sedation_flag s USING ({id_name}, start_dttm)
@@ -261,7 +262,7 @@ def _calculate_brain_subscore(
         """)
     else:
         # Both-source: score gcs_total and gcs_motor independently, keep worst
-        brain_score = duckdb.sql(f"""
+        brain_score = _con().sql(f"""
             FROM cohort_rel c
             LEFT JOIN gcs_combined g USING ({id_name}, start_dttm)
             LEFT JOIN has_sedation_flag s USING ({id_name}, start_dttm)
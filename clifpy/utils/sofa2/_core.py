@@ -8,6 +8,12 @@ This module contains the main public functions:
 from __future__ import annotations
 
 import platform
+import shutil
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack, contextmanager
+from pathlib import Path
 
 import pandas as pd
 import polars as pl
@@ -30,6 +36,7 @@ from ._kidney import _calculate_kidney_subscore
 from ._hemo import _calculate_hemo_subscore
 from ._perf import StepTimer, NoOpTimer, _cleanup_temp_tables, _materialize_subscore, _drop_temp_table, _register_temp_table, _with_duckdb_config
 from clifpy.utils._duckdb_config import DuckDBResourceConfig
+from clifpy.utils._duckdb_helpers import _default_connection, _default_cursor, get_duckdb_config
 from clifpy.utils.logging_config import get_logger
 
 logger = get_logger('utils.sofa2.core')
@@ -229,6 +236,129 @@ def _load_crrt_optional(clif_config_path: str | None) -> DuckDBPyRelation:
     return rel
 
 
+_CLIF_TABLES = (
+    'labs', 'vitals', 'assessments', 'cont_meds', 'resp',
+    'crrt', 'ecmo', 'intm_meds', 'output', 'input',
+)
+
+
+def _load_clif_tables(
+    clif_config_path: str | None,
+    id_name: str,
+    id_mapping: pd.DataFrame | DuckDBPyRelation | None,
+) -> dict[str, DuckDBPyRelation]:
+    """Lazily load every CLIF input of SOFA-2, remapped to ``id_name`` if needed.
+
+    Returns a dict keyed by the names in ``_CLIF_TABLES``.
+    """
+    from clifpy import load_data
+
+    logger.info("Loading CLIF tables (vitals, labs, meds, respiratory_support, crrt_therapy)...")
+    labs_rel = load_data('labs', config_path=clif_config_path, return_rel=True,
+        columns=['hospitalization_id', 'lab_category', 'lab_collect_dttm', 'lab_value_numeric'],
+        filters={'lab_category': [
+            'platelet_count', 'bilirubin_total', 'creatinine',
+            'potassium', 'ph_arterial', 'ph_venous',
+            'bicarbonate', 'po2_arterial',
+        ]})
+    crrt_rel = _load_crrt_optional(clif_config_path)
+    assessments_rel = load_data('patient_assessments', config_path=clif_config_path, return_rel=True,
+        columns=['hospitalization_id', 'assessment_category', 'recorded_dttm', 'numerical_value'],
+        filters={'assessment_category': ['gcs_total', 'gcs_motor']})
+    vitals_rel = load_data('vitals', config_path=clif_config_path, return_rel=True,
+        columns=['hospitalization_id', 'vital_category', 'recorded_dttm', 'vital_value'],
+        filters={'vital_category': ['spo2', 'map', 'weight_kg']})
+    cont_meds_rel = load_data('medication_admin_continuous', config_path=clif_config_path, return_rel=True,
+        columns=['hospitalization_id', 'admin_dttm', 'med_category', 'med_dose', 'med_dose_unit', 'mar_action_category'])
+    resp_rel = load_data('respiratory_support', config_path=clif_config_path, return_rel=True,
+        columns=['hospitalization_id', 'recorded_dttm', 'device_category', 'mode_category', 'fio2_set', 'lpm_set'])
+    clif_tables = {
+        'labs': labs_rel,
+        'vitals': vitals_rel,
+        'assessments': assessments_rel,
+        'cont_meds': cont_meds_rel,
+        'resp': resp_rel,
+        'crrt': crrt_rel,
+        'ecmo': _load_ecmo_optional(clif_config_path),
+        'intm_meds': _load_intm_meds_optional(clif_config_path),
+        'output': _load_output_optional(clif_config_path),
+        'input': _load_input_optional(clif_config_path),
+    }
+
+    # Remap CLIF tables when using alternative ID
+    if id_mapping is not None:
+        logger.info(f"Remapping CLIF tables: hospitalization_id -> {id_name}...")
+        clif_tables = {
+            name: _remap_clif_rel(rel, id_name, id_mapping) for name, rel in clif_tables.items()
+        }
+    return clif_tables
+
+
+@contextmanager
+def _preloaded_clif_store(
+    cohort_df: pd.DataFrame,
+    clif_config_path: str | None,
+    *,
+    id_name: str,
+    id_mapping: pd.DataFrame | DuckDBPyRelation | None,
+    temp_directory: str | None,
+):
+    """Scan the CLIF inputs once into a file-backed DuckDB shared by all batches.
+
+    Every table is filtered to the ids of the whole cohort, remapped to
+    ``id_name`` and written sorted by ``id_name``, so the zone maps of each
+    row group cover a narrow id range and a batch's SEMI JOIN only reads the
+    row groups holding its ids. The database file lives under
+    ``temp_directory`` (system temp if None) and is removed on exit.
+
+    Yields
+    ------
+    str
+        Name of the attached catalog holding one table per ``_CLIF_TABLES`` entry.
+    """
+    store_dir = Path(tempfile.mkdtemp(prefix='clifpy_sofa2_', dir=temp_directory))
+    catalog = '_sofa2_clif_store'
+    cohort_ids = cohort_df[[id_name]].drop_duplicates()
+    duckdb.execute(f"ATTACH '{(store_dir / 'clif.duckdb').as_posix()}' AS {catalog}")
+    try:
+        logger.info(f"Preloading CLIF tables for {len(cohort_ids)} ids into {store_dir}...")
+        for tbl_name, rel in _load_clif_tables(clif_config_path, id_name, id_mapping).items():
+            duckdb.execute(f"""
+                CREATE TABLE {catalog}.{tbl_name} AS
+                FROM rel t
+                SEMI JOIN cohort_ids c ON t.{id_name} = c.{id_name}
+                SELECT t.*
+                ORDER BY t.{id_name}
+            """)
+        yield catalog
+    finally:
+        duckdb.execute(f"DETACH {catalog}")
+        shutil.rmtree(store_dir, ignore_errors=True)
+
+
+def _resolve_resource_config(
+    memory_limit: str | None,
+    duckdb_config: DuckDBResourceConfig | None,
+) -> DuckDBResourceConfig:
+    """Pick the DuckDB resource limits for one public SOFA-2 call."""
+    # Backward compat: wrap legacy memory_limit into DuckDBResourceConfig
+    if memory_limit is not None and duckdb_config is None:
+        duckdb_config = DuckDBResourceConfig(memory_limit=memory_limit)
+
+    if duckdb_config is not None:
+        return duckdb_config
+    if get_duckdb_config() is not None:
+        # package-wide limits (configure_duckdb) are already in force
+        return DuckDBResourceConfig(batch_size=get_duckdb_config().batch_size)
+    if platform.system() == 'Windows':
+        cfg = DuckDBResourceConfig.from_system()
+        logger.info("Windows detected: auto-applying resource limits")
+        for line in cfg.summary().splitlines():
+            logger.info(f"  {line}")
+        return cfg
+    return DuckDBResourceConfig()
+
+
 def calculate_sofa2(
     cohort_df: pd.DataFrame | DuckDBPyRelation,
     clif_config_path: str | None = None,
@@ -241,6 +371,8 @@ def calculate_sofa2(
     id_mapping: pd.DataFrame | DuckDBPyRelation | None = None,
     memory_limit: str | None = None,
     duckdb_config: DuckDBResourceConfig | None = None,
+    preload_clif: bool = False,
+    concurrent_subscores: bool = False,
 ) -> pd.DataFrame | DuckDBPyRelation | tuple:
     """
     Calculate SOFA-2 scores for a cohort with time windows.
@@ -252,6 +384,9 @@ def calculate_sofa2(
         One row per scoring window. Windows for the same id_name must be non-overlapping.
         When id_name != 'hospitalization_id' and id_mapping is not provided,
         cohort must also contain 'hospitalization_id' for CLIF table remapping.
+        An optional 'uo_anchor_dttm' column (constant per id_name) starts the
+        urine-output window chain earlier than the first window, so later
+        windows can be scored alone with the predecessors of a full run.
     clif_config_path : str, optional
         Path to CLIF config file for data loading.
     return_rel : bool, default False
@@ -276,7 +411,22 @@ def calculate_sofa2(
         spill to disk instead of exceeding this limit.
     duckdb_config : DuckDBResourceConfig, optional
         DuckDB resource limits (memory, disk, batching). When provided,
-        supersedes ``memory_limit``. Default: None (DuckDB system defaults).
+        supersedes ``memory_limit``. Default: None (the package-wide limits
+        from ``configure_duckdb``, else DuckDB system defaults).
+    preload_clif : bool, default False
+        Only used when the cohort is batched (``duckdb_config.batch_size``).
+        If True, the CLIF tables are scanned once, filtered to the whole
+        cohort and stored sorted by ``id_name`` in a file-backed DuckDB under
+        ``duckdb_config.temp_directory``; each batch then slices that store
+        instead of rescanning the source files. Costs disk space for the
+        cohort's CLIF rows, saves one full scan of every table per batch.
+    concurrent_subscores : bool, default False
+        If True, the six organ subscores are evaluated at the same time, each
+        on its own DuckDB cursor over the shared materialized CLIF inputs, so
+        cores left idle by the light subscores are used. With
+        ``perf_profile`` the timer reports the wall-clock of the whole
+        subscore step plus each subscore's own time. Ignored when dev=True
+        (intermediates must stay on the default connection).
 
     Returns
     -------
@@ -304,19 +454,7 @@ def calculate_sofa2(
             - Hemo: platelet_count, platelet_dttm_offset
         If dev=True: (results, intermediates_dict)
     """
-    # Backward compat: wrap legacy memory_limit into DuckDBResourceConfig
-    if memory_limit is not None and duckdb_config is None:
-        duckdb_config = DuckDBResourceConfig(memory_limit=memory_limit)
-
-    if duckdb_config is not None:
-        cfg = duckdb_config
-    elif platform.system() == 'Windows':
-        cfg = DuckDBResourceConfig.from_system()
-        logger.info("Windows detected: auto-applying resource limits")
-        for line in cfg.summary().splitlines():
-            logger.info(f"  {line}")
-    else:
-        cfg = DuckDBResourceConfig()
+    cfg = _resolve_resource_config(memory_limit, duckdb_config)
 
     with _with_duckdb_config(cfg.memory_limit, cfg.temp_directory, cfg.max_temp_directory_size, cfg.threads):
         # Batching: split large cohorts into chunks to reduce peak memory
@@ -330,19 +468,37 @@ def calculate_sofa2(
                 sofa2_config=sofa2_config, perf_profile=perf_profile,
                 id_name=id_name, id_mapping=id_mapping,
                 batch_size=cfg.batch_size,
+                preload_clif=preload_clif, temp_directory=cfg.temp_directory,
+                concurrent_subscores=concurrent_subscores,
             )
         return _calculate_sofa2_impl(
             cohort_df, clif_config_path, return_rel, dev,
             sofa2_config=sofa2_config, perf_profile=perf_profile,
             id_name=id_name, id_mapping=id_mapping,
+            concurrent_subscores=concurrent_subscores,
         )
 
 
 def _calculate_sofa2_batched(
     cohort_df, clif_config_path, return_rel, dev,
     *, sofa2_config, perf_profile, id_name, id_mapping, batch_size,
+    preload_clif=False, temp_directory=None, concurrent_subscores=False,
 ):
-    """Split cohort into batches, run _calculate_sofa2_impl per batch, concat."""
+    """Split cohort into batches, run _calculate_sofa2_impl per batch, concat.
+
+    With ``preload_clif`` the CLIF tables are scanned once into a sorted,
+    file-backed store (see ``_preloaded_clif_store``) and the cohort is
+    ordered by ``id_name`` so each batch reads a contiguous id range of it.
+    """
+    if preload_clif:
+        if id_name != 'hospitalization_id':
+            cohort_rel = duckdb.sql("SELECT * FROM cohort_df")
+            _validate_id_name(cohort_rel, id_name, id_mapping_provided=id_mapping is not None)
+            if id_mapping is None:
+                # one mapping for the whole cohort, shared by the store and every batch
+                id_mapping = _extract_id_mapping(cohort_rel, id_name).df()
+        cohort_df = cohort_df.sort_values(id_name, kind='stable')
+
     chunks = [cohort_df[i:i + batch_size] for i in range(0, len(cohort_df), batch_size)]
     logger.info(f"Batching: {len(cohort_df)} rows -> {len(chunks)} batches of <={batch_size}")
 
@@ -350,18 +506,26 @@ def _calculate_sofa2_batched(
     last_timer = None
     last_cv_timer = None
 
-    for i, chunk in enumerate(chunks):
-        logger.info(f"Batch {i + 1}/{len(chunks)}: {len(chunk)} rows")
-        out = _calculate_sofa2_impl(
-            chunk, clif_config_path, return_rel=False, dev=False,
-            sofa2_config=sofa2_config, perf_profile=perf_profile,
-            id_name=id_name, id_mapping=id_mapping,
-        )
-        if perf_profile:
-            result, last_timer, last_cv_timer = out
-        else:
-            result = out
-        all_results.append(result)
+    with ExitStack() as stack:
+        clif_store = None
+        if preload_clif:
+            clif_store = stack.enter_context(_preloaded_clif_store(
+                cohort_df, clif_config_path,
+                id_name=id_name, id_mapping=id_mapping, temp_directory=temp_directory,
+            ))
+        for i, chunk in enumerate(chunks):
+            logger.info(f"Batch {i + 1}/{len(chunks)}: {len(chunk)} rows")
+            out = _calculate_sofa2_impl(
+                chunk, clif_config_path, return_rel=False, dev=False,
+                sofa2_config=sofa2_config, perf_profile=perf_profile,
+                id_name=id_name, id_mapping=id_mapping, clif_store=clif_store,
+                concurrent_subscores=concurrent_subscores,
+            )
+            if perf_profile:
+                result, last_timer, last_cv_timer = out
+            else:
+                result = out
+            all_results.append(result)
 
     combined = pd.concat(all_results, ignore_index=True)
 
@@ -372,13 +536,95 @@ def _calculate_sofa2_batched(
     return combined
 
 
+_SUBSCORES = ('brain', 'resp', 'cv', 'liver', 'kidney', 'hemo')
+
+
+def _calculate_subscores_concurrently(
+    cfg: SOFA2Config,
+    *,
+    id_name: str,
+    cv_timer: StepTimer | None,
+) -> tuple[dict[str, DuckDBPyRelation], dict[str, float]]:
+    """Evaluate the six subscores side by side, each on its own DuckDB connection.
+
+    Every subscore reads the shared ``_sofa2_windows`` and ``_clif_*`` tables
+    written by ``_calculate_sofa2_impl`` by name and materializes its result
+    into a shared ``_sofa2_{name}`` table. Five run in threads on cursors of
+    their own (`_default_cursor`); CV runs on the calling thread.
+
+    Returns
+    -------
+    tuple
+        (subscore name -> relation on the default connection,
+         subscore name -> seconds that subscore took in its thread)
+    """
+    # Cursors start with the database default zone; match the caller's session
+    timezone = duckdb.sql("SELECT current_setting('TimeZone')").fetchone()[0]
+
+    def run(name: str) -> float:
+        start = time.perf_counter()
+        con = _default_connection(timezone=timezone)
+        cohort_rel = con.table("_sofa2_windows")
+        t = {tbl_name: con.table(f"_clif_{tbl_name}") for tbl_name in _CLIF_TABLES}
+        if name == 'brain':
+            score = _calculate_brain_subscore(
+                cohort_rel, t['assessments'], t['cont_meds'], t['intm_meds'], cfg, id_name=id_name,
+            )
+        elif name == 'resp':
+            score = _calculate_resp_subscore(
+                cohort_rel, t['resp'], t['labs'], t['vitals'], t['ecmo'], cfg, id_name=id_name,
+            )
+        elif name == 'cv':
+            score = _calculate_cv_subscore(
+                cohort_rel, t['cont_meds'], t['vitals'], t['ecmo'], cfg, id_name=id_name, _timer=cv_timer,
+            )
+        elif name == 'liver':
+            score = _calculate_liver_subscore(cohort_rel, t['labs'], cfg, id_name=id_name)
+        elif name == 'kidney':
+            vitals_rel = t['vitals']
+            weight_rel = con.sql("""
+                FROM vitals_rel
+                SELECT *
+                WHERE vital_category = 'weight_kg' AND vital_value IS NOT NULL
+            """)
+            score = _calculate_kidney_subscore(
+                cohort_rel, t['labs'], t['crrt'], cfg,
+                output_rel=t['output'], input_rel=t['input'], weight_rel=weight_rel,
+                id_name=id_name,
+            )
+        else:
+            score = _calculate_hemo_subscore(cohort_rel, t['labs'], cfg, id_name=id_name)
+        _materialize_subscore(name, score, shared=True)
+        if name == 'cv':
+            for tbl in ["pressor_events_raw", "pressor_events", "epi_ne_wide", "epi_ne_duration"]:
+                _drop_temp_table(tbl)
+        return time.perf_counter() - start
+
+    def run_on_own_cursor(name: str) -> float:
+        with _default_cursor():
+            return run(name)
+
+    # The CV subscore's dose conversion queries DuckDB's default connection
+    # directly, so CV runs here on the caller's connection while the other
+    # five run on worker cursors; no relation crosses between connections
+    workers = [name for name in _SUBSCORES if name != 'cv']
+    with ThreadPoolExecutor(max_workers=len(workers), thread_name_prefix='sofa2') as pool:
+        futures = {name: pool.submit(run_on_own_cursor, name) for name in workers}
+        elapsed = {'cv': run('cv')}
+        elapsed.update({name: future.result() for name, future in futures.items()})
+    return {name: duckdb.table(f"_sofa2_{name}") for name in _SUBSCORES}, elapsed
+
+
 def _calculate_sofa2_impl(
     cohort_df, clif_config_path, return_rel, dev,
-    *, sofa2_config, perf_profile, id_name, id_mapping,
+    *, sofa2_config, perf_profile, id_name, id_mapping, clif_store=None,
+    concurrent_subscores=False,
 ):
-    """Inner implementation of calculate_sofa2 (separated for resource config wrapping)."""
-    from clifpy import load_data
+    """Inner implementation of calculate_sofa2 (separated for resource config wrapping).
 
+    ``clif_store`` names an attached catalog from ``_preloaded_clif_store``;
+    when set, CLIF tables are read from it instead of loaded from source.
+    """
     cfg = sofa2_config or SOFA2Config()
     intermediates = {} if dev else None
     timer = StepTimer() if perf_profile else NoOpTimer()
@@ -386,6 +632,13 @@ def _calculate_sofa2_impl(
     logger.info("Starting SOFA-2 calculation...")
     logger.info(f"Config: {cfg}")
 
+    if concurrent_subscores and dev:
+        logger.info("dev=True: computing subscores sequentially on the default connection")
+    concurrent = concurrent_subscores and not dev
+    # Worker cursors cannot see the default connection's temp tables, so the
+    # inputs they read are regular (still registered, still dropped) tables
+    table_kind = "TABLE" if concurrent else "TEMP TABLE"
+
     # Materialize cohort into DuckDB temp table for optimal join planning.
     # A lazy duckdb.sql() wrapper is insufficient for Polars — DuckDB's Polars
     # scan path lacks statistics, causing nested-loop joins on temporal windows.
@@ -407,47 +660,21 @@ def _calculate_sofa2_impl(
         logger.info(f"Deduplicating cohort to ({id_name}, start_dttm, end_dttm)...")
         cohort_rel = _dedup_cohort(cohort_rel, id_name).df()
 
+    if concurrent:
+        duckdb.execute("CREATE OR REPLACE TABLE _sofa2_windows AS SELECT * FROM cohort_rel")
+        _register_temp_table("_sofa2_windows")
+        cohort_rel = duckdb.table("_sofa2_windows")
+
     # =========================================================================
     # Load CLIF tables (with category predicate pushdown into parquet scan)
     # =========================================================================
-    with timer.step("load_tables"):
-        logger.info("Loading CLIF tables (vitals, labs, meds, respiratory_support, crrt_therapy)...")
-        labs_rel = load_data('labs', config_path=clif_config_path, return_rel=True,
-            columns=['hospitalization_id', 'lab_category', 'lab_collect_dttm', 'lab_value_numeric'],
-            filters={'lab_category': [
-                'platelet_count', 'bilirubin_total', 'creatinine',
-                'potassium', 'ph_arterial', 'ph_venous',
-                'bicarbonate', 'po2_arterial',
-            ]})
-        crrt_rel = _load_crrt_optional(clif_config_path)
-        assessments_rel = load_data('patient_assessments', config_path=clif_config_path, return_rel=True,
-            columns=['hospitalization_id', 'assessment_category', 'recorded_dttm', 'numerical_value'],
-            filters={'assessment_category': ['gcs_total', 'gcs_motor']})
-        vitals_rel = load_data('vitals', config_path=clif_config_path, return_rel=True,
-            columns=['hospitalization_id', 'vital_category', 'recorded_dttm', 'vital_value'],
-            filters={'vital_category': ['spo2', 'map', 'weight_kg']})
-        cont_meds_rel = load_data('medication_admin_continuous', config_path=clif_config_path, return_rel=True,
-            columns=['hospitalization_id', 'admin_dttm', 'med_category', 'med_dose', 'med_dose_unit', 'mar_action_category'])
-        resp_rel = load_data('respiratory_support', config_path=clif_config_path, return_rel=True,
-            columns=['hospitalization_id', 'recorded_dttm', 'device_category', 'mode_category', 'fio2_set', 'lpm_set'])
-        ecmo_rel = _load_ecmo_optional(clif_config_path)
-        intm_meds_rel = _load_intm_meds_optional(clif_config_path)
-        output_rel = _load_output_optional(clif_config_path)
-        input_rel = _load_input_optional(clif_config_path)
-
-    # Remap CLIF tables when using alternative ID
-    if id_mapping is not None:
-        logger.info(f"Remapping CLIF tables: hospitalization_id -> {id_name}...")
-        labs_rel = _remap_clif_rel(labs_rel, id_name, id_mapping)
-        crrt_rel = _remap_clif_rel(crrt_rel, id_name, id_mapping)
-        assessments_rel = _remap_clif_rel(assessments_rel, id_name, id_mapping)
-        vitals_rel = _remap_clif_rel(vitals_rel, id_name, id_mapping)
-        cont_meds_rel = _remap_clif_rel(cont_meds_rel, id_name, id_mapping)
-        resp_rel = _remap_clif_rel(resp_rel, id_name, id_mapping)
-        ecmo_rel = _remap_clif_rel(ecmo_rel, id_name, id_mapping)
-        intm_meds_rel = _remap_clif_rel(intm_meds_rel, id_name, id_mapping)
-        output_rel = _remap_clif_rel(output_rel, id_name, id_mapping)
-        input_rel = _remap_clif_rel(input_rel, id_name, id_mapping)
+    if clif_store is None:
+        with timer.step("load_tables"):
+            clif_tables = _load_clif_tables(clif_config_path, id_name, id_mapping)
+    else:
+        # Batch of a preloaded run: slice the stored, already remapped tables
+        # instead of rescanning the source files
+        clif_tables = {name: duckdb.sql(f"FROM {clif_store}.{name}") for name in _CLIF_TABLES}
 
     # =========================================================================
     # Materialize CLIF tables filtered to cohort (Phase 1+2 optimization)
@@ -460,22 +687,10 @@ def _calculate_sofa2_impl(
     # ~99% for small cohorts (n=100 out of 10K hospitalizations).
     with timer.step("materialize_clif"):
         logger.info("Materializing CLIF tables (filtered to cohort)...")
-        clif_tables = {
-            'labs': labs_rel,
-            'vitals': vitals_rel,
-            'assessments': assessments_rel,
-            'cont_meds': cont_meds_rel,
-            'resp': resp_rel,
-            'crrt': crrt_rel,
-            'ecmo': ecmo_rel,
-            'intm_meds': intm_meds_rel,
-            'output': output_rel,
-            'input': input_rel,
-        }
         for tbl_name, rel in clif_tables.items():
             table_id = f"_clif_{tbl_name}"
             duckdb.execute(f"""
-                CREATE OR REPLACE TEMP TABLE {table_id} AS
+                CREATE OR REPLACE {table_kind} {table_id} AS
                 FROM rel t
                 SEMI JOIN cohort_rel c ON t.{id_name} = c.{id_name}
                 SELECT t.*
@@ -503,105 +718,114 @@ def _calculate_sofa2_impl(
     # =========================================================================
     # Calculate subscores
     # =========================================================================
-    logger.info("Calculating all 6 organ subscores in sequence...")
-
-    # Brain subscore
     cv_timer = StepTimer() if perf_profile else None
-    with timer.step("brain"):
-        if dev:
-            brain_score, brain_intermediates = _calculate_brain_subscore(
-                cohort_rel, assessments_rel, cont_meds_rel, intm_meds_rel, cfg,
-                dev=True, id_name=id_name,
-            )
-            intermediates.update({f'brain_{k}': v for k, v in brain_intermediates.items()})
-            intermediates['brain_score'] = brain_score
-        else:
-            brain_score = _calculate_brain_subscore(
-                cohort_rel, assessments_rel, cont_meds_rel, intm_meds_rel, cfg,
-                id_name=id_name,
-            )
-        brain_score = _materialize_subscore("brain", brain_score)
-
-    # Respiratory subscore
-    with timer.step("resp"):
-        if dev:
-            resp_score, resp_intermediates = _calculate_resp_subscore(
-                cohort_rel, resp_rel, labs_rel, vitals_rel, ecmo_rel, cfg,
-                dev=True, id_name=id_name,
-            )
-            intermediates.update({f'resp_{k}': v for k, v in resp_intermediates.items()})
-            intermediates['resp_score'] = resp_score
-        else:
-            resp_score = _calculate_resp_subscore(
-                cohort_rel, resp_rel, labs_rel, vitals_rel, ecmo_rel, cfg,
-                id_name=id_name,
-            )
-        resp_score = _materialize_subscore("resp", resp_score)
-
-    # Cardiovascular subscore
-    with timer.step("cv"):
-        if dev:
-            cv_score, cv_intermediates = _calculate_cv_subscore(
-                cohort_rel, cont_meds_rel, vitals_rel, ecmo_rel, cfg,
-                dev=True, id_name=id_name, _timer=cv_timer,
-            )
-            intermediates.update({f'cv_{k}': v for k, v in cv_intermediates.items()})
-            intermediates['cv_score'] = cv_score
-        else:
-            cv_score = _calculate_cv_subscore(
-                cohort_rel, cont_meds_rel, vitals_rel, ecmo_rel, cfg,
-                id_name=id_name, _timer=cv_timer,
-            )
-        cv_score = _materialize_subscore("cv", cv_score)
-        # CV intermediates no longer referenced — free DuckDB memory
-        for t in ["pressor_events_raw", "pressor_events", "epi_ne_wide", "epi_ne_duration"]:
-            _drop_temp_table(t)
-
-    # Liver subscore
-    with timer.step("liver"):
-        if dev:
-            liver_score, liver_intermediates = _calculate_liver_subscore(
-                cohort_rel, labs_rel, cfg, dev=True, id_name=id_name,
-            )
-            intermediates.update({f'liver_{k}': v for k, v in liver_intermediates.items()})
-            intermediates['liver_score'] = liver_score
-        else:
-            liver_score = _calculate_liver_subscore(
-                cohort_rel, labs_rel, cfg, id_name=id_name,
-            )
-        liver_score = _materialize_subscore("liver", liver_score)
-
-    # Kidney subscore
-    with timer.step("kidney"):
-        if dev:
-            kidney_score, kidney_intermediates = _calculate_kidney_subscore(
-                cohort_rel, labs_rel, crrt_rel, cfg,
-                output_rel=output_rel, input_rel=input_rel, weight_rel=weight_rel,
-                dev=True, id_name=id_name,
-            )
-            intermediates.update({f'kidney_{k}': v for k, v in kidney_intermediates.items()})
-            intermediates['kidney_score'] = kidney_score
-        else:
-            kidney_score = _calculate_kidney_subscore(
-                cohort_rel, labs_rel, crrt_rel, cfg,
-                output_rel=output_rel, input_rel=input_rel, weight_rel=weight_rel,
-                id_name=id_name,
-            )
-        kidney_score = _materialize_subscore("kidney", kidney_score)
-
-    # Hemostasis subscore
-    with timer.step("hemo"):
-        if dev:
-            hemo_score, hemo_intermediates = _calculate_hemo_subscore(
-                cohort_rel, labs_rel, cfg, dev=True, id_name=id_name,
-            )
-            intermediates.update({f'hemo_{k}': v for k, v in hemo_intermediates.items()})
-            intermediates['hemo_score'] = hemo_score
-        else:
-            hemo_score = _calculate_hemo_subscore(
-                cohort_rel, labs_rel, cfg, id_name=id_name,
-            )
-        hemo_score = _materialize_subscore("hemo", hemo_score)
+    if concurrent:
+        logger.info("Calculating all 6 organ subscores concurrently...")
+        with timer.step("subscores"):
+            scores, elapsed = _calculate_subscores_concurrently(cfg, id_name=id_name, cv_timer=cv_timer)
+        for name, seconds in elapsed.items():
+            timer.record(name, seconds, concurrent=True)
+        brain_score, resp_score, cv_score = scores['brain'], scores['resp'], scores['cv']
+        liver_score, kidney_score, hemo_score = scores['liver'], scores['kidney'], scores['hemo']
+    else:
+        logger.info("Calculating all 6 organ subscores in sequence...")
+
+        # Brain subscore
+        with timer.step("brain"):
+            if dev:
+                brain_score, brain_intermediates = _calculate_brain_subscore(
+                    cohort_rel, assessments_rel, cont_meds_rel, intm_meds_rel, cfg,
+                    dev=True, id_name=id_name,
+                )
+                intermediates.update({f'brain_{k}': v for k, v in brain_intermediates.items()})
+                intermediates['brain_score'] = brain_score
+            else:
+                brain_score = _calculate_brain_subscore(
+                    cohort_rel, assessments_rel, cont_meds_rel, intm_meds_rel, cfg,
+                    id_name=id_name,
+                )
+            brain_score = _materialize_subscore("brain", brain_score)
+
+        # Respiratory subscore
+        with timer.step("resp"):
+            if dev:
+                resp_score, resp_intermediates = _calculate_resp_subscore(
+                    cohort_rel, resp_rel, labs_rel, vitals_rel, ecmo_rel, cfg,
+                    dev=True, id_name=id_name,
+                )
+                intermediates.update({f'resp_{k}': v for k, v in resp_intermediates.items()})
+                intermediates['resp_score'] = resp_score
+            else:
+                resp_score = _calculate_resp_subscore(
+                    cohort_rel, resp_rel, labs_rel, vitals_rel, ecmo_rel, cfg,
+                    id_name=id_name,
+                )
+            resp_score = _materialize_subscore("resp", resp_score)
+
+        # Cardiovascular subscore
+        with timer.step("cv"):
+            if dev:
+                cv_score, cv_intermediates = _calculate_cv_subscore(
+                    cohort_rel, cont_meds_rel, vitals_rel, ecmo_rel, cfg,
+                    dev=True, id_name=id_name, _timer=cv_timer,
+                )
+                intermediates.update({f'cv_{k}': v for k, v in cv_intermediates.items()})
+                intermediates['cv_score'] = cv_score
+            else:
+                cv_score = _calculate_cv_subscore(
+                    cohort_rel, cont_meds_rel, vitals_rel, ecmo_rel, cfg,
+                    id_name=id_name, _timer=cv_timer,
+                )
+            cv_score = _materialize_subscore("cv", cv_score)
+            # CV intermediates no longer referenced — free DuckDB memory
+            for t in ["pressor_events_raw", "pressor_events", "epi_ne_wide", "epi_ne_duration"]:
+                _drop_temp_table(t)
+
+        # Liver subscore
+        with timer.step("liver"):
+            if dev:
+                liver_score, liver_intermediates = _calculate_liver_subscore(
+                    cohort_rel, labs_rel, cfg, dev=True, id_name=id_name,
+                )
+                intermediates.update({f'liver_{k}': v for k, v in liver_intermediates.items()})
+                intermediates['liver_score'] = liver_score
+            else:
+                liver_score = _calculate_liver_subscore(
+                    cohort_rel, labs_rel, cfg, id_name=id_name,
+                )
+            liver_score = _materialize_subscore("liver", liver_score)
+
+        # Kidney subscore
+        with timer.step("kidney"):
+            if dev:
+                kidney_score, kidney_intermediates = _calculate_kidney_subscore(
+                    cohort_rel, labs_rel, crrt_rel, cfg,
+                    output_rel=output_rel, input_rel=input_rel, weight_rel=weight_rel,
+                    dev=True, id_name=id_name,
+                )
+                intermediates.update({f'kidney_{k}': v for k, v in kidney_intermediates.items()})
+                intermediates['kidney_score'] = kidney_score
+            else:
+                kidney_score = _calculate_kidney_subscore(
+                    cohort_rel, labs_rel, crrt_rel, cfg,
+                    output_rel=output_rel, input_rel=input_rel, weight_rel=weight_rel,
+                    id_name=id_name,
+                )
+            kidney_score = _materialize_subscore("kidney", kidney_score)
+
+        # Hemostasis subscore
+        with timer.step("hemo"):
+            if dev:
+                hemo_score, hemo_intermediates = _calculate_hemo_subscore(
+                    cohort_rel, labs_rel, cfg, dev=True, id_name=id_name,
+                )
+                intermediates.update({f'hemo_{k}': v for k, v in hemo_intermediates.items()})
+                intermediates['hemo_score'] = hemo_score
+            else:
+                hemo_score = _calculate_hemo_subscore(
+                    cohort_rel, labs_rel, cfg, id_name=id_name,
+                )
+            hemo_score = _materialize_subscore("hemo", hemo_score)
 
     # =========================================================================
     # Combine all subscores
@@ -727,6 +951,8 @@ def calculate_sofa2_daily(
     id_mapping: pd.DataFrame | DuckDBPyRelation | None = None,
     memory_limit: str | None = None,
     duckdb_config: DuckDBResourceConfig | None = None,
+    preload_clif: bool = False,
+    concurrent_subscores: bool = False,
 ) -> pd.DataFrame | DuckDBPyRelation:
     """
     Calculate daily SOFA-2 scores with carry-forward for missing data.
@@ -766,7 +992,12 @@ def calculate_sofa2_daily(
         spill to disk instead of exceeding this limit.
     duckdb_config : DuckDBResourceConfig, optional
         DuckDB resource limits (memory, disk, batching). When provided,
-        supersedes ``memory_limit``. Default: None (DuckDB system defaults).
+        supersedes ``memory_limit``. Default: None (the package-wide limits
+        from ``configure_duckdb``, else DuckDB system defaults).
+    preload_clif : bool, default False
+        Scan the CLIF tables once for all batches. See calculate_sofa2().
+    concurrent_subscores : bool, default False
+        Evaluate the six subscores concurrently. See calculate_sofa2().
 
     Returns
     -------
@@ -785,105 +1016,77 @@ def calculate_sofa2_daily(
 
     - Example: 47h window → 1 row (nth_day=1); 49h window → 2 rows (nth_day=1, 2)
     """
-    # Backward compat: wrap legacy memory_limit into DuckDBResourceConfig
-    if memory_limit is not None and duckdb_config is None:
-        duckdb_config = DuckDBResourceConfig(memory_limit=memory_limit)
-
-    if duckdb_config is not None:
-        cfg = duckdb_config
-    elif platform.system() == 'Windows':
-        cfg = DuckDBResourceConfig.from_system()
-        logger.info("Windows detected: auto-applying resource limits")
-        for line in cfg.summary().splitlines():
-            logger.info(f"  {line}")
-    else:
-        cfg = DuckDBResourceConfig()
+    cfg = _resolve_resource_config(memory_limit, duckdb_config)
 
     with _with_duckdb_config(cfg.memory_limit, cfg.temp_directory, cfg.max_temp_directory_size, cfg.threads):
         return _calculate_sofa2_daily_impl(
             cohort_df, clif_config_path, return_rel,
             sofa2_config=sofa2_config, perf_profile=perf_profile,
             id_name=id_name, id_mapping=id_mapping,
+            duckdb_config=cfg, preload_clif=preload_clif,
+            concurrent_subscores=concurrent_subscores,
         )
 
 
-def _calculate_sofa2_daily_impl(
-    cohort_df, clif_config_path, return_rel,
-    *, sofa2_config, perf_profile, id_name, id_mapping,
-):
-    """Inner implementation of calculate_sofa2_daily (separated for resource config wrapping)."""
-    cfg = sofa2_config or SOFA2Config()
-    rrt_carryforward_days = cfg.rrt_carryforward_days
+def _apply_daily_carry_forward(
+    raw_scores: pd.DataFrame,
+    expanded_cohort: pd.DataFrame,
+    *,
+    id_name: str,
+    rrt_carryforward_days: int,
+    seed: pd.DataFrame | None = None,
+) -> DuckDBPyRelation:
+    """Carry subscores forward across days and apply the RRT override (footnote b).
 
-    logger.info("Starting daily SOFA-2 calculation...")
-    timer = StepTimer() if perf_profile else NoOpTimer()
+    Parameters
+    ----------
+    raw_scores : pd.DataFrame
+        calculate_sofa2() output for the daily windows.
+    expanded_cohort : pd.DataFrame
+        Daily windows with nth_day (from _expand_to_daily_windows).
+    id_name : str
+        Identity column name.
+    rrt_carryforward_days : int
+        Days the kidney subscore stays 4 after a day with RRT.
+    seed : pd.DataFrame, optional
+        Carry-forward state from days scored earlier, one row per id_name:
+        seed_sofa2_{brain,resp,cv,liver,kidney,hemo} (the last stored day's
+        subscores, which hold the forward-filled values) and
+        seed_last_rrt_day. Ids without a row start from day 1 as usual.
 
-    # Convert to relation if needed
-    if isinstance(cohort_df, pd.DataFrame):
-        cohort_rel = duckdb.sql("SELECT * FROM cohort_df")
+    Returns
+    -------
+    DuckDBPyRelation
+        Daily scores in the calculate_sofa2_daily() layout.
+    """
+    rrt_window = f"""MAX(CASE WHEN has_rrt = 1 THEN e.nth_day END) OVER (
+                    PARTITION BY r.{id_name}
+                    ORDER BY r.start_dttm
+                    ROWS BETWEEN UNBOUNDED PRECEDING AND CURRENT ROW
+                )"""
+    if seed is None:
+        seed_join, seed_cols, last_rrt_day = '', '', rrt_window
     else:
-        cohort_rel = cohort_df
+        seed_join = f"LEFT JOIN seed s USING ({id_name})"
+        seed_cols = f", s.* EXCLUDE ({id_name})"
+        last_rrt_day = f"COALESCE(GREATEST({rrt_window}, s.seed_last_rrt_day), {rrt_window}, s.seed_last_rrt_day)"
 
-    # Extract ID mapping before expansion (when using alternative ID)
-    if id_name != 'hospitalization_id':
-        _validate_id_name(cohort_rel, id_name, id_mapping_provided=id_mapping is not None)
-        if id_mapping is None:
-            logger.info(f"Extracting hospitalization_id -> {id_name} mapping from cohort...")
-            id_mapping = _extract_id_mapping(cohort_rel, id_name)
-        logger.info(f"Deduplicating cohort to ({id_name}, start_dttm, end_dttm)...")
-        cohort_rel = _dedup_cohort(cohort_rel, id_name).df()
-
-    # Step 1: Expand arbitrary windows to complete 24h periods
-    with timer.step("expand_windows"):
-        logger.info("Expanding windows to 24h periods...")
-        # Materialize expansion to DataFrame so calculate_sofa2() gets
-        # concrete cardinality — prevents DuckDB optimizer from choking on
-        # deeply nested lazy subqueries (observed 5x slowdown without this).
-        expanded_cohort = _expand_to_daily_windows(cohort_rel, id_name=id_name).df()
-        logger.info(f"Expanded cohort: {len(expanded_cohort)} rows (from input cohort)")
+    def seeded(col: str) -> str:
+        # fallback after the in-range fill: the stored value of the last seeded day
+        return '' if seed is None else f", seed_{col}"
 
-    # Step 2: Calculate raw scores for each 24h window
-    with timer.step("calculate_sofa2"):
-        if perf_profile:
-            raw_result, inner_timer, inner_cv_timer = calculate_sofa2(
-                expanded_cohort,
-                clif_config_path=clif_config_path,
-                return_rel=False,
-                dev=False,
-                sofa2_config=sofa2_config,
-                perf_profile=True,
-                id_name=id_name,
-                id_mapping=id_mapping,
-            )
-            raw_scores = raw_result
-        else:
-            raw_scores = calculate_sofa2(
-                expanded_cohort,
-                clif_config_path=clif_config_path,
-                return_rel=False,
-                dev=False,
-                sofa2_config=sofa2_config,
-                id_name=id_name,
-                id_mapping=id_mapping,
-            )
-    logger.info(f"Raw scores: {len(raw_scores)} rows")
-
-    # Step 3: Join back to get nth_day and apply carry-forward logic
-    logger.info("Applying carry-forward logic...")
-    filled_scores = duckdb.sql(f"""
+    return duckdb.sql(f"""
         WITH with_nth_day AS (
             -- Join raw scores with expanded cohort to get nth_day
             FROM raw_scores r
             LEFT JOIN expanded_cohort e USING ({id_name}, start_dttm)
+            {seed_join}
             SELECT
                 r.*
                 , e.nth_day
+                {seed_cols}
                 -- Most recent day with actual RRT (for 3-day carry-forward)
-                , MAX(CASE WHEN has_rrt = 1 THEN e.nth_day END) OVER (
-                    PARTITION BY r.{id_name}
-                    ORDER BY r.start_dttm
-                    ROWS BETWEEN UNBOUNDED PRECEDING AND CURRENT ROW
-                ) AS last_rrt_day
+                , {last_rrt_day} AS last_rrt_day
         ),
         with_carryforward AS (
             FROM with_nth_day
@@ -891,16 +1094,16 @@ def _calculate_sofa2_daily_impl(
                 -- For each subscore, fill NULLs with last non-null value (day 2+)
                 -- Day 1 NULLs become 0 at the end
                 , CASE WHEN nth_day = 1 THEN sofa2_brain
-                       ELSE COALESCE(sofa2_brain, LAST_VALUE(sofa2_brain IGNORE NULLS) OVER w)
+                       ELSE COALESCE(sofa2_brain, LAST_VALUE(sofa2_brain IGNORE NULLS) OVER w{seeded('sofa2_brain')})
                   END AS sofa2_brain_filled
                 , CASE WHEN nth_day = 1 THEN sofa2_resp
-                       ELSE COALESCE(sofa2_resp, LAST_VALUE(sofa2_resp IGNORE NULLS) OVER w)
+                       ELSE COALESCE(sofa2_resp, LAST_VALUE(sofa2_resp IGNORE NULLS) OVER w{seeded('sofa2_resp')})
                   END AS sofa2_resp_filled
                 , CASE WHEN nth_day = 1 THEN sofa2_cv
-                       ELSE COALESCE(sofa2_cv, LAST_VALUE(sofa2_cv IGNORE NULLS) OVER w)
+                       ELSE COALESCE(sofa2_cv, LAST_VALUE(sofa2_cv IGNORE NULLS) OVER w{seeded('sofa2_cv')})
                   END AS sofa2_cv_filled
                 , CASE WHEN nth_day = 1 THEN sofa2_liver
-                       ELSE COALESCE(sofa2_liver, LAST_VALUE(sofa2_liver IGNORE NULLS) OVER w)
+                       ELSE COALESCE(sofa2_liver, LAST_VALUE(sofa2_liver IGNORE NULLS) OVER w{seeded('sofa2_liver')})
                   END AS sofa2_liver_filled
                 -- RRT 3-day carry-forward: override to 4 within window, then standard fill
                 , CASE
@@ -908,10 +1111,10 @@ def _calculate_sofa2_daily_impl(
                          AND nth_day - last_rrt_day < {rrt_carryforward_days}
                     THEN 4
                     WHEN nth_day = 1 THEN sofa2_kidney
-                    ELSE COALESCE(sofa2_kidney, LAST_VALUE(sofa2_kidney IGNORE NULLS) OVER w)
+                    ELSE COALESCE(sofa2_kidney, LAST_VALUE(sofa2_kidney IGNORE NULLS) OVER w{seeded('sofa2_kidney')})
                   END AS sofa2_kidney_filled
                 , CASE WHEN nth_day = 1 THEN sofa2_hemo
-                       ELSE COALESCE(sofa2_hemo, LAST_VALUE(sofa2_hemo IGNORE NULLS) OVER w)
+                       ELSE COALESCE(sofa2_hemo, LAST_VALUE(sofa2_hemo IGNORE NULLS) OVER w{seeded('sofa2_hemo')})
                   END AS sofa2_hemo_filled
             WINDOW w AS (
                 PARTITION BY {id_name}
@@ -1000,6 +1203,82 @@ def _calculate_sofa2_daily_impl(
             , platelet_dttm_offset
     """)
 
+
+def _calculate_sofa2_daily_impl(
+    cohort_df, clif_config_path, return_rel,
+    *, sofa2_config, perf_profile, id_name, id_mapping,
+    duckdb_config=None, preload_clif=False, concurrent_subscores=False,
+):
+    """Inner implementation of calculate_sofa2_daily (separated for resource config wrapping)."""
+    cfg = sofa2_config or SOFA2Config()
+    rrt_carryforward_days = cfg.rrt_carryforward_days
+
+    logger.info("Starting daily SOFA-2 calculation...")
+    timer = StepTimer() if perf_profile else NoOpTimer()
+
+    # Convert to relation if needed
+    if isinstance(cohort_df, pd.DataFrame):
+        cohort_rel = duckdb.sql("SELECT * FROM cohort_df")
+    else:
+        cohort_rel = cohort_df
+
+    # Extract ID mapping before expansion (when using alternative ID)
+    if id_name != 'hospitalization_id':
+        _validate_id_name(cohort_rel, id_name, id_mapping_provided=id_mapping is not None)
+        if id_mapping is None:
+            logger.info(f"Extracting hospitalization_id -> {id_name} mapping from cohort...")
+            id_mapping = _extract_id_mapping(cohort_rel, id_name)
+        logger.info(f"Deduplicating cohort to ({id_name}, start_dttm, end_dttm)...")
+        cohort_rel = _dedup_cohort(cohort_rel, id_name).df()
+
+    # Step 1: Expand arbitrary windows to complete 24h periods
+    with timer.step("expand_windows"):
+        logger.info("Expanding windows to 24h periods...")
+        # Materialize expansion to DataFrame so calculate_sofa2() gets
+        # concrete cardinality — prevents DuckDB optimizer from choking on
+        # deeply nested lazy subqueries (observed 5x slowdown without this).
+        expanded_cohort = _expand_to_daily_windows(cohort_rel, id_name=id_name).df()
+        logger.info(f"Expanded cohort: {len(expanded_cohort)} rows (from input cohort)")
+
+    # Step 2: Calculate raw scores for each 24h window
+    with timer.step("calculate_sofa2"):
+        if perf_profile:
+            raw_result, inner_timer, inner_cv_timer = calculate_sofa2(
+                expanded_cohort,
+                clif_config_path=clif_config_path,
+                return_rel=False,
+                dev=False,
+                sofa2_config=sofa2_config,
+                perf_profile=True,
+                id_name=id_name,
+                id_mapping=id_mapping,
+                duckdb_config=duckdb_config,
+                preload_clif=preload_clif,
+                concurrent_subscores=concurrent_subscores,
+            )
+            raw_scores = raw_result
+        else:
+            raw_scores = calculate_sofa2(
+                expanded_cohort,
+                clif_config_path=clif_config_path,
+                return_rel=False,
+                dev=False,
+                sofa2_config=sofa2_config,
+                id_name=id_name,
+                id_mapping=id_mapping,
+                duckdb_config=duckdb_config,
+                preload_clif=preload_clif,
+                concurrent_subscores=concurrent_subscores,
+            )
+    logger.info(f"Raw scores: {len(raw_scores)} rows")
+
+    # Step 3: Join back to get nth_day and apply carry-forward logic
+    logger.info("Applying carry-forward logic...")
+    filled_scores = _apply_daily_carry_forward(
+        raw_scores, expanded_cohort,
+        id_name=id_name, rrt_carryforward_days=rrt_carryforward_days,
+    )
+
     logger.info("Daily SOFA-2 calculation complete")
 
     if return_rel:
@@ -1011,3 +1290,216 @@ def _calculate_sofa2_daily_impl(
     if perf_profile:
         return result, timer, inner_timer, inner_cv_timer
     return result
+
+
+def calculate_sofa2_daily_incremental(
+    previous_daily: pd.DataFrame | None,
+    cohort_df: pd.DataFrame | DuckDBPyRelation,
+    clif_config_path: str | None = None,
+    *,
+    sofa2_config: SOFA2Config | None = None,
+    id_name: str = 'hospitalization_id',
+    id_mapping: pd.DataFrame | DuckDBPyRelation | None = None,
+    duckdb_config: DuckDBResourceConfig | None = None,
+    recompute_days: int = 0,
+    preload_clif: bool = False,
+    concurrent_subscores: bool = False,
+) -> pd.DataFrame:
+    """
+    Update daily SOFA-2 scores, scoring only the days not already computed.
+
+    Meant for rolling dashboards that rescore every active stay as time
+    passes: ``previous_daily`` is the last result, ``cohort_df`` the current
+    horizon (typically admission to now). Only the new complete days (plus
+    any asked for with ``recompute_days``) are scored; the carry-forward
+    state is seeded from the stored tail:
+
+    - subscore forward-fill continues from the last stored day's subscores
+
+    - the RRT carry-forward counts from the last stored day with has_rrt = 1;
+      stored days still inside an RRT carry-forward are rescored, because
+      their stored kidney value is the override, not the value to fill from
+
+    - the urine-output LAG chain still starts at each stay's first day, so
+      the new days see the same UO predecessors as a full run
+
+    The result equals ``calculate_sofa2_daily(cohort_df, ...)`` up to row
+    order and column dtypes.
+
+    Parameters
+    ----------
+    previous_daily : pd.DataFrame or None
+        Earlier output of calculate_sofa2_daily() or of this function for
+        the same cohort definition. Rows whose (id_name, start_dttm, nth_day)
+        no longer match a day of the horizon are dropped. None scores
+        everything.
+    cohort_df : pd.DataFrame | DuckDBPyRelation
+        Current horizon, as for calculate_sofa2_daily().
+    clif_config_path : str, optional
+        Path to CLIF config file for data loading.
+    sofa2_config : SOFA2Config, optional
+        Must match the config ``previous_daily`` was computed with.
+    id_name : str, default 'hospitalization_id'
+        Identity column name. See calculate_sofa2().
+    id_mapping : pd.DataFrame | DuckDBPyRelation, optional
+        Mapping from hospitalization_id to id_name. See calculate_sofa2().
+    duckdb_config : DuckDBResourceConfig, optional
+        DuckDB resource limits. See calculate_sofa2().
+    recompute_days : int, default 0
+        Also rescore this many of the latest stored days per id, e.g. to pick
+        up late-charted data.
+    preload_clif : bool, default False
+        See calculate_sofa2().
+    concurrent_subscores : bool, default False
+        See calculate_sofa2().
+
+    Returns
+    -------
+    pd.DataFrame
+        Daily scores for every complete day of the horizon, in the
+        calculate_sofa2_daily() layout, sorted by (id_name, start_dttm).
+
+    Examples
+    --------
+    >>> daily = calculate_sofa2_daily(icu_stays_so_far, CONFIG_PATH)
+    >>> # an hour later
+    >>> daily = calculate_sofa2_daily_incremental(daily, icu_stays_so_far, CONFIG_PATH)
+    """
+    if recompute_days < 0:
+        raise ValueError(f"recompute_days must be >= 0, got {recompute_days}")
+    cfg = _resolve_resource_config(None, duckdb_config)
+
+    with _with_duckdb_config(cfg.memory_limit, cfg.temp_directory, cfg.max_temp_directory_size, cfg.threads):
+        return _calculate_sofa2_daily_incremental_impl(
+            previous_daily, cohort_df, clif_config_path,
+            sofa2_config=sofa2_config, id_name=id_name, id_mapping=id_mapping,
+            duckdb_config=cfg, recompute_days=recompute_days,
+            preload_clif=preload_clif, concurrent_subscores=concurrent_subscores,
+        )
+
+
+def _incremental_resume_days(
+    previous_daily: pd.DataFrame,
+    expanded_cohort: pd.DataFrame,
+    *,
+    id_name: str,
+    recompute_days: int,
+    rrt_carryforward_days: int,
+) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """Pick the first day to score per id and the carry-forward seed before it.
+
+    The resume day is the first day of the horizon missing from
+    ``previous_daily``, moved back by ``recompute_days`` and then past any
+    stored days still covered by an RRT carry-forward (their stored kidney
+    subscore is the override, so it cannot seed the fill).
+
+    Returns
+    -------
+    tuple
+        (stored rows kept as they are, seed frame for
+        _apply_daily_carry_forward with one row per id that has stored days
+        before its resume day and a resume_day column)
+    """
+    keys = [id_name, 'start_dttm', 'nth_day']
+    stored = previous_daily.merge(expanded_cohort[keys], on=keys, how='inner')
+    stored = stored.sort_values([id_name, 'nth_day'], kind='stable').reset_index(drop=True)
+
+    # first horizon day without a stored row (days after a gap are rescored)
+    flagged = expanded_cohort[keys].merge(stored[keys], on=keys, how='left', indicator=True)
+    missing = flagged[flagged['_merge'] == 'left_only'].groupby(id_name)['nth_day'].min()
+    last_day = expanded_cohort.groupby(id_name)['nth_day'].max()
+    first_missing = missing.reindex(last_day.index).fillna(last_day + 1)
+    resume = (first_missing - recompute_days).clip(lower=1).rename('resume_day')
+    stored = stored.merge(resume, left_on=id_name, right_index=True)
+    stored = stored[stored['nth_day'] < stored['resume_day']]
+
+    # days under an RRT carry-forward; the last one not under it is the seed
+    rrt_day = stored['nth_day'].where(stored['has_rrt'] == 1)
+    last_rrt = rrt_day.groupby(stored[id_name]).ffill()
+    overridden = last_rrt.notna() & (stored['nth_day'] - last_rrt < rrt_carryforward_days)
+    seed_day = stored['nth_day'].where(~overridden).groupby(stored[id_name]).max()
+    resume = (seed_day.reindex(resume.index) + 1).fillna(1).astype(int).rename('resume_day')
+
+    stored = stored.drop(columns='resume_day').merge(resume, left_on=id_name, right_index=True)
+    kept = stored[stored['nth_day'] < stored['resume_day']]
+
+    tail = kept.groupby(id_name).tail(1).set_index(id_name)
+    subscores = ['sofa2_brain', 'sofa2_resp', 'sofa2_cv', 'sofa2_liver', 'sofa2_kidney', 'sofa2_hemo']
+    seed = tail[subscores].add_prefix('seed_')
+    seed['seed_last_rrt_day'] = kept['nth_day'].where(kept['has_rrt'] == 1).groupby(kept[id_name]).max()
+    seed = seed.join(resume, how='right').reset_index()
+    return kept.drop(columns='resume_day'), seed
+
+
+def _calculate_sofa2_daily_incremental_impl(
+    previous_daily, cohort_df, clif_config_path,
+    *, sofa2_config, id_name, id_mapping, duckdb_config, recompute_days,
+    preload_clif, concurrent_subscores,
+):
+    """Inner implementation of calculate_sofa2_daily_incremental."""
+    cfg = sofa2_config or SOFA2Config()
+    logger.info("Starting incremental daily SOFA-2 calculation...")
+
+    if isinstance(cohort_df, pd.DataFrame):
+        cohort_rel = duckdb.sql("SELECT * FROM cohort_df")
+    else:
+        cohort_rel = cohort_df
+
+    if id_name != 'hospitalization_id':
+        _validate_id_name(cohort_rel, id_name, id_mapping_provided=id_mapping is not None)
+        if id_mapping is None:
+            logger.info(f"Extracting hospitalization_id -> {id_name} mapping from cohort...")
+            id_mapping = _extract_id_mapping(cohort_rel, id_name)
+        logger.info(f"Deduplicating cohort to ({id_name}, start_dttm, end_dttm)...")
+        cohort_rel = _dedup_cohort(cohort_rel, id_name).df()
+
+    expanded_cohort = _expand_to_daily_windows(cohort_rel, id_name=id_name).df()
+    # Anchor each id's UO LAG chain at its first day, as a full run would
+    expanded_cohort['uo_anchor_dttm'] = expanded_cohort.groupby(id_name)['start_dttm'].transform('min')
+    daily_cols = None
+
+    if previous_daily is not None and len(previous_daily):
+        daily_cols = list(previous_daily.columns)
+        kept, seed = _incremental_resume_days(
+            previous_daily, expanded_cohort,
+            id_name=id_name, recompute_days=recompute_days,
+            rrt_carryforward_days=cfg.rrt_carryforward_days,
+        )
+        to_score = expanded_cohort.merge(seed[[id_name, 'resume_day']], on=id_name, how='left')
+        to_score = to_score[to_score['nth_day'] >= to_score['resume_day'].fillna(1)].drop(columns='resume_day')
+        seed = seed[seed['resume_day'] > 1].drop(columns='resume_day')
+    else:
+        kept, seed, to_score = None, None, expanded_cohort
+    logger.info(
+        f"Scoring {len(to_score)} of {len(expanded_cohort)} days "
+        f"({0 if kept is None else len(kept)} kept from previous_daily)"
+    )
+
+    parts = [] if kept is None else [kept]
+    if len(to_score):
+        raw_scores = calculate_sofa2(
+            to_score.reset_index(drop=True),
+            clif_config_path=clif_config_path,
+            return_rel=False,
+            dev=False,
+            sofa2_config=sofa2_config,
+            id_name=id_name,
+            id_mapping=id_mapping,
+            duckdb_config=duckdb_config,
+            preload_clif=preload_clif,
+            concurrent_subscores=concurrent_subscores,
+        )
+        filled = _apply_daily_carry_forward(
+            raw_scores, to_score,
+            id_name=id_name, rrt_carryforward_days=cfg.rrt_carryforward_days,
+            seed=seed if seed is not None and len(seed) else None,
+        ).df()
+        _cleanup_temp_tables()
+        parts.append(filled)
+        daily_cols = daily_cols or list(filled.columns)
+
+    if not parts:
+        return pd.DataFrame(columns=daily_cols or [])
+    result = pd.concat([part[daily_cols] for part in parts], ignore_index=True)
+    logger.info("Incremental daily SOFA-2 calculation complete")
+    return result.sort_values([id_name, 'start_dttm'], kind='stable').reset_index(drop=True)
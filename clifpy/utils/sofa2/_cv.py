@@ -18,11 +18,10 @@ from __future__ import annotations
 
 import logging
 
-import duckdb
 from duckdb import DuckDBPyRelation
 
-from ._utils import SOFA2Config, _agg_map, _flag_mechanical_cv_support
-from ._perf import NoOpTimer, StepTimer, _register_temp_table
+from ._utils import SOFA2Config, _agg_map, _arg_worst_sql, _flag_mechanical_cv_support
+from ._perf import NoOpTimer, StepTimer, _con, _register_temp_table
 from clifpy.utils.logging_config import get_logger
 
 logger = get_logger('utils.sofa2.cv')
@@ -106,7 +105,7 @@ def _calculate_cv_subscore(
     # SEMI JOIN filters to cohort patients without duplicating across windows;
     # pre-filter to weight_kg avoids passing all vital categories downstream.
     # No time filter: preserves pre-window weights for ASOF forward-fill.
-    cohort_weights = duckdb.sql(f"""
+    cohort_weights = _con().sql(f"""
         FROM vitals_rel t
         SEMI JOIN cohort_rel c ON t.{id_name} = c.{id_name}
         SELECT t.*
@@ -119,7 +118,7 @@ def _calculate_cv_subscore(
     logger.info("Collecting vasopressor events across pre/in/post windows for episode tracking...")
 
     # Pre-window: Forward-filled event AT start_dttm for each vasopressor
-    pressor_at_start = duckdb.sql(f"""
+    pressor_at_start = _con().sql(f"""
         WITH med_cats AS (
             SELECT UNNEST({cohort_vasopressors}::VARCHAR[]) AS med_category
         ),
@@ -147,7 +146,7 @@ def _calculate_cv_subscore(
     """)
 
     # In-window: Events during [start_dttm, end_dttm]
-    pressor_in_window = duckdb.sql(f"""
+    pressor_in_window = _con().sql(f"""
         FROM cont_meds_rel t
         JOIN cohort_rel c ON
             t.{id_name} = c.{id_name}
@@ -165,7 +164,7 @@ def _calculate_cv_subscore(
     """)
 
     # Post-window: Forward-filled event AT end_dttm (for duration calculation)
-    pressor_at_end = duckdb.sql(f"""
+    pressor_at_end = _con().sql(f"""
         WITH med_cats AS (
             SELECT UNNEST({cohort_vasopressors}::VARCHAR[]) AS med_category
         ),
@@ -191,7 +190,7 @@ def _calculate_cv_subscore(
     """)
 
     # Combine all pressor events (materialize to break lazy chain)
-    duckdb.execute(f"""
+    _con().execute(f"""
         CREATE OR REPLACE TEMP TABLE pressor_events_raw AS
         SELECT {id_name}, start_dttm, admin_dttm, med_category, med_dose, med_dose_unit, mar_action_category
         FROM pressor_at_start
@@ -202,7 +201,7 @@ def _calculate_cv_subscore(
         SELECT {id_name}, start_dttm, admin_dttm, med_category, med_dose, med_dose_unit, mar_action_category
         FROM pressor_at_end
     """)
-    pressor_events_raw = duckdb.table("pressor_events_raw")
+    pressor_events_raw = _con().table("pressor_events_raw")
     _register_temp_table("pressor_events_raw")
     if logger.isEnabledFor(logging.DEBUG):
         logger.debug(f"pressor_events_raw materialized: {pressor_events_raw.count('*').fetchone()[0]} rows")
@@ -215,7 +214,7 @@ def _calculate_cv_subscore(
     # =========================================================================
     timer.start("cv.dedup_and_unit_conversion")
     logger.info("Deduplicating MAR actions to resolve simultaneous entries...")
-    pressor_events_deduped = duckdb.sql(f"""
+    pressor_events_deduped = _con().sql(f"""
         FROM pressor_events_raw t
         SELECT
             t.{id_name}
@@ -251,8 +250,8 @@ def _calculate_cv_subscore(
         id_name=id_name,
     )
     # Materialize after unit conversion to isolate external function
-    duckdb.execute("CREATE OR REPLACE TEMP TABLE pressor_events AS SELECT * FROM pressor_events_rel")
-    pressor_events = duckdb.table("pressor_events")
+    _con().execute("CREATE OR REPLACE TEMP TABLE pressor_events AS SELECT * FROM pressor_events_rel")
+    pressor_events = _con().table("pressor_events")
     _register_temp_table("pressor_events")
     if logger.isEnabledFor(logging.DEBUG):
         logger.debug(f"pressor_events materialized: {pressor_events.count('*').fetchone()[0]} rows")
@@ -265,7 +264,7 @@ def _calculate_cv_subscore(
     # =========================================================================
     timer.start("cv.pivot_and_episodes")
     logger.info("Pivoting epi+norepi to wide format for concurrent dosage calculation...")
-    duckdb.execute(f"""
+    _con().execute(f"""
         CREATE OR REPLACE TEMP TABLE epi_ne_wide AS
         FROM pressor_events
         PIVOT (
@@ -277,7 +276,7 @@ def _calculate_cv_subscore(
             GROUP BY {id_name}, start_dttm, admin_dttm
         )
     """)
-    epi_ne_wide = duckdb.table("epi_ne_wide")
+    epi_ne_wide = _con().table("epi_ne_wide")
     _register_temp_table("epi_ne_wide")
     if logger.isEnabledFor(logging.DEBUG):
         logger.debug(f"epi_ne_wide materialized: {epi_ne_wide.count('*').fetchone()[0]} rows")
@@ -286,7 +285,7 @@ def _calculate_cv_subscore(
 
     logger.info("Forward-filling epi+norepi to get continuous dosage values...")
     # Forward-fill epi+norepi
-    epi_ne_filled = duckdb.sql(f"""
+    epi_ne_filled = _con().sql(f"""
         FROM epi_ne_wide
         SELECT
             {id_name}
@@ -302,7 +301,7 @@ def _calculate_cv_subscore(
     # Step 6: Episode detection and 60-min duration validation for epi+norepi
     # =========================================================================
     logger.info("Detecting episodes and validating 60-min duration per footnote j...")
-    duckdb.execute(f"""
+    _con().execute(f"""
         CREATE OR REPLACE TEMP TABLE epi_ne_duration AS
         WITH with_lag AS (
             FROM epi_ne_filled
@@ -352,7 +351,7 @@ def _calculate_cv_subscore(
             , CASE WHEN epi > 0 AND epi_episode_duration >= {min_duration}
                    THEN epi ELSE 0 END AS epi_valid
     """)
-    epi_ne_duration = duckdb.table("epi_ne_duration")
+    epi_ne_duration = _con().table("epi_ne_duration")
     _register_temp_table("epi_ne_duration")
     if logger.isEnabledFor(logging.DEBUG):
         logger.debug(f"epi_ne_duration materialized: {epi_ne_duration.count('*').fetchone()[0]} rows")
@@ -360,13 +359,13 @@ def _calculate_cv_subscore(
         logger.info("epi_ne_duration materialized")
 
     # Aggregate epi+norepi with offset at max dose
-    epi_ne_agg = duckdb.sql(f"""
+    epi_ne_agg = _con().sql(f"""
         FROM epi_ne_duration
         SELECT
             {id_name}
             , start_dttm
             , MAX(norepi_valid + epi_valid) AS norepi_epi_maxsum
-            , ARG_MAX(admin_dttm, norepi_valid + epi_valid) - start_dttm AS norepi_epi_maxsum_dttm_offset
+            , {_arg_worst_sql('admin_dttm', 'norepi_valid + epi_valid', 'admin_dttm', 'max')} - start_dttm AS norepi_epi_maxsum_dttm_offset
             , MAX(norepi_valid) AS norepi_max
             , MAX(epi_valid) AS epi_max
         GROUP BY {id_name}, start_dttm
@@ -379,7 +378,7 @@ def _calculate_cv_subscore(
     # =========================================================================
     timer.start("cv.aggregation_and_scoring")
     logger.info("Validating duration for dopamine and other pressors per footnote l...")
-    other_pressor_duration = duckdb.sql(f"""
+    other_pressor_duration = _con().sql(f"""
         WITH filtered AS (
             FROM pressor_events
             SELECT {id_name}, start_dttm, admin_dttm, med_category, med_dose
@@ -423,20 +422,20 @@ def _calculate_cv_subscore(
     """)
 
     # Aggregate dopamine + others with offset at max dose
-    other_pressor_agg = duckdb.sql(f"""
+    other_pressor_agg = _con().sql(f"""
         FROM other_pressor_duration
         SELECT
             {id_name}
             , start_dttm
             , MAX(dose_valid) FILTER (WHERE med_category = 'dopamine') AS dopa_max
-            , ARG_MAX(admin_dttm, dose_valid) FILTER (WHERE med_category = 'dopamine') - start_dttm AS dopa_max_dttm_offset
+            , {_arg_worst_sql('admin_dttm', 'dose_valid', 'admin_dttm', 'max')} FILTER (WHERE med_category = 'dopamine') - start_dttm AS dopa_max_dttm_offset
             , CASE WHEN MAX(dose_valid) FILTER (WHERE med_category != 'dopamine') > 0
                    THEN 1 ELSE 0 END AS has_other_non_dopa
         GROUP BY {id_name}, start_dttm
     """)
 
     # Combine pressor aggregations
-    pressor_agg = duckdb.sql(f"""
+    pressor_agg = _con().sql(f"""
         FROM cohort_rel c
         LEFT JOIN epi_ne_agg ne USING ({id_name}, start_dttm)
         LEFT JOIN other_pressor_agg op USING ({id_name}, start_dttm)
@@ -460,7 +459,7 @@ def _calculate_cv_subscore(
     # Step 8: Calculate CV score
     # =========================================================================
     logger.info("Applying CV scoring rules based on norepi+epi dose tiers and pressor combinations...")
-    cv_score = duckdb.sql(f"""
+    cv_score = _con().sql(f"""
         FROM cohort_rel c
         LEFT JOIN map_agg m USING ({id_name}, start_dttm)
         LEFT JOIN pressor_agg v USING ({id_name}, start_dttm)
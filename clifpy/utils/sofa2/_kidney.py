@@ -26,10 +26,10 @@ Reviewers:
 
 from __future__ import annotations
 
-import duckdb
 from duckdb import DuckDBPyRelation
 
-from ._utils import SOFA2Config, _flag_rrt
+from ._utils import SOFA2Config, _arg_worst_sql, _flag_rrt
+from ._perf import _con
 from clifpy.utils.logging_config import get_logger
 
 logger = get_logger('utils.sofa2.kidney')
@@ -104,16 +104,20 @@ def _calculate_uo_score(
     # Per-patient cohort span — used to bound the UO loading window.
     # Each patient gets: [min(start_dttm) - lookback, max(end_dttm)]
     # The lookback provides room for LAG to find real predecessors at boundaries.
+    # An optional uo_anchor_dttm column moves the span start earlier, so a
+    # cohort holding only a stay's latest days (incremental daily scoring)
+    # builds the same LAG chain as one holding the whole stay.
+    anchor_col = 'uo_anchor_dttm' if 'uo_anchor_dttm' in cohort_rel.columns else 'start_dttm'
     logger.info(
         f"Computing per-patient cohort span with {lookback_hours}h prewindow lookback..."
     )
-    patient_span = duckdb.sql(f"""
+    patient_span = _con().sql(f"""
         FROM cohort_rel
         SELECT
             {id_name}
-            , MIN(start_dttm) AS earliest_start_dttm
+            , MIN({anchor_col}) AS earliest_start_dttm
             , MAX(end_dttm) AS latest_end_dttm
-            , MIN(start_dttm) - INTERVAL '{lookback_hours} hours' AS load_lower_bound
+            , MIN({anchor_col}) - INTERVAL '{lookback_hours} hours' AS load_lower_bound
         GROUP BY {id_name}
     """)
 
@@ -121,7 +125,7 @@ def _calculate_uo_score(
     # NO cohort join yet — we operate on patient-level data to compute LAG globally.
     # Net = output_volume - input_volume (irrigation flushes negate UO).
     logger.info("Collecting per-patient UO events (output - irrigation) ...")
-    uo_events = duckdb.sql(f"""
+    uo_events = _con().sql(f"""
         FROM output_rel t
         JOIN patient_span p USING ({id_name})
         SELECT
@@ -148,7 +152,7 @@ def _calculate_uo_score(
     # Step B (refactored): Net volume per (patient, timestamp).
     # No start_dttm in GROUP BY — this is patient-level, pre-window-association.
     logger.info("Aggregating net UO volume per (patient, timestamp)...")
-    net_uo = duckdb.sql(f"""
+    net_uo = _con().sql(f"""
         FROM uo_events
         SELECT
             {id_name}
@@ -172,7 +176,7 @@ def _calculate_uo_score(
         first_uo_expr = "0"
 
     logger.info(f"Computing global LAG-based tm_since_last_uo (baseline={baseline})...")
-    with_tm = duckdb.sql(f"""
+    with_tm = _con().sql(f"""
         FROM net_uo
         SELECT
             {id_name}
@@ -200,7 +204,7 @@ def _calculate_uo_score(
     # Rows between (start - lookback_hours) and (start - 24h) exist only as
     # LAG predecessors and are dropped here.
     logger.info("Associating rows with scoring windows...")
-    per_window_events = duckdb.sql(f"""
+    per_window_events = _con().sql(f"""
         FROM with_tm t
         JOIN cohort_rel c ON
             t.{id_name} = c.{id_name}
@@ -223,7 +227,7 @@ def _calculate_uo_score(
     # per-anchor values (constant within each group) to support intermediate testing
     # of Step B/C outputs without a separate join.
     logger.info("Computing trailing 6h/12h/24h UO volumes and observation times...")
-    trailing_uo = duckdb.sql(f"""
+    trailing_uo = _con().sql(f"""
         FROM per_window_events io
         LEFT JOIN per_window_events iosum
             ON io.{id_name} = iosum.{id_name}
@@ -258,7 +262,7 @@ def _calculate_uo_score(
 
     # Step E: ASOF JOIN to weight for mL/kg/h calculation
     logger.info("Matching weight via ASOF JOIN for rate calculation...")
-    with_weight = duckdb.sql(f"""
+    with_weight = _con().sql(f"""
         FROM trailing_uo tr
         ASOF LEFT JOIN weight_rel w
             ON tr.{id_name} = w.{id_name}
@@ -277,7 +281,7 @@ def _calculate_uo_score(
 
     # Step F: Per-window aggregation — take worst (min) rates, score 0-3
     logger.info("Aggregating per-window UO scores...")
-    uo_scored = duckdb.sql(f"""
+    uo_scored = _con().sql(f"""
         WITH uo_per_window AS (
             FROM with_weight
             SELECT
@@ -290,7 +294,7 @@ def _calculate_uo_score(
                 -- Anuria check: minimum 12h trailing volume (valid observations only)
                 , MIN(uo_vol_12hr) FILTER (uo_tm_12hr >= 12) AS min_uo_vol_12hr
                 -- Weight at the measurement with worst 6h rate (for output)
-                , ARG_MIN(weight_kg, COALESCE(uo_rate_6hr, 999)) AS weight_at_uo
+                , {_arg_worst_sql('weight_kg', 'COALESCE(uo_rate_6hr, 999)', 'recorded_dttm')} AS weight_at_uo
             GROUP BY {id_name}, start_dttm
         )
         FROM uo_per_window
@@ -398,7 +402,7 @@ def _calculate_kidney_subscore(
     # MAX creatinine/potassium = worst, MIN pH/bicarbonate = worst
     # Offset = lab_collect_dttm - start_dttm (positive for in-window)
     logger.info("Collecting in-window creatinine, potassium, pH, bicarbonate...")
-    labs_in_window = duckdb.sql(f"""
+    labs_in_window = _con().sql(f"""
         FROM labs_rel t
         JOIN cohort_rel c ON
             t.{id_name} = c.{id_name}
@@ -408,14 +412,14 @@ def _calculate_kidney_subscore(
             t.{id_name}
             , c.start_dttm
             , MAX(lab_value_numeric) FILTER(lab_category = 'creatinine') AS creatinine
-            , ARG_MAX(lab_collect_dttm, lab_value_numeric) FILTER(lab_category = 'creatinine') - c.start_dttm AS creatinine_dttm_offset
+            , {_arg_worst_sql('lab_collect_dttm', 'lab_value_numeric', 'lab_collect_dttm', 'max')} FILTER(lab_category = 'creatinine') - c.start_dttm AS creatinine_dttm_offset
             , MAX(lab_value_numeric) FILTER(lab_category = 'potassium') AS potassium
-            , ARG_MAX(lab_collect_dttm, lab_value_numeric) FILTER(lab_category = 'potassium') - c.start_dttm AS potassium_dttm_offset
+            , {_arg_worst_sql('lab_collect_dttm', 'lab_value_numeric', 'lab_collect_dttm', 'max')} FILTER(lab_category = 'potassium') - c.start_dttm AS potassium_dttm_offset
             , MIN(lab_value_numeric) FILTER(lab_category IN ('ph_arterial', 'ph_venous')) AS ph
-            , ARG_MIN(lab_category, lab_value_numeric) FILTER(lab_category IN ('ph_arterial', 'ph_venous')) AS ph_type
-            , ARG_MIN(lab_collect_dttm, lab_value_numeric) FILTER(lab_category IN ('ph_arterial', 'ph_venous')) - c.start_dttm AS ph_dttm_offset
+            , {_arg_worst_sql('lab_category', 'lab_value_numeric', 'lab_collect_dttm, lab_category')} FILTER(lab_category IN ('ph_arterial', 'ph_venous')) AS ph_type
+            , {_arg_worst_sql('lab_collect_dttm', 'lab_value_numeric', 'lab_collect_dttm')} FILTER(lab_category IN ('ph_arterial', 'ph_venous')) - c.start_dttm AS ph_dttm_offset
             , MIN(lab_value_numeric) FILTER(lab_category = 'bicarbonate') AS bicarbonate
-            , ARG_MIN(lab_collect_dttm, lab_value_numeric) FILTER(lab_category = 'bicarbonate') - c.start_dttm AS bicarbonate_dttm_offset
+            , {_arg_worst_sql('lab_collect_dttm', 'lab_value_numeric', 'lab_collect_dttm')} FILTER(lab_category = 'bicarbonate') - c.start_dttm AS bicarbonate_dttm_offset
         WHERE t.lab_category IN {tuple(lab_categories)}
         GROUP BY t.{id_name}, c.start_dttm
     """)
@@ -425,7 +429,7 @@ def _calculate_kidney_subscore(
     # ASOF returns single closest record, so offset is directly available
     # Offset = lab_collect_dttm - start_dttm (negative for pre-window)
     logger.info("Looking back for pre-window labs to handle missing in-window data...")
-    labs_pre_window_long = duckdb.sql(f"""
+    labs_pre_window_long = _con().sql(f"""
         WITH lab_cats AS (
             SELECT UNNEST({lab_categories}::VARCHAR[]) AS lab_category
         ),
@@ -454,7 +458,7 @@ def _calculate_kidney_subscore(
     # in the data. If a category has no rows, the column is missing → Binder Error.
     # Explicit FILTER aggregation always creates all columns (NULL when no data).
     logger.info("Pivoting pre-window labs to enable per-lab fallback pattern...")
-    labs_pre_window = duckdb.sql(f"""
+    labs_pre_window = _con().sql(f"""
         FROM labs_pre_window_long
         SELECT
             {id_name}
@@ -476,7 +480,7 @@ def _calculate_kidney_subscore(
     # Use pre-window value only if no in-window value exists for that specific lab
     logger.info("Applying fallback: use pre-window only when in-window is missing...")
 
-    labs_with_fallback = duckdb.sql(f"""
+    labs_with_fallback = _con().sql(f"""
         FROM cohort_rel c
         LEFT JOIN labs_in_window l USING ({id_name}, start_dttm)
         LEFT JOIN labs_pre_window p USING ({id_name}, start_dttm)
@@ -508,7 +512,7 @@ def _calculate_kidney_subscore(
         logger.info("Calculating urine output-based score...")
         # Create empty input_rel sentinel if input table not available
         if input_rel is None:
-            input_rel = duckdb.sql(f"""
+            input_rel = _con().sql(f"""
                 SELECT
                     NULL::VARCHAR AS {id_name}
                     , NULL::TIMESTAMPTZ AS recorded_dttm
@@ -536,7 +540,7 @@ def _calculate_kidney_subscore(
     logger.info("Scoring kidney with creatinine + UO + RRT override + footnote p...")
 
     if uo_result is not None:
-        kidney_score = duckdb.sql(f"""
+        kidney_score = _con().sql(f"""
             FROM labs_with_fallback l
             LEFT JOIN rrt_flag r USING ({id_name}, start_dttm)
             LEFT JOIN uo_result uo USING ({id_name}, start_dttm)
@@ -584,7 +588,7 @@ def _calculate_kidney_subscore(
         """)
     else:
         # No UO data: creatinine-only scoring (existing behavior)
-        kidney_score = duckdb.sql(f"""
+        kidney_score = _con().sql(f"""
             FROM labs_with_fallback l
             LEFT JOIN rrt_flag r USING ({id_name}, start_dttm)
             SELECT
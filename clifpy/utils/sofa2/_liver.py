@@ -13,10 +13,10 @@ Reviewers:
 
 from __future__ import annotations
 
-import duckdb
 from duckdb import DuckDBPyRelation
 
-from ._utils import SOFA2Config
+from ._utils import SOFA2Config, _arg_worst_sql
+from ._perf import _con
 from clifpy.utils.logging_config import get_logger
 
 logger = get_logger('utils.sofa2.liver')
@@ -65,7 +65,7 @@ def _calculate_liver_subscore(
     # Step 1: Get in-window bilirubin values (MAX = worst) with offset from start_dttm
     # Offset = lab_collect_dttm - start_dttm (positive for in-window)
     logger.info("Collecting worst in-window bilirubin for liver dysfunction assessment...")
-    bilirubin_in_window = duckdb.sql(f"""
+    bilirubin_in_window = _con().sql(f"""
         FROM labs_rel t
         JOIN cohort_rel c ON
             t.{id_name} = c.{id_name}
@@ -75,7 +75,7 @@ def _calculate_liver_subscore(
             t.{id_name}
             , c.start_dttm
             , MAX(lab_value_numeric) AS bilirubin_total
-            , ARG_MAX(lab_collect_dttm, lab_value_numeric) - c.start_dttm AS bilirubin_dttm_offset
+            , {_arg_worst_sql('lab_collect_dttm', 'lab_value_numeric', 'lab_collect_dttm', 'max')} - c.start_dttm AS bilirubin_dttm_offset
         WHERE t.lab_category = 'bilirubin_total'
         GROUP BY t.{id_name}, c.start_dttm
     """)
@@ -84,7 +84,7 @@ def _calculate_liver_subscore(
     # ASOF returns single closest record, so offset is directly available
     # Offset = lab_collect_dttm - start_dttm (negative for pre-window)
     logger.info("Looking back for pre-window bilirubin to handle missing data...")
-    bilirubin_pre_window = duckdb.sql(f"""
+    bilirubin_pre_window = _con().sql(f"""
         FROM cohort_rel c
         ASOF LEFT JOIN labs_rel t
             ON c.{id_name} = t.{id_name}
@@ -100,7 +100,7 @@ def _calculate_liver_subscore(
 
     # Step 3: Apply fallback pattern (use pre-window only if no in-window data)
     logger.info("Applying fallback: use pre-window bilirubin only when in-window missing...")
-    bilirubin_with_fallback = duckdb.sql(f"""
+    bilirubin_with_fallback = _con().sql(f"""
         WITH windows_with_data AS (
             SELECT DISTINCT {id_name}, start_dttm
             FROM bilirubin_in_window
@@ -117,7 +117,7 @@ def _calculate_liver_subscore(
 
     # Step 4: Calculate subscore
     logger.info("Scoring liver subscore based on bilirubin thresholds...")
-    liver_score = duckdb.sql(f"""
+    liver_score = _con().sql(f"""
         FROM cohort_rel c
         LEFT JOIN bilirubin_with_fallback b USING ({id_name}, start_dttm)
         SELECT
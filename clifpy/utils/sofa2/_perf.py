@@ -3,8 +3,12 @@
 Provides:
 - StepTimer: Collects per-step wall-clock timing via context manager
 - NoOpTimer: Zero-cost drop-in replacement when profiling is off
-- _register_temp_table / _cleanup_temp_tables: Temp table lifecycle management
-- _with_duckdb_config: Context manager for DuckDB resource limits with save/restore
+- _materialize_subscore: Materialize a subscore relation into a registered temp table
+- _con: DuckDB connection for sofa2 queries (a worker's own cursor in concurrent runs)
+
+Temp-table lifecycle (_register_temp_table / _drop_temp_table /
+_cleanup_temp_tables) and resource limits (_with_duckdb_config) live in
+clifpy.utils._duckdb_helpers and are re-exported here for the sofa2 modules.
 """
 from __future__ import annotations
 
@@ -14,43 +18,32 @@ from dataclasses import dataclass, field
 
 import duckdb
 
+from clifpy.utils._duckdb_helpers import (  # noqa: F401  (re-exported)
+    _cleanup_temp_tables,
+    _default_connection,
+    _drop_temp_table,
+    _register_temp_table,
+    _with_duckdb_config,
+)
 
-# =============================================================================
-# Temp Table Registry
-# =============================================================================
-
-_TEMP_TABLE_REGISTRY: list[str] = []
-
-
-def _register_temp_table(name: str):
-    """Register a temp table for cleanup after pipeline completes."""
-    if name not in _TEMP_TABLE_REGISTRY:
-        _TEMP_TABLE_REGISTRY.append(name)
 
+def _con() -> duckdb.DuckDBPyConnection:
+    """DuckDB's default connection, or the worker's cursor inside a `_default_cursor` scope.
 
-def _drop_temp_table(name: str):
-    """Drop a specific temp table and remove it from the registry."""
-    try:
-        duckdb.execute(f"DROP TABLE IF EXISTS {name}")
-    except Exception:
-        pass
-    try:
-        _TEMP_TABLE_REGISTRY.remove(name)
-    except ValueError:
-        pass
+    Every sofa2 query goes through here so a subscore evaluated in a worker
+    thread (``concurrent_subscores``) builds its relations on its own cursor.
+    Call it inline (``_con().sql(...)``) so DuckDB resolves DataFrame and
+    relation names from the caller's frame.
+    """
+    return _default_connection(timezone=None)
 
 
-def _cleanup_temp_tables():
-    """Drop all registered temp tables. Best-effort, ignores errors."""
-    while _TEMP_TABLE_REGISTRY:
-        name = _TEMP_TABLE_REGISTRY.pop()
-        try:
-            duckdb.execute(f"DROP TABLE IF EXISTS {name}")
-        except Exception:
-            pass
+# =============================================================================
+# Subscore Materialization
+# =============================================================================
 
 
-def _materialize_subscore(name: str, rel) -> duckdb.DuckDBPyRelation:
+def _materialize_subscore(name: str, rel, *, shared: bool = False) -> duckdb.DuckDBPyRelation:
     """Eagerly materialize a subscore result to a DuckDB temp table.
 
     This forces evaluation of the lazy relation chain, allowing DuckDB to
@@ -63,6 +56,10 @@ def _materialize_subscore(name: str, rel) -> duckdb.DuckDBPyRelation:
         Subscore name (e.g., 'brain', 'cv'). Table will be named _sofa2_{name}.
     rel : DuckDBPyRelation
         Lazy relation to materialize.
+    shared : bool, default False
+        Create a regular table instead of a temp table, so other cursors on
+        the database (the assembly query, when computed in a worker thread)
+        can read it. Still registered for cleanup.
 
     Returns
     -------
@@ -70,68 +67,10 @@ def _materialize_subscore(name: str, rel) -> duckdb.DuckDBPyRelation:
         Reference to the materialized temp table.
     """
     table_name = f"_sofa2_{name}"
-    duckdb.execute(f"CREATE OR REPLACE TEMP TABLE {table_name} AS SELECT * FROM rel")
+    kind = "TABLE" if shared else "TEMP TABLE"
+    _con().execute(f"CREATE OR REPLACE {kind} {table_name} AS SELECT * FROM rel")
     _register_temp_table(table_name)
-    return duckdb.table(table_name)
-
-
-# =============================================================================
-# DuckDB Resource Limits
-# =============================================================================
-
-
-@contextmanager
-def _with_duckdb_config(
-    memory_limit: str | None = None,
-    temp_directory: str | None = None,
-    max_temp_directory_size: str | None = None,
-    threads: int | None = None,
-):
-    """Set DuckDB resource limits for the context duration, then restore.
-
-    Uses SET/RESET on the global DuckDB connection. Handles four layers:
-    - memory_limit: RAM cap for buffer manager (spills to disk when exceeded)
-    - temp_directory: where spill files go
-    - max_temp_directory_size: disk cap for spill files (clean error if exceeded)
-    - threads: parallel execution thread count
-
-    Only settings with non-None values are applied. When all are None,
-    this is a no-op.
-
-    Parameters
-    ----------
-    memory_limit : str, optional
-        DuckDB memory limit (e.g., '8GB', '16GB').
-    temp_directory : str, optional
-        Directory for DuckDB spill files.
-    max_temp_directory_size : str, optional
-        Max disk for spill files (e.g., '10GB').
-    threads : int, optional
-        Number of threads for parallel execution.
-    """
-    settings = {}
-    if memory_limit is not None:
-        settings['memory_limit'] = memory_limit
-    if temp_directory is not None:
-        settings['temp_directory'] = temp_directory
-    if max_temp_directory_size is not None:
-        settings['max_temp_directory_size'] = max_temp_directory_size
-    if threads is not None:
-        settings['threads'] = str(threads)
-
-    if not settings:
-        yield
-        return
-
-    saved = {}
-    for key, val in settings.items():
-        saved[key] = duckdb.sql(f"SELECT current_setting('{key}')").fetchone()[0]
-        duckdb.execute(f"SET {key} = '{val}'")
-    try:
-        yield
-    finally:
-        for key, old_val in saved.items():
-            duckdb.execute(f"SET {key} = '{old_val}'")
+    return _con().table(table_name)
 
 
 # =============================================================================
@@ -189,9 +128,18 @@ class StepTimer:
                 'elapsed_s': time.perf_counter() - self._pending.pop(name),
             })
 
+    def record(self, name: str, elapsed_s: float, *, concurrent: bool = False):
+        """Add a step timed elsewhere (e.g. in a worker thread).
+
+        ``concurrent`` steps overlapped with each other inside the preceding
+        step; they are listed under it but left out of ``total``, which stays
+        wall-clock time.
+        """
+        self.results.append({'step': name, 'elapsed_s': elapsed_s, 'concurrent': concurrent})
+
     @property
     def total(self) -> float:
-        return sum(r['elapsed_s'] for r in self.results)
+        return sum(r['elapsed_s'] for r in self.results if not r.get('concurrent'))
 
     def report(self) -> str:
         lines = []
@@ -200,7 +148,8 @@ class StepTimer:
         total = self.total
         for r in self.results:
             pct = r['elapsed_s'] / total * 100 if total > 0 else 0
-            lines.append(f"{r['step']:<35} {_fmt_time(r['elapsed_s']):<15} {pct:<10.1f}")
+            step = f"  | {r['step']}" if r.get('concurrent') else r['step']
+            lines.append(f"{step:<35} {_fmt_time(r['elapsed_s']):<15} {pct:<10.1f}")
         lines.append("-" * 60)
         lines.append(f"{'TOTAL':<35} {_fmt_time(total):<15}")
         return "\n".join(lines)
@@ -221,6 +170,9 @@ class NoOpTimer:
     def stop(self, name: str):
         pass
 
+    def record(self, name: str, elapsed_s: float, *, concurrent: bool = False):
+        pass
+
     @property
     def total(self) -> float:
         return 0.0
@@ -23,10 +23,10 @@ Special rules:
 
 from __future__ import annotations
 
-import duckdb
 from duckdb import DuckDBPyRelation
 
-from ._utils import SOFA2Config
+from ._utils import SOFA2Config, _arg_worst_sql
+from ._perf import _con
 from clifpy.utils.logging_config import get_logger
 
 logger = get_logger('utils.sofa2.resp')
@@ -62,7 +62,7 @@ def _forward_fill_fio2(
     DuckDBPyRelation
         Same schema as input, with fio2_set forward-filled within device episodes.
     """
-    return duckdb.sql(f"""
+    return _con().sql(f"""
         WITH ordered AS (
             -- Detect device_category changes to create episode boundaries
             -- IS DISTINCT FROM is NULL-safe: consecutive NULLs stay in the same episode
@@ -171,7 +171,7 @@ def _calculate_resp_subscore(
     # =========================================================================
     logger.info("Applying device heuristic: inferring IMV from mode_category...")
 
-    resp_rel = duckdb.sql("""
+    resp_rel = _con().sql("""
         FROM resp_rel
         SELECT * REPLACE (
             CASE
@@ -205,7 +205,7 @@ def _calculate_resp_subscore(
     logger.info("Processing FiO2 with room air imputation and pre-window fallback...")
 
     # Get in-window FiO2 measurements
-    fio2_in_window = duckdb.sql(f"""
+    fio2_in_window = _con().sql(f"""
         FROM resp_rel t
         JOIN cohort_rel c ON
             t.{id_name} = c.{id_name}
@@ -221,7 +221,7 @@ def _calculate_resp_subscore(
     """)
 
     # Get pre-window FiO2 measurement (ASOF JOIN)
-    fio2_pre_window = duckdb.sql(f"""
+    fio2_pre_window = _con().sql(f"""
         FROM cohort_rel c
         ASOF LEFT JOIN resp_rel t
             ON c.{id_name} = t.{id_name}
@@ -239,7 +239,7 @@ def _calculate_resp_subscore(
     """)
 
     # Apply fallback and FiO2 imputation
-    fio2_imputed = duckdb.sql(f"""
+    fio2_imputed = _con().sql(f"""
         WITH windows_with_data AS (
             SELECT DISTINCT {id_name}, start_dttm
             FROM fio2_in_window
@@ -286,7 +286,7 @@ def _calculate_resp_subscore(
     # =========================================================================
     logger.info("Collecting PaO2 measurements for P/F ratio calculation...")
 
-    pao2_in_window = duckdb.sql(f"""
+    pao2_in_window = _con().sql(f"""
         FROM labs_rel t
         JOIN cohort_rel c ON
             t.{id_name} = c.{id_name}
@@ -301,7 +301,7 @@ def _calculate_resp_subscore(
             AND t.lab_value_numeric IS NOT NULL
     """)
 
-    pao2_pre_window = duckdb.sql(f"""
+    pao2_pre_window = _con().sql(f"""
         FROM cohort_rel c
         ASOF LEFT JOIN labs_rel t
             ON c.{id_name} = t.{id_name}
@@ -318,7 +318,7 @@ def _calculate_resp_subscore(
             AND time_gap <= INTERVAL '{lookback_hours} hours'
     """)
 
-    pao2_measurements = duckdb.sql(f"""
+    pao2_measurements = _con().sql(f"""
         WITH windows_with_data AS (
             SELECT DISTINCT {id_name}, start_dttm
             FROM pao2_in_window
@@ -338,7 +338,7 @@ def _calculate_resp_subscore(
     # =========================================================================
     logger.info("Collecting SpO2 measurements for S/F ratio fallback...")
 
-    spo2_in_window = duckdb.sql(f"""
+    spo2_in_window = _con().sql(f"""
         FROM vitals_rel t
         JOIN cohort_rel c ON
             t.{id_name} = c.{id_name}
@@ -354,7 +354,7 @@ def _calculate_resp_subscore(
             AND t.vital_value < 98  -- Only use SpO2 < 98% per spec
     """)
 
-    spo2_pre_window = duckdb.sql(f"""
+    spo2_pre_window = _con().sql(f"""
         FROM cohort_rel c
         ASOF LEFT JOIN vitals_rel t
             ON c.{id_name} = t.{id_name}
@@ -372,7 +372,7 @@ def _calculate_resp_subscore(
             AND time_gap <= INTERVAL '{lookback_hours} hours'
     """)
 
-    spo2_measurements = duckdb.sql(f"""
+    spo2_measurements = _con().sql(f"""
         WITH windows_with_data AS (
             SELECT DISTINCT {id_name}, start_dttm
             FROM spo2_in_window
@@ -392,7 +392,7 @@ def _calculate_resp_subscore(
     # =========================================================================
     logger.info("Computing concurrent P/F ratios using ASOF JOIN with tolerance window...")
 
-    concurrent_pf = duckdb.sql(f"""
+    concurrent_pf = _con().sql(f"""
         FROM pao2_measurements p
         ASOF JOIN fio2_imputed f
             ON p.{id_name} = f.{id_name}
@@ -419,7 +419,7 @@ def _calculate_resp_subscore(
     # =========================================================================
     logger.info("Computing concurrent S/F ratios for patients without arterial blood gas...")
 
-    concurrent_sf = duckdb.sql(f"""
+    concurrent_sf = _con().sql(f"""
         FROM spo2_measurements s
         ASOF JOIN fio2_imputed f
             ON s.{id_name} = f.{id_name}
@@ -446,7 +446,7 @@ def _calculate_resp_subscore(
     # =========================================================================
     logger.info("Selecting worst P/F ratio, falling back to S/F when PaO2 unavailable...")
 
-    resp_agg = duckdb.sql(f"""
+    resp_agg = _con().sql(f"""
         WITH pf_worst AS (
             -- Worst P/F ratio per window
             FROM concurrent_pf
@@ -454,12 +454,12 @@ def _calculate_resp_subscore(
                 {id_name}
                 , start_dttm
                 , MIN(pf_ratio) AS pf_ratio
-                , ARG_MIN(is_advanced_support, pf_ratio) AS has_advanced_support
-                , ARG_MIN(device_category, pf_ratio) AS device_category
-                , ARG_MIN(pao2, pf_ratio) AS pao2_at_worst
-                , ARG_MIN(fio2_imputed, pf_ratio) AS fio2_at_worst
-                , ARG_MIN(pao2_dttm_offset, pf_ratio) AS pao2_dttm_offset
-                , ARG_MIN(fio2_dttm_offset, pf_ratio) AS fio2_dttm_offset
+                , {_arg_worst_sql('is_advanced_support', 'pf_ratio', 'pao2_dttm_offset')} AS has_advanced_support
+                , {_arg_worst_sql('device_category', 'pf_ratio', 'pao2_dttm_offset')} AS device_category
+                , {_arg_worst_sql('pao2', 'pf_ratio', 'pao2_dttm_offset')} AS pao2_at_worst
+                , {_arg_worst_sql('fio2_imputed', 'pf_ratio', 'pao2_dttm_offset')} AS fio2_at_worst
+                , {_arg_worst_sql('pao2_dttm_offset', 'pf_ratio', 'pao2_dttm_offset')} AS pao2_dttm_offset
+                , {_arg_worst_sql('fio2_dttm_offset', 'pf_ratio', 'pao2_dttm_offset')} AS fio2_dttm_offset
             GROUP BY {id_name}, start_dttm
         ),
         sf_worst AS (
@@ -471,12 +471,12 @@ def _calculate_resp_subscore(
                 {id_name}
                 , start_dttm
                 , MIN(sf_ratio) AS sf_ratio
-                , ARG_MIN(is_advanced_support, sf_ratio) AS has_advanced_support
-                , ARG_MIN(device_category, sf_ratio) AS device_category
-                , ARG_MIN(spo2, sf_ratio) AS spo2_at_worst
-                , ARG_MIN(fio2_imputed, sf_ratio) AS fio2_at_worst
-                , ARG_MIN(spo2_dttm_offset, sf_ratio) AS spo2_dttm_offset
-                , ARG_MIN(fio2_dttm_offset, sf_ratio) AS fio2_dttm_offset
+                , {_arg_worst_sql('is_advanced_support', 'sf_ratio', 'spo2_dttm_offset')} AS has_advanced_support
+                , {_arg_worst_sql('device_category', 'sf_ratio', 'spo2_dttm_offset')} AS device_category
+                , {_arg_worst_sql('spo2', 'sf_ratio', 'spo2_dttm_offset')} AS spo2_at_worst
+                , {_arg_worst_sql('fio2_imputed', 'sf_ratio', 'spo2_dttm_offset')} AS fio2_at_worst
+                , {_arg_worst_sql('spo2_dttm_offset', 'sf_ratio', 'spo2_dttm_offset')} AS spo2_dttm_offset
+                , {_arg_worst_sql('fio2_dttm_offset', 'sf_ratio', 'spo2_dttm_offset')} AS fio2_dttm_offset
             GROUP BY {id_name}, start_dttm
         )
         -- Combine: P/F takes priority, S/F only for windows without P/F
@@ -498,7 +498,7 @@ def _calculate_resp_subscore(
     # =========================================================================
     logger.info("Checking ECMO flag for automatic score 4 override...")
 
-    ecmo_flag = duckdb.sql(f"""
+    ecmo_flag = _con().sql(f"""
         FROM ecmo_rel t
         JOIN cohort_rel c ON
             t.{id_name} = c.{id_name}
@@ -519,7 +519,7 @@ def _calculate_resp_subscore(
     # =========================================================================
     logger.info("Applying respiratory scoring based on P/F or S/F thresholds...")
 
-    resp_score = duckdb.sql(f"""
+    resp_score = _con().sql(f"""
         FROM cohort_rel c
         LEFT JOIN resp_agg r USING ({id_name}, start_dttm)
         LEFT JOIN ecmo_flag e USING ({id_name}, start_dttm)
@@ -9,9 +9,10 @@ This module contains:
 import re
 from dataclasses import dataclass
 
-import duckdb
 from duckdb import DuckDBPyRelation
 
+from ._perf import _con
+
 
 @dataclass
 class SOFA2Config:
@@ -149,7 +150,7 @@ def _extract_id_mapping(cohort_rel: DuckDBPyRelation, id_name: str) -> DuckDBPyR
     DuckDBPyRelation
         Columns: [hospitalization_id, {id_name}]
     """
-    return duckdb.sql(f"""
+    return _con().sql(f"""
         FROM cohort_rel
         SELECT DISTINCT hospitalization_id, {id_name}
     """)
@@ -180,7 +181,7 @@ def _remap_clif_rel(
     DuckDBPyRelation
         Same table with hospitalization_id replaced by id_name.
     """
-    return duckdb.sql(f"""
+    return _con().sql(f"""
         FROM clif_rel t
         JOIN mapping_rel m ON t.hospitalization_id = m.hospitalization_id
         SELECT t.* EXCLUDE(hospitalization_id), m.{id_name}
@@ -192,7 +193,8 @@ def _dedup_cohort(cohort_rel: DuckDBPyRelation, id_name: str) -> DuckDBPyRelatio
     Deduplicate cohort to unique (id_name, start_dttm, end_dttm).
 
     After extracting the mapping, drop hospitalization_id and deduplicate
-    so each (id_name, start_dttm, end_dttm) appears once.
+    so each (id_name, start_dttm, end_dttm) appears once. An optional
+    uo_anchor_dttm column (see _calculate_uo_score) is kept.
 
     Parameters
     ----------
@@ -204,11 +206,13 @@ def _dedup_cohort(cohort_rel: DuckDBPyRelation, id_name: str) -> DuckDBPyRelatio
     Returns
     -------
     DuckDBPyRelation
-        Deduplicated cohort with columns [id_name, start_dttm, end_dttm].
+        Deduplicated cohort with columns [id_name, start_dttm, end_dttm]
+        (plus uo_anchor_dttm when present).
     """
-    return duckdb.sql(f"""
+    anchor = ', uo_anchor_dttm' if 'uo_anchor_dttm' in cohort_rel.columns else ''
+    return _con().sql(f"""
         FROM cohort_rel
-        SELECT DISTINCT {id_name}, start_dttm, end_dttm
+        SELECT DISTINCT {id_name}, start_dttm, end_dttm{anchor}
     """)
 
 
@@ -254,7 +258,7 @@ def _agg_labs(
         Aggregated lab values per window with offset timestamps
     """
     # Offset = lab_collect_dttm - start_dttm (positive for in-window)
-    return duckdb.sql(f"""
+    return _con().sql(f"""
         FROM labs_rel t
         JOIN cohort_rel c ON
             t.{id_name} = c.{id_name}
@@ -265,21 +269,21 @@ def _agg_labs(
             , c.start_dttm  -- window identity
             -- MIN aggregations (worse = lower) with offsets
             , MIN(lab_value_numeric) FILTER(lab_category = 'platelet_count') AS platelet_count
-            , ARG_MIN(lab_collect_dttm, lab_value_numeric) FILTER(lab_category = 'platelet_count') - c.start_dttm AS platelet_dttm_offset
+            , {_arg_worst_sql('lab_collect_dttm', 'lab_value_numeric', 'lab_collect_dttm')} FILTER(lab_category = 'platelet_count') - c.start_dttm AS platelet_dttm_offset
             , MIN(lab_value_numeric) FILTER(lab_category = 'po2_arterial') AS po2_arterial
-            , ARG_MIN(lab_collect_dttm, lab_value_numeric) FILTER(lab_category = 'po2_arterial') - c.start_dttm AS po2_arterial_dttm_offset
+            , {_arg_worst_sql('lab_collect_dttm', 'lab_value_numeric', 'lab_collect_dttm')} FILTER(lab_category = 'po2_arterial') - c.start_dttm AS po2_arterial_dttm_offset
             -- MAX aggregations (worse = higher) with offsets
             , MAX(lab_value_numeric) FILTER(lab_category = 'creatinine') AS creatinine
-            , ARG_MAX(lab_collect_dttm, lab_value_numeric) FILTER(lab_category = 'creatinine') - c.start_dttm AS creatinine_dttm_offset
+            , {_arg_worst_sql('lab_collect_dttm', 'lab_value_numeric', 'lab_collect_dttm', 'max')} FILTER(lab_category = 'creatinine') - c.start_dttm AS creatinine_dttm_offset
             , MAX(lab_value_numeric) FILTER(lab_category = 'bilirubin_total') AS bilirubin_total
-            , ARG_MAX(lab_collect_dttm, lab_value_numeric) FILTER(lab_category = 'bilirubin_total') - c.start_dttm AS bilirubin_dttm_offset
+            , {_arg_worst_sql('lab_collect_dttm', 'lab_value_numeric', 'lab_collect_dttm', 'max')} FILTER(lab_category = 'bilirubin_total') - c.start_dttm AS bilirubin_dttm_offset
             -- Footnote p: RRT criteria fallback labs with offsets
             , MAX(lab_value_numeric) FILTER(lab_category = 'potassium') AS potassium
-            , ARG_MAX(lab_collect_dttm, lab_value_numeric) FILTER(lab_category = 'potassium') - c.start_dttm AS potassium_dttm_offset
+            , {_arg_worst_sql('lab_collect_dttm', 'lab_value_numeric', 'lab_collect_dttm', 'max')} FILTER(lab_category = 'potassium') - c.start_dttm AS potassium_dttm_offset
             , MIN(lab_value_numeric) FILTER(lab_category IN ('ph_arterial', 'ph_venous')) AS ph_min
-            , ARG_MIN(lab_collect_dttm, lab_value_numeric) FILTER(lab_category IN ('ph_arterial', 'ph_venous')) - c.start_dttm AS ph_dttm_offset
+            , {_arg_worst_sql('lab_collect_dttm', 'lab_value_numeric', 'lab_collect_dttm')} FILTER(lab_category IN ('ph_arterial', 'ph_venous')) - c.start_dttm AS ph_dttm_offset
             , MIN(lab_value_numeric) FILTER(lab_category = 'bicarbonate') AS bicarbonate
-            , ARG_MIN(lab_collect_dttm, lab_value_numeric) FILTER(lab_category = 'bicarbonate') - c.start_dttm AS bicarbonate_dttm_offset
+            , {_arg_worst_sql('lab_collect_dttm', 'lab_value_numeric', 'lab_collect_dttm')} FILTER(lab_category = 'bicarbonate') - c.start_dttm AS bicarbonate_dttm_offset
         WHERE t.lab_category IN (
             'platelet_count', 'creatinine', 'bilirubin_total', 'po2_arterial',
             'potassium', 'ph_arterial', 'ph_venous', 'bicarbonate'
@@ -310,7 +314,7 @@ def _agg_gcs(
     DuckDBPyRelation
         Columns: [id_name, start_dttm, gcs_min]
     """
-    return duckdb.sql(f"""
+    return _con().sql(f"""
         FROM assessments_rel t
         JOIN cohort_rel c ON
             t.{id_name} = c.{id_name}
@@ -348,7 +352,7 @@ def _agg_map(
         Columns: [id_name, start_dttm, map_min, map_min_dttm_offset]
         Offset is interval from start_dttm (always positive for in-window)
     """
-    return duckdb.sql(f"""
+    return _con().sql(f"""
         FROM vitals_rel t
         JOIN cohort_rel c ON
             t.{id_name} = c.{id_name}
@@ -358,7 +362,7 @@ def _agg_map(
             t.{id_name}
             , c.start_dttm  -- window identity
             , MIN(vital_value) AS map_min
-            , ARG_MIN(t.recorded_dttm, vital_value) - c.start_dttm AS map_min_dttm_offset
+            , {_arg_worst_sql('t.recorded_dttm', 'vital_value', 't.recorded_dttm')} - c.start_dttm AS map_min_dttm_offset
         WHERE vital_category = 'map'
         GROUP BY t.{id_name}, c.start_dttm
     """)
@@ -391,7 +395,7 @@ def _flag_rrt(
         Columns: [id_name, start_dttm, has_rrt, rrt_dttm_offset]
         Only includes rows where RRT was detected (has_rrt = 1)
     """
-    return duckdb.sql(f"""
+    return _con().sql(f"""
         FROM crrt_rel t
         JOIN cohort_rel c ON
             t.{id_name} = c.{id_name}
@@ -453,7 +457,7 @@ def _flag_delirium_drug(
     # --- Continuous delirium drugs (dexmedetomidine): pre-window ASOF + in-window ---
 
     # Pre-window: ASOF JOIN to detect drugs already infusing at window start
-    cont_pre_window = duckdb.sql(f"""
+    cont_pre_window = _con().sql(f"""
         WITH med_cats AS (
             SELECT UNNEST({cont_delirium_list}::VARCHAR[]) AS med_category
         ),
@@ -477,7 +481,7 @@ def _flag_delirium_drug(
     """)
 
     # In-window continuous delirium drugs
-    cont_in_window = duckdb.sql(f"""
+    cont_in_window = _con().sql(f"""
         FROM cont_meds_rel t
         JOIN cohort_rel c ON
             t.{id_name} = c.{id_name}
@@ -493,7 +497,7 @@ def _flag_delirium_drug(
 
     # --- Intermittent delirium drugs: in-window only ---
 
-    intm_in_window = duckdb.sql(f"""
+    intm_in_window = _con().sql(f"""
         FROM intm_meds_rel t
         JOIN cohort_rel c ON
             t.{id_name} = c.{id_name}
@@ -508,7 +512,7 @@ def _flag_delirium_drug(
             AND t.mar_action_category != 'not_given'
     """)
 
-    return duckdb.sql(f"""
+    return _con().sql(f"""
         FROM (
             FROM cont_pre_window SELECT *
             UNION ALL
@@ -558,7 +562,7 @@ def _flag_mechanical_cv_support(
         Columns: [id_name, start_dttm, has_mechanical_cv_support, mechanical_cv_dttm_offset]
         Only includes rows where mechanical CV support was detected (has_mechanical_cv_support = 1)
     """
-    return duckdb.sql(f"""
+    return _con().sql(f"""
         FROM ecmo_rel t
         JOIN cohort_rel c ON
             t.{id_name} = c.{id_name}
@@ -618,6 +622,35 @@ def _hemo_score_sql(value_expr: str, alias: str = 'sofa2_hemo') -> str:
             END"""
 
 
+def _arg_worst_sql(arg: str, value: str, tiebreak: str, worst: str = 'min') -> str:
+    """Generate ``ARG_MIN`` SQL for ``arg`` at the worst ``value``, ties broken by ``tiebreak``.
+
+    A bare ``ARG_MIN(arg, value)`` returns whichever tied row DuckDB meets
+    first, which changes with scan order (batching, preloading, concurrent
+    subscores). Keying on ``(value, tiebreak)`` makes the pick deterministic.
+    Rows with a NULL ``value`` are skipped, as by ``ARG_MIN`` / ``ARG_MAX``.
+
+    Parameters
+    ----------
+    arg : str
+        SQL expression to return.
+    value : str
+        SQL expression whose worst value selects the row.
+    tiebreak : str
+        Comma-separated SQL expressions ordering tied rows; the lowest wins
+        (e.g., ``'lab_collect_dttm'`` for the earliest measurement).
+    worst : {'min', 'max'}
+        Whether the worst value is the lowest or the highest. Default 'min'.
+
+    Returns
+    -------
+    str
+        SQL aggregate expression (a ``FILTER`` clause may follow it).
+    """
+    key = value if worst == 'min' else f"-({value})"
+    return f"ARG_MIN({arg}, CASE WHEN {value} IS NOT NULL THEN ({key}, {tiebreak}) END)"
+
+
 SEDATION_DRUGS = [
     'propofol',
     'dexmedetomidine',
@@ -676,7 +709,7 @@ def _find_earliest_sedation(
     sedation_drugs_tuple = tuple(SEDATION_DRUGS)
 
     # Source 1: Pre-window ASOF for continuous drugs already infusing at window start
-    cont_pre_window = duckdb.sql(f"""
+    cont_pre_window = _con().sql(f"""
         WITH med_cats AS (
             SELECT UNNEST({sedation_drugs_list}::VARCHAR[]) AS med_category
         ),
@@ -701,7 +734,7 @@ def _find_earliest_sedation(
     """)
 
     # Source 2: In-window continuous sedation drugs
-    cont_in_window = duckdb.sql(f"""
+    cont_in_window = _con().sql(f"""
         FROM cont_meds_rel t
         JOIN cohort_rel c ON
             t.{id_name} = c.{id_name}
@@ -716,7 +749,7 @@ def _find_earliest_sedation(
     """)
 
     # Source 3: In-window intermittent sedation drugs
-    intm_in_window = duckdb.sql(f"""
+    intm_in_window = _con().sql(f"""
         FROM intm_meds_rel t
         JOIN cohort_rel c ON
             t.{id_name} = c.{id_name}
@@ -732,7 +765,7 @@ def _find_earliest_sedation(
     """)
 
     # UNION ALL → MIN per window
-    return duckdb.sql(f"""
+    return _con().sql(f"""
         FROM (
             FROM cont_pre_window SELECT *
             UNION ALL
@@ -794,7 +827,7 @@ def _detect_sedation_episodes(
     # -------------------------------------------------------------------------
 
     # Pre-window: ASOF JOIN to detect drugs already infusing at window start
-    sedation_at_start = duckdb.sql(f"""
+    sedation_at_start = _con().sql(f"""
         WITH med_cats AS (
             SELECT UNNEST({sedation_drugs_list}::VARCHAR[]) AS med_category
         ),
@@ -822,7 +855,7 @@ def _detect_sedation_episodes(
     # Captures recently-stopped episodes whose post-sedation period extends into
     # the window. The ASOF above only returns the single nearest record (which may
     # be a stop), missing earlier events needed to reconstruct the full episode.
-    sedation_pre_window = duckdb.sql(f"""
+    sedation_pre_window = _con().sql(f"""
         FROM cont_meds_rel t
         JOIN cohort_rel c ON
             t.{id_name} = c.{id_name}
@@ -839,7 +872,7 @@ def _detect_sedation_episodes(
     """)
 
     # In-window: standard events during [start_dttm, end_dttm]
-    sedation_in_window = duckdb.sql(f"""
+    sedation_in_window = _con().sql(f"""
         FROM cont_meds_rel t
         JOIN cohort_rel c ON
             t.{id_name} = c.{id_name}
@@ -857,7 +890,7 @@ def _detect_sedation_episodes(
 
     # At-end: forward-fill drug state AT end_dttm (window-bounded, NOT after)
     # Uses end_dttm as synthetic admin_dttm to extend episodes to window boundary
-    sedation_at_end = duckdb.sql(f"""
+    sedation_at_end = _con().sql(f"""
         WITH med_cats AS (
             SELECT UNNEST({sedation_drugs_list}::VARCHAR[]) AS med_category
         ),
@@ -884,7 +917,7 @@ def _detect_sedation_episodes(
     """)
 
     # Combine all temporal slices
-    sedation_events = duckdb.sql("""
+    sedation_events = _con().sql("""
         FROM sedation_at_start SELECT *
         UNION ALL
         FROM sedation_pre_window SELECT *
@@ -898,7 +931,7 @@ def _detect_sedation_episodes(
     # Dedup + episode detection (unchanged pipeline)
     # -------------------------------------------------------------------------
 
-    return duckdb.sql(f"""
+    return _con().sql(f"""
         WITH deduped AS (
             -- MAR deduplication (same pattern as CV subscore)
             FROM sedation_events
@@ -1008,7 +1041,7 @@ def _expand_to_daily_windows(
 
     - Example: 47 hours → 1 row (nth_day=1); 49 hours → 2 rows (nth_day=1, 2)
     """
-    return duckdb.sql(f"""
+    return _con().sql(f"""
         WITH window_info AS (
             -- Calculate number of complete 24h periods per window
             FROM cohort_rel
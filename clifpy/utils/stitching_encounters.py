@@ -1,13 +1,107 @@
 
+import logging
 import pandas as pd
 import numpy as np
 from typing import Tuple, Optional
 
+from ._duckdb_helpers import pooled_connection
+
+logger = logging.getLogger('clifpy.utils.stitching_encounters')
+
+STITCH_ENGINES = ('pandas', 'duckdb', 'polars')
+
+# tiny tolerance for float rounding of the discharge-to-admission gap
+_LINK_EPS_HRS = 1e-6
+
+
+def _encounter_blocks_pandas(hospital_block: pd.DataFrame, time_interval: float) -> np.ndarray:
+    """Encounter block per row of ``hospital_block`` (sorted by patient_id, admission_dttm).
+
+    Gaps and islands: row i is linked when the same patient's next admission
+    starts within ``time_interval`` hours of its discharge. A chain ends on
+    every unlinked row, the running count of earlier chain ends numbers the
+    chains, and each row takes the 1-based position of its chain's last row.
+    """
+    n = len(hospital_block)
+    if n == 0:
+        return np.empty(0, dtype='int32')
+    patient = hospital_block['patient_id'].to_numpy()
+    same_patient_next = np.append((patient[1:] == patient[:-1]) & pd.notna(patient[1:]), False)
+    gap_hrs = (
+        (hospital_block['admission_dttm'].shift(-1) - hospital_block['discharge_dttm']).dt.total_seconds() / 3600
+    )
+    linked = same_patient_next & gap_hrs.le(time_interval + _LINK_EPS_HRS).to_numpy()
+
+    chain_end = ~linked
+    chain = np.concatenate(([0], np.cumsum(chain_end[:-1])))
+    return (np.flatnonzero(chain_end)[chain] + 1).astype('int32')
+
+
+def _encounter_blocks_duckdb(hospital_block: pd.DataFrame, time_interval: float) -> np.ndarray:
+    """`_encounter_blocks_pandas` as one DuckDB window query."""
+    frame = hospital_block[['patient_id', 'admission_dttm', 'discharge_dttm']].assign(
+        _pos=np.arange(1, len(hospital_block) + 1)
+    )
+    with pooled_connection() as conn:
+        conn.register('_stitch_hosp', frame)
+        try:
+            blocks = conn.execute(f"""
+                WITH linked AS (
+                    SELECT _pos,
+                           COALESCE(
+                               patient_id = LEAD(patient_id) OVER w
+                               AND (epoch(LEAD(admission_dttm) OVER w) - epoch(discharge_dttm)) / 3600
+                                   <= {time_interval + _LINK_EPS_HRS},
+                               false
+                           ) AS linked
+                    FROM _stitch_hosp
+                    WINDOW w AS (ORDER BY _pos)
+                ), chains AS (
+                    SELECT _pos,
+                           SUM(CASE WHEN linked THEN 0 ELSE 1 END) OVER (ORDER BY _pos)
+                               - CASE WHEN linked THEN 0 ELSE 1 END AS chain
+                    FROM linked
+                )
+                SELECT CAST(MAX(_pos) OVER (PARTITION BY chain) AS INTEGER) AS encounter_block
+                FROM chains
+                ORDER BY _pos
+            """).fetchnumpy()['encounter_block']
+        finally:
+            conn.unregister('_stitch_hosp')
+    return np.asarray(blocks, dtype='int32')
+
+
+def _encounter_blocks_polars(hospital_block: pd.DataFrame, time_interval: float) -> np.ndarray:
+    """`_encounter_blocks_pandas` as Polars expressions."""
+    import polars as pl
+
+    frame = pl.from_pandas(hospital_block[['patient_id', 'admission_dttm', 'discharge_dttm']])
+    gap_hrs = (pl.col('admission_dttm').shift(-1) - pl.col('discharge_dttm')).dt.total_nanoseconds() / 3.6e12
+    chain_end = (~pl.col('linked')).cast(pl.Int64)
+    blocks = (
+        frame.with_row_index('_pos', offset=1)
+        .with_columns(
+            linked=((pl.col('patient_id') == pl.col('patient_id').shift(-1))
+                    & (gap_hrs <= time_interval + _LINK_EPS_HRS)).fill_null(False)
+        )
+        .with_columns(chain=chain_end.cum_sum() - chain_end)
+        .select(pl.col('_pos').max().over('chain').cast(pl.Int32))
+    )
+    return blocks.to_series().to_numpy()
+
+
+_ENCOUNTER_BLOCK_ENGINES = {
+    'pandas': _encounter_blocks_pandas,
+    'duckdb': _encounter_blocks_duckdb,
+    'polars': _encounter_blocks_polars,
+}
+
 
 def stitch_encounters(
     hospitalization: pd.DataFrame, 
     adt: pd.DataFrame, 
-    time_interval: int = 6
+    time_interval: int = 6,
+    engine: str = 'pandas'
 ) -> Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
     """
     Stitches together related hospital encounters that occur within a specified time interval.
@@ -40,6 +134,10 @@ def stitch_encounters(
     time_interval : int, default=6
         Number of hours between discharge and next admission to consider encounters linked.
         If a patient is readmitted within this window, the encounters are stitched together.
+    engine : str, default='pandas'
+        How encounter blocks are computed: 'pandas' (NumPy), 'duckdb' or
+        'polars'. All three are single-pass and give identical blocks;
+        'polars' falls back to pandas when Polars is not installed.
         
     Returns
     -------
@@ -54,7 +152,7 @@ def stitch_encounters(
     Raises
     ------
     ValueError
-        If required columns are missing from input DataFrames
+        If required columns are missing from input DataFrames, or the engine is unknown
     
     Examples
     --------
@@ -64,6 +162,9 @@ def stitch_encounters(
     ...     time_interval=12  # 12-hour window
     ... )
     """
+    if engine not in STITCH_ENGINES:
+        raise ValueError(f"engine must be one of {STITCH_ENGINES}, got {engine!r}")
+
     # Validate input DataFrames
     hosp_required_cols = [
         "patient_id", "hospitalization_id", "admission_dttm", 
@@ -82,84 +183,28 @@ def stitch_encounters(
     missing_adt_cols = [col for col in adt_required_cols if col not in adt.columns]
     if missing_adt_cols:
         raise ValueError(f"Missing required columns in ADT DataFrame: {missing_adt_cols}")
-    hospitalization_filtered = hospitalization[["patient_id","hospitalization_id","admission_dttm",
-                                                "discharge_dttm","age_at_admission", "admission_type_category", "discharge_category"]].copy()
+    stitch_key_cols = ["patient_id", "hospitalization_id", "admission_dttm", "discharge_dttm"]
+    hospitalization_filtered = hospitalization[stitch_key_cols].copy()
     hospitalization_filtered['admission_dttm'] = pd.to_datetime(hospitalization_filtered['admission_dttm'])
     hospitalization_filtered['discharge_dttm'] = pd.to_datetime(hospitalization_filtered['discharge_dttm'])
 
-    hosp_adt_join = pd.merge(hospitalization_filtered[["patient_id","hospitalization_id","age_at_admission","admission_type_category",
-                                                       "admission_dttm","discharge_dttm",
-                                                        "discharge_category"]], 
-                      adt[["hospitalization_id","in_dttm","out_dttm","location_category","hospital_id"]],
-                 on="hospitalization_id",how="left")
-
-    hospital_cat = hosp_adt_join[["hospitalization_id","in_dttm","out_dttm","hospital_id"]]
-
-    # Step 1: Sort by patient_id and admission_dttm
-    hospital_block = hosp_adt_join[["patient_id","hospitalization_id","admission_dttm","discharge_dttm", "age_at_admission",  "discharge_category", "admission_type_category"]]
-    hospital_block = hospital_block.drop_duplicates()
+    # Step 1: One row per hospitalization, sorted by patient_id and admission_dttm
+    # (ADT rows only carry the block back at the end; other columns such as
+    # discharge_category must not split a stay into two rows)
+    hospital_block = hospitalization_filtered.drop_duplicates(subset=stitch_key_cols)
     hospital_block = hospital_block.sort_values(by=["patient_id", "admission_dttm"]).reset_index(drop=True)
-    hospital_block = hospital_block[["patient_id","hospitalization_id","admission_dttm","discharge_dttm", "age_at_admission",  "discharge_category", "admission_type_category"]]
-
-    # Step 2: Calculate time between discharge and next admission
-    hospital_block["next_admission_dttm"] = hospital_block.groupby("patient_id")["admission_dttm"].shift(-1)
-    hospital_block["discharge_to_next_admission_hrs"] = (
-        (hospital_block["next_admission_dttm"] - hospital_block["discharge_dttm"]).dt.total_seconds() / 3600
-    )
 
-    # Step 3: Create linked column based on time_interval
-    eps = 1e-6  # tiny tolerance for float rounding
-    hospital_block["linked_hrs"] = (
-        hospital_block["discharge_to_next_admission_hrs"].le(time_interval + eps).fillna(False)
-    )
+    # Step 2: Link each stay to the next one within time_interval and number the chains
+    if engine == 'polars':
+        try:
+            import polars  # noqa: F401
+        except ImportError:
+            logger.warning("Polars not installed. Stitching encounters with pandas")
+            engine = 'pandas'
+    hospital_block['encounter_block'] = _ENCOUNTER_BLOCK_ENGINES[engine](hospital_block, time_interval)
 
-    # Sort values to ensure correct order
-    hospital_block = hospital_block.sort_values(by=["patient_id", "admission_dttm"]).reset_index(drop=True)
-
-    # Initialize encounter_block with row indices + 1
-    hospital_block['encounter_block'] = hospital_block.index + 1
-
-    # Iteratively propagate the encounter_block values
-    while True:
-      shifted = hospital_block['encounter_block'].shift(-1)
-      mask = hospital_block['linked_hrs'] & (hospital_block['patient_id'] == hospital_block['patient_id'].shift(-1))
-      old_values = hospital_block['encounter_block'].copy()
-      hospital_block.loc[mask, 'encounter_block'] = shifted[mask]
-      if hospital_block['encounter_block'].equals(old_values):
-          break
-
-    hospital_block['encounter_block'] = hospital_block['encounter_block'].bfill().astype('int32')
-    hospital_block = pd.merge(hospital_block,hospital_cat,how="left",on="hospitalization_id")
-    hospital_block = hospital_block.sort_values(by=["patient_id", "admission_dttm","in_dttm","out_dttm"]).reset_index(drop=True)
-    hospital_block = hospital_block.drop_duplicates()
-
-    hospital_block2 = hospital_block.groupby(['patient_id','encounter_block']).agg(
-        admission_dttm=pd.NamedAgg(column='admission_dttm', aggfunc='min'),
-        discharge_dttm=pd.NamedAgg(column='discharge_dttm', aggfunc='max'),
-        admission_type_category=pd.NamedAgg(column='admission_type_category', aggfunc='first'),
-        discharge_category=pd.NamedAgg(column='discharge_category', aggfunc='last'),
-        hospital_id = pd.NamedAgg(column='hospital_id', aggfunc='last'),
-        age_at_admission=pd.NamedAgg(column='age_at_admission', aggfunc='last'),
-        list_hospitalization_id=pd.NamedAgg(column='hospitalization_id', aggfunc=lambda x: sorted(x.unique()))
-    ).reset_index()
-
-    df = pd.merge(hospital_block[["patient_id",
-                                  "hospitalization_id",
-                                  "encounter_block"]].drop_duplicates(),
-             hosp_adt_join[["hospitalization_id","location_category","in_dttm","out_dttm"]], on="hospitalization_id",how="left")
-
-    df = pd.merge(df,hospital_block2[["encounter_block",
-                                      "admission_dttm",
-                                      "discharge_dttm",
-                                      "discharge_category",
-                                      "admission_type_category",
-                                      "age_at_admission",
-                                      "hospital_id",
-                                     "list_hospitalization_id"]],on="encounter_block",how="left")
-    df = df.drop_duplicates(subset=["patient_id","encounter_block","in_dttm","out_dttm","location_category"])
-    
     # Create the mapping DataFrame
-    encounter_mapping = hospital_block[["hospitalization_id", "encounter_block"]].drop_duplicates()
+    encounter_mapping = hospital_block[["hospitalization_id", "encounter_block"]].drop_duplicates().reset_index(drop=True)
     
     # Create hospitalization_stitched DataFrame
     hospitalization_stitched = hospitalization.merge(
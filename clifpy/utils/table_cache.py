@@ -0,0 +1,234 @@
+"""
+On-disk cache of loaded CLIF tables.
+
+``BaseTable.from_file`` re-reads the source file and re-runs the ID cast and
+site-timezone relabel on every call. With ``cache=True`` the post-processed
+table is written once as an uncompressed Arrow IPC (Feather v2) file and later
+loads memory-map it back instead.
+
+Entries are keyed by the source file's path, size and modification time (every
+shard for partitioned datasets) together with the load arguments (columns,
+filters, sample size, site timezone, CLIF version and backend), so a changed
+source or different arguments simply miss the cache. Entries beyond the size
+cap are evicted least-recently-used first.
+"""
+
+import datetime as _dt
+import hashlib
+import json
+import logging
+import os
+import threading
+import uuid
+from typing import Any, Dict, List, Optional, Union
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.feather as feather
+
+from ._duckdb_config import _parse_memory_size
+from ._filters import Cohort
+
+# Initialize logger for this module
+logger = logging.getLogger('clifpy.utils.table_cache')
+
+# Bump when the stored layout or post-processing changes
+_CACHE_FORMAT_VERSION = 1
+
+_SUFFIX = '.arrow'
+
+
+class _Uncacheable(Exception):
+    """A load argument that cannot be fingerprinted (e.g. a DuckDB relation)."""
+
+
+def _source_fingerprint(path: str) -> List[Any]:
+    """(relative path, size, mtime_ns) for the file or every file under a dataset directory."""
+    if os.path.isfile(path):
+        stat = os.stat(path)
+        return [[os.path.abspath(path), stat.st_size, stat.st_mtime_ns]]
+    entries = []
+    for root, _, files in os.walk(path):
+        for name in files:
+            full = os.path.join(root, name)
+            stat = os.stat(full)
+            entries.append([os.path.relpath(full, path), stat.st_size, stat.st_mtime_ns])
+    return [[os.path.abspath(path)]] + sorted(entries)
+
+
+def _hash_arrow(table: pa.Table) -> str:
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return hashlib.sha256(sink.getvalue().to_pybytes()).hexdigest()
+
+
+def _fingerprint_value(value: Any) -> Any:
+    """JSON-serializable, content-based stand-in for a load argument."""
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    if isinstance(value, dict):
+        return {str(k): _fingerprint_value(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_fingerprint_value(v) for v in value]
+    if isinstance(value, (set, frozenset)):
+        return sorted((_fingerprint_value(v) for v in value), key=repr)
+    if isinstance(value, (pd.Timestamp, _dt.datetime, _dt.date)):
+        return value.isoformat()
+    if isinstance(value, Cohort):
+        return {'cohort': value.column, 'sha256': _hash_arrow(value.table)}
+    if isinstance(value, (pd.DataFrame, pd.Series)):
+        hashed = pd.util.hash_pandas_object(value, index=False).values
+        columns = list(value.columns) if isinstance(value, pd.DataFrame) else [value.name]
+        return {'frame': [str(c) for c in columns], 'sha256': hashlib.sha256(hashed.tobytes()).hexdigest()}
+    if isinstance(value, pa.Table):
+        return {'arrow': _hash_arrow(value)}
+    if isinstance(value, (pa.Array, pa.ChunkedArray)):
+        return {'arrow': _hash_arrow(pa.table({'v': value}))}
+    module = type(value).__module__ or ''
+    if module.startswith('polars'):
+        frame = value.collect() if hasattr(value, 'collect') else value
+        if hasattr(frame, 'to_frame') and not hasattr(frame, 'columns'):
+            frame = frame.to_frame()
+        return {'arrow': _hash_arrow(frame.to_arrow())}
+    if hasattr(value, 'item'):
+        # numpy scalar
+        return _fingerprint_value(value.item())
+    raise _Uncacheable(type(value).__name__)
+
+
+class TableCache:
+    """Size-capped LRU cache of post-processed tables as Arrow IPC files.
+
+    Parameters
+    ----------
+    cache_dir : str
+        Directory holding the cache files (created if missing).
+    max_size : str or int, optional
+        Total size cap, e.g. ``'20GB'`` or a byte count. Default ``'20GB'``.
+
+    Examples
+    --------
+    >>> from clifpy import Vitals
+    >>> from clifpy.utils.table_cache import TableCache
+    >>> cache = TableCache('output/.clifpy_cache', max_size='5GB')
+    >>> vitals = Vitals.from_file(config_path='config.yaml', cache=cache)
+    >>> cache.clear()
+    """
+
+    def __init__(self, cache_dir: str, max_size: Union[str, int] = '20GB'):
+        self.cache_dir = cache_dir
+        self.max_bytes = _parse_memory_size(max_size)
+        self._lock = threading.Lock()
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+    def __repr__(self) -> str:
+        return f"TableCache({self.cache_dir!r}, max_bytes={self.max_bytes})"
+
+    def key(self, source_path: str, **load_args: Any) -> Optional[str]:
+        """Cache key for a load of ``source_path``, or None if it cannot be cached.
+
+        Parameters
+        ----------
+        source_path : str
+            Resolved file or dataset directory.
+        **load_args
+            Every argument that affects the loaded content (columns, filters,
+            sample size, site timezone, CLIF version, backend, ...).
+        """
+        try:
+            payload = {
+                'format': _CACHE_FORMAT_VERSION,
+                'source': _source_fingerprint(source_path),
+                'args': _fingerprint_value(load_args),
+            }
+        except _Uncacheable as e:
+            logger.debug(f"Load arguments not cacheable ({e}); bypassing cache")
+            return None
+        except OSError:
+            return None
+        text = json.dumps(payload, sort_keys=True, default=str)
+        return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, key + _SUFFIX)
+
+    def get(self, key: Optional[str], as_pandas: bool = True) -> Optional[Union[pd.DataFrame, pa.Table]]:
+        """Memory-map a cached table, or return None on a miss.
+
+        Parameters
+        ----------
+        key : str or None
+            From `key`.
+        as_pandas : bool, optional
+            Convert to pandas (dtypes and timezones are restored from the stored
+            pandas metadata). False returns the memory-mapped Arrow table.
+        """
+        if key is None:
+            return None
+        path = self._path(key)
+        try:
+            table = feather.read_table(path, memory_map=True)
+            os.utime(path)  # recency for LRU eviction
+        except (FileNotFoundError, OSError, pa.ArrowInvalid):
+            return None
+        logger.debug(f"Cache hit: {os.path.basename(path)}")
+        return table.to_pandas() if as_pandas else table
+
+    def put(self, key: Optional[str], data: Union[pd.DataFrame, pa.Table]) -> None:
+        """Store a loaded table (best-effort; failures are logged, not raised)."""
+        if key is None or data is None:
+            return
+        path = self._path(key)
+        tmp_path = f"{path}.{uuid.uuid4().hex}.tmp"
+        try:
+            table = data if isinstance(data, pa.Table) else pa.Table.from_pandas(data, preserve_index=False)
+            feather.write_feather(table, tmp_path, compression='uncompressed')
+            os.replace(tmp_path, path)
+        except Exception as e:
+            logger.warning(f"Could not write table cache entry: {e}")
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            return
+        self._evict()
+
+    def entries(self) -> List[Dict[str, Any]]:
+        """Cached files, least recently used first."""
+        entries = []
+        for name in os.listdir(self.cache_dir):
+            if not name.endswith(_SUFFIX):
+                continue
+            try:
+                stat = os.stat(os.path.join(self.cache_dir, name))
+            except FileNotFoundError:
+                continue
+            entries.append({'key': name[:-len(_SUFFIX)], 'bytes': stat.st_size, 'last_used': stat.st_mtime})
+        return sorted(entries, key=lambda e: e['last_used'])
+
+    def size(self) -> int:
+        """Total bytes currently cached."""
+        return sum(e['bytes'] for e in self.entries())
+
+    def _evict(self) -> None:
+        """Delete least-recently-used entries until the cache fits ``max_bytes``."""
+        with self._lock:
+            entries = self.entries()
+            total = sum(e['bytes'] for e in entries)
+            for entry in entries:
+                if total <= self.max_bytes:
+                    break
+                try:
+                    os.remove(self._path(entry['key']))
+                    logger.debug(f"Evicted cache entry {entry['key']}")
+                except OSError:
+                    continue  # gone already, or still mapped (Windows)
+                total -= entry['bytes']
+
+    def clear(self) -> None:
+        """Delete every cached table."""
+        with self._lock:
+            for entry in self.entries():
+                try:
+                    os.remove(self._path(entry['key']))
+                except OSError:
+                    pass
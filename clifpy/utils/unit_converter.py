@@ -16,6 +16,7 @@ from duckdb import DuckDBPyRelation
 
 from clifpy.utils.logging_config import get_logger
 from clifpy.utils._duckdb_helpers import (
+    _default_connection,
     _register_temp_table,
     _cleanup_temp_tables,
 )
@@ -1293,7 +1294,7 @@ def _pin_default_tz_for_deferred_render(tz_map: dict) -> None:
         return
     tz = tz_map.get('admin_dttm') or next(iter(tz_map.values()))
     try:
-        duckdb.execute(f"SET TimeZone = '{tz}'")
+        _default_connection(timezone=tz)
     except Exception:
         logger.warning(f"Could not pin default-connection TimeZone to '{tz}' for deferred render")
 
@@ -21,6 +21,8 @@ DESIGN PRINCIPLES:
 - Default backend is Polars (memory-efficient, lazy evaluation)
 - Falls back to DuckDB if Polars is unavailable or fails a runtime smoke test
 - Uses garbage collection and cache clearing for memory management
+- run_full_dqa collects the aggregates shared by several checks in one
+  fused Polars scan (_DQAScanPlan) instead of one scan per check
 """
 import os
 import yaml
@@ -32,6 +34,7 @@ from pathlib import Path
 import gc
 
 from ..schemas import DEFAULT_CLIF_VERSION, load_schema
+from ._duckdb_helpers import _acquire_connection, _release_connection
 
 # Logger for this module
 _logger = logging.getLogger(__name__)
@@ -588,6 +591,113 @@ class DQAPlausibilityResult:
         }
 
 
+# ---------------------------------------------------------------------------
+# FUSED SCAN PLANNING (Polars backend)
+# ---------------------------------------------------------------------------
+
+class _DQAScanPlan:
+    """Aggregations several Polars checks need from one table, collected together.
+
+    Checks register named scalar aggregations (null counts, range violation
+    counts, row count) and named derived queries (category value counts,
+    distinct composite keys) against the same normalized LazyFrame.
+    :meth:`execute` collects everything with one ``pl.collect_all`` call:
+    the scalar aggregations share a single ``select`` and common-subplan
+    elimination lets the derived queries reuse that scan. Each check then
+    reads its numbers from the plan instead of issuing its own ``collect()``.
+
+    Registering the same name twice keeps the first definition, so checks
+    that need the same aggregate (e.g. the row count) share it.
+    """
+
+    def __init__(self, lf: 'pl.LazyFrame'):
+        self.lf = lf
+        self.col_names = lf.collect_schema().names()
+        self._scalars: Dict[str, 'pl.Expr'] = {}
+        self._queries: Dict[str, 'pl.LazyFrame'] = {}
+        self._scalar_row: Dict[str, Any] = {}
+        self._frames: Dict[str, 'pl.DataFrame'] = {}
+        self.executed = False
+
+    def add_scalar(self, name: str, expr: 'pl.Expr') -> None:
+        self._scalars.setdefault(name, expr.alias(name))
+
+    def add_query(self, name: str, query: 'pl.LazyFrame') -> None:
+        self._queries.setdefault(name, query)
+
+    def execute(self) -> '_DQAScanPlan':
+        if self.executed:
+            return self
+        names = list(self._queries)
+        frames = [self._queries[n] for n in names]
+        if self._scalars:
+            frames.append(self.lf.select(list(self._scalars.values())))
+        _logger.debug("Fused DQA scan: %d scalar aggregates, %d derived queries",
+                      len(self._scalars), len(names))
+        collected = pl.collect_all(frames, engine='streaming') if frames else []
+        self._frames = dict(zip(names, collected))
+        if self._scalars:
+            self._scalar_row = collected[-1].row(0, named=True)
+        self.executed = True
+        return self
+
+    def scalar(self, name: str) -> Any:
+        return self._scalar_row[name]
+
+    def query(self, name: str) -> 'pl.DataFrame':
+        return self._frames[name]
+
+
+def _planned(scan: Optional[_DQAScanPlan], lf: 'pl.LazyFrame', planner, *args) -> _DQAScanPlan:
+    """Return the shared *scan*, or a single-check plan built by *planner* and executed."""
+    if scan is None:
+        scan = _DQAScanPlan(lf)
+        planner(scan, *args)
+        scan.execute()
+    return scan
+
+
+def _plan_row_count(plan: _DQAScanPlan) -> None:
+    plan.add_scalar('row_count', pl.len())
+
+
+def _plan_missingness(plan: _DQAScanPlan, schema: Dict[str, Any]) -> None:
+    _plan_row_count(plan)
+    for col in schema.get('required_columns', []):
+        if col in plan.col_names:
+            plan.add_scalar(f'null:{col}', pl.col(col).is_null().sum())
+
+
+def _plan_category_values(plan: _DQAScanPlan, schema: Dict[str, Any]) -> None:
+    """Value counts of every mCIDE category column (B.4 and completeness B)."""
+    category_columns = schema.get('category_columns') or []
+    for col_spec in schema.get('columns', []):
+        col_name = col_spec['name']
+        if not col_spec.get('permissible_values') or col_name not in category_columns:
+            continue
+        if col_name not in plan.col_names:
+            continue
+        orig_col = f"{_ORIG_PREFIX}{col_name}"
+        if orig_col in plan.col_names:
+            query = (
+                plan.lf
+                .select([pl.col(col_name), pl.col(orig_col)])
+                .drop_nulls(subset=[col_name])
+                .group_by(col_name)
+                .agg([pl.len().alias('count'),
+                      pl.col(orig_col).first().alias('__orig_val')])
+            )
+        else:
+            query = (
+                plan.lf
+                .select(pl.col(col_name))
+                .drop_nulls()
+                .group_by(col_name)
+                .agg(pl.len().alias('count'))
+            )
+        plan.add_query(f'values:{col_name}', query)
+
+
 # ---------------------------------------------------------------------------
 # CONFORMANCE CHECKS - A. Structure Checks
 # ---------------------------------------------------------------------------
@@ -638,7 +748,8 @@ def check_table_exists(
 # A.1b. Table presence check (DataFrame-level)
 def check_table_presence_polars(
     df: Union['pl.DataFrame', 'pl.LazyFrame'],
-    table_name: str
+    table_name: str,
+    scan: Optional[_DQAScanPlan] = None,
 ) -> DQAConformanceResult:
     """
     Check that a loaded DataFrame has rows and columns using Polars.
@@ -649,6 +760,8 @@ def check_table_presence_polars(
         The data to validate
     table_name : str
         Name of the table
+    scan : _DQAScanPlan, optional
+        Executed shared scan to read the row count from (see run_full_dqa).
     """
     result = DQAConformanceResult("table_presence", table_name)
 
@@ -656,7 +769,7 @@ def check_table_presence_polars(
         lf = df if isinstance(df, pl.LazyFrame) else df.lazy()
         column_names = _strip_sidecars(lf.collect_schema().names())
         column_count = len(column_names)
-        row_count = lf.select(pl.len()).collect().item()
+        row_count = _planned(scan, lf, _plan_row_count).scalar('row_count')
 
         result.metrics["row_count"] = row_count
         result.metrics["column_count"] = column_count
@@ -732,7 +845,8 @@ def check_table_presence_duckdb(
 
 def check_table_presence(
     df: Union[pd.DataFrame, 'pl.DataFrame', 'pl.LazyFrame'],
-    table_name: str
+    table_name: str,
+    scan: Optional[_DQAScanPlan] = None,
 ) -> DQAConformanceResult:
     """
     Check that a loaded DataFrame has rows and columns.
@@ -743,10 +857,12 @@ def check_table_presence(
         Data to validate (already loaded)
     table_name : str
         Name of the table
+    scan : _DQAScanPlan, optional
+        Shared Polars scan (see run_full_dqa); ignored by the DuckDB backend.
     """
     _logger.debug("check_table_presence: starting for table '%s'", table_name)
     if _ACTIVE_BACKEND == 'polars':
-        result = check_table_presence_polars(df, table_name)
+        result = check_table_presence_polars(df, table_name, scan=scan)
     else:
         result = check_table_presence_duckdb(df, table_name)
     _logger.debug("check_table_presence: table '%s' — rows=%s, cols=%s",
@@ -1040,8 +1156,9 @@ def check_column_dtypes_duckdb(
         'DOUBLE': ['FLOAT', 'DOUBLE', 'REAL', 'DECIMAL'],
     }
 
+    con = None
     try:
-        con = duckdb.connect(':memory:')
+        con = _acquire_connection(timezone=None)
         con.register('df', df)
 
         describe_result = con.execute("DESCRIBE df").fetchall()
@@ -1125,8 +1242,6 @@ def check_column_dtypes_duckdb(
                     {"column": col_name, "expected": expected_type}
                 )
 
-        con.close()
-
         result.atomic_total = len(schema.get('columns', []))
         result.atomic_passed = result.atomic_total - len(dtype_errors)
     except Exception as e:
@@ -1135,6 +1250,8 @@ def check_column_dtypes_duckdb(
         if result.atomic_total is None:
             result.atomic_total = 0
             result.atomic_passed = 0
+    finally:
+        _release_connection(con)
 
     return result
 
@@ -1262,8 +1379,9 @@ def check_datetime_format_duckdb(
     """Validate datetime columns are in correct format using DuckDB."""
     result = DQAConformanceResult("datetime_format", table_name)
 
+    con = None
     try:
-        con = duckdb.connect(':memory:')
+        con = _acquire_connection(timezone=None)
         con.register('df', df)
 
         describe_result = con.execute("DESCRIBE df").fetchall()
@@ -1302,8 +1420,6 @@ def check_datetime_format_duckdb(
                     {"column": col}
                 )
 
-        con.close()
-
         result.atomic_total = len(all_datetime_columns)
         result.atomic_passed = len(all_datetime_columns) - len(result.errors)
     except Exception as e:
@@ -1312,6 +1428,8 @@ def check_datetime_format_duckdb(
         if result.atomic_total is None:
             result.atomic_total = 0
             result.atomic_passed = 0
+    finally:
+        _release_connection(con)
 
     return result
 
@@ -1616,8 +1734,9 @@ def check_lab_reference_units_duckdb(
 
     _log_lab_reference_units_schema_summary(schema, table_name)
 
+    con = None
     try:
-        con = duckdb.connect(':memory:')
+        con = _acquire_connection(timezone=None)
         # Self-normalize if caller invoked the check directly (e.g. from tests).
         if not any(c.startswith(_ORIG_PREFIX) for c in df.columns):
             df = _normalize_columns_pandas(df)
@@ -1625,7 +1744,6 @@ def check_lab_reference_units_duckdb(
 
         if 'lab_category' not in df.columns or 'reference_unit' not in df.columns:
             result.add_error("Missing required columns: lab_category and/or reference_unit")
-            con.close()
             result.atomic_total = 1
             result.atomic_passed = 0
             return result
@@ -1699,7 +1817,6 @@ def check_lab_reference_units_duckdb(
                 )
 
         result.metrics["invalid_unit_categories"] = invalid_count
-        con.close()
         gc.collect()
 
         result.atomic_total = len(lab_units_normalized)
@@ -1710,6 +1827,8 @@ def check_lab_reference_units_duckdb(
         if result.atomic_total is None:
             result.atomic_total = 1
             result.atomic_passed = 0
+    finally:
+        _release_connection(con)
 
     return result
 
@@ -2066,8 +2185,9 @@ def check_medication_dose_units_duckdb(
         return result
     continuous = table_name == 'medication_admin_continuous'
 
+    con = None
     try:
-        con = duckdb.connect(':memory:')
+        con = _acquire_connection(timezone=None)
         # Self-normalize if caller invoked the check directly (e.g. from tests).
         if not any(c.startswith(_ORIG_PREFIX) for c in df.columns):
             df = _normalize_columns_pandas(df)
@@ -2075,7 +2195,6 @@ def check_medication_dose_units_duckdb(
 
         if 'med_category' not in df.columns or 'med_dose_unit' not in df.columns:
             result.add_error("Missing required columns: med_category and/or med_dose_unit")
-            con.close()
             result.atomic_total = 1
             result.atomic_passed = 0
             return result
@@ -2159,7 +2278,6 @@ def check_medication_dose_units_duckdb(
         elif continuous and expected_vol:
             result.add_info("Column 'volume_infusion_rate_unit' not found in table")
 
-        con.close()
         gc.collect()
 
         result.atomic_total = len(mapping_normalized) + (1 if vol_checked else 0)
@@ -2170,6 +2288,8 @@ def check_medication_dose_units_duckdb(
         if result.atomic_total is None:
             result.atomic_total = 1
             result.atomic_passed = 0
+    finally:
+        _release_connection(con)
 
     return result
 
@@ -2195,7 +2315,8 @@ def check_medication_dose_units(
 def check_categorical_values_polars(
     df: Union['pl.DataFrame', 'pl.LazyFrame'],
     schema: Dict[str, Any],
-    table_name: str
+    table_name: str,
+    scan: Optional[_DQAScanPlan] = None,
 ) -> DQAConformanceResult:
     """Check if categorical values match mCIDE permissible values using Polars."""
     result = DQAConformanceResult("categorical_values", table_name)
@@ -2206,6 +2327,7 @@ def check_categorical_values_polars(
         if not _has_sidecars_polars(lf):
             lf = _normalize_columns_polars(lf)
         col_names = lf.collect_schema().names()
+        scan = _planned(scan, lf, _plan_category_values, schema)
 
         category_columns = schema.get('category_columns') or []
         invalid_values_by_col = {}
@@ -2228,28 +2350,8 @@ def check_categorical_values_polars(
                 columns_missing.add(col_name)
                 continue
 
-            orig_col = f"{_ORIG_PREFIX}{col_name}"
-            has_orig = orig_col in col_names
-
-            if has_orig:
-                unique_vals = (
-                    lf
-                    .select([pl.col(col_name), pl.col(orig_col)])
-                    .drop_nulls(subset=[col_name])
-                    .group_by(col_name)
-                    .agg([pl.len().alias('count'),
-                          pl.col(orig_col).first().alias('__orig_val')])
-                    .collect(streaming=True)
-                )
-            else:
-                unique_vals = (
-                    lf
-                    .select(pl.col(col_name))
-                    .drop_nulls()
-                    .group_by(col_name)
-                    .agg(pl.len().alias('count'))
-                    .collect(streaming=True)
-                )
+            has_orig = f"{_ORIG_PREFIX}{col_name}" in col_names
+            unique_vals = scan.query(f'values:{col_name}')
 
             permissible_lower = {str(v).lower().strip() for v in permissible}
 
@@ -2323,11 +2425,12 @@ def check_categorical_values_duckdb(
     """Check if categorical values match mCIDE permissible values using DuckDB."""
     result = DQAConformanceResult("categorical_values", table_name)
 
+    con = None
     try:
         # Self-normalize if caller invoked the check directly (e.g. from tests).
         if not any(c.startswith(_ORIG_PREFIX) for c in df.columns):
             df = _normalize_columns_pandas(df)
-        con = duckdb.connect(':memory:')
+        con = _acquire_connection(timezone=None)
         con.register('df', df)
 
         category_columns = schema.get('category_columns') or []
@@ -2420,8 +2523,6 @@ def check_categorical_values_duckdb(
                     {"column": col_name}
                 )
 
-        con.close()
-
         result.atomic_total = len(columns_checked)
         result.atomic_passed = len(columns_checked) - len(result.errors)
     except Exception as e:
@@ -2430,6 +2531,8 @@ def check_categorical_values_duckdb(
         if result.atomic_total is None:
             result.atomic_total = 0
             result.atomic_passed = 0
+    finally:
+        _release_connection(con)
 
     return result
 
@@ -2437,12 +2540,13 @@ def check_categorical_values_duckdb(
 def check_categorical_values(
     df: Union[pd.DataFrame, 'pl.DataFrame', 'pl.LazyFrame'],
     schema: Dict[str, Any],
-    table_name: str
+    table_name: str,
+    scan: Optional[_DQAScanPlan] = None,
 ) -> DQAConformanceResult:
     """Check if categorical values match mCIDE permissible values."""
     _logger.debug("check_categorical_values: starting for table '%s'", table_name)
     if _ACTIVE_BACKEND == 'polars':
-        result = check_categorical_values_polars(df, schema, table_name)
+        result = check_categorical_values_polars(df, schema, table_name, scan=scan)
     else:
         result = check_categorical_values_duckdb(df, schema, table_name)
     _logger.debug("check_categorical_values: table '%s' — columns_checked=%s, columns_with_invalid=%s",
@@ -2619,11 +2723,12 @@ def check_category_group_mapping_duckdb(
         result.atomic_passed = 0
         return result
 
+    con = None
     try:
         # Self-normalize if caller invoked the check directly (e.g. from tests).
         if not any(c.startswith(_ORIG_PREFIX) for c in df.columns):
             df = _normalize_columns_pandas(df)
-        con = duckdb.connect(':memory:')
+        con = _acquire_connection(timezone=None)
         con.register('mapping_df', df)
         col_names = list(df.columns)
 
@@ -2741,7 +2846,6 @@ def check_category_group_mapping_duckdb(
 
         result.atomic_total = total_pairs
         result.atomic_passed = total_pairs - mismatch_total
-        con.close()
         gc.collect()
 
     except Exception as e:
@@ -2750,6 +2854,8 @@ def check_category_group_mapping_duckdb(
         if result.atomic_total is None:
             result.atomic_total = 1
             result.atomic_passed = 0
+    finally:
+        _release_connection(con)
 
     return result
 
@@ -2779,7 +2885,8 @@ def check_missingness_polars(
     schema: Dict[str, Any],
     table_name: str,
     error_threshold: float = 50.0,
-    warning_threshold: float = 10.0
+    warning_threshold: float = 10.0,
+    scan: Optional[_DQAScanPlan] = None,
 ) -> DQACompletenessResult:
     """Check missingness in required columns using Polars."""
     result = DQACompletenessResult("missingness", table_name)
@@ -2787,6 +2894,7 @@ def check_missingness_polars(
     try:
         lf = df if isinstance(df, pl.LazyFrame) else df.lazy()
         col_names = lf.collect_schema().names()
+        scan = _planned(scan, lf, _plan_missingness, schema)
 
         required_columns = schema.get('required_columns', [])
         required_not_in_df = [c for c in required_columns if c not in col_names]
@@ -2804,7 +2912,7 @@ def check_missingness_polars(
         # Columns with allow_missing: severity capped at warning (never error)
         allow_missing_cols = {col['name'] for col in schema.get('columns', []) if col.get('allow_missing')}
 
-        total_rows = lf.select(pl.len()).collect()[0, 0]
+        total_rows = scan.scalar('row_count')
 
         if total_rows == 0:
             result.add_error("DataFrame is empty")
@@ -2815,18 +2923,11 @@ def check_missingness_polars(
             result.atomic_passed = 0
             return result
 
-        null_exprs = [
-            pl.col(c).is_null().sum().alias(f"{c}_null")
-            for c in required_in_df
-        ]
-
-        null_counts = lf.select(null_exprs).collect(streaming=True)
-
         missingness_stats = []
         high_missingness = []
 
         for col in required_in_df:
-            null_count = null_counts[0, f"{col}_null"]
+            null_count = scan.scalar(f'null:{col}')
             pct_missing = (null_count / total_rows) * 100
 
             missingness_stats.append({
@@ -2929,8 +3030,9 @@ def check_missingness_duckdb(
     """Check missingness in required columns using DuckDB."""
     result = DQACompletenessResult("missingness", table_name)
 
+    con = None
     try:
-        con = duckdb.connect(':memory:')
+        con = _acquire_connection(timezone=None)
         con.register('df', df)
 
         required_columns = schema.get('required_columns', [])
@@ -2958,7 +3060,6 @@ def check_missingness_duckdb(
             # (report_generator.collect_dqa_issues) doesn't choke on None.
             result.atomic_total = max(len(required_columns), 1)
             result.atomic_passed = 0
-            con.close()
             return result
 
         # Build a single query for all null counts (efficient single scan)
@@ -3051,7 +3152,6 @@ def check_missingness_duckdb(
         )
         result.atomic_passed = result.atomic_total - failed_errors
 
-        con.close()
         gc.collect()
 
     except Exception as e:
@@ -3060,6 +3160,8 @@ def check_missingness_duckdb(
         if result.atomic_total is None:
             result.atomic_total = 1
             result.atomic_passed = 0
+    finally:
+        _release_connection(con)
 
     return result
 
@@ -3069,7 +3171,8 @@ def check_missingness(
     schema: Dict[str, Any],
     table_name: str,
     error_threshold: float = 50.0,
-    warning_threshold: float = 10.0
+    warning_threshold: float = 10.0,
+    scan: Optional[_DQAScanPlan] = None,
 ) -> DQACompletenessResult:
     """
     Check missingness in required columns.
@@ -3086,6 +3189,8 @@ def check_missingness(
         Percent missing above which an error is raised
     warning_threshold : float
         Percent missing above which a warning is raised
+    scan : _DQAScanPlan, optional
+        Shared Polars scan (see run_full_dqa); ignored by the DuckDB backend.
 
     Returns
     -------
@@ -3095,7 +3200,7 @@ def check_missingness(
     _logger.debug("check_missingness: starting for table '%s' (error_threshold=%.1f%%, warning_threshold=%.1f%%)",
                   table_name, error_threshold, warning_threshold)
     if _ACTIVE_BACKEND == 'polars':
-        result = check_missingness_polars(df, schema, table_name, error_threshold, warning_threshold)
+        result = check_missingness_polars(df, schema, table_name, error_threshold, warning_threshold, scan=scan)
     else:
         result = check_missingness_duckdb(df, schema, table_name, error_threshold, warning_threshold)
     if result.errors:
@@ -3260,8 +3365,9 @@ def check_conditional_requirements_duckdb(
         result.atomic_passed = 0
         return result
 
+    con = None
     try:
-        con = duckdb.connect(':memory:')
+        con = _acquire_connection(timezone=None)
         con.register('df', df)
 
         # Atomic counting: 1 per (rule × then_required column) — matches
@@ -3338,7 +3444,6 @@ def check_conditional_requirements_duckdb(
 
         result.atomic_total = atomic_total
         result.atomic_passed = atomic_total - atomic_failed_by_errors
-        con.close()
 
     except Exception as e:
         _logger.error("Check 'conditional_requirements' failed for table '%s': %s", table_name, e)
@@ -3346,6 +3451,8 @@ def check_conditional_requirements_duckdb(
         if result.atomic_total is None:
             result.atomic_total = 1
             result.atomic_passed = 0
+    finally:
+        _release_connection(con)
 
     return result
 
@@ -3373,7 +3480,8 @@ def check_conditional_requirements(
 def check_mcide_value_coverage_polars(
     df: Union['pl.DataFrame', 'pl.LazyFrame'],
     schema: Dict[str, Any],
-    table_name: str
+    table_name: str,
+    scan: Optional[_DQAScanPlan] = None,
 ) -> DQACompletenessResult:
     """Check if all mCIDE standardized values are present in the data using Polars."""
     result = DQACompletenessResult("mcide_value_coverage", table_name)
@@ -3381,6 +3489,7 @@ def check_mcide_value_coverage_polars(
     try:
         lf = df if isinstance(df, pl.LazyFrame) else df.lazy()
         col_names = lf.collect_schema().names()
+        scan = _planned(scan, lf, _plan_category_values, schema)
 
         category_columns = schema.get('category_columns') or []
         coverage_by_col = {}
@@ -3406,13 +3515,8 @@ def check_mcide_value_coverage_polars(
                 columns_missing.add(col_name)
                 continue
 
-            unique_vals = (
-                lf
-                .select(pl.col(col_name).drop_nulls().unique())
-                .collect(streaming=True)
-                .to_series()
-                .to_list()
-            )
+            # Distinct values are the group keys of the shared value counts
+            unique_vals = scan.query(f'values:{col_name}').get_column(col_name).to_list()
 
             unique_vals_lower = {str(v).lower().strip() for v in unique_vals if v is not None}
 
@@ -3489,8 +3593,9 @@ def check_mcide_value_coverage_duckdb(
     """Check if all mCIDE standardized values are present in the data using DuckDB."""
     result = DQACompletenessResult("mcide_value_coverage", table_name)
 
+    con = None
     try:
-        con = duckdb.connect(':memory:')
+        con = _acquire_connection(timezone=None)
         con.register('df', df)
 
         category_columns = schema.get('category_columns') or []
@@ -3572,14 +3677,14 @@ def check_mcide_value_coverage_duckdb(
                 {"column": col_name}
             )
 
-        con.close()
-
     except Exception as e:
         _logger.error("Check 'mcide_value_coverage' failed for table '%s': %s", table_name, e)
         result.add_error(f"Error checking mCIDE value coverage: {str(e)}")
         if result.atomic_total is None:
             result.atomic_total = 1
             result.atomic_passed = 0
+    finally:
+        _release_connection(con)
 
     return result
 
@@ -3587,12 +3692,13 @@ def check_mcide_value_coverage_duckdb(
 def check_mcide_value_coverage(
     df: Union[pd.DataFrame, 'pl.DataFrame', 'pl.LazyFrame'],
     schema: Dict[str, Any],
-    table_name: str
+    table_name: str,
+    scan: Optional[_DQAScanPlan] = None,
 ) -> DQACompletenessResult:
     """Check if all mCIDE standardized values are present in the data."""
     _logger.debug("check_mcide_value_coverage: starting for table '%s'", table_name)
     if _ACTIVE_BACKEND == 'polars':
-        result = check_mcide_value_coverage_polars(df, schema, table_name)
+        result = check_mcide_value_coverage_polars(df, schema, table_name, scan=scan)
     else:
         result = check_mcide_value_coverage_duckdb(df, schema, table_name)
     _logger.debug("check_mcide_value_coverage: table '%s' — columns_checked=%s",
@@ -3676,8 +3782,9 @@ def check_relational_integrity_duckdb(
     """Check relational integrity between tables using DuckDB."""
     result = DQACompletenessResult("relational_integrity", f"{source_table}->{reference_table}")
 
+    con = None
     try:
-        con = duckdb.connect(':memory:')
+        con = _acquire_connection(timezone=None)
         con.register('source_tbl', source_df)
         con.register('ref_tbl', reference_df)
 
@@ -3722,7 +3829,6 @@ def check_relational_integrity_duckdb(
         else:
             result.add_info(f"All {key_column} values in {source_table} exist in {reference_table}")
 
-        con.close()
         gc.collect()
 
         result.atomic_total = 1
@@ -3733,6 +3839,8 @@ def check_relational_integrity_duckdb(
         if result.atomic_total is None:
             result.atomic_total = 1
             result.atomic_passed = 0
+    finally:
+        _release_connection(con)
 
     return result
 
@@ -4096,8 +4204,9 @@ def check_chronological_order_duckdb(
         result.atomic_passed = 0
         return result
 
+    con = None
     try:
-        con = duckdb.connect(':memory:')
+        con = _acquire_connection(timezone=None)
         con.register('df', df)
         violations_by_pair = {}
 
@@ -4156,8 +4265,6 @@ def check_chronological_order_duckdb(
         result.metrics["pairs_checked"] = len(violations_by_pair)
         result.metrics["violations_by_pair"] = violations_by_pair
 
-        con.close()
-
         result.atomic_total = len(chronological_rules)
         result.atomic_passed = len(chronological_rules) - len(result.errors)
     except Exception as e:
@@ -4166,6 +4273,8 @@ def check_chronological_order_duckdb(
         if result.atomic_total is None:
             result.atomic_total = len(chronological_rules) if chronological_rules else 1
             result.atomic_passed = 0
+    finally:
+        _release_connection(con)
 
     return result
 
@@ -4196,12 +4305,68 @@ def check_chronological_order(
 # A.2 Numeric range plausibility
 # ---------------------------------------------------------------------------
 
+def _numeric_range_combos(col_ranges: Dict[str, Any], two_level: bool) -> List[tuple]:
+    """Category-dependent range leaves: (cat, [unit,] min, max) in config order."""
+    combos = []
+    for cat_val, entry in col_ranges.items():
+        if not isinstance(entry, dict):
+            continue
+        if two_level:
+            for unit_val, ranges in entry.items():
+                if isinstance(ranges, dict) and 'min' in ranges:
+                    combos.append((cat_val, unit_val, ranges['min'], ranges['max']))
+        elif 'min' in entry:
+            combos.append((cat_val, entry['min'], entry['max']))
+    return combos
+
+
+def _norm_str_expr(col: str) -> 'pl.Expr':
+    return pl.col(col).cast(pl.Utf8).str.to_lowercase().str.strip_chars()
+
+
+def _plan_numeric_ranges(plan: _DQAScanPlan, table_name: str, table_config: Dict[str, Any]) -> None:
+    """Range-violation counts for every configured (col, [cat], [unit]) leaf."""
+    schema = plan.lf.collect_schema()
+    cat_map = _CATEGORY_COLUMN_MAP.get(table_name, {})
+    for col_name, col_ranges in table_config.items():
+        if col_name not in plan.col_names or not isinstance(col_ranges, dict):
+            continue
+        # String-typed numeric columns are compared as Float64
+        value = pl.col(col_name)
+        if schema[col_name] in (pl.Utf8, pl.String):
+            value = value.cast(pl.Float64, strict=False)
+
+        if 'min' in col_ranges and 'max' in col_ranges:
+            rmin, rmax = col_ranges['min'], col_ranges['max']
+            plan.add_scalar(f'range:{col_name}:total', value.drop_nulls().len())
+            plan.add_scalar(f'range:{col_name}:oor', ((value < rmin) | (value > rmax)).sum())
+            plan.add_scalar(f'range:{col_name}:below', (value < rmin).sum())
+            plan.add_scalar(f'range:{col_name}:above', (value > rmax).sum())
+            continue
+
+        cat_col_info = cat_map.get(col_name)
+        if cat_col_info is None:
+            continue
+        two_level = isinstance(cat_col_info, tuple)
+        cat_col, unit_col = cat_col_info if two_level else (cat_col_info, None)
+        if cat_col not in plan.col_names or (two_level and unit_col not in plan.col_names):
+            continue
+        for idx, combo in enumerate(_numeric_range_combos(col_ranges, two_level)):
+            rmin, rmax = combo[-2], combo[-1]
+            mask = (_norm_str_expr(cat_col) == str(combo[0]).lower().strip()) & value.is_not_null()
+            if two_level:
+                mask = mask & (_norm_str_expr(unit_col) == str(combo[1]).lower().strip())
+            plan.add_scalar(f'range:{col_name}:t{idx}', mask.sum())
+            plan.add_scalar(f'range:{col_name}:o{idx}', (mask & ((value < rmin) | (value > rmax))).sum())
+
+
 def check_numeric_range_plausibility_polars(
     df: Union['pl.DataFrame', 'pl.LazyFrame'],
     table_name: str,
     outlier_config: Optional[Dict[str, Any]] = None,
     warning_threshold: float = 0.0,
     error_threshold: float = 10.0,
+    scan: Optional[_DQAScanPlan] = None,
 ) -> DQAPlausibilityResult:
     """Check numeric values are within plausible ranges using Polars."""
     result = DQAPlausibilityResult("numeric_range_plausibility", table_name)
@@ -4226,17 +4391,7 @@ def check_numeric_range_plausibility_polars(
         # or error emitted) count as passed.
         atomic_total = 0
         atomic_passed = 0
-
-        # Pre-cast: ensure all configured columns are numeric (string → Float64)
-        schema = lf.collect_schema()
-        cast_exprs = []
-        for _col in table_config:
-            if _col in schema.names():
-                _dtype = schema[_col]
-                if _dtype in (pl.Utf8, pl.String):
-                    cast_exprs.append(pl.col(_col).cast(pl.Float64, strict=False))
-        if cast_exprs:
-            lf = lf.with_columns(cast_exprs)
+        scan = _planned(scan, lf, _plan_numeric_ranges, table_name, table_config)
 
         for col_name, col_ranges in table_config.items():
             if col_name not in col_names:
@@ -4246,18 +4401,12 @@ def check_numeric_range_plausibility_polars(
                 # Simple range: one atomic leaf
                 atomic_total += 1
                 rmin, rmax = col_ranges['min'], col_ranges['max']
-                stats = lf.select([
-                    pl.col(col_name).drop_nulls().len().alias('total'),
-                    ((pl.col(col_name) < rmin) | (pl.col(col_name) > rmax)).sum().alias('oor'),
-                    (pl.col(col_name) < rmin).sum().alias('below'),
-                    (pl.col(col_name) > rmax).sum().alias('above'),
-                ]).collect(streaming=True)
 
                 # Polars sum() over an all-null column returns None — coerce to 0.
-                total = stats[0, 'total'] or 0
-                oor = stats[0, 'oor'] or 0
-                below = stats[0, 'below'] or 0
-                above = stats[0, 'above'] or 0
+                total = scan.scalar(f'range:{col_name}:total') or 0
+                oor = scan.scalar(f'range:{col_name}:oor') or 0
+                below = scan.scalar(f'range:{col_name}:below') or 0
+                above = scan.scalar(f'range:{col_name}:above') or 0
                 pct = (oor / total * 100) if total > 0 else 0
 
                 oor_summary[col_name] = {
@@ -4299,48 +4448,21 @@ def check_numeric_range_plausibility_polars(
                     continue
 
                 if isinstance(cat_col_info, tuple):
-                    # 2-level: (category_col, unit_col) — batched single scan
+                    # 2-level: (category_col, unit_col)
                     cat_col, unit_col = cat_col_info
                     if cat_col not in col_names or unit_col not in col_names:
                         continue
 
-                    combo_keys = []  # (cat_val, unit_val, rmin, rmax)
-                    range_exprs = []
-                    lf_cat = lf.with_columns([
-                        pl.col(cat_col).cast(pl.Utf8).str.to_lowercase().str.strip_chars().alias('_cat_norm'),
-                        pl.col(unit_col).cast(pl.Utf8).str.to_lowercase().str.strip_chars().alias('_unit_norm'),
-                    ])
-
-                    for cat_val, unit_ranges in col_ranges.items():
-                        if not isinstance(unit_ranges, dict):
-                            continue
-                        for unit_val, ranges in unit_ranges.items():
-                            if not isinstance(ranges, dict) or 'min' not in ranges:
-                                continue
-                            rmin, rmax = ranges['min'], ranges['max']
-                            idx = len(combo_keys)
-                            combo_keys.append((cat_val, unit_val, rmin, rmax))
-                            cat_norm = str(cat_val).lower().strip()
-                            unit_norm = str(unit_val).lower().strip()
-                            mask = (
-                                (pl.col('_cat_norm') == cat_norm) &
-                                (pl.col('_unit_norm') == unit_norm) &
-                                pl.col(col_name).is_not_null()
-                            )
-                            oor = (pl.col(col_name) < rmin) | (pl.col(col_name) > rmax)
-                            range_exprs.append(mask.sum().alias(f'_t{idx}'))
-                            range_exprs.append((mask & oor).sum().alias(f'_o{idx}'))
-
-                    if not range_exprs:
+                    combo_keys = _numeric_range_combos(col_ranges, two_level=True)
+                    if not combo_keys:
                         continue
 
                     atomic_total += len(combo_keys)
-                    stats_row = lf_cat.select(range_exprs).collect(streaming=True)
                     total_oor = 0
                     total_count = 0
                     for idx, (cat_val, unit_val, rmin, rmax) in enumerate(combo_keys):
-                        cat_total = int(stats_row[0, f'_t{idx}'] or 0)
-                        cat_oor = int(stats_row[0, f'_o{idx}'] or 0)
+                        cat_total = int(scan.scalar(f'range:{col_name}:t{idx}') or 0)
+                        cat_oor = int(scan.scalar(f'range:{col_name}:o{idx}') or 0)
                         cat_pct = (cat_oor / cat_total * 100) if cat_total > 0 else 0
                         total_count += cat_total
                         total_oor += cat_oor
@@ -4365,39 +4487,21 @@ def check_numeric_range_plausibility_polars(
                         "out_of_range_percent": round(pct, 2),
                     }
                 else:
-                    # 1-level category-dependent — batched single scan
+                    # 1-level category-dependent
                     cat_col = cat_col_info
                     if cat_col not in col_names:
                         continue
 
-                    combo_keys = []  # (cat_val, rmin, rmax)
-                    range_exprs = []
-                    lf_cat = lf.with_columns(
-                        pl.col(cat_col).cast(pl.Utf8).str.to_lowercase().str.strip_chars().alias('_cat_norm')
-                    )
-
-                    for cat_val, ranges in col_ranges.items():
-                        if not isinstance(ranges, dict) or 'min' not in ranges:
-                            continue
-                        rmin, rmax = ranges['min'], ranges['max']
-                        idx = len(combo_keys)
-                        combo_keys.append((cat_val, rmin, rmax))
-                        cat_norm = str(cat_val).lower().strip()
-                        mask = (pl.col('_cat_norm') == cat_norm) & pl.col(col_name).is_not_null()
-                        oor = (pl.col(col_name) < rmin) | (pl.col(col_name) > rmax)
-                        range_exprs.append(mask.sum().alias(f'_t{idx}'))
-                        range_exprs.append((mask & oor).sum().alias(f'_o{idx}'))
-
-                    if not range_exprs:
+                    combo_keys = _numeric_range_combos(col_ranges, two_level=False)
+                    if not combo_keys:
                         continue
 
                     atomic_total += len(combo_keys)
-                    stats_row = lf_cat.select(range_exprs).collect(streaming=True)
                     total_oor = 0
                     total_count = 0
                     for idx, (cat_val, rmin, rmax) in enumerate(combo_keys):
-                        cat_total = int(stats_row[0, f'_t{idx}'] or 0)
-                        cat_oor = int(stats_row[0, f'_o{idx}'] or 0)
+                        cat_total = int(scan.scalar(f'range:{col_name}:t{idx}') or 0)
+                        cat_oor = int(scan.scalar(f'range:{col_name}:o{idx}') or 0)
                         cat_pct = (cat_oor / cat_total * 100) if cat_total > 0 else 0
                         total_count += cat_total
                         total_oor += cat_oor
@@ -4469,8 +4573,9 @@ def check_numeric_range_plausibility_duckdb(
         result.atomic_passed = 0
         return result
 
+    con = None
     try:
-        con = duckdb.connect(':memory:')
+        con = _acquire_connection(timezone=None)
         con.register('df', df)
         actual_cols = list(df.columns)
         oor_summary = {}
@@ -4680,7 +4785,6 @@ def check_numeric_range_plausibility_duckdb(
             else:
                 result.add_info("No numeric columns with range configuration to check")
 
-        con.close()
         gc.collect()
 
     except Exception as e:
@@ -4689,6 +4793,8 @@ def check_numeric_range_plausibility_duckdb(
         if result.atomic_total is None:
             result.atomic_total = 1
             result.atomic_passed = 0
+    finally:
+        _release_connection(con)
 
     return result
 
@@ -4699,13 +4805,19 @@ def check_numeric_range_plausibility(
     outlier_config: Optional[Dict[str, Any]] = None,
     warning_threshold: float = 0.0,
     error_threshold: float = 10.0,
+    scan: Optional[_DQAScanPlan] = None,
 ) -> DQAPlausibilityResult:
-    """Check numeric values are within plausible ranges."""
+    """Check numeric values are within plausible ranges.
+
+    *scan* is the shared Polars scan from run_full_dqa; the DuckDB backend
+    ignores it.
+    """
     _logger.debug("check_numeric_range_plausibility: starting for table '%s'", table_name)
     if _ACTIVE_BACKEND == 'polars':
         result = check_numeric_range_plausibility_polars(df, table_name, outlier_config,
                                                          warning_threshold=warning_threshold,
-                                                         error_threshold=error_threshold)
+                                                         error_threshold=error_threshold,
+                                                         scan=scan)
     else:
         result = check_numeric_range_plausibility_duckdb(df, table_name, outlier_config,
                                                          warning_threshold=warning_threshold,
@@ -4919,8 +5031,9 @@ def check_field_plausibility_duckdb(
         result.atomic_passed = 0
         return result
 
+    con = None
     try:
-        con = duckdb.connect(':memory:')
+        con = _acquire_connection(timezone=None)
         con.register('df', df)
         violations_by_rule = {}
         empty_string_columns = {}
@@ -5037,8 +5150,6 @@ def check_field_plausibility_duckdb(
         result.metrics["violations_by_rule"] = violations_by_rule
         result.metrics["empty_string_columns"] = empty_string_columns
 
-        con.close()
-
         result.atomic_total = len(rules)
         result.atomic_passed = len(rules) - len(result.errors)
     except Exception as e:
@@ -5047,6 +5158,8 @@ def check_field_plausibility_duckdb(
         if result.atomic_total is None:
             result.atomic_total = len(rules) if rules else 1
             result.atomic_passed = 0
+    finally:
+        _release_connection(con)
 
     return result
 
@@ -5200,13 +5313,13 @@ def check_medication_dose_unit_consistency_duckdb(
         result.atomic_passed = 0
         return result
 
+    con = None
     try:
-        con = duckdb.connect(':memory:')
+        con = _acquire_connection(timezone=None)
         con.register('df', df)
 
         if 'med_dose_unit' not in df.columns:
             result.add_info("Column 'med_dose_unit' not found in table")
-            con.close()
             result.atomic_total = 0
             result.atomic_passed = 0
             return result
@@ -5236,7 +5349,6 @@ def check_medication_dose_unit_consistency_duckdb(
 
         if total == 0:
             result.add_info("No non-null med_dose_unit values to check")
-            con.close()
             result.atomic_total = 0
             result.atomic_passed = 0
             return result
@@ -5274,7 +5386,6 @@ def check_medication_dose_unit_consistency_duckdb(
             else:
                 result.add_info("All med_dose_unit values use dose-based units (e.g. mg, mL) appropriate for intermittent administration")
 
-        con.close()
         gc.collect()
 
         result.atomic_total = 1
@@ -5285,6 +5396,8 @@ def check_medication_dose_unit_consistency_duckdb(
         if result.atomic_total is None:
             result.atomic_total = 1
             result.atomic_passed = 0
+    finally:
+        _release_connection(con)
 
     return result
 
@@ -5427,21 +5540,20 @@ def check_cross_table_temporal_plausibility_duckdb(
     """Check that datetime values fall within hospitalization bounds using DuckDB."""
     result = DQAPlausibilityResult("cross_table_temporal", target_table)
 
+    con = None
     try:
-        con = duckdb.connect(':memory:')
+        con = _acquire_connection(timezone=None)
         con.register('target_tbl', target_df)
         con.register('hosp_tbl', hospitalization_df)
 
         if 'hospitalization_id' not in target_df.columns or 'hospitalization_id' not in hospitalization_df.columns:
             result.add_info("Missing hospitalization_id column; skipping cross-table check")
-            con.close()
             result.atomic_total = 0
             result.atomic_passed = 0
             return result
 
         if 'admission_dttm' not in hospitalization_df.columns or 'discharge_dttm' not in hospitalization_df.columns:
             result.add_info("Missing admission/discharge columns in hospitalization table")
-            con.close()
             result.atomic_total = 0
             result.atomic_passed = 0
             return result
@@ -5497,7 +5609,6 @@ def check_cross_table_temporal_plausibility_duckdb(
         result.metrics["time_columns_checked"] = list(violations_by_col.keys())
         result.metrics["violations_by_column"] = violations_by_col
 
-        con.close()
         gc.collect()
 
         result.atomic_total = max(1, len(violations_by_col))
@@ -5508,6 +5619,8 @@ def check_cross_table_temporal_plausibility_duckdb(
         if result.atomic_total is None:
             result.atomic_total = 1
             result.atomic_passed = 0
+    finally:
+        _release_connection(con)
 
     return result
 
@@ -5622,13 +5735,13 @@ def check_overlapping_periods_duckdb(
     """Check for overlapping time periods within entities using DuckDB."""
     result = DQAPlausibilityResult("overlapping_periods", table_name)
 
+    con = None
     try:
-        con = duckdb.connect(':memory:')
+        con = _acquire_connection(timezone=None)
         con.register('df', df)
 
         if entity_col not in df.columns or start_col not in df.columns or end_col not in df.columns:
             result.add_info(f"Required columns ({entity_col}, {start_col}, {end_col}) not all present")
-            con.close()
             result.atomic_total = 0
             result.atomic_passed = 0
             return result
@@ -5676,7 +5789,6 @@ def check_overlapping_periods_duckdb(
                  "entities_checked": int(entities_checked)}
             )
 
-        con.close()
         gc.collect()
 
         result.atomic_total = 1
@@ -5687,6 +5799,8 @@ def check_overlapping_periods_duckdb(
         if result.atomic_total is None:
             result.atomic_total = 1
             result.atomic_passed = 0
+    finally:
+        _release_connection(con)
 
     return result
 
@@ -5934,8 +6048,9 @@ def check_category_temporal_consistency_duckdb(
     """Check category distribution consistency over time using DuckDB."""
     result = DQAPlausibilityResult("category_temporal_consistency", table_name)
 
+    con = None
     try:
-        con = duckdb.connect(':memory:')
+        con = _acquire_connection(timezone=None)
         con.register('df', df)
         actual_cols = list(df.columns)
 
@@ -5946,7 +6061,6 @@ def check_category_temporal_consistency_duckdb(
             result.add_info("No suitable datetime column found for temporal consistency check")
             result.atomic_total = 0
             result.atomic_passed = 0
-            con.close()
             return result
 
         category_columns = schema.get('category_columns') or []
@@ -5956,7 +6070,6 @@ def check_category_temporal_consistency_duckdb(
             result.add_info("No category columns found for temporal consistency check")
             result.atomic_total = 0
             result.atomic_passed = 0
-            con.close()
             return result
 
         id_col = 'hospitalization_id' if 'hospitalization_id' in actual_cols else (
@@ -6105,7 +6218,6 @@ def check_category_temporal_consistency_duckdb(
         result.atomic_total = atomic_total
         result.atomic_passed = atomic_total  # P.6 emits no errors in normal flow
 
-        con.close()
         gc.collect()
 
     except Exception as e:
@@ -6114,6 +6226,8 @@ def check_category_temporal_consistency_duckdb(
         if result.atomic_total is None:
             result.atomic_total = 1
             result.atomic_passed = 0
+    finally:
+        _release_connection(con)
 
     return result
 
@@ -6140,6 +6254,15 @@ def check_category_temporal_consistency(
 # D.1 Duplicate composite keys
 # ---------------------------------------------------------------------------
 
+def _plan_duplicate_keys(plan: _DQAScanPlan, composite_keys: List[str]) -> None:
+    _plan_row_count(plan)
+    if composite_keys and all(k in plan.col_names for k in composite_keys):
+        plan.add_query(
+            f"unique_keys:{','.join(composite_keys)}",
+            plan.lf.group_by(composite_keys).agg(pl.len().alias('_n')).select(pl.len()),
+        )
+
+
 def check_duplicate_composite_keys_polars(
     df: Union['pl.DataFrame', 'pl.LazyFrame'],
     table_name: str,
@@ -6147,6 +6270,7 @@ def check_duplicate_composite_keys_polars(
     schema: Optional[Dict[str, Any]] = None,
     warning_threshold: float = 0.0,
     error_threshold: float = 10.0,
+    scan: Optional[_DQAScanPlan] = None,
 ) -> DQAPlausibilityResult:
     """Check for duplicate composite keys using Polars."""
     result = DQAPlausibilityResult("duplicate_composite_keys", table_name)
@@ -6172,14 +6296,9 @@ def check_duplicate_composite_keys_polars(
             result.atomic_passed = 0
             return result
 
-        total = lf.select(pl.len()).collect(streaming=True).item()
-        unique = (
-            lf.group_by(composite_keys)
-            .agg(pl.len().alias('_n'))
-            .select(pl.len())
-            .collect(streaming=True)
-            .item()
-        )
+        scan = _planned(scan, lf, _plan_duplicate_keys, composite_keys)
+        total = scan.scalar('row_count')
+        unique = scan.query(f"unique_keys:{','.join(composite_keys)}").item()
         duplicates = total - unique
         pct = (duplicates / total * 100) if total > 0 else 0
 
@@ -6239,14 +6358,14 @@ def check_duplicate_composite_keys_duckdb(
         result.atomic_passed = 0
         return result
 
+    con = None
     try:
-        con = duckdb.connect(':memory:')
+        con = _acquire_connection(timezone=None)
         con.register('df', df)
 
         missing_keys = [k for k in composite_keys if k not in df.columns]
         if missing_keys:
             result.add_info(f"Composite key columns missing: {missing_keys}")
-            con.close()
             result.atomic_total = 0
             result.atomic_passed = 0
             return result
@@ -6284,7 +6403,6 @@ def check_duplicate_composite_keys_duckdb(
         else:
             result.add_info("No duplicate composite keys found")
 
-        con.close()
         gc.collect()
 
         result.atomic_total = 1
@@ -6295,6 +6413,8 @@ def check_duplicate_composite_keys_duckdb(
         if result.atomic_total is None:
             result.atomic_total = 1
             result.atomic_passed = 0
+    finally:
+        _release_connection(con)
 
     return result
 
@@ -6306,13 +6426,19 @@ def check_duplicate_composite_keys(
     schema: Optional[Dict[str, Any]] = None,
     warning_threshold: float = 0.0,
     error_threshold: float = 10.0,
+    scan: Optional[_DQAScanPlan] = None,
 ) -> DQAPlausibilityResult:
-    """Check for duplicate composite keys."""
+    """Check for duplicate composite keys.
+
+    *scan* is the shared Polars scan from run_full_dqa; the DuckDB backend
+    ignores it.
+    """
     _logger.debug("check_duplicate_composite_keys: starting for table '%s'", table_name)
     if _ACTIVE_BACKEND == 'polars':
         result = check_duplicate_composite_keys_polars(df, table_name, composite_keys, schema,
                                                        warning_threshold=warning_threshold,
-                                                       error_threshold=error_threshold)
+                                                       error_threshold=error_threshold,
+                                                       scan=scan)
     else:
         result = check_duplicate_composite_keys_duckdb(df, table_name, composite_keys, schema,
                                                        warning_threshold=warning_threshold,
@@ -6324,10 +6450,38 @@ def check_duplicate_composite_keys(
 # COMPREHENSIVE DQA RUNNER
 # ---------------------------------------------------------------------------
 
+def _plan_table_scan(
+    lf: 'pl.LazyFrame',
+    schema: Dict[str, Any],
+    table_name: str,
+) -> Optional[_DQAScanPlan]:
+    """Collect the aggregates of every fusable single-table check in one pass.
+
+    Covers table presence, missingness, categorical values, mCIDE value
+    coverage, numeric range plausibility and duplicate composite keys.
+    Returns None when the fused collect fails, so each check falls back to
+    its own scan and reports its own error.
+    """
+    plan = _DQAScanPlan(lf)
+    _plan_missingness(plan, schema)
+    _plan_category_values(plan, schema)
+    table_config = _load_outlier_config().get('tables', {}).get(table_name, {})
+    if table_config:
+        _plan_numeric_ranges(plan, table_name, table_config)
+    _plan_duplicate_keys(plan, _get_composite_keys(table_name, schema))
+    try:
+        return plan.execute()
+    except Exception as e:
+        _logger.warning("Fused DQA scan failed for table '%s', running checks separately: %s",
+                        table_name, e)
+        return None
+
+
 def run_conformance_checks(
     df: Union[pd.DataFrame, 'pl.DataFrame', 'pl.LazyFrame'],
     schema: Dict[str, Any],
-    table_name: str
+    table_name: str,
+    scan: Optional[_DQAScanPlan] = None,
 ) -> Dict[str, DQAConformanceResult]:
     """
     Run all conformance checks on a table.
@@ -6340,6 +6494,8 @@ def run_conformance_checks(
         Schema for the table
     table_name : str
         Name of the table
+    scan : _DQAScanPlan, optional
+        Shared Polars scan built by run_full_dqa from the normalized *df*.
 
     Returns
     -------
@@ -6359,7 +6515,7 @@ def run_conformance_checks(
 
     results = {}
 
-    results['table_presence'] = check_table_presence(df, table_name)
+    results['table_presence'] = check_table_presence(df, table_name, scan=scan)
     gc.collect()
 
     results['required_columns'] = check_required_columns(df, schema, table_name)
@@ -6379,7 +6535,7 @@ def run_conformance_checks(
         results['medication_dose_units'] = check_medication_dose_units(df, schema, table_name)
         gc.collect()
 
-    results['categorical_values'] = check_categorical_values(df, schema, table_name)
+    results['categorical_values'] = check_categorical_values(df, schema, table_name, scan=scan)
     gc.collect()
 
     results['category_group_mapping'] = check_category_group_mapping(df, schema, table_name)
@@ -6397,7 +6553,8 @@ def run_completeness_checks(
     schema: Dict[str, Any],
     table_name: str,
     error_threshold: float = 50.0,
-    warning_threshold: float = 10.0
+    warning_threshold: float = 10.0,
+    scan: Optional[_DQAScanPlan] = None,
 ) -> Dict[str, DQACompletenessResult]:
     """
     Run all completeness checks on a table.
@@ -6414,6 +6571,8 @@ def run_completeness_checks(
         Percent missing above which an error is raised
     warning_threshold : float
         Percent missing above which a warning is raised
+    scan : _DQAScanPlan, optional
+        Shared Polars scan built by run_full_dqa from the normalized *df*.
 
     Returns
     -------
@@ -6433,14 +6592,14 @@ def run_completeness_checks(
     results = {}
 
     results['missingness'] = check_missingness(
-        df, schema, table_name, error_threshold, warning_threshold
+        df, schema, table_name, error_threshold, warning_threshold, scan=scan
     )
     gc.collect()
 
     results['conditional_requirements'] = check_conditional_requirements(df, table_name)
     gc.collect()
 
-    results['mcide_value_coverage'] = check_mcide_value_coverage(df, schema, table_name)
+    results['mcide_value_coverage'] = check_mcide_value_coverage(df, schema, table_name, scan=scan)
     gc.collect()
 
     passed = sum(1 for r in results.values() if r.passed)
@@ -7266,6 +7425,7 @@ def run_plausibility_checks(
     table_name: str,
     hosp_years: Optional[set] = None,
     plausibility_thresholds: Optional[Dict[str, Dict[str, float]]] = None,
+    scan: Optional[_DQAScanPlan] = None,
 ) -> Dict[str, DQAPlausibilityResult]:
     """
     Run all single-table plausibility checks on a table.
@@ -7280,6 +7440,8 @@ def run_plausibility_checks(
         Name of the table
     plausibility_thresholds : dict, optional
         Override default plausibility thresholds per check.
+    scan : _DQAScanPlan, optional
+        Shared Polars scan built by run_full_dqa from the normalized *df*.
 
     Returns
     -------
@@ -7313,7 +7475,7 @@ def run_plausibility_checks(
 
     # A.2 Numeric range plausibility
     results['numeric_range_plausibility'] = check_numeric_range_plausibility(
-        df, table_name, **thresholds['numeric_range_plausibility'])
+        df, table_name, **thresholds['numeric_range_plausibility'], scan=scan)
     gc.collect()
 
     # A.3 Field-level plausibility
@@ -7343,7 +7505,7 @@ def run_plausibility_checks(
 
     # D.1 Duplicate composite keys
     results['duplicate_composite_keys'] = check_duplicate_composite_keys(
-        df, table_name, schema=schema, **thresholds['duplicate_composite_keys'])
+        df, table_name, schema=schema, **thresholds['duplicate_composite_keys'], scan=scan)
     gc.collect()
 
     passed = sum(1 for r in results.values() if r.passed)
@@ -7471,6 +7633,12 @@ def run_full_dqa(
     checks, and — when *tables* is provided — auto-detected relational
     integrity and cross-table plausibility checks.
 
+    The table is converted and case-normalized once for all three check
+    families. On the Polars backend the aggregates behind table presence,
+    missingness, categorical values, mCIDE coverage, numeric ranges and
+    duplicate keys are then collected in one fused scan, and those checks
+    read their results from it.
+
     Parameters
     ----------
     df : DataFrame
@@ -7528,10 +7696,19 @@ def run_full_dqa(
         'plausibility': {},
     }
 
+    # Convert and normalize once; the family runners skip both for a
+    # frame that already carries sidecars.
+    if _ACTIVE_BACKEND == 'polars' and isinstance(df, pd.DataFrame):
+        df = pl.from_pandas(df)
+    df = _normalize_for_validation(df)
+    scan = None
+    if _ACTIVE_BACKEND == 'polars' and HAS_POLARS and isinstance(df, pl.LazyFrame):
+        scan = _plan_table_scan(df, schema, table_name)
+
     results['conformance'] = {
         k: v.to_dict()
         for k, v in _stamp_clif_version(
-            run_conformance_checks(df, schema, table_name), resolved_version
+            run_conformance_checks(df, schema, table_name, scan=scan), resolved_version
         ).items()
     }
 
@@ -7539,7 +7716,7 @@ def run_full_dqa(
         k: v.to_dict()
         for k, v in _stamp_clif_version(
             run_completeness_checks(
-                df, schema, table_name, error_threshold, warning_threshold
+                df, schema, table_name, error_threshold, warning_threshold, scan=scan
             ),
             resolved_version,
         ).items()
@@ -7586,7 +7763,7 @@ def run_full_dqa(
         for k, v in _stamp_clif_version(
             run_plausibility_checks(
                 df, schema, table_name, hosp_years=hosp_years,
-                plausibility_thresholds=plausibility_thresholds,
+                plausibility_thresholds=plausibility_thresholds, scan=scan,
             ),
             resolved_version,
         ).items()
@@ -1,9 +1,222 @@
+import os
 import pandas as pd
 import numpy as np
 from tqdm import tqdm
-from typing import Union
+from typing import Dict, List, Optional, Union
 import duckdb 
 
+from clifpy.utils._batch_runner import run_batches
+from clifpy.utils._duckdb_config import DuckDBResourceConfig
+from clifpy.utils._duckdb_helpers import pooled_connection
+from clifpy.utils.wide_dataset import _WidePartitionWriter, _write_partition
+
+WATERFALL_ENGINES = ("pandas", "duckdb")
+
+_LABEL_COLS = ["device_category", "device_name", "mode_category", "mode_name"]
+_NUM_COLS = [
+    "tracheostomy", "fio2_set", "lpm_set", "peep_set",
+    "tidal_volume_set", "resp_rate_set", "resp_rate_obs",
+    "pressure_support_set", "peak_inspiratory_pressure_set",
+]
+
+
+def _normalize_waterfall_input(resp_support: pd.DataFrame) -> pd.DataFrame:
+    """Copy with categoricals as object, lower-cased labels and numeric setters."""
+    rs = resp_support.copy()
+
+    # Categoricals (esp. unordered ones returned by CLIF loaders for memory
+    # efficiency) break sort_values() and several pandas string operations
+    # downstream. Cast them once on input so the rest of the function can
+    # treat dtypes as plain object/numeric.
+    cat_cols = rs.select_dtypes(include='category').columns
+    if len(cat_cols):
+        rs[cat_cols] = rs[cat_cols].astype('object')
+
+    # Lower-case categorical strings
+    for c in _LABEL_COLS:
+        if c in rs.columns:
+            rs[c] = rs[c].str.lower()
+
+    # Numeric coercion
+    num_cols = [c for c in _NUM_COLS if c in rs.columns]
+    if num_cols:
+        rs[num_cols] = rs[num_cols].apply(pd.to_numeric, errors="coerce")
+    return rs
+
+
+def waterfall_table_stats(resp_support: pd.DataFrame) -> Dict:
+    """
+    The table-wide choices of the waterfall, computed over ``resp_support``.
+
+    Everything in the waterfall is per encounter except two decisions taken
+    over the whole table: whether FiO₂ is documented in percent (mean > 1)
+    and the most common IMV / NIPPV ``device_name`` used to label inferred
+    devices. Pass the result as ``table_stats`` to run part of a table (e.g.
+    one shard) exactly as the whole table would be run.
+
+    Parameters
+    ----------
+    resp_support : pd.DataFrame
+        The full table; only the label columns and ``fio2_set`` are used.
+
+    Returns
+    -------
+    dict
+        ``scale_fio2`` (bool), ``imv_device_name`` and ``nippv_device_name``.
+    """
+    cols = [c for c in _LABEL_COLS + ["fio2_set"] if c in resp_support.columns]
+    rs = _normalize_waterfall_input(resp_support[cols])
+
+    fio2_mean = rs["fio2_set"].mean(skipna=True) if "fio2_set" in rs.columns else np.nan
+
+    # Most-frequent fall-back labels
+    device_counts = rs[["device_name", "device_category"]].value_counts().reset_index()
+    imv_devices = device_counts.loc[device_counts["device_category"] == "imv", "device_name"]
+    nippv_devices = device_counts.loc[device_counts["device_category"] == "nippv", "device_name"]
+    return {
+        "scale_fio2": bool(pd.notna(fio2_mean) and fio2_mean > 1.0),
+        "imv_device_name": imv_devices.iloc[0] if len(imv_devices) > 0 else "ventilator",
+        "nippv_device_name": nippv_devices.iloc[0] if len(nippv_devices) > 0 else "bipap",
+    }
+
+
+# (column, partition, order, back-fill?, episode id) for the hierarchical IDs
+# of Phase 2; each fill is partitioned by the previous level's ID
+_ID_STEPS = [
+    ("device_category", "_id", "_pos", False, "device_cat_id"),
+    ("device_name", "_id, device_cat_id", "_tpos", True, "device_id"),
+    ("mode_category", "_id, device_id", "_pos", True, "mode_cat_id"),
+    ("mode_name", "_id, mode_cat_id", "_pos", True, "mode_name_id"),
+]
+
+
+def _filled_sql(expr: str, partition: str, order: str, bfill: bool) -> str:
+    """Window expression for ``expr`` forward- (and optionally back-) filled per partition."""
+    ffill = (f"last_value({expr} IGNORE NULLS) OVER (PARTITION BY {partition} ORDER BY {order} "
+             f"ROWS BETWEEN UNBOUNDED PRECEDING AND CURRENT ROW)")
+    if not bfill:
+        return ffill
+    back = (f"first_value({expr} IGNORE NULLS) OVER (PARTITION BY {partition} ORDER BY {order} "
+            f"ROWS BETWEEN CURRENT ROW AND UNBOUNDED FOLLOWING)")
+    return f"COALESCE({ffill}, {back})"
+
+
+def _gather(values: pd.Series, src: np.ndarray):
+    """Take each row's value from row ``src`` (-1: keep its own), as a fill would."""
+    return values.array.take(np.where(src >= 0, src, np.arange(len(src))))
+
+
+def _waterfall_ids_duckdb(rs: pd.DataFrame, id_col: str, bfill: bool) -> pd.DataFrame:
+    """Phase 2 of the waterfall as DuckDB window functions.
+
+    Each label column is factorized to integer codes, so DuckDB only sees
+    integers: a fill becomes ``last_value(... IGNORE NULLS)`` over the code and
+    the source row position, and an episode ID is a running count of code
+    changes (NaN counting as ``"missing"``). Values are then gathered back from
+    the original columns by source position, which keeps them identical to
+    the pandas ``groupby`` fills. ``rs`` must be in the pandas engine's order.
+    """
+    n = len(rs)
+    frame = {"_pos": np.arange(n), "_id": pd.factorize(rs[id_col])[0]}
+    # device_name is filled in recorded_dttm order, exactly as the pandas
+    # engine's (unstable) single-key sort leaves it
+    tpos = np.empty(n, dtype=np.int64)
+    tpos[rs[["recorded_dttm"]].reset_index(drop=True).sort_values("recorded_dttm").index.to_numpy()] = np.arange(n)
+    frame["_tpos"] = tpos
+    missing = {}
+    for col, *_ in _ID_STEPS:
+        codes, uniques = pd.factorize(rs[col])
+        frame[f"{col}_code"] = pd.arrays.IntegerArray(codes.astype("int64"), codes < 0)
+        hit = np.flatnonzero(np.asarray(uniques == "missing", dtype=bool))
+        missing[col] = int(hit[0]) if len(hit) else -1
+
+    ctes, prev = [], "_codes"
+    for col, partition, order, fill_back, id_name in _ID_STEPS:
+        code = f"{col}_code"
+        back = bfill and fill_back
+        ctes.append(f"""{col}_f AS (
+            SELECT *,
+                   {_filled_sql(code, partition, order, back)} AS {col}_fcode,
+                   {_filled_sql(f"CASE WHEN {code} IS NOT NULL THEN _pos END", partition, order, back)} AS {col}_src
+            FROM {prev}
+        )""")
+        key = f"COALESCE({col}_fcode, {missing[col]})"
+        ctes.append(f"""{col}_chg AS (
+            SELECT *, ({key} IS DISTINCT FROM LAG({key}) OVER (PARTITION BY _id ORDER BY _pos))::INTEGER AS {col}_new
+            FROM {col}_f
+        )""")
+        ctes.append(f"""{col}_ids AS (
+            SELECT *, SUM({col}_new) OVER (PARTITION BY _id ORDER BY _pos
+                                          ROWS BETWEEN UNBOUNDED PRECEDING AND CURRENT ROW) AS {id_name}
+            FROM {col}_chg
+        )""")
+        prev = f"{col}_ids"
+    outputs = ", ".join(
+        [f"COALESCE({col}_src, -1) AS {col}_src" for col, *_ in _ID_STEPS]
+        + [f"CAST({id_name} AS INTEGER) AS {id_name}" for *_, id_name in _ID_STEPS]
+    )
+    sql = f"WITH {', '.join(ctes)} SELECT {outputs} FROM {prev} ORDER BY _pos"
+
+    with pooled_connection() as con:
+        con.register("_codes", pd.DataFrame(frame))
+        try:
+            out = con.execute(sql).fetchnumpy()
+        finally:
+            con.unregister("_codes")
+
+    for col, _, _, fill_back, id_name in _ID_STEPS:
+        filled = pd.Series(_gather(rs[col], np.asarray(out[f"{col}_src"])), index=rs.index)
+        # the pandas engine's groupby().transform() results are inferred
+        rs[col] = filled.infer_objects(copy=False) if col != "device_category" else filled
+        rs[id_name] = np.asarray(out[id_name], dtype="int32")
+    return rs
+
+
+def _waterfall_fill_duckdb(rs: pd.DataFrame, id_col: str, num_cols_fill: List[str], bfill: bool) -> pd.DataFrame:
+    """Phase 3 numeric fill and tracheostomy ffill as DuckDB window functions.
+
+    Numeric setters are filled inside each ``(id_col, mode_name_id)`` block,
+    restarting at every trach-collar row; tracheostomy is forward-filled per
+    encounter. As in `_waterfall_ids_duckdb`, DuckDB returns source positions
+    and the values are gathered from the original columns.
+    """
+    frame = {
+        "_pos": np.arange(len(rs)),
+        "_id": pd.factorize(rs[id_col])[0],
+        "mode_name_id": rs["mode_name_id"].to_numpy(),
+        "_tc": rs["device_category"].eq("trach collar").to_numpy(dtype=bool),
+    }
+    sources = []
+    for i, col in enumerate(num_cols_fill):
+        frame[f"_nn{i}"] = rs[col].notna().to_numpy()
+        sources.append(f"COALESCE({_filled_sql(f'CASE WHEN _nn{i} THEN _pos END', '_id, mode_name_id, _breaker', '_pos', bfill)}, -1) AS _src{i}")
+    if "tracheostomy" in rs.columns:
+        frame["_nn_trach"] = rs["tracheostomy"].notna().to_numpy()
+        sources.append(f"COALESCE({_filled_sql('CASE WHEN _nn_trach THEN _pos END', '_id', '_pos', False)}, -1) AS _src_trach")
+    if not sources:
+        return rs
+
+    sql = f"""
+        WITH blocks AS (
+            SELECT *, SUM(_tc::INTEGER) OVER (PARTITION BY _id, mode_name_id ORDER BY _pos
+                                              ROWS BETWEEN UNBOUNDED PRECEDING AND CURRENT ROW) AS _breaker
+            FROM _fill
+        )
+        SELECT {', '.join(sources)} FROM blocks ORDER BY _pos
+    """
+    with pooled_connection() as con:
+        con.register("_fill", pd.DataFrame(frame))
+        try:
+            out = con.execute(sql).fetchnumpy()
+        finally:
+            con.unregister("_fill")
+
+    for i, col in enumerate(num_cols_fill):
+        rs[col] = _gather(rs[col], np.asarray(out[f"_src{i}"]))
+    if "tracheostomy" in rs.columns:
+        rs["tracheostomy"] = _gather(rs["tracheostomy"], np.asarray(out["_src_trach"]))
+    return rs
+
 
 def process_resp_support_waterfall(
     resp_support: pd.DataFrame,
@@ -11,6 +224,8 @@ def process_resp_support_waterfall(
     id_col: str = "hospitalization_id",
     bfill: bool = False,                
     verbose: bool = True,
+    engine: str = "pandas",
+    table_stats: Optional[Dict] = None,
 ) -> pd.DataFrame:
     """
     Clean + waterfall-fill the CLIF **`resp_support`** table
@@ -27,6 +242,15 @@ def process_resp_support_waterfall(
         If *False* (default) only forward-fill is used.
     verbose : bool, default ``True``
         Prints progress banners when *True*.
+    engine : str, default ``"pandas"``
+        ``"pandas"`` is the reference implementation (per-group fills).
+        ``"duckdb"`` computes the episode IDs and fills of Phases 2-3 with
+        window functions in a handful of queries and returns an identical
+        frame; use it for large tables.
+    table_stats : dict, optional
+        Table-wide choices from `waterfall_table_stats`. Computed from
+        ``resp_support`` when omitted; pass the full table's when
+        ``resp_support`` is only part of it (as the sharded mode does).
 
     Returns
     -------
@@ -48,6 +272,9 @@ def process_resp_support_waterfall(
     calling if needed.
     """
 
+    if engine not in WATERFALL_ENGINES:
+        raise ValueError(f"engine must be one of {WATERFALL_ENGINES}, got {engine!r}")
+
     p = print if verbose else (lambda *_, **__: None)
 
     # ------------------------------------------------------------------ #
@@ -69,33 +296,32 @@ def process_resp_support_waterfall(
             if verbose:
                 p("  • Building hourly scaffold via DuckDB")
 
-            con = duckdb.connect()
-            # Only need id + timestamps for bounds
-            con.register("rs", rs[[id_col, "recorded_dttm"]].dropna(subset=["recorded_dttm"]))
-
-            # Generate hourly series from floor(min) to floor(max), then add :59:59
-            sql = f"""
-            WITH bounds AS (
-              SELECT
-                {id_col} AS id,
-                date_trunc('hour', MIN(recorded_dttm)) AS tmin_h,
-                date_trunc('hour', MAX(recorded_dttm)) AS tmax_h
-              FROM rs
-              GROUP BY 1
-            ),
-            hour_sequence AS (
-              SELECT
-                b.id AS {id_col},
-                gs.ts + INTERVAL '59 minutes 59 seconds' AS recorded_dttm
-              FROM bounds b,
-                   LATERAL generate_series(b.tmin_h, b.tmax_h, INTERVAL 1 HOUR) AS gs(ts)
-            )
-            SELECT {id_col}, recorded_dttm
-            FROM hour_sequence
-            ORDER BY {id_col}, recorded_dttm
-            """
-            scaffold = con.execute(sql).df()
-            con.close()
+            with pooled_connection(timezone="UTC") as con:
+                # Only need id + timestamps for bounds
+                con.register("rs", rs[[id_col, "recorded_dttm"]].dropna(subset=["recorded_dttm"]))
+
+                # Generate hourly series from floor(min) to floor(max), then add :59:59
+                sql = f"""
+                WITH bounds AS (
+                  SELECT
+                    {id_col} AS id,
+                    date_trunc('hour', MIN(recorded_dttm)) AS tmin_h,
+                    date_trunc('hour', MAX(recorded_dttm)) AS tmax_h
+                  FROM rs
+                  GROUP BY 1
+                ),
+                hour_sequence AS (
+                  SELECT
+                    b.id AS {id_col},
+                    gs.ts + INTERVAL '59 minutes 59 seconds' AS recorded_dttm
+                  FROM bounds b,
+                       LATERAL generate_series(b.tmin_h, b.tmax_h, INTERVAL 1 HOUR) AS gs(ts)
+                )
+                SELECT {id_col}, recorded_dttm
+                FROM hour_sequence
+                ORDER BY {id_col}, recorded_dttm
+                """
+                scaffold = con.execute(sql).df()
 
             # Ensure pandas datetime with UTC if input was tz-aware
             # (function contract says already UTC; this keeps dtype consistent)
@@ -141,37 +367,14 @@ def process_resp_support_waterfall(
     # Phase 0 – set-up & hourly scaffold                                 #
     # ------------------------------------------------------------------ #
     p("✦ Phase 0: initialise & create hourly scaffold")
-    rs = resp_support.copy()
-
-    # Categoricals (esp. unordered ones returned by CLIF loaders for memory
-    # efficiency) break sort_values() and several pandas string operations
-    # downstream. Cast them once on input so the rest of the function can
-    # treat dtypes as plain object/numeric.
-    cat_cols = rs.select_dtypes(include='category').columns
-    if len(cat_cols):
-        rs[cat_cols] = rs[cat_cols].astype('object')
-
-    # Lower-case categorical strings
-    for c in ["device_category", "device_name", "mode_category", "mode_name"]:
-        if c in rs.columns:
-            rs[c] = rs[c].str.lower()
-
-    # Numeric coercion
-    num_cols = [
-        "tracheostomy", "fio2_set", "lpm_set", "peep_set",
-        "tidal_volume_set", "resp_rate_set", "resp_rate_obs",
-        "pressure_support_set", "peak_inspiratory_pressure_set",
-    ]
-    num_cols = [c for c in num_cols if c in rs.columns]
-    if num_cols:
-        rs[num_cols] = rs[num_cols].apply(pd.to_numeric, errors="coerce")
+    rs = _normalize_waterfall_input(resp_support)
+    if table_stats is None:
+        table_stats = waterfall_table_stats(rs)
 
     # FiO₂ scaling if documented 40 → 0.40
-    if "fio2_set" in rs.columns:
-        fio2_mean = rs["fio2_set"].mean(skipna=True)
-        if pd.notna(fio2_mean) and fio2_mean > 1.0:
-            rs.loc[rs["fio2_set"] > 1, "fio2_set"] /= 100
-            p("  • Scaled FiO₂ values > 1 down by /100")
+    if "fio2_set" in rs.columns and table_stats["scale_fio2"]:
+        rs.loc[rs["fio2_set"] > 1, "fio2_set"] /= 100
+        p("  • Scaled FiO₂ values > 1 down by /100")
 
     # Build hourly scaffold (DuckDB if available, else pandas)
     scaffold = _build_hourly_scaffold(rs)
@@ -188,19 +391,8 @@ def process_resp_support_waterfall(
     p("✦ Phase 1: heuristic inference of device & mode")
 
     # Most-frequent fall-back labels
-    device_counts = rs[["device_name", "device_category"]].value_counts().reset_index()
-
-    imv_devices = device_counts.loc[device_counts["device_category"] == "imv", "device_name"]
-    most_common_imv_name = imv_devices.iloc[0] if len(imv_devices) > 0 else "ventilator"
-
-    nippv_devices = device_counts.loc[device_counts["device_category"] == "nippv", "device_name"]
-    most_common_nippv_name = nippv_devices.iloc[0] if len(nippv_devices) > 0 else "bipap"
-
-    mode_counts = rs[["mode_name", "mode_category"]].value_counts().reset_index()
-    cmv_modes = mode_counts.loc[
-        mode_counts["mode_category"] == "assist control-volume control", "mode_name"
-    ]
-    most_common_cmv_name = cmv_modes.iloc[0] if len(cmv_modes) > 0 else "AC/VC"
+    most_common_imv_name = table_stats["imv_device_name"]
+    most_common_nippv_name = table_stats["nippv_device_name"]
 
     # --- 1-a IMV from mode_category
     mask = (
@@ -279,32 +471,39 @@ def process_resp_support_waterfall(
             .astype("int32")
         )
 
-    rs["device_category"] = rs.groupby(id_col)["device_category"].ffill()
-    rs["device_cat_id"]   = change_id(rs["device_category"], rs[id_col])
+    def _waterfall_ids_pandas(rs: pd.DataFrame) -> pd.DataFrame:
+        rs["device_category"] = rs.groupby(id_col)["device_category"].ffill()
+        rs["device_cat_id"]   = change_id(rs["device_category"], rs[id_col])
 
-    rs["device_name"] = (
-        rs.sort_values("recorded_dttm")
-          .groupby([id_col, "device_cat_id"])["device_name"]
-          .transform(fb).infer_objects(copy=False)
-    )
-    rs["device_id"] = change_id(rs["device_name"], rs[id_col])
+        rs["device_name"] = (
+            rs.sort_values("recorded_dttm")
+              .groupby([id_col, "device_cat_id"])["device_name"]
+              .transform(fb).infer_objects(copy=False)
+        )
+        rs["device_id"] = change_id(rs["device_name"], rs[id_col])
 
-    rs = rs.sort_values([id_col, "recorded_dttm"])
-    rs["mode_category"] = (
-        rs.groupby([id_col, "device_id"])["mode_category"]
-          .transform(fb).infer_objects(copy=False)
-    )
-    rs["mode_cat_id"] = change_id(
-        rs["mode_category"].fillna("missing"), rs[id_col]
-    )
+        rs = rs.sort_values([id_col, "recorded_dttm"])
+        rs["mode_category"] = (
+            rs.groupby([id_col, "device_id"])["mode_category"]
+              .transform(fb).infer_objects(copy=False)
+        )
+        rs["mode_cat_id"] = change_id(
+            rs["mode_category"].fillna("missing"), rs[id_col]
+        )
 
-    rs["mode_name"] = (
-        rs.groupby([id_col, "mode_cat_id"])["mode_name"]
-          .transform(fb).infer_objects(copy=False)
-    )
-    rs["mode_name_id"] = change_id(
-        rs["mode_name"].fillna("missing"), rs[id_col]
-    )
+        rs["mode_name"] = (
+            rs.groupby([id_col, "mode_cat_id"])["mode_name"]
+              .transform(fb).infer_objects(copy=False)
+        )
+        rs["mode_name_id"] = change_id(
+            rs["mode_name"].fillna("missing"), rs[id_col]
+        )
+        return rs
+
+    if engine == "duckdb":
+        rs = _waterfall_ids_duckdb(rs.sort_values([id_col, "recorded_dttm"]), id_col, bfill)
+    else:
+        rs = _waterfall_ids_pandas(rs)
 
     # ------------------------------------------------------------------ #
     # Phase 3 – numeric waterfall                                        #
@@ -336,22 +535,27 @@ def process_resp_support_waterfall(
     def fill_block(g: pd.DataFrame) -> pd.DataFrame:
         if (g["device_category"] == "trach collar").any():
             breaker = (g["device_category"] == "trach collar").cumsum()
-            return g.groupby(breaker)[num_cols_fill].apply(fb)
+            # group_keys=False: keep g's index so the result aligns back onto rs
+            return g.groupby(breaker, group_keys=False)[num_cols_fill].apply(fb)
         return fb(g[num_cols_fill])
 
     p(f"  • applying waterfall fill to {rs[id_col].nunique():,} encounters")
-    tqdm.pandas(disable=not verbose, desc="Waterfall fill by mode_name_id")
-    rs[num_cols_fill] = (
-        rs.groupby([id_col, "mode_name_id"], group_keys=False, sort=False)
-          .progress_apply(fill_block)
-    )
+    if engine == "duckdb":
+        # Tracheostomy is filled here too; T-piece relabelling does not touch it
+        rs = _waterfall_fill_duckdb(rs, id_col, num_cols_fill, bfill)
+    else:
+        tqdm.pandas(disable=not verbose, desc="Waterfall fill by mode_name_id")
+        rs[num_cols_fill] = (
+            rs.groupby([id_col, "mode_name_id"], group_keys=False, sort=False)
+              .progress_apply(fill_block)
+        )
 
     # “T-piece” → classify as blow-by
     tpiece = rs["mode_category"].isna() & rs.get("device_name").str.contains("t-piece", na=False)
     rs.loc[tpiece, "mode_category"] = "blow by"
 
     # Tracheostomy flag forward-fill per encounter
-    if "tracheostomy" in rs.columns:
+    if "tracheostomy" in rs.columns and engine == "pandas":
         rs["tracheostomy"] = rs.groupby(id_col)["tracheostomy"].ffill()
 
     # ------------------------------------------------------------------ #
@@ -369,3 +573,140 @@ def process_resp_support_waterfall(
 
     p("[OK] Respiratory-support waterfall complete.")
     return rs
+
+
+def _shard_sql(id_col: str, n_shards: int) -> str:
+    """Shard of each row: a stable hash of the encounter ID.
+
+    ``hash`` is UINT64; the shard is cast to BIGINT so it comes back as a
+    plain integer (numpy ``uint64`` keys would not serialize to the manifest).
+    """
+    return f"CAST(hash(CAST({id_col} AS VARCHAR)) % {int(n_shards)} AS BIGINT)"
+
+
+def _waterfall_shard_worker(payload: Dict) -> Optional[Dict]:
+    """Run the waterfall on one shard and write it as a parquet partition."""
+    id_col = payload["id_col"]
+    df = payload["df"]
+    if df is None:
+        with pooled_connection(timezone="UTC") as con:
+            df = con.execute(
+                f"SELECT * FROM read_parquet('{payload['source']}') "
+                f"WHERE {_shard_sql(id_col, payload['n_shards'])} = {payload['shard']}"
+            ).df()
+    if df.empty:
+        return None
+
+    out = process_resp_support_waterfall(
+        df, id_col=id_col, bfill=payload["bfill"], verbose=False,
+        engine=payload["engine"], table_stats=payload["table_stats"],
+    )
+    if payload["timezone"] is not None and isinstance(out["recorded_dttm"].dtype, pd.DatetimeTZDtype):
+        out["recorded_dttm"] = out["recorded_dttm"].dt.tz_convert(payload["timezone"])
+    return _write_partition(payload["directory"], out, payload["shard"], id_col)
+
+
+def process_resp_support_waterfall_sharded(
+    resp_support: Union[pd.DataFrame, str, os.PathLike],
+    output_dir: Union[str, os.PathLike],
+    *,
+    id_col: str = "hospitalization_id",
+    bfill: bool = False,
+    engine: str = "pandas",
+    n_shards: int = 16,
+    max_workers: int = 1,
+    max_retries: int = 2,
+    memory_limit: Optional[str] = None,
+    threads: Optional[int] = None,
+    timezone: Optional[str] = None,
+    verbose: bool = True,
+) -> str:
+    """
+    Run the waterfall shard by shard and stream the result to parquet.
+
+    Encounters are split into ``n_shards`` by a hash of ``id_col``; each shard
+    (its rows plus its hourly scaffold) is processed on its own, optionally in
+    a pool of ``max_workers`` processes, and written as one
+    ``part-<shard>.parquet`` file of ``output_dir`` before the next is taken,
+    so peak memory is about one shard per worker. The table-wide choices
+    (`waterfall_table_stats`) are computed once up front, so the rows are
+    the same as from `process_resp_support_waterfall` on the whole table.
+
+    Parameters
+    ----------
+    resp_support : pd.DataFrame or path
+        The table (UTC timestamps), or the path of a parquet file holding it.
+        With a path each worker reads only its own shard from the file.
+    output_dir : str or PathLike
+        Directory for the partitions and their ``_manifest.json``; a previous
+        run's partitions there are replaced. Read the result back with
+        `load_wide_dataset` or `iter_wide_partitions`.
+    id_col, bfill, engine
+        As for `process_resp_support_waterfall`.
+    n_shards : int, default 16
+        Number of shards (and at most that many output files). More shards
+        means smaller ones.
+    max_workers : int, default 1
+        Worker processes; ``1`` runs the shards in this process.
+    max_retries : int, default 2
+        Extra attempts per shard before the run fails.
+    memory_limit, threads : optional
+        Total DuckDB budget, split evenly across workers.
+    timezone : str, optional
+        Convert ``recorded_dttm`` to this timezone before writing.
+    verbose : bool, default ``True``
+        Show a progress bar over shards.
+
+    Returns
+    -------
+    str
+        Path of the manifest. Rows are ordered by ``id_col`` and
+        ``recorded_dttm`` within each partition, not across partitions.
+    """
+    if engine not in WATERFALL_ENGINES:
+        raise ValueError(f"engine must be one of {WATERFALL_ENGINES}, got {engine!r}")
+    if n_shards < 1:
+        raise ValueError(f"n_shards must be at least 1, got {n_shards}")
+
+    source = None
+    if isinstance(resp_support, pd.DataFrame):
+        table_stats = waterfall_table_stats(resp_support)
+        with pooled_connection() as con:
+            con.register("_ids", resp_support[[id_col]])
+            try:
+                shard_of = con.execute(f"SELECT {_shard_sql(id_col, n_shards)} AS shard FROM _ids").fetchnumpy()["shard"]
+            finally:
+                con.unregister("_ids")
+        groups = pd.Series(np.arange(len(resp_support))).groupby(np.asarray(shard_of)).indices
+        rows = {int(shard): idx for shard, idx in groups.items()}
+        shards = sorted(rows)
+    else:
+        source = os.path.abspath(os.fspath(resp_support)).replace("'", "''")
+        with pooled_connection(timezone="UTC") as con:
+            columns = [r[0] for r in con.execute(f"DESCRIBE SELECT * FROM read_parquet('{source}')").fetchall()]
+            needed = [c for c in _LABEL_COLS + ["fio2_set"] if c in columns]
+            table_stats = waterfall_table_stats(
+                con.execute(f"SELECT {', '.join(needed)} FROM read_parquet('{source}')").df()
+            )
+        shards = list(range(n_shards))
+
+    writer = _WidePartitionWriter(os.fspath(output_dir), partition_key=id_col)
+    shared = {
+        "id_col": id_col, "bfill": bfill, "engine": engine, "table_stats": table_stats,
+        "timezone": timezone, "directory": writer.directory, "source": source, "n_shards": n_shards,
+    }
+    payloads = (
+        (shard, {**shared, "shard": shard,
+                 "df": resp_support.iloc[rows[shard]] if source is None else None})
+        for shard in shards
+    )
+    resource_config = DuckDBResourceConfig(memory_limit=memory_limit, threads=threads)
+
+    progress = tqdm(total=len(shards), desc="Waterfall shards", disable=not verbose)
+    for _, partition in run_batches(_waterfall_shard_worker, payloads, max_workers, max_retries,
+                                    resource_config, label="Shard"):
+        progress.update(1)
+        if partition is not None:
+            writer.add(partition)
+    progress.close()
+    return writer.close()
@@ -7,16 +7,25 @@ using DuckDB for high performance.
 """
 
 import pandas as pd
+import pyarrow as pa
 import duckdb
 import numpy as np
 from datetime import datetime
+import json
 import os
 import re
+import shutil
 import yaml
-from typing import List, Dict, Optional, Union
+from dataclasses import dataclass, field
+from typing import Iterator, List, Dict, Optional, Tuple, Union
 from tqdm import tqdm
+from types import SimpleNamespace
 import logging
 
+from ._duckdb_config import DuckDBResourceConfig
+from ._duckdb_helpers import pooled_connection
+from ._batch_runner import run_batches
+
 # Set up logging - use centralized logger
 logger = logging.getLogger('clifpy.utils.wide_dataset')
 
@@ -115,8 +124,12 @@ def create_wide_dataset(
     batch_size: int = 1000,
     memory_limit: Optional[str] = None,
     threads: Optional[int] = None,
-    show_progress: bool = True
-) -> Optional[pd.DataFrame]:
+    show_progress: bool = True,
+    output_directory: Optional[str] = None,
+    max_workers: int = 1,
+    max_retries: int = 2,
+    time_resolution: str = 'minute'
+) -> Optional[Union[pd.DataFrame, str]]:
     """
     Create a wide dataset by joining multiple CLIF tables with pivoting support.
     
@@ -157,7 +170,16 @@ def create_wide_dataset(
         If provided, data will be filtered to only include events within the specified
         time windows for each hospitalization
     output_format : str, default='dataframe'
-        'dataframe', 'csv', or 'parquet'
+        'dataframe', 'csv', 'parquet', or 'parquet_dataset'. 'parquet_dataset'
+        streams: each batch is written to ``<output_directory>/<output_filename>/``
+        as a parquet partition as soon as it is built, followed by a
+        ``_manifest.json`` describing the partitions, and the manifest path is
+        returned instead of a DataFrame. Read it back with
+        `iter_wide_partitions` / `load_wide_dataset`, or pass the path straight
+        to `convert_wide_to_hourly` or `compute_sofa`. The latest timestamp of
+        every hospitalization in every source table is saved alongside
+        (``_watermarks.parquet``) so `refresh_wide_dataset` can later rebuild
+        only the hospitalizations that received new rows.
     save_to_data_location : bool, default=False
         save output to data directory
     output_filename : str, optional
@@ -174,17 +196,36 @@ def create_wide_dataset(
         Number of threads for DuckDB to use
     show_progress : bool, default=True
         Show progress bars for long operations
+    output_directory : str, optional
+        Parent directory of a 'parquet_dataset' (default: the instance's
+        output_directory, else its data_directory)
+    max_workers : int, default=1
+        Number of batches to build concurrently, each in its own process with
+        ``1/max_workers`` of the DuckDB memory and threads (from memory_limit /
+        threads, else the package config, else the system). Only the batch's
+        own rows are sent to a worker. Output order does not depend on it.
+    max_retries : int, default=2
+        Times a failed batch is retried before the whole call fails.
+    time_resolution : str, default='minute'
+        Granularity at which rows from different tables are matched to the
+        same event: 'minute' (values recorded within the same minute share a
+        row), 'second', or 'none' (exact timestamps only). event_time itself
+        is never truncated.
     
     Returns
     -------
-    pd.DataFrame or None
-        DataFrame if return_dataframe=True, None otherwise
+    pd.DataFrame, str or None
+        DataFrame if return_dataframe=True, None otherwise; for
+        output_format='parquet_dataset', the path of the dataset manifest
     """
 
 
     logger.info("Phase 4: Wide Dataset Processing (utility function)")
     logger.debug("  4.1: Starting wide dataset creation")
 
+    if time_resolution not in _TIME_RESOLUTIONS:
+        raise ValueError(f"time_resolution must be one of {_TIME_RESOLUTIONS}, got {time_resolution!r}")
+
     # Validate cohort_df if provided
     if cohort_df is not None:
         required_cols = ['hospitalization_id', 'start_time', 'end_time']
@@ -219,23 +260,15 @@ def create_wide_dataset(
     
     tables_to_load = list(category_filters.keys())
     
-    # Create DuckDB connection with optimized settings
-    conn_config = {
-        'preserve_insertion_order': 'false'
-    }
-    
-    if memory_limit:
-        conn_config['memory_limit'] = memory_limit
-    if threads:
-        conn_config['threads'] = str(threads)
-    
-    # Use context manager for connection
-    with duckdb.connect(':memory:', config=conn_config) as conn:
-        # Preserve timezone from clif_instance configuration
-        conn.execute(f"SET timezone = '{clif_instance.timezone}'")
-        # Set additional optimization settings
-        conn.execute("SET preserve_insertion_order = false")
-        
+    # Pooled DuckDB connection: package-wide limits, per-call overrides reset on exit
+    resource_config = DuckDBResourceConfig(memory_limit=memory_limit or None, threads=threads or None)
+
+    # Preserve timezone from clif_instance configuration
+    with pooled_connection(
+        timezone=clif_instance.timezone,
+        config=resource_config,
+        settings={'preserve_insertion_order': 'false'},
+    ) as conn:
         # Get hospitalization IDs to process
         hospitalization_df = clif_instance.hospitalization.df.copy()
 
@@ -301,6 +334,35 @@ def create_wide_dataset(
         logger.info(f"       - Base tables filtered - Hospitalization: {len(hospitalization_df)}, Patient: {len(patient_df)}, ADT: {len(adt_df)}")
 
         logger.info("  4.2: Determining processing mode")
+        if output_format == 'parquet_dataset':
+            if output_filename is None:
+                output_filename = f"wide_dataset_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+            parent = (output_directory or getattr(clif_instance, 'output_directory', None)
+                      or clif_instance.data_directory)
+            stream_batch_size = batch_size if batch_size > 0 else max(len(required_ids), 1)
+            # Watermarks are taken before the build, so rows arriving during it
+            # are picked up by the next refresh
+            build = {
+                'category_filters': category_filters,
+                'time_resolution': time_resolution,
+                'batch_size': stream_batch_size,
+                'scope': 'all' if hospitalization_ids is None and cohort_df is None and not sample else 'subset',
+                'cohort_windows': cohort_df is not None,
+            }
+            writer = _WidePartitionWriter(
+                os.path.join(parent, output_filename), build=build,
+                watermarks=_hospitalization_watermarks(conn, clif_instance, tables_to_load, required_ids),
+            )
+            logger.info(f"       - Streaming mode: {len(required_ids)} hospitalizations in batches of {stream_batch_size} -> {writer.directory}")
+            logger.info("  4.B: === BATCH PROCESSING MODE ===")
+            return _process_in_batches(
+                conn, clif_instance, required_ids, patient_df, hospitalization_df, adt_df,
+                tables_to_load, category_filters, PIVOT_TABLES, WIDE_TABLES,
+                stream_batch_size, show_progress, False, output_filename,
+                output_format, False, cohort_df, writer=writer,
+                max_workers=max_workers, max_retries=max_retries, resource_config=resource_config,
+                time_resolution=time_resolution
+            )
         # Process in batches to avoid memory issues
         if batch_size > 0 and len(required_ids) > batch_size:
             logger.info(f"       - Batch mode: {len(required_ids)} hospitalizations in {len(required_ids)//batch_size + 1} batches of {batch_size}")
@@ -309,7 +371,9 @@ def create_wide_dataset(
                 conn, clif_instance, required_ids, patient_df, hospitalization_df, adt_df,
                 tables_to_load, category_filters, PIVOT_TABLES, WIDE_TABLES,
                 batch_size, show_progress, save_to_data_location, output_filename,
-                output_format, return_dataframe, cohort_df
+                output_format, return_dataframe, cohort_df,
+                max_workers=max_workers, max_retries=max_retries, resource_config=resource_config,
+                time_resolution=time_resolution
             )
         else:
             logger.info(f"       - Single mode: Processing all {len(required_ids)} hospitalizations at once")
@@ -318,12 +382,12 @@ def create_wide_dataset(
             return _process_hospitalizations(
                 conn, clif_instance, required_ids, patient_df, hospitalization_df, adt_df,
                 tables_to_load, category_filters, PIVOT_TABLES, WIDE_TABLES,
-                show_progress, cohort_df
+                show_progress, cohort_df, time_resolution
             )
 
 
 def convert_wide_to_hourly(
-    wide_df: pd.DataFrame,
+    wide_df: Union[pd.DataFrame, str],
     aggregation_config: Dict[str, List[str]],
     id_name: str = 'hospitalization_id',
     hourly_window: int = 1,
@@ -331,8 +395,13 @@ def convert_wide_to_hourly(
     memory_limit: str = '4GB',
     temp_directory: Optional[str] = None,
     batch_size: Optional[int] = None,
-    timezone: str = 'UTC'
-) -> pd.DataFrame:
+    timezone: str = 'UTC',
+    max_workers: int = 1,
+    max_retries: int = 2,
+    backend: str = 'pandas',
+    window_step: Optional[int] = None,
+    window_alignment: str = 'event'
+) -> Union[pd.DataFrame, pa.Table]:
     """
     Convert a wide dataset to temporal aggregation with user-defined aggregation methods.
 
@@ -340,8 +409,12 @@ def convert_wide_to_hourly(
 
     Parameters
     ----------
-    wide_df : pd.DataFrame
-        Wide dataset DataFrame from create_wide_dataset()
+    wide_df : pd.DataFrame or str
+        Wide dataset DataFrame from create_wide_dataset(), or the directory /
+        manifest path of a partitioned wide dataset
+        (``output_format='parquet_dataset'``). A partitioned dataset is read
+        one partition at a time (or, when ``id_name`` is not the partition
+        key, one batch of ``id_name`` values at a time) and never loaded whole.
     aggregation_config : Dict[str, List[str]]
         Dict mapping aggregation methods to list of columns
         Example: {
@@ -388,11 +461,33 @@ def convert_wide_to_hourly(
         Process in batches if dataset is large (auto-determined if None)
     timezone : str, default='UTC'
         Timezone for datetime operations in DuckDB (e.g., 'UTC', 'America/New_York')
+    max_workers : int, default=1
+        Number of batches to aggregate concurrently, each in its own process
+        with ``1/max_workers`` of memory_limit and the 4 DuckDB threads. Only
+        used when the data is batched (``batch_size`` or a partitioned dataset).
+    max_retries : int, default=2
+        Times a failed batch is retried before the call fails.
+    backend : {'pandas', 'arrow'}, default='pandas'
+        Return type. All aggregates are computed by one DuckDB query per
+        batch; 'arrow' returns its result as a ``pyarrow.Table`` without
+        converting to pandas.
+    window_step : int, optional
+        Hours between consecutive window ends (default: hourly_window, i.e.
+        non-overlapping windows). A smaller step gives sliding windows: with
+        ``hourly_window=24, window_step=1`` window N covers the 24 hours
+        ending ``N + 1`` hours after the origin. Must divide hourly_window.
+        Each step is aggregated once and windows combine their trailing
+        steps, so the cost does not grow with the overlap.
+    window_alignment : {'event', 'calendar'}, default='event'
+        'event' starts the window grid at each group's first event.
+        'calendar' starts it at the wall-clock step boundary at or before the
+        first event (top of the hour, or midnight when the step divides 24),
+        in the timezone the wide dataset was created in.
 
     Returns
     -------
-    pd.DataFrame
-        Aggregated dataset with columns:
+    pd.DataFrame or pyarrow.Table
+        Aggregated dataset, sorted by {id_name} and window_number, with columns:
 
         **Group & Window Identifiers:**
         - {id_name}: Group identifier (hospitalization_id or encounter_block)
@@ -409,7 +504,10 @@ def convert_wide_to_hourly(
           (_max, _min, _mean, _median, _first, _last, _boolean, one-hot encoded)
 
         **Notes:**
-        - Windows are relative to each group's first event, not calendar boundaries
+        - Windows are relative to each group's first event unless
+          window_alignment='calendar'
+        - With sliding windows (window_step < hourly_window) the first windows
+          start before the origin and cover only part of their span
         - window_end_dttm - window_start_dttm = hourly_window hours (always)
         - When fill_gaps=True, gap windows contain NaN (not forward-filled)
         - When fill_gaps=False, only windows with data appear (sparse output)
@@ -425,12 +523,27 @@ def convert_wide_to_hourly(
     if not isinstance(fill_gaps, bool):
         raise ValueError(f"fill_gaps must be a boolean, got: {type(fill_gaps).__name__}")
 
+    if backend not in ('pandas', 'arrow'):
+        raise ValueError(f"Unknown backend: {backend}. Expected 'pandas' or 'arrow'")
+
+    # Validate windowing parameters
+    if window_alignment not in _WINDOW_ALIGNMENTS:
+        raise ValueError(f"window_alignment must be one of {_WINDOW_ALIGNMENTS}, got: {window_alignment!r}")
+    if window_step is not None:
+        if not isinstance(window_step, int) or not 1 <= window_step <= hourly_window:
+            raise ValueError(f"window_step must be an integer between 1 and hourly_window ({hourly_window}), got: {window_step}")
+        if hourly_window % window_step:
+            raise ValueError(f"window_step ({window_step}) must divide hourly_window ({hourly_window})")
+
+    if _is_wide_dataset_path(wide_df):
+        return _hourly_from_wide_dataset(
+            wide_df, aggregation_config, id_name, hourly_window, fill_gaps,
+            memory_limit, temp_directory, batch_size, timezone, max_workers, max_retries, backend,
+            window_step, window_alignment
+        )
+
     # Strip timezone from datetime columns (no conversion, just remove tz metadata)
-    wide_df = wide_df.copy()
-    for col in wide_df.columns:
-        if pd.api.types.is_datetime64_any_dtype(wide_df[col]):
-            if hasattr(wide_df[col].dtype, 'tz') and wide_df[col].dtype.tz is not None:
-                wide_df[col] = wide_df[col].dt.tz_localize(None)
+    wide_df = _strip_datetime_tz(wide_df.copy())
 
     # Update log statements
     window_label = "hourly" if hourly_window == 1 else f"{hourly_window}-hour"
@@ -460,35 +573,137 @@ def convert_wide_to_hourly(
         else:
             batch_size = 0  # Process all at once
     
-    # Configure DuckDB connection
-    config = {
-        'memory_limit': memory_limit,
-        'temp_directory': temp_directory or '/tmp/duckdb_temp',
-        'preserve_insertion_order': 'false',
-        'threads': '4'
-    }
-    
-    # Remove None values from config
-    config = {k: v for k, v in config.items() if v is not None}
-    
-    try:
-        # Create DuckDB connection with error handling
-        with duckdb.connect(':memory:', config=config) as conn:
-            # Use timezone from parameter (passed from orchestrator)
-            conn.execute(f"SET timezone = '{timezone}'")
-            # Set additional optimization settings
-            conn.execute("SET preserve_insertion_order = false")
+    # Configure DuckDB connection (pooled; per-call limits are reset on exit)
+    resource_config = DuckDBResourceConfig(
+        memory_limit=memory_limit,
+        temp_directory=temp_directory or '/tmp/duckdb_temp',
+        threads=4,
+    )
 
+    try:
+        # Use timezone from parameter (passed from orchestrator)
+        with pooled_connection(
+            timezone=timezone,
+            config=resource_config,
+            settings={'preserve_insertion_order': 'false'},
+        ) as conn:
             if batch_size > 0:
-                return _process_hourly_in_batches(conn, wide_df, aggregation_config, id_name, batch_size, hourly_window, fill_gaps)
+                return _process_hourly_in_batches(
+                    conn, wide_df, aggregation_config, id_name, batch_size, hourly_window, fill_gaps,
+                    timezone, max_workers, max_retries, resource_config, backend,
+                    window_step, window_alignment
+                )
             else:
-                return _process_hourly_single_batch(conn, wide_df, aggregation_config, id_name, hourly_window, fill_gaps)
+                return _process_hourly_single_batch(
+                    conn, wide_df, aggregation_config, id_name, hourly_window, fill_gaps, backend,
+                    window_step, window_alignment
+                )
 
     except Exception as e:
         logger.error(f"DuckDB processing failed: {str(e)}")
         raise
 
 
+def _strip_datetime_tz(df: pd.DataFrame) -> pd.DataFrame:
+    """Drop tz metadata from datetime columns in place (wall time is kept)."""
+    for col in df.columns:
+        if pd.api.types.is_datetime64_any_dtype(df[col]):
+            if hasattr(df[col].dtype, 'tz') and df[col].dtype.tz is not None:
+                df[col] = df[col].dt.tz_localize(None)
+    return df
+
+
+def _iter_wide_id_batches(
+    manifest: Dict,
+    id_name: str,
+    batch_size: int
+) -> Iterator[pd.DataFrame]:
+    """Yield a partitioned wide dataset regrouped into batches of ``id_name`` values.
+
+    Used when ``id_name`` is not the partition key (e.g. encounter_block), so
+    one group may span partitions. Each batch reads only its rows from every
+    partition (row-group pruning on the id column).
+    """
+    paths = [os.path.join(manifest['directory'], p['path']) for p in manifest['partitions']
+             if id_name in p['columns']]
+    ids = pd.concat(
+        [pd.read_parquet(path, columns=[id_name])[id_name] for path in paths],
+        ignore_index=True
+    ).dropna().unique()
+    ids = np.sort(ids)
+    columns = manifest['columns']
+    for i in range(0, len(ids), batch_size):
+        batch_ids = ids[i:i + batch_size].tolist()
+        parts = []
+        for path in paths:
+            part = pd.read_parquet(path, filters=[(id_name, 'in', batch_ids)])
+            if len(part) > 0:
+                parts.append(part)
+        if parts:
+            batch = pd.concat(parts, ignore_index=True)
+            for col in columns:
+                if col not in batch.columns:
+                    batch[col] = np.nan
+            yield batch[columns]
+
+
+def _hourly_from_wide_dataset(
+    dataset: Union[str, os.PathLike],
+    aggregation_config: Dict[str, List[str]],
+    id_name: str,
+    hourly_window: int,
+    fill_gaps: bool,
+    memory_limit: str,
+    temp_directory: Optional[str],
+    batch_size: Optional[int],
+    timezone: str,
+    max_workers: int = 1,
+    max_retries: int = 2,
+    backend: str = 'pandas',
+    window_step: Optional[int] = None,
+    window_alignment: str = 'event'
+) -> Union[pd.DataFrame, pa.Table]:
+    """convert_wide_to_hourly over a partitioned wide dataset, one chunk at a time."""
+    manifest = read_wide_manifest(dataset)
+    for col in ['event_time', id_name, 'day_number']:
+        if col not in manifest['columns']:
+            raise ValueError(f"wide dataset must contain '{col}' column")
+
+    window_label = "hourly" if hourly_window == 1 else f"{hourly_window}-hour"
+    logger.info(f"Starting {window_label} aggregation over partitioned wide dataset {manifest['directory']}")
+    logger.info(f"Input dataset: {manifest['total_rows']:,} records in {len(manifest['partitions'])} partitions")
+
+    if id_name == manifest['partition_key']:
+        # Partitions hold disjoint ids, so each one aggregates independently
+        chunks = iter_wide_partitions(dataset)
+        n_chunks = len(manifest['partitions'])
+    else:
+        chunks = _iter_wide_id_batches(manifest, id_name, batch_size or 5000)
+        n_chunks = None
+
+    resource_config = DuckDBResourceConfig(
+        memory_limit=memory_limit,
+        temp_directory=temp_directory or '/tmp/duckdb_temp',
+        threads=4,
+    )
+    with pooled_connection(
+        timezone=timezone,
+        config=resource_config,
+        settings={'preserve_insertion_order': 'false'},
+    ) as conn:
+        results = _run_hourly_batches(
+            conn, (_strip_datetime_tz(chunk) for chunk in chunks), aggregation_config, id_name,
+            hourly_window, fill_gaps, timezone, n_chunks, max_workers, max_retries, resource_config,
+            backend, window_step, window_alignment
+        )
+
+    if not results:
+        raise ValueError("No rows in wide dataset")
+    final_df = _combine_hourly_results(results, id_name, backend)
+    logger.info(f"Final {window_label} dataset: {len(final_df)} records from {len(results)} chunks")
+    return final_df
+
+
 def _find_alternative_timestamp(table_name: str, columns: List[str]) -> Optional[str]:
     """Find alternative timestamp column if the default is not found (from config)."""
     table_config = _get_table_config(table_name)
@@ -524,6 +739,486 @@ def _save_dataset(
     logger.info(f"Wide dataset saved to: {output_path}")
 
 
+# Partitioned wide datasets (output_format='parquet_dataset')
+WIDE_MANIFEST_FILENAME = '_manifest.json'
+WIDE_WATERMARKS_FILENAME = '_watermarks.parquet'
+_WIDE_MANIFEST_VERSION = 2
+_WIDE_REFRESH_DIRNAME = '_refresh'
+
+
+def _partition_name(batch_index: int) -> str:
+    return f'part-{batch_index:05d}.parquet'
+
+
+def _write_partition(
+    directory: str,
+    df: pd.DataFrame,
+    batch_index: int,
+    partition_key: str = 'hospitalization_id'
+) -> Dict:
+    """Write one batch as ``part-<batch>.parquet`` and return its manifest entry."""
+    name = _partition_name(batch_index)
+    path = os.path.join(directory, name)
+    tmp_path = path + '.tmp'
+    df.to_parquet(tmp_path, index=False)
+    os.replace(tmp_path, path)
+
+    ids = df[partition_key] if partition_key in df.columns else pd.Series(dtype=str)
+    logger.debug(f"             - Wrote {name} ({len(df)} records)")
+    return {
+        'path': name,
+        'batch': batch_index,
+        'rows': int(len(df)),
+        'n_ids': int(ids.nunique()),
+        'min_id': None if ids.empty else str(ids.min()),
+        'max_id': None if ids.empty else str(ids.max()),
+        'columns': [str(c) for c in df.columns],
+    }
+
+
+class _WidePartitionWriter:
+    """Collect parquet partitions of a wide dataset and write the closing manifest.
+
+    Each batch is written as ``part-<batch>.parquet`` as soon as it is built
+    (by this process or a worker), so only the batches in flight are held in
+    memory. The manifest is written last; a directory without one is an
+    incomplete run. ``build`` (the parameters `refresh_wide_dataset` reuses)
+    and the per-hospitalization ``watermarks`` are recorded when given.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        partition_key: str = 'hospitalization_id',
+        build: Optional[Dict] = None,
+        watermarks: Optional[pd.DataFrame] = None
+    ):
+        self.directory = directory
+        self.partition_key = partition_key
+        self.build = build
+        self.watermarks = watermarks
+        self.partitions: List[Dict] = []
+        os.makedirs(directory, exist_ok=True)
+
+        # Overwrite an earlier run, like _save_dataset does for single files
+        stale = [f for f in os.listdir(directory)
+                 if (f.startswith('part-') and f.endswith('.parquet'))
+                 or f in (WIDE_MANIFEST_FILENAME, WIDE_WATERMARKS_FILENAME)]
+        for name in stale:
+            os.remove(os.path.join(directory, name))
+        if os.path.isdir(os.path.join(directory, _WIDE_REFRESH_DIRNAME)):
+            shutil.rmtree(os.path.join(directory, _WIDE_REFRESH_DIRNAME))
+        if stale:
+            logger.info(f"Removed {len(stale)} files from a previous wide dataset in {directory}")
+
+    def write(self, df: pd.DataFrame, batch_index: int) -> None:
+        self.add(_write_partition(self.directory, df, batch_index, self.partition_key))
+
+    def add(self, partition: Dict) -> None:
+        """Record a partition written by `_write_partition`."""
+        self.partitions.append(partition)
+
+    def close(self) -> str:
+        """Write the manifest (partitions in batch order) and return its path."""
+        self.partitions.sort(key=lambda p: p['batch'])
+        columns: List[str] = []
+        for partition in self.partitions:
+            columns.extend(c for c in partition['columns'] if c not in columns)
+        manifest = {
+            'format_version': _WIDE_MANIFEST_VERSION,
+            'created': datetime.now().isoformat(timespec='seconds'),
+            'partition_key': self.partition_key,
+            'total_rows': sum(p['rows'] for p in self.partitions),
+            'columns': columns,
+            'partitions': self.partitions,
+        }
+        if self.build is not None:
+            manifest['build'] = self.build
+        if self.watermarks is not None:
+            manifest['watermarks'] = _watermark_summary(self.watermarks)
+        path = _write_wide_manifest(self.directory, manifest)
+        if self.watermarks is not None:
+            _write_watermarks(self.directory, self.watermarks)
+        logger.info(f"Wide dataset written to: {self.directory} "
+                    f"({len(self.partitions)} partitions, {manifest['total_rows']} records)")
+        return path
+
+
+def _write_wide_manifest(directory: str, manifest: Dict) -> str:
+    """Atomically replace the manifest of ``directory`` and return its path."""
+    path = os.path.join(directory, WIDE_MANIFEST_FILENAME)
+    with open(path + '.tmp', 'w') as f:
+        json.dump(manifest, f, indent=2)
+    os.replace(path + '.tmp', path)
+    return path
+
+
+def _write_watermarks(directory: str, watermarks: pd.DataFrame) -> None:
+    path = os.path.join(directory, WIDE_WATERMARKS_FILENAME)
+    watermarks.to_parquet(path + '.tmp', index=False)
+    os.replace(path + '.tmp', path)
+
+
+def _watermark_summary(watermarks: pd.DataFrame) -> Dict:
+    """Manifest entry for the watermarks file: its path and each table's high-water mark."""
+    tables = {}
+    for col in watermarks.columns:
+        if col != 'hospitalization_id':
+            latest = watermarks[col].max()
+            tables[col] = None if pd.isna(latest) else pd.Timestamp(latest).isoformat()
+    return {
+        'path': WIDE_WATERMARKS_FILENAME,
+        'hospitalizations': int(len(watermarks)),
+        'tables': tables,
+    }
+
+
+def _hospitalization_watermarks(
+    conn: duckdb.DuckDBPyConnection,
+    clif_instance,
+    tables_to_load: List[str],
+    hospitalization_ids: List[str]
+) -> pd.DataFrame:
+    """Latest timestamp per hospitalization in adt and each loaded table.
+
+    One row per hospitalization and one column per table; NaT where a
+    hospitalization has no timestamped rows in that table.
+    """
+    watermarks = pd.DataFrame({'hospitalization_id': pd.unique(pd.Series(hospitalization_ids, dtype=str))})
+    conn.register('_watermark_ids', watermarks)
+    try:
+        for table_name in ['adt'] + [t for t in tables_to_load if t != 'adt']:
+            table_obj = getattr(clif_instance, table_name, None)
+            if table_obj is None:
+                continue
+            if getattr(table_obj, 'is_materialized', True):
+                data = table_obj.df
+                columns = list(data.columns)
+            else:
+                data = table_obj.to_arrow()
+                columns = data.column_names
+            timestamp_col = 'in_dttm' if table_name == 'adt' else _get_timestamp_column(table_name)
+            if timestamp_col not in columns:
+                timestamp_col = _find_alternative_timestamp(table_name, columns)
+            if timestamp_col is None or 'hospitalization_id' not in columns:
+                continue
+
+            conn.register('_watermark_source', data)
+            try:
+                latest = conn.execute(f"""
+                    SELECT CAST(hospitalization_id AS VARCHAR) AS hospitalization_id,
+                           MAX("{timestamp_col}") AS latest
+                    FROM _watermark_source
+                    WHERE CAST(hospitalization_id AS VARCHAR) IN (SELECT hospitalization_id FROM _watermark_ids)
+                    GROUP BY 1
+                """).df()
+            finally:
+                conn.unregister('_watermark_source')
+            watermarks[table_name] = pd.to_datetime(
+                watermarks['hospitalization_id'].map(latest.set_index('hospitalization_id')['latest']),
+                utc=True
+            )
+    finally:
+        conn.unregister('_watermark_ids')
+    return watermarks
+
+
+def _stale_hospitalizations(stored: pd.DataFrame, current: pd.DataFrame) -> List[str]:
+    """IDs in ``current`` that are new or have a later timestamp than ``stored`` in any table."""
+    merged = current.merge(stored, on='hospitalization_id', how='left',
+                           suffixes=('', '_stored'), indicator=True)
+    stale = merged['_merge'] == 'left_only'
+    for table in current.columns:
+        if table == 'hospitalization_id':
+            continue
+        latest = pd.to_datetime(merged[table], utc=True)
+        if f'{table}_stored' not in merged.columns:
+            # Table was not watermarked at build time: any rows are new
+            stale |= latest.notna()
+            continue
+        previous = pd.to_datetime(merged[f'{table}_stored'], utc=True)
+        stale |= latest.notna() & (previous.isna() | (latest > previous))
+    return sorted(merged.loc[stale, 'hospitalization_id'].tolist())
+
+
+def refresh_wide_dataset(
+    clif_instance,
+    dataset: Union[str, os.PathLike],
+    hospitalization_ids: Optional[List[str]] = None,
+    memory_limit: Optional[str] = None,
+    threads: Optional[int] = None,
+    show_progress: bool = True,
+    max_workers: int = 1,
+    max_retries: int = 2
+) -> List[str]:
+    """
+    Bring a partitioned wide dataset up to date, rebuilding only what changed.
+
+    `create_wide_dataset(..., output_format='parquet_dataset')` saves the
+    latest timestamp of every hospitalization in every source table
+    (``_watermarks.parquet``; the per-table high-water marks are in the
+    manifest under ``watermarks``). A hospitalization is stale when one of the
+    loaded tables now holds a later timestamp for it, or when it is new. Only
+    stale hospitalizations are rebuilt, with the dataset's original
+    category_filters, time_resolution and batch_size; the partitions that held
+    them are rewritten without them and the rebuilt rows are added as new
+    partitions. The manifest is replaced last, so an interrupted refresh leaves
+    the previous dataset readable.
+
+    Parameters
+    ----------
+    clif_instance
+        CLIF object with the current data loaded
+    dataset : str or PathLike
+        The dataset directory or its ``_manifest.json``.
+    hospitalization_ids : List[str], optional
+        Hospitalizations to check. Default: those already in the dataset, plus
+        any other hospitalization in ``clif_instance.hospitalization`` when the
+        dataset was built for all of them.
+    memory_limit : str, optional
+        DuckDB memory limit for the rebuild (e.g., '8GB')
+    threads : int, optional
+        Number of threads for DuckDB to use
+    show_progress : bool, default=True
+        Show progress bars while rebuilding
+    max_workers : int, default=1
+        Number of rebuild batches to run concurrently (see `create_wide_dataset`)
+    max_retries : int, default=2
+        Times a failed batch is retried before the refresh fails
+
+    Returns
+    -------
+    List[str]
+        The rebuilt hospitalization IDs, empty when nothing changed. Derived
+        outputs only need recomputing for these, e.g.
+        ``convert_wide_to_hourly(load_wide_dataset(dataset, ids=refreshed), config)``.
+
+    Notes
+    -----
+    Changes are detected by timestamp only. Rows deleted or corrected in place,
+    or added with a timestamp no later than the hospitalization's watermark
+    for that table, are not seen; rebuild with `create_wide_dataset` for those.
+    """
+    manifest = read_wide_manifest(dataset)
+    directory = manifest['directory']
+    build = manifest.get('build')
+    watermarks_path = os.path.join(directory, WIDE_WATERMARKS_FILENAME)
+    if build is None or not os.path.exists(watermarks_path):
+        raise ValueError(
+            f"Wide dataset at {directory} has no watermarks. Rebuild it with "
+            "create_wide_dataset(..., output_format='parquet_dataset') to refresh it incrementally."
+        )
+    if build['cohort_windows']:
+        raise ValueError("Wide datasets built with cohort_df time windows cannot be refreshed incrementally")
+    key = manifest['partition_key']
+
+    stored = pd.read_parquet(watermarks_path)
+    if hospitalization_ids is not None:
+        candidates = [str(i) for i in hospitalization_ids]
+    elif build['scope'] == 'all':
+        candidates = clif_instance.hospitalization.df['hospitalization_id'].astype(str).unique().tolist()
+    else:
+        candidates = stored['hospitalization_id'].tolist()
+
+    tables_to_load = list(build['category_filters'])
+    resource_config = DuckDBResourceConfig(memory_limit=memory_limit or None, threads=threads or None)
+    with pooled_connection(timezone=clif_instance.timezone, config=resource_config) as conn:
+        current = _hospitalization_watermarks(conn, clif_instance, tables_to_load, candidates)
+    stale = _stale_hospitalizations(stored, current)
+    if not stale:
+        logger.info(f"Wide dataset at {directory} is up to date ({len(candidates)} hospitalizations checked)")
+        return []
+    logger.info(f"Refreshing {len(stale)} of {len(candidates)} hospitalizations in {directory}")
+
+    # Rebuild the stale hospitalizations into a staging dataset
+    create_wide_dataset(
+        clif_instance,
+        category_filters=build['category_filters'],
+        hospitalization_ids=stale,
+        output_format='parquet_dataset',
+        output_directory=directory,
+        output_filename=_WIDE_REFRESH_DIRNAME,
+        batch_size=build['batch_size'],
+        memory_limit=memory_limit,
+        threads=threads,
+        show_progress=show_progress,
+        max_workers=max_workers,
+        max_retries=max_retries,
+        time_resolution=build['time_resolution'],
+    )
+    staging = os.path.join(directory, _WIDE_REFRESH_DIRNAME)
+    staged = read_wide_manifest(staging)
+
+    # Partitions holding stale ids are rewritten under new names, and the old
+    # files removed only after the new manifest is in place
+    stale_set = set(stale)
+    lowest, highest = stale[0], stale[-1]
+    next_batch = max((p['batch'] for p in manifest['partitions']), default=-1) + 1
+    partitions, obsolete = [], []
+    for partition in manifest['partitions']:
+        path = os.path.join(directory, partition['path'])
+        if (partition['min_id'] is None or partition['max_id'] < lowest
+                or partition['min_id'] > highest
+                or not pd.read_parquet(path, columns=[key])[key].astype(str).isin(stale_set).any()):
+            partitions.append(partition)
+            continue
+        obsolete.append(path)
+        kept = pd.read_parquet(path)
+        kept = kept[~kept[key].astype(str).isin(stale_set)]
+        if len(kept) > 0:
+            partitions.append(_write_partition(directory, kept, next_batch, key))
+            next_batch += 1
+    for partition in staged['partitions']:
+        name = _partition_name(next_batch)
+        os.replace(os.path.join(staging, partition['path']), os.path.join(directory, name))
+        partitions.append({**partition, 'path': name, 'batch': next_batch})
+        next_batch += 1
+    partitions.sort(key=lambda p: p['batch'])
+
+    refreshed = pd.read_parquet(os.path.join(staging, WIDE_WATERMARKS_FILENAME))
+    watermarks = pd.concat(
+        [stored[~stored['hospitalization_id'].isin(stale_set)], refreshed], ignore_index=True
+    )
+    columns = list(manifest['columns'])
+    for partition in partitions:
+        columns.extend(c for c in partition['columns'] if c not in columns)
+    updated = {k: v for k, v in manifest.items() if k != 'directory'}
+    updated.update({
+        'format_version': _WIDE_MANIFEST_VERSION,
+        'refreshed': datetime.now().isoformat(timespec='seconds'),
+        'total_rows': sum(p['rows'] for p in partitions),
+        'columns': columns,
+        'partitions': partitions,
+        'watermarks': _watermark_summary(watermarks),
+    })
+    # Manifest first: if interrupted before the watermarks are replaced, the
+    # next refresh just rebuilds these hospitalizations again
+    _write_wide_manifest(directory, updated)
+    _write_watermarks(directory, watermarks)
+    for path in obsolete:
+        os.remove(path)
+    shutil.rmtree(staging)
+
+    logger.info(f"Refreshed wide dataset at {directory}: {len(stale)} hospitalizations rebuilt, "
+                f"{len(obsolete)} partitions rewritten, {len(staged['partitions'])} added")
+    return stale
+
+
+def _is_wide_dataset_path(wide_df) -> bool:
+    return isinstance(wide_df, (str, os.PathLike))
+
+
+def read_wide_manifest(dataset: Union[str, os.PathLike]) -> Dict:
+    """
+    Read the manifest of a partitioned wide dataset.
+
+    Parameters
+    ----------
+    dataset : str or PathLike
+        The dataset directory or its ``_manifest.json``.
+
+    Returns
+    -------
+    dict
+        Manifest with ``partition_key``, ``columns``, ``total_rows`` and
+        ``partitions`` (relative ``path``, ``rows``, ``n_ids``,
+        ``min_id``/``max_id`` and ``columns`` per partition), and
+        for datasets from `create_wide_dataset` the ``build`` parameters and
+        ``watermarks`` summary used by `refresh_wide_dataset`. A
+        ``directory`` key holding the absolute dataset directory is added.
+    """
+    path = os.fspath(dataset)
+    if os.path.isdir(path):
+        path = os.path.join(path, WIDE_MANIFEST_FILENAME)
+    if not os.path.exists(path):
+        raise FileNotFoundError(
+            f"No wide dataset manifest at {path}. "
+            "Create one with create_wide_dataset(..., output_format='parquet_dataset')."
+        )
+    with open(path) as f:
+        manifest = json.load(f)
+    manifest['directory'] = os.path.dirname(os.path.abspath(path))
+    return manifest
+
+
+def iter_wide_partitions(
+    dataset: Union[str, os.PathLike],
+    columns: Optional[List[str]] = None,
+    ids: Optional[List[str]] = None
+) -> Iterator[pd.DataFrame]:
+    """
+    Yield a partitioned wide dataset one partition at a time.
+
+    Parameters
+    ----------
+    dataset : str or PathLike
+        The dataset directory or its ``_manifest.json``.
+    columns : List[str], optional
+        Columns to read. Columns a partition lacks (e.g. a category with no
+        data in that batch) are returned as NaN so every partition has the
+        same columns.
+    ids : List[str], optional
+        Only read rows with these ``partition_key`` values (e.g. the IDs
+        returned by `refresh_wide_dataset`). Partitions whose ID range cannot
+        hold any of them are skipped, and so are partitions with no match.
+
+    Yields
+    ------
+    pd.DataFrame
+        One partition. Partitions hold disjoint sets of ``partition_key`` IDs.
+    """
+    manifest = read_wide_manifest(dataset)
+    wanted = columns if columns is not None else manifest['columns']
+    filters = None
+    if ids is not None:
+        ids = [str(i) for i in ids]
+        if not ids:
+            return
+        lowest, highest = min(ids), max(ids)
+        filters = [(manifest['partition_key'], 'in', ids)]
+    for partition in manifest['partitions']:
+        if filters is not None and (partition['min_id'] is None or partition['max_id'] < lowest
+                                    or partition['min_id'] > highest):
+            continue
+        present = [c for c in wanted if c in partition['columns']]
+        df = pd.read_parquet(os.path.join(manifest['directory'], partition['path']),
+                             columns=present, filters=filters)
+        if filters is not None and len(df) == 0:
+            continue
+        for col in wanted:
+            if col not in df.columns:
+                df[col] = np.nan
+        yield df[wanted]
+
+
+def load_wide_dataset(
+    dataset: Union[str, os.PathLike],
+    columns: Optional[List[str]] = None,
+    ids: Optional[List[str]] = None
+) -> pd.DataFrame:
+    """
+    Load a partitioned wide dataset into a single DataFrame.
+
+    Parameters
+    ----------
+    dataset : str or PathLike
+        The dataset directory or its ``_manifest.json``.
+    columns : List[str], optional
+        Columns to read (default: all).
+    ids : List[str], optional
+        Only load rows with these ``partition_key`` values.
+
+    Returns
+    -------
+    pd.DataFrame
+        All partitions concatenated in batch order.
+    """
+    parts = list(iter_wide_partitions(dataset, columns, ids))
+    if not parts:
+        return pd.DataFrame(columns=columns or read_wide_manifest(dataset)['columns'])
+    return pd.concat(parts, ignore_index=True)
+
+
 def _get_timestamp_column(table_name: str) -> Optional[str]:
     """Get the timestamp column name for each table type from config."""
     table_config = _get_table_config(table_name)
@@ -538,178 +1233,109 @@ def _process_hourly_single_batch(
     aggregation_config: Dict[str, List[str]],
     id_name: str = 'hospitalization_id',
     hourly_window: int = 1,
-    fill_gaps: bool = False
-) -> pd.DataFrame:
-    """Process entire dataset in a single batch with progress tracking by aggregation type."""
-    
+    fill_gaps: bool = False,
+    backend: str = 'pandas',
+    window_step: Optional[int] = None,
+    window_alignment: str = 'event'
+) -> Union[pd.DataFrame, pa.Table]:
+    """Aggregate a whole batch with one fused DuckDB query, sorted by id and window."""
+
     try:
-        # Register the DataFrame
         conn.register('wide_data', wide_df)
-
-        # Create window assignments with event-based windowing
-        window_label = "hourly" if hourly_window == 1 else f"{hourly_window}-hour"
-        logger.info(f"Creating event-based {window_label} windows")
-        logger.debug("Calculating window boundaries")
-        conn.execute(f"""
-            CREATE OR REPLACE TABLE windowed_data AS
-            WITH first_events AS (
-                SELECT
-                    {id_name},
-                    MIN(event_time) AS first_event_time
-                FROM wide_data
-                GROUP BY {id_name}
-            )
-            SELECT
-                wd.*,
-                fe.first_event_time,
-                CAST(FLOOR((EPOCH(wd.event_time) - EPOCH(fe.first_event_time)) / ({hourly_window} * 3600)) AS INTEGER) AS window_number
-            FROM wide_data wd
-            JOIN first_events fe ON wd.{id_name} = fe.{id_name}
-        """)
-        
-        # Build separate queries for each aggregation type
-        agg_queries = _build_aggregation_query_duckdb(conn, aggregation_config, wide_df.columns, id_name, hourly_window)
-
-        # Execute base query first
-        logger.info("Processing aggregations by type:")
-        logger.debug("- Extracting base columns")
-        base_df = conn.execute(agg_queries['base']).df()
-
-        # Process each aggregation type separately and merge properly
-        result_df = base_df
-
-        # Define the order of operations for better user feedback
-        agg_order = ['max', 'min', 'mean', 'median', 'first', 'last', 'boolean', 'one_hot_encode']
-
-        for agg_type in agg_order:
-            if agg_type in agg_queries and agg_type != 'base':
-                logger.info(f"- Processing {agg_type} aggregation")
-                try:
-                    agg_result = conn.execute(agg_queries[agg_type]).df()
-                    # Merge on the keys to ensure proper row alignment
-                    result_df = result_df.merge(
-                        agg_result,
-                        on=[id_name, 'window_number'],
-                        how='left'
-                    )
-                    logger.info(f"  [ok] {agg_type} complete ({agg_result.shape[1] - 2} columns)")
-                except Exception as e:
-                    logger.error(f"  [fail] {agg_type} failed: {str(e)}")
-
-        # Merge all results
-        logger.debug("Merging aggregation results")
-
-        # Fill gaps if requested
-        if fill_gaps:
-            logger.info("Filling gaps in window sequence")
-            result_df = _fill_window_gaps(conn, result_df, id_name, hourly_window)
-
-        # Sort by id_name and window_number
-        result_df = result_df.sort_values([id_name, 'window_number']).reset_index(drop=True)
-
-        # Strip timezone from datetime columns (DuckDB to_timestamp adds it back)
-        for col in result_df.columns:
-            if pd.api.types.is_datetime64_any_dtype(result_df[col]):
-                if hasattr(result_df[col].dtype, 'tz') and result_df[col].dtype.tz is not None:
-                    result_df[col] = result_df[col].dt.tz_localize(None)
-
         window_label = "hourly" if hourly_window == 1 else f"{hourly_window}-hour"
-        logger.info(f"{window_label.capitalize()} aggregation complete: {len(result_df)} records")
-        logger.info(f"Columns in dataset: {len(result_df.columns)}")
+        if window_step and window_step != hourly_window:
+            window_label += f" (every {window_step}h)"
+        logger.info(f"Creating {window_alignment}-aligned {window_label} windows and aggregating in one pass")
+        query = _build_hourly_query_duckdb(
+            conn, aggregation_config, list(wide_df.columns), id_name, hourly_window, fill_gaps,
+            window_step, window_alignment
+        )
+        cursor = conn.execute(query)
+        result = cursor.fetch_arrow_table() if backend == 'arrow' else cursor.df()
+        conn.unregister('wide_data')
 
-        return result_df
+        logger.info(f"{window_label.capitalize()} aggregation complete: {len(result)} records")
+        logger.info(f"Columns in dataset: {len(result.columns)}")
+        return result
 
     except Exception as e:
         logger.error(f"Single batch processing failed: {str(e)}")
         raise
 
 
-def _fill_window_gaps(
-    conn: duckdb.DuckDBPyConnection,
-    aggregated_df: pd.DataFrame,
+def _combine_hourly_results(
+    results: List[Union[pd.DataFrame, pa.Table]],
     id_name: str,
-    hourly_window: int
-) -> pd.DataFrame:
-    """
-    Fill gaps in window sequence by creating rows for missing windows with NaN values.
-
-    Parameters
-    ----------
-    conn : duckdb.DuckDBPyConnection
-        Active DuckDB connection
-    aggregated_df : pd.DataFrame
-        Aggregated data with window_number, window_start_dttm, window_end_dttm
-    id_name : str
-        Grouping column name
-    hourly_window : int
-        Window size in hours
-
-    Returns
-    -------
-    pd.DataFrame
-        Complete window sequence with gaps filled as NaN
-    """
-    logger.debug(f"  - Generating complete window sequences per {id_name}")
-
-    # Register aggregated data
-    conn.register('aggregated_data', aggregated_df)
-
-    # Create complete window sequence
-    complete_df = conn.execute(f"""
-        WITH window_ranges AS (
-            SELECT
-                {id_name},
-                MIN(window_number) AS min_window,
-                MAX(window_number) AS max_window
-            FROM aggregated_data
-            GROUP BY {id_name}
-        ),
-        first_event_times AS (
-            SELECT
-                {id_name},
-                window_start_dttm
-            FROM aggregated_data
-            WHERE window_number = 0
-        ),
-        all_windows AS (
-            SELECT
-                wr.{id_name},
-                unnest(generate_series(wr.min_window, wr.max_window, 1)) AS window_number
-            FROM window_ranges wr
-        ),
-        window_timestamps AS (
-            SELECT
-                aw.{id_name},
-                aw.window_number,
-                fe.window_start_dttm + (aw.window_number * {hourly_window}) * INTERVAL '1' HOUR AS window_start_dttm,
-                fe.window_start_dttm + ((aw.window_number + 1) * {hourly_window}) * INTERVAL '1' HOUR AS window_end_dttm
-            FROM all_windows aw
-            LEFT JOIN first_event_times fe ON aw.{id_name} = fe.{id_name}
+    backend: str = 'pandas'
+) -> Union[pd.DataFrame, pa.Table]:
+    """Concatenate per-batch hourly results (columns may differ) sorted by id and window."""
+    keys = [id_name, 'window_number']
+    if backend == 'arrow':
+        combined = pa.concat_tables(results, promote_options='default')
+        return combined.sort_by([(key, 'ascending') for key in keys])
+    combined = pd.concat(results, ignore_index=True)
+    return combined.sort_values(keys).reset_index(drop=True)
+
+
+def _hourly_batch_worker(payload: Dict) -> pd.DataFrame:
+    """Aggregate one batch of groups in a worker process."""
+    with pooled_connection(
+        timezone=payload['timezone'],
+        settings={'preserve_insertion_order': 'false'},
+    ) as conn:
+        return _process_hourly_single_batch(
+            conn, payload['batch_df'], payload['aggregation_config'], payload['id_name'],
+            payload['hourly_window'], payload['fill_gaps'], payload['backend'],
+            payload['window_step'], payload['window_alignment']
         )
-        SELECT
-            wt.{id_name},
-            wt.window_number,
-            wt.window_start_dttm,
-            wt.window_end_dttm,
-            ad.* EXCLUDE ({id_name}, window_number, window_start_dttm, window_end_dttm)
-        FROM window_timestamps wt
-        LEFT JOIN aggregated_data ad
-            ON wt.{id_name} = ad.{id_name}
-            AND wt.window_number = ad.window_number
-        ORDER BY wt.{id_name}, wt.window_number
-    """).df()
 
-    # Cleanup
-    conn.unregister('aggregated_data')
 
-    # Report stats
-    original_rows = len(aggregated_df)
-    filled_rows = len(complete_df)
-    gap_rows = filled_rows - original_rows
+def _run_hourly_batches(
+    conn: duckdb.DuckDBPyConnection,
+    chunks,
+    aggregation_config: Dict[str, List[str]],
+    id_name: str,
+    hourly_window: int,
+    fill_gaps: bool,
+    timezone: str,
+    n_batches: Optional[int],
+    max_workers: int = 1,
+    max_retries: int = 2,
+    resource_config: Optional[DuckDBResourceConfig] = None,
+    backend: str = 'pandas',
+    window_step: Optional[int] = None,
+    window_alignment: str = 'event'
+) -> List[Union[pd.DataFrame, pa.Table]]:
+    """Aggregate each chunk of whole groups; results come back in chunk order."""
+
+    def payload(batch_df):
+        return {
+            'batch_df': batch_df,
+            'aggregation_config': aggregation_config,
+            'id_name': id_name, 'hourly_window': hourly_window,
+            'fill_gaps': fill_gaps, 'timezone': timezone, 'backend': backend,
+            'window_step': window_step, 'window_alignment': window_alignment,
+        }
 
-    logger.info(f"  - Original: {original_rows} windows, Filled: {filled_rows} windows (+{gap_rows} gaps filled with NaN)")
+    payloads = ((i, payload(chunk)) for i, chunk in enumerate(chunks) if len(chunk) > 0)
+    if max_workers > 1:
+        batch_func = _hourly_batch_worker
+    else:
+        def batch_func(item):
+            return _process_hourly_single_batch(
+                conn, item['batch_df'], item['aggregation_config'], id_name, hourly_window, fill_gaps, backend,
+                window_step, window_alignment
+            )
 
-    return complete_df
+    results = {}
+    for batch_num, batch_result in tqdm(
+        run_batches(batch_func, payloads, max_workers, max_retries, resource_config, label='Batch'),
+        desc="Processing batches", total=n_batches, unit="batch"
+    ):
+        if len(batch_result) > 0:
+            results[batch_num] = batch_result
+            logger.info(f"Batch {batch_num + 1} completed: {len(batch_result)} records")
+    return [results[i] for i in sorted(results)]
 
 
 def _process_hourly_in_batches(
@@ -719,63 +1345,34 @@ def _process_hourly_in_batches(
     id_name: str,
     batch_size: int,
     hourly_window: int = 1,
-    fill_gaps: bool = False
-) -> pd.DataFrame:
+    fill_gaps: bool = False,
+    timezone: str = 'UTC',
+    max_workers: int = 1,
+    max_retries: int = 2,
+    resource_config: Optional[DuckDBResourceConfig] = None,
+    backend: str = 'pandas',
+    window_step: Optional[int] = None,
+    window_alignment: str = 'event'
+) -> Union[pd.DataFrame, pa.Table]:
     """Process dataset in batches to manage memory usage with progress tracking."""
 
     logger.info(f"Processing in batches of {batch_size} {id_name}s")
 
-    # Get unique IDs
+    # Batch membership from one pass over the id column
     unique_ids = wide_df[id_name].unique()
     n_batches = (len(unique_ids) + batch_size - 1) // batch_size
-    
-    batch_results = []
-    
-    # Use tqdm for batch-level progress
-    batch_iterator = tqdm(range(0, len(unique_ids), batch_size),
-                         desc="Processing batches",
-                         total=n_batches,
-                         unit="batch")
-
-    for i in batch_iterator:
-        batch_ids = unique_ids[i:i + batch_size]
-        batch_num = (i // batch_size) + 1
-        
-        batch_iterator.set_description(f"Processing batch {batch_num}/{n_batches}")
-        
-        try:
-            # Filter to current batch
-            batch_df = wide_df[wide_df[id_name].isin(batch_ids)].copy()
-
-            logger.debug(f"--- Batch {batch_num}/{n_batches} ({len(batch_ids)} {id_name}s) ---")
-
-            # Process this batch
-            batch_result = _process_hourly_single_batch(conn, batch_df, aggregation_config.copy(), id_name, hourly_window, fill_gaps)
+    id_to_batch = {group_id: i // batch_size for i, group_id in enumerate(unique_ids)}
+    positions = _batch_positions(wide_df[id_name], id_to_batch)
+    chunks = (wide_df.iloc[positions[i]] for i in range(n_batches) if i in positions)
 
-            if len(batch_result) > 0:
-                batch_results.append(batch_result)
-                logger.info(f"Batch {batch_num} completed: {len(batch_result)} records")
-            
-            # Clean up batch-specific tables
-            try:
-                conn.execute("DROP TABLE IF EXISTS windowed_data")
-                conn.unregister('wide_data')
-            except:
-                pass
-            
-            # Explicit garbage collection between batches
-            import gc
-            gc.collect()
-
-
-        except Exception as e:
-            logger.error(f"Error processing batch {batch_num}: {str(e)}")
-            continue
+    batch_results = _run_hourly_batches(
+        conn, chunks, aggregation_config, id_name, hourly_window, fill_gaps, timezone,
+        n_batches, max_workers, max_retries, resource_config, backend, window_step, window_alignment
+    )
 
     if batch_results:
         logger.info(f"Combining {len(batch_results)} batch results")
-        final_df = pd.concat(batch_results, ignore_index=True)
-        final_df = final_df.sort_values([id_name, 'window_number']).reset_index(drop=True)
+        final_df = _combine_hourly_results(batch_results, id_name, backend)
 
         window_label = "hourly" if hourly_window == 1 else f"{hourly_window}-hour"
         logger.info(f"Final {window_label} dataset: {len(final_df)} records from {len(batch_results)} batches")
@@ -784,15 +1381,53 @@ def _process_hourly_in_batches(
         raise ValueError("No batches processed successfully")
 
 
-def _build_aggregation_query_duckdb(
+_HOURLY_AGG_ORDER = ['max', 'min', 'mean', 'median', 'first', 'last', 'boolean', 'one_hot_encode']
+_WINDOW_ALIGNMENTS = ('event', 'calendar')
+
+# Aggregate of one window straight from its events
+_TUMBLING_AGG_SQL = {
+    'max': "MAX({col})",
+    'min': "MIN({col})",
+    'mean': "AVG({col})",
+    'median': "MEDIAN({col})",
+    'first': "FIRST({col} ORDER BY event_time)",
+    'last': "LAST({col} ORDER BY event_time)",
+    'boolean': "CASE WHEN COUNT({col}) > 0 THEN 1 ELSE 0 END",
+    'one_hot_encode': "MAX(CASE WHEN {col} = {value} THEN 1 ELSE 0 END)",
+}
+
+# Sliding windows: (per-step partial aggregates, combination over the frame ``w``).
+# first/last wrap the value in a struct so an empty step (NULL struct) is
+# skipped while a NULL first value is kept, as in the tumbling FIRST/LAST.
+_SLIDING_AGG_SQL = {
+    'max': (["MAX({col}) AS {p}"], "MAX({p}) OVER w"),
+    'min': (["MIN({col}) AS {p}"], "MIN({p}) OVER w"),
+    'mean': (["SUM({col}) AS {p}_sum", "COUNT({col}) AS {p}_n"],
+             "SUM({p}_sum) OVER w / NULLIF(SUM({p}_n) OVER w, 0)"),
+    'median': (["LIST({col}) FILTER (WHERE {col} IS NOT NULL) AS {p}"],
+               "list_median(flatten(list_filter(LIST({p}) OVER w, x -> x IS NOT NULL)))"),
+    'first': (["struct_pack(v := FIRST({col} ORDER BY event_time)) AS {p}"],
+              "(first_value({p} IGNORE NULLS) OVER w).v"),
+    'last': (["struct_pack(v := LAST({col} ORDER BY event_time)) AS {p}"],
+             "(last_value({p} IGNORE NULLS) OVER w).v"),
+    'boolean': (["COUNT({col}) AS {p}"], "CASE WHEN SUM({p}) OVER w > 0 THEN 1 ELSE 0 END"),
+    'one_hot_encode': (["MAX(CASE WHEN {col} = {value} THEN 1 ELSE 0 END) AS {p}"], "MAX({p}) OVER w"),
+}
+
+
+def _hourly_aggregates(
     conn: duckdb.DuckDBPyConnection,
     aggregation_config: Dict[str, List[str]],
     all_columns: List[str],
-    id_name: str = 'hospitalization_id',
-    hourly_window: int = 1
-) -> Dict[str, str]:
-    """Build separate DuckDB aggregation queries by type for better performance and progress tracking."""
-    
+    id_name: str = 'hospitalization_id'
+) -> List[Tuple[str, str, str, Optional[str]]]:
+    """Resolve ``aggregation_config`` into ``(method, column, output name, one-hot value)``.
+
+    Entries come in output order: patient_id / day_number, then max, min,
+    mean, median, first, last, boolean and one-hot columns. Columns not in the
+    config default to 'first' with a '_c' postfix.
+    """
+
     # Group by columns
     group_cols = [id_name, 'window_number', 'window_start_dttm', 'window_end_dttm']
 
@@ -805,150 +1440,245 @@ def _build_aggregation_query_duckdb(
                       if col not in all_agg_columns
                       and col not in group_cols
                       and col not in ['patient_id', 'day_number', 'first_event_time', 'event_time', 'window_number']]
-    
+
     if non_agg_columns:
         logger.info(f"Columns not in aggregation_config, defaulting to 'first' with '_c' postfix: {', '.join(non_agg_columns[:5])}")
         if len(non_agg_columns) > 5:
             logger.debug(f"  ... and {len(non_agg_columns) - 5} more")
-        if 'first' not in aggregation_config:
-            aggregation_config['first'] = []
-        aggregation_config['first'].extend(non_agg_columns)
-    
-    # Build separate queries for each aggregation type
-    queries = {}
-    
-    # Base columns query with window calculations
-    base_query = f"""
-    WITH window_aggregates AS (
+
+    specs = [('first', col, col, None) for col in ['patient_id', 'day_number'] if col in all_columns]
+    for agg_method in _HOURLY_AGG_ORDER:
+        columns = list(aggregation_config.get(agg_method, []))
+        if agg_method == 'first':
+            columns += non_agg_columns
+        valid_columns = [col for col in columns if col in all_columns]
+        if not valid_columns:
+            continue
+        logger.debug(f"- {agg_method} aggregation: {len(valid_columns)} columns")
+
+        for col in valid_columns:
+            if agg_method == 'one_hot_encode':
+                specs.extend(('one_hot_encode', col, name, value) for name, value in _one_hot_values_duckdb(conn, col))
+            elif agg_method == 'first' and col in non_agg_columns:
+                specs.append(('first', col, f"{col}_c", None))
+            else:
+                specs.append((agg_method, col, f"{col}_{agg_method}", None))
+    return specs
+
+
+def _build_hourly_query_duckdb(
+    conn: duckdb.DuckDBPyConnection,
+    aggregation_config: Dict[str, List[str]],
+    all_columns: List[str],
+    id_name: str = 'hospitalization_id',
+    hourly_window: int = 1,
+    fill_gaps: bool = False,
+    window_step: Optional[int] = None,
+    window_alignment: str = 'event'
+) -> str:
+    """Build the single query that windows, aggregates and (optionally) gap-fills ``wide_data``.
+
+    Window ``n`` ends ``(n + 1) * window_step`` hours after the group's origin
+    (its first event, or the calendar step boundary at or before it) and is
+    ``hourly_window`` hours long. Tumbling windows (``window_step ==
+    hourly_window``) aggregate events in one ``GROUP BY``. Sliding windows
+    aggregate each step once and combine the last ``hourly_window /
+    window_step`` steps with a ``ROWS`` window frame, so each event is read
+    once however many windows overlap it.
+    """
+    step = window_step or hourly_window
+    specs = _hourly_aggregates(conn, aggregation_config, all_columns, id_name)
+
+    if window_alignment == 'calendar':
+        # Step boundaries on the wall clock (midnight-aligned when step divides 24)
+        origin = (f"TIMESTAMP '1970-01-01' + (FLOOR(EPOCH(MIN(event_time) OVER (PARTITION BY {id_name}))"
+                  f" / ({step} * 3600)) * {step}) * INTERVAL '1' HOUR")
+    else:
+        origin = f"MIN(event_time) OVER (PARTITION BY {id_name})"
+
+    windowed = f"""
+    WITH origins AS (
+        SELECT *, {origin} AS window_origin
+        FROM wide_data
+    ),
+    windowed_data AS (
         SELECT
-            {id_name},
-            window_number,
-            MIN(first_event_time) AS first_event_time
+            *,
+            CAST(FLOOR((EPOCH(event_time) - EPOCH(window_origin)) / ({step} * 3600)) AS INTEGER) AS window_number
+        FROM origins
+    )"""
+    # Window bounds; ``{t}`` is the table qualifier
+    window_start = f"{{t}}window_origin + (({{t}}window_number + 1) * {step} - {hourly_window}) * INTERVAL '1' HOUR"
+    window_end = f"{{t}}window_origin + (({{t}}window_number + 1) * {step}) * INTERVAL '1' HOUR"
+
+    if step != hourly_window:
+        return windowed + _sliding_aggregation_sql(
+            specs, id_name, hourly_window // step, window_start, window_end, fill_gaps
+        )
+
+    select_parts = [
+        id_name,
+        'window_number',
+        f"MIN({window_start.format(t='')}) AS window_start_dttm",
+        f"MIN({window_end.format(t='')}) AS window_end_dttm",
+    ] + [
+        f"{_TUMBLING_AGG_SQL[method].format(col=col, value=value)} AS {name}"
+        for method, col, name, value in specs
+    ]
+    query = windowed + f""",
+    aggregated AS (
+        SELECT
+            {', '.join(select_parts)}
         FROM windowed_data
         GROUP BY {id_name}, window_number
     )
-    SELECT
-        wa.{id_name},
-        wa.window_number,
-        wa.first_event_time + (wa.window_number * {hourly_window}) * INTERVAL '1' HOUR AS window_start_dttm,
-        wa.first_event_time + ((wa.window_number + 1) * {hourly_window}) * INTERVAL '1' HOUR AS window_end_dttm,
-        FIRST(wd.patient_id ORDER BY wd.event_time) AS patient_id,
-        FIRST(wd.day_number ORDER BY wd.event_time) AS day_number
-    FROM windowed_data wd
-    JOIN window_aggregates wa
-        ON wd.{id_name} = wa.{id_name}
-        AND wd.window_number = wa.window_number
-    GROUP BY wa.{id_name}, wa.window_number, wa.first_event_time
     """
-    queries['base'] = base_query
-    
-    # Process each aggregation type separately
-    for agg_method, columns in aggregation_config.items():
-        if agg_method == 'one_hot_encode':
-            continue  # Handle separately
-            
-        valid_columns = [col for col in columns if col in all_columns]
-        if not valid_columns:
-            continue
 
-        select_parts = [id_name, 'window_number']
+    if not fill_gaps:
+        return query + f"SELECT * FROM aggregated ORDER BY {id_name}, window_number"
+
+    # Dense output: every window from 0 to the group's last one, gaps left NULL
+    logger.info("Filling gaps in window sequence")
+    return query + f"""
+    , window_ranges AS (
+        SELECT
+            {id_name},
+            MIN(window_number) AS min_window,
+            MAX(window_number) AS max_window,
+            MIN(window_start_dttm - (window_number * {hourly_window}) * INTERVAL '1' HOUR) AS origin
+        FROM aggregated
+        GROUP BY {id_name}
+    ),
+    all_windows AS (
+        SELECT
+            {id_name},
+            origin,
+            unnest(generate_series(min_window, max_window, 1)) AS window_number
+        FROM window_ranges
+    )
+    SELECT
+        aw.{id_name},
+        aw.window_number,
+        aw.origin + (aw.window_number * {hourly_window}) * INTERVAL '1' HOUR AS window_start_dttm,
+        aw.origin + ((aw.window_number + 1) * {hourly_window}) * INTERVAL '1' HOUR AS window_end_dttm,
+        ag.* EXCLUDE ({id_name}, window_number, window_start_dttm, window_end_dttm)
+    FROM all_windows aw
+    LEFT JOIN aggregated ag
+        ON aw.{id_name} = ag.{id_name}
+        AND aw.window_number = ag.window_number
+    ORDER BY aw.{id_name}, aw.window_number
+    """
 
-        for col in valid_columns:
-            if agg_method == 'max':
-                select_parts.append(f"MAX({col}) AS {col}_max")
-            elif agg_method == 'min':
-                select_parts.append(f"MIN({col}) AS {col}_min")
-            elif agg_method == 'mean':
-                select_parts.append(f"AVG({col}) AS {col}_mean")
-            elif agg_method == 'median':
-                select_parts.append(f"MEDIAN({col}) AS {col}_median")
-            elif agg_method == 'first':
-                if col in non_agg_columns:
-                    select_parts.append(f"FIRST({col} ORDER BY event_time) AS {col}_c")
-                else:
-                    select_parts.append(f"FIRST({col} ORDER BY event_time) AS {col}_first")
-            elif agg_method == 'last':
-                select_parts.append(f"LAST({col} ORDER BY event_time) AS {col}_last")
-            elif agg_method == 'boolean':
-                select_parts.append(f"CASE WHEN COUNT({col}) > 0 THEN 1 ELSE 0 END AS {col}_boolean")
 
-        query = f"""
+def _sliding_aggregation_sql(
+    specs: List[Tuple[str, str, str, Optional[str]]],
+    id_name: str,
+    n_steps: int,
+    window_start: str,
+    window_end: str,
+    fill_gaps: bool
+) -> str:
+    """Sliding-window tail of `_build_hourly_query_duckdb` (after ``windowed_data``).
+
+    Events are aggregated once per step, steps are densified from 0 to the
+    group's last one, and every window combines its ``n_steps`` trailing steps.
+    Windows without events are dropped unless ``fill_gaps``.
+    """
+    partials = ["COUNT(*) AS _events"]
+    finals = []
+    for i, (method, col, name, value) in enumerate(specs):
+        partial_sql, final_sql = _SLIDING_AGG_SQL[method]
+        partials += [part.format(col=col, value=value, p=f"_p{i}") for part in partial_sql]
+        finals.append(f"{final_sql.format(p=f'_p{i}')} AS {name}")
+
+    return f""",
+    steps AS (
         SELECT
-            {', '.join(select_parts)}
+            {id_name},
+            window_number,
+            MIN(window_origin) AS window_origin,
+            {', '.join(partials)}
         FROM windowed_data
         GROUP BY {id_name}, window_number
-        """
-        queries[agg_method] = query
-    
-    # Handle one-hot encoding separately
-    if 'one_hot_encode' in aggregation_config:
-        one_hot_query = _build_one_hot_encoding_query_duckdb(
-            conn, aggregation_config['one_hot_encode'], all_columns, id_name
-        )
-        if one_hot_query:
-            queries['one_hot_encode'] = one_hot_query
-    
-    return queries
+    ),
+    all_steps AS (
+        SELECT
+            {id_name},
+            MIN(window_origin) AS window_origin,
+            unnest(generate_series(0, MAX(window_number), 1)) AS window_number
+        FROM steps
+        GROUP BY {id_name}
+    ),
+    aggregated AS (
+        SELECT
+            a.{id_name},
+            a.window_number,
+            {window_start.format(t='a.')} AS window_start_dttm,
+            {window_end.format(t='a.')} AS window_end_dttm,
+            SUM(s._events) OVER w AS _window_events,
+            {', '.join(finals)}
+        FROM all_steps a
+        LEFT JOIN steps s USING ({id_name}, window_number)
+        WINDOW w AS (PARTITION BY a.{id_name} ORDER BY a.window_number
+                     ROWS BETWEEN {n_steps - 1} PRECEDING AND CURRENT ROW)
+    )
+    SELECT * EXCLUDE (_window_events)
+    FROM aggregated
+    {'' if fill_gaps else 'WHERE _window_events > 0'}
+    ORDER BY {id_name}, window_number
+    """
 
 
-def _build_one_hot_encoding_query_duckdb(
+def _one_hot_values_duckdb(
     conn: duckdb.DuckDBPyConnection,
-    one_hot_columns: List[str],
-    all_columns: List[str],
-    id_name: str = 'hospitalization_id'
-) -> Optional[str]:
-    """Build a separate query for one-hot encoding."""
-    
-    valid_columns = [col for col in one_hot_columns if col in all_columns]
-    if not valid_columns:
-        return None
+    col: str
+) -> List[Tuple[str, str]]:
+    """``(output column, SQL literal)`` for each distinct value of a one-hot column."""
+
+    # Get unique values for this column
+    unique_vals_query = f"""
+    SELECT DISTINCT {col}
+    FROM wide_data
+    WHERE {col} IS NOT NULL
+    ORDER BY {col}
+    LIMIT 100  -- Limit to prevent too many columns
+    """
 
-    select_parts = [id_name, 'window_number']
+    values = []
+    try:
+        unique_vals_result = conn.execute(unique_vals_query).fetchall()
 
-    for col in valid_columns:
-        # Get unique values for this column
-        unique_vals_query = f"""
-        SELECT DISTINCT {col}
-        FROM windowed_data
-        WHERE {col} IS NOT NULL
-        ORDER BY {col}
-        LIMIT 100  -- Limit to prevent too many columns
-        """
-        
-        try:
-            unique_vals_result = conn.execute(unique_vals_query).fetchall()
-            
-            if len(unique_vals_result) > 50:
-                logger.warning(f"{col} has {len(unique_vals_result)} unique values. One-hot encoding may create many columns")
-            
-            # Create conditional aggregation for each unique value
-            for (val,) in unique_vals_result:
-                # Clean column name
-                clean_val = re.sub(r'[^a-zA-Z0-9_]', '_', str(val))
-                col_name = f"{col}_{clean_val}"
-                
-                # Handle string values with proper escaping
-                if isinstance(val, str):
-                    val_escaped = val.replace("'", "''")
-                    select_parts.append(f"MAX(CASE WHEN {col} = '{val_escaped}' THEN 1 ELSE 0 END) AS {col_name}")
-                else:
-                    select_parts.append(f"MAX(CASE WHEN {col} = {val} THEN 1 ELSE 0 END) AS {col_name}")
+        if len(unique_vals_result) > 50:
+            logger.warning(f"{col} has {len(unique_vals_result)} unique values. One-hot encoding may create many columns")
+
+        for (val,) in unique_vals_result:
+            # Clean column name
+            clean_val = re.sub(r'[^a-zA-Z0-9_]', '_', str(val))
 
+            # Handle string values with proper escaping
+            if isinstance(val, str):
+                values.append((f"{col}_{clean_val}", "'" + val.replace("'", "''") + "'"))
+            else:
+                values.append((f"{col}_{clean_val}", str(val)))
 
-        except Exception as e:
-            logger.warning(f"Could not create one-hot encoding for {col}: {str(e)}")
+    except Exception as e:
+        logger.warning(f"Could not create one-hot encoding for {col}: {str(e)}")
 
+    return values
 
-    if len(select_parts) > 2:  # More than just the group by columns
-        query = f"""
-        SELECT
-            {', '.join(select_parts)}
-        FROM windowed_data
-        GROUP BY {id_name}, window_number
-        """
-        return query
 
-    return None
+_TIME_RESOLUTIONS = ('minute', 'second', 'none')
+
+
+def _event_key_sql(ts_expr: str, time_resolution: str) -> str:
+    """SQL for the timestamp half of the ``(hospitalization_id, _event_key)`` join key.
+
+    The key stays a TIMESTAMP so joins hash two typed columns; 'minute' matches
+    the historical ``hospitalization_id || '_' || strftime(ts, '%Y%m%d%H%M')`` key.
+    """
+    if time_resolution == 'none':
+        return ts_expr
+    return f"date_trunc('{time_resolution}', {ts_expr})"
 
 
 def _process_hospitalizations(
@@ -963,7 +1693,8 @@ def _process_hospitalizations(
     pivot_tables: List[str],
     wide_tables: List[str],
     show_progress: bool,
-    cohort_df: Optional[pd.DataFrame] = None
+    cohort_df: Optional[pd.DataFrame] = None,
+    time_resolution: str = 'minute'
 ) -> Optional[pd.DataFrame]:
     """Process hospitalizations with pivot-first approach."""
     
@@ -982,10 +1713,13 @@ def _process_hospitalizations(
     conn.execute("CREATE OR REPLACE TABLE adt AS SELECT * FROM temp_adt")
     conn.unregister('temp_adt')
     
-    # Dictionaries to store table info
+    # Event time sources and the output columns of the fused query
     event_time_queries = []
-    pivoted_table_names = {}
-    raw_table_names = {}
+    plan = _WidePlan(
+        base_columns=list(base_cohort.columns),
+        adt_columns=[col for col in adt_df.columns if col != 'hospitalization_id']
+        if 'in_dttm' in adt_df.columns else [],
+    )
     
     # Add ADT event times
     if 'in_dttm' in adt_df.columns:
@@ -1010,110 +1744,123 @@ def _process_hospitalizations(
             logger.warning(f"{table_name} not loaded in CLIF instance, skipping")
             continue
             
-        # Filter by hospitalization IDs immediately
-        # Check if this is medication table with converted data (from config)
         table_config = _get_table_config(table_name)
-        if table_config and table_config.get('supports_unit_conversion', False):
-            # Check if converted data exists
-            if hasattr(table_obj, 'df_converted') and table_obj.df_converted is not None:
-                logger.info(f"           === SPECIAL: USING CONVERTED MEDICATION DATA ===")
-                # Use all converted data (both successful and failed conversions)
-                all_data = table_obj.df_converted[table_obj.df_converted['hospitalization_id'].isin(required_ids)]
-                table_df = all_data.copy()
-
-                # Report conversion statistics
-                success_count = (all_data['_convert_status'] == 'success').sum()
-                failed_count = len(all_data) - success_count
-
-                if failed_count > 0:
-                    percentage = (failed_count / len(all_data)) * 100
-                    logger.info(f"           - Including all {len(all_data):,} rows: {success_count:,} successful conversions, {failed_count:,} ({percentage:.1f}%) fallback to original units")
+        uses_converted = bool(
+            table_config and table_config.get('supports_unit_conversion', False)
+            and getattr(table_obj, 'df_converted', None) is not None
+        )
+        if not uses_converted and not getattr(table_obj, 'is_materialized', True):
+            # Arrow / relation-backed table: stage in DuckDB without a pandas copy
+            staged = _stage_lazy_table(
+                conn, table_name, table_obj.to_arrow(), wide_tables, category_filters, cohort_df
+            )
+            if staged is None:
+                continue
+            table_df, timestamp_col = staged
+            raw_table_name = f"{table_name}_raw"
+        else:
+            # Filter by hospitalization IDs immediately
+            # Check if this is medication table with converted data (from config)
+            if table_config and table_config.get('supports_unit_conversion', False):
+                # Check if converted data exists
+                if hasattr(table_obj, 'df_converted') and table_obj.df_converted is not None:
+                    logger.info(f"           === SPECIAL: USING CONVERTED MEDICATION DATA ===")
+                    # Use all converted data (both successful and failed conversions)
+                    all_data = table_obj.df_converted[table_obj.df_converted['hospitalization_id'].isin(required_ids)]
+                    table_df = all_data.copy()
+
+                    # Report conversion statistics
+                    success_count = (all_data['_convert_status'] == 'success').sum()
+                    failed_count = len(all_data) - success_count
+
+                    if failed_count > 0:
+                        percentage = (failed_count / len(all_data)) * 100
+                        logger.info(f"           - Including all {len(all_data):,} rows: {success_count:,} successful conversions, {failed_count:,} ({percentage:.1f}%) fallback to original units")
+                    else:
+                        logger.info(f"           - All {len(table_df):,} conversions successful")
                 else:
-                    logger.info(f"           - All {len(table_df):,} conversions successful")
+                    # Fallback to original behavior
+                    logger.info(f"           - No converted data found, using original medication data")
+                    table_df = table_obj.df[table_obj.df['hospitalization_id'].isin(required_ids)].copy()
             else:
-                # Fallback to original behavior
-                logger.info(f"           - No converted data found, using original medication data")
+                # Original behavior for other tables
                 table_df = table_obj.df[table_obj.df['hospitalization_id'].isin(required_ids)].copy()
-        else:
-            # Original behavior for other tables
-            table_df = table_obj.df[table_obj.df['hospitalization_id'].isin(required_ids)].copy()
 
-        if len(table_df) == 0:
-            logger.warning(f"No data found in {table_name} for selected hospitalizations")
-            continue
+            if len(table_df) == 0:
+                logger.warning(f"No data found in {table_name} for selected hospitalizations")
+                continue
         
-        # For wide tables (non-pivot), filter columns based on category_filters
-        if table_name in wide_tables and table_name in category_filters:
-            # For respiratory_support, category_filters contains column names to keep
-            required_cols = ['hospitalization_id']  # Always keep hospitalization_id
-            timestamp_col = _get_timestamp_column(table_name)
-            if timestamp_col:
-                required_cols.append(timestamp_col)
+            # For wide tables (non-pivot), filter columns based on category_filters
+            if table_name in wide_tables and table_name in category_filters:
+                # For respiratory_support, category_filters contains column names to keep
+                required_cols = ['hospitalization_id']  # Always keep hospitalization_id
+                timestamp_col = _get_timestamp_column(table_name)
+                if timestamp_col:
+                    required_cols.append(timestamp_col)
             
-            # Add the columns specified in category_filters
-            specified_cols = category_filters[table_name]
-            required_cols.extend(specified_cols)
+                # Add the columns specified in category_filters
+                specified_cols = category_filters[table_name]
+                required_cols.extend(specified_cols)
             
-            # Filter to only available columns
-            available_cols = [col for col in required_cols if col in table_df.columns]
-            missing_cols = [col for col in required_cols if col not in table_df.columns]
+                # Filter to only available columns
+                available_cols = [col for col in required_cols if col in table_df.columns]
+                missing_cols = [col for col in required_cols if col not in table_df.columns]
 
-            if missing_cols:
-                logger.warning(f"Columns not found in {table_name}: {missing_cols}")
+                if missing_cols:
+                    logger.warning(f"Columns not found in {table_name}: {missing_cols}")
 
-            if available_cols:
-                table_df = table_df[available_cols].copy()
-                logger.debug(f"Filtered {table_name} to {len(available_cols)} columns: {available_cols}")
+                if available_cols:
+                    table_df = table_df[available_cols].copy()
+                    logger.debug(f"Filtered {table_name} to {len(available_cols)} columns: {available_cols}")
 
-        logger.info(f"Loaded {len(table_df)} records from {table_name}")
+            logger.info(f"Loaded {len(table_df)} records from {table_name}")
 
-        # Get timestamp column
-        timestamp_col = _get_timestamp_column(table_name)
-        if timestamp_col and timestamp_col not in table_df.columns:
-            timestamp_col = _find_alternative_timestamp(table_name, table_df.columns)
+            # Get timestamp column
+            timestamp_col = _get_timestamp_column(table_name)
+            if timestamp_col and timestamp_col not in table_df.columns:
+                timestamp_col = _find_alternative_timestamp(table_name, table_df.columns)
 
-        if not timestamp_col or timestamp_col not in table_df.columns:
-            logger.warning(f"No timestamp column found for {table_name}, skipping")
-            continue
+            if not timestamp_col or timestamp_col not in table_df.columns:
+                logger.warning(f"No timestamp column found for {table_name}, skipping")
+                continue
         
-        # Apply time filtering if cohort_df is provided
-        if cohort_df is not None:
-
-            logger.info("           === SPECIAL: TIME FILTERING ===")
-            pre_filter_count = len(table_df)
-            logger.debug(f"           - Applying cohort time windows to {table_name}")
-            # Merge with cohort_df to get time windows
-            table_df = pd.merge(
-                table_df,
-                cohort_df[['hospitalization_id', 'start_time', 'end_time']],
-                on='hospitalization_id',
-                how='inner'
-            )
-
-            # Ensure timestamp column is datetime
-            if not pd.api.types.is_datetime64_any_dtype(table_df[timestamp_col]):
-                table_df[timestamp_col] = pd.to_datetime(table_df[timestamp_col])
-
-            # Filter to time window
-            table_df = table_df[
-                (table_df[timestamp_col] >= table_df['start_time']) &
-                (table_df[timestamp_col] <= table_df['end_time'])
-            ].copy()
+            # Apply time filtering if cohort_df is provided
+            if cohort_df is not None:
 
-            # Drop the time window columns
-            table_df = table_df.drop(columns=['start_time', 'end_time'])
-
-            logger.info(f"           - {table_name}: {pre_filter_count} -> {len(table_df)} records after filtering")
-
-        # Register raw table as a proper table, not a view
-        raw_table_name = f"{table_name}_raw"
-        # First register the DataFrame temporarily
-        conn.register('temp_df', table_df)
-        # Create a proper table from it
-        conn.execute(f"CREATE OR REPLACE TABLE {raw_table_name} AS SELECT * FROM temp_df")
-        # Clean up the temporary registration
-        conn.unregister('temp_df')
-        raw_table_names[table_name] = raw_table_name
+                logger.info("           === SPECIAL: TIME FILTERING ===")
+                pre_filter_count = len(table_df)
+                logger.debug(f"           - Applying cohort time windows to {table_name}")
+                # Merge with cohort_df to get time windows
+                table_df = pd.merge(
+                    table_df,
+                    cohort_df[['hospitalization_id', 'start_time', 'end_time']],
+                    on='hospitalization_id',
+                    how='inner'
+                )
+
+                # Ensure timestamp column is datetime
+                if not pd.api.types.is_datetime64_any_dtype(table_df[timestamp_col]):
+                    table_df[timestamp_col] = pd.to_datetime(table_df[timestamp_col])
+
+                # Filter to time window
+                table_df = table_df[
+                    (table_df[timestamp_col] >= table_df['start_time']) &
+                    (table_df[timestamp_col] <= table_df['end_time'])
+                ].copy()
+
+                # Drop the time window columns
+                table_df = table_df.drop(columns=['start_time', 'end_time'])
+
+                logger.info(f"           - {table_name}: {pre_filter_count} -> {len(table_df)} records after filtering")
+
+            # Register raw table as a proper table, not a view
+            raw_table_name = f"{table_name}_raw"
+            # First register the DataFrame temporarily
+            conn.register('temp_df', table_df)
+            # Create a proper table from it
+            conn.execute(f"CREATE OR REPLACE TABLE {raw_table_name} AS SELECT * FROM temp_df")
+            # Clean up the temporary registration
+            conn.unregister('temp_df')
         
         # Process based on table type
         if table_name in pivot_tables:
@@ -1121,10 +1868,10 @@ def _process_hospitalizations(
             logger.info(f"           === PIVOTING {table_name.upper()} ===")
             if table_name in category_filters and category_filters[table_name]:
                 logger.debug(f"           - Categories to pivot: {category_filters[table_name]}")
-            # Pivot the table first
-            pivoted_name = _pivot_table_duckdb(conn, table_name, table_df, timestamp_col, category_filters)
-            if pivoted_name:
-                pivoted_table_names[table_name] = pivoted_name
+            # Resolve the pivot's output columns; the pivot itself runs in the fused query
+            pivot = _plan_pivot(conn, table_name, table_df, raw_table_name, timestamp_col, category_filters)
+            if pivot:
+                plan.pivots.append(pivot)
                 # Add event times from the RAW table (not pivoted)
                 event_time_queries.append(f"""
                     SELECT DISTINCT hospitalization_id, {timestamp_col} AS event_time
@@ -1136,24 +1883,25 @@ def _process_hospitalizations(
             logger.info(f"           === WIDE TABLE {table_name.upper()} ===")
             if table_name in category_filters and category_filters[table_name]:
                 logger.debug(f"           - Keeping columns: {category_filters[table_name]}")
-            # Wide table - just add event times
+            # Wide table - add event times and join its columns as-is
             event_time_queries.append(f"""
                 SELECT DISTINCT hospitalization_id, {timestamp_col} AS event_time
                 FROM {raw_table_name}
                 WHERE {timestamp_col} IS NOT NULL
             """)
+            wide_cols = [col for col in table_df.columns if col not in ['hospitalization_id', timestamp_col]]
+            if wide_cols:
+                plan.wide.append(_WideSpec(raw_table_name, timestamp_col, wide_cols))
     
     # Now create the union and join
     if event_time_queries:
         logger.info("    4.S.4: Creating wide dataset")
         logger.debug("           - Building event time union from {} tables".format(len(event_time_queries)))
-        logger.debug("           - Creating combo_id keys")
+        logger.debug(f"           - Keying events on (hospitalization_id, {time_resolution})")
         logger.debug("           - Executing main join query")
         final_df = _create_wide_dataset(
-            conn, base_cohort, event_time_queries,
-            pivoted_table_names, raw_table_names,
-            tables_to_load, pivot_tables,
-            category_filters, cohort_df
+            conn, event_time_queries, plan,
+            tables_to_load, category_filters, cohort_df, time_resolution
         )
         return final_df
     else:
@@ -1161,14 +1909,146 @@ def _process_hospitalizations(
         return base_cohort
 
 
-def _pivot_table_duckdb(
+def _stage_lazy_table(
     conn: duckdb.DuckDBPyConnection,
     table_name: str,
-    table_df: pd.DataFrame,
+    arrow_table,
+    wide_tables: List[str],
+    category_filters: Dict[str, List[str]],
+    cohort_df: Optional[pd.DataFrame] = None
+) -> Optional[Tuple[duckdb.DuckDBPyRelation, str]]:
+    """Create ``{table_name}_raw`` straight from an Arrow table.
+
+    SQL version of the pandas staging in `_process_hospitalizations` for
+    tables loaded with an Arrow / relation backend: the Arrow data is scanned
+    in place, filtered to the base cohort, trimmed to the configured columns
+    (wide tables) and to the cohort time windows.
+
+    Returns
+    -------
+    tuple of (DuckDBPyRelation, str) or None
+        The raw table and its timestamp column, or None if the table is skipped.
+    """
+    columns = list(arrow_table.column_names)
+    select_cols = columns
+
+    # For wide tables (non-pivot), keep only the columns in category_filters
+    if table_name in wide_tables and table_name in category_filters:
+        required_cols = ['hospitalization_id']
+        timestamp_col = _get_timestamp_column(table_name)
+        if timestamp_col:
+            required_cols.append(timestamp_col)
+        required_cols.extend(category_filters[table_name])
+        available_cols = [col for col in required_cols if col in columns]
+        missing_cols = [col for col in required_cols if col not in columns]
+        if missing_cols:
+            logger.warning(f"Columns not found in {table_name}: {missing_cols}")
+        if available_cols:
+            select_cols = available_cols
+
+    timestamp_col = _get_timestamp_column(table_name)
+    if timestamp_col and timestamp_col not in select_cols:
+        timestamp_col = _find_alternative_timestamp(table_name, select_cols)
+
+    raw_table_name = f"{table_name}_raw"
+    source_view = f"_{table_name}_arrow"
+    select_sql = ", ".join(f'"{col}"' for col in select_cols)
+    conn.register(source_view, arrow_table)
+    try:
+        conn.execute(f"""
+            CREATE OR REPLACE TABLE {raw_table_name} AS
+            SELECT {select_sql}
+            FROM {source_view}
+            WHERE hospitalization_id IN (SELECT hospitalization_id FROM base_cohort)
+        """)
+    finally:
+        conn.unregister(source_view)
+
+    row_count = conn.execute(f"SELECT COUNT(*) FROM {raw_table_name}").fetchone()[0]
+    if row_count == 0:
+        logger.warning(f"No data found in {table_name} for selected hospitalizations")
+        conn.execute(f"DROP TABLE {raw_table_name}")
+        return None
+    logger.info(f"Loaded {row_count} records from {table_name}")
+
+    if not timestamp_col or timestamp_col not in select_cols:
+        logger.warning(f"No timestamp column found for {table_name}, skipping")
+        conn.execute(f"DROP TABLE {raw_table_name}")
+        return None
+
+    # Apply time filtering if cohort_df is provided
+    if cohort_df is not None:
+        logger.info("           === SPECIAL: TIME FILTERING ===")
+        conn.register('_cohort_windows', cohort_df[['hospitalization_id', 'start_time', 'end_time']])
+        try:
+            conn.execute(f"""
+                CREATE OR REPLACE TABLE {raw_table_name} AS
+                SELECT r.*
+                FROM {raw_table_name} r
+                INNER JOIN _cohort_windows w
+                    ON r.hospitalization_id = w.hospitalization_id
+                   AND r.{timestamp_col} >= w.start_time
+                   AND r.{timestamp_col} <= w.end_time
+            """)
+        finally:
+            conn.unregister('_cohort_windows')
+        filtered_count = conn.execute(f"SELECT COUNT(*) FROM {raw_table_name}").fetchone()[0]
+        logger.info(f"           - {table_name}: {row_count} -> {filtered_count} records after filtering")
+
+    return conn.table(raw_table_name), timestamp_col
+
+
+@dataclass
+class _PivotSpec:
+    """One long table's share of the fused pivot: ``(category, output column)`` pairs."""
+    raw_table: str
+    timestamp_col: str
+    category_expr: str
+    value_col: str
+    columns: List[Tuple[str, str]]
+
+
+@dataclass
+class _WideSpec:
+    """A wide table joined as-is on the event key."""
+    raw_table: str
+    timestamp_col: str
+    columns: List[str]
+
+
+@dataclass
+class _WidePlan:
+    """Everything `_create_wide_dataset` needs to build its single query."""
+    base_columns: List[str]
+    adt_columns: List[str]
+    pivots: List[_PivotSpec] = field(default_factory=list)
+    wide: List[_WideSpec] = field(default_factory=list)
+
+
+def _sql_literal(value: str) -> str:
+    return "'" + str(value).replace("'", "''") + "'"
+
+
+def _sql_identifier(name: str) -> str:
+    return '"' + str(name).replace('"', '""') + '"'
+
+
+def _plan_pivot(
+    conn: duckdb.DuckDBPyConnection,
+    table_name: str,
+    table_df: Union[pd.DataFrame, duckdb.DuckDBPyRelation],
+    raw_table_name: str,
     timestamp_col: str,
     category_filters: Dict[str, List[str]]
-) -> Optional[str]:
-    """Pivot a table and return the pivoted table name."""
+) -> Optional[_PivotSpec]:
+    """Resolve the pivot columns of one long table without pivoting it.
+
+    The columns are the categories present in the data (restricted to
+    ``category_filters`` when listed), sorted as DuckDB ``PIVOT`` sorts them,
+    so the wide dataset keeps the columns and column order of the former
+    per-table pivots. Requested categories without rows are added at the end
+    by `_add_missing_columns`, as before.
+    """
 
     # Get column mappings from config
     table_config = _get_table_config(table_name)
@@ -1179,10 +2059,10 @@ def _pivot_table_duckdb(
 
     category_col = table_config.get('category_column')
     value_col = table_config.get('value_column')
+    category_expr = category_col
 
     # Check if this is medication table with converted data
     has_converted_meds = False
-    unit_col = None
     if table_config.get('supports_unit_conversion', False):
         # Check if converted columns exist in the dataframe
         converted_value_col = table_config.get('converted_value_column')
@@ -1192,8 +2072,11 @@ def _pivot_table_duckdb(
                 converted_value_col in table_df.columns and converted_unit_col in table_df.columns):
             has_converted_meds = True
             value_col = converted_value_col
-            unit_col = converted_unit_col
-            logger.debug(f"           - Using converted medication columns: {value_col}, {unit_col}")
+            category_expr = (
+                f"{category_col} || '_' || "
+                f"REPLACE(REPLACE(REPLACE(REPLACE({converted_unit_col}, '/', '_'), '-', '_'), ' ', '_'), '.', '_')"
+            )
+            logger.debug(f"           - Using converted medication columns: {value_col}, {converted_unit_col}")
         else:
             logger.debug(f"           - Using original medication column: {value_col}")
 
@@ -1204,91 +2087,156 @@ def _pivot_table_duckdb(
     if category_col not in table_df.columns or value_col not in table_df.columns:
         logger.warning(f"Required columns {category_col} or {value_col} not found in {table_name}")
         return None
-    
-    # Build filter clause if categories specified
-    filter_clause = ""
-    if table_name in category_filters and category_filters[table_name]:
-        categories_list = "','".join(category_filters[table_name])
-        filter_clause = f"AND {category_col} IN ('{categories_list}')"
-        logger.debug(f"Filtering {table_name} categories to: {category_filters[table_name]}")
 
-    # Create pivot query
-    pivoted_table_name = f"{table_name}_pivoted"
+    categories = category_filters.get(table_name) or []
+    filter_clause = ""
+    if categories:
+        filter_clause = f"AND {category_col} IN ({', '.join(_sql_literal(c) for c in categories)})"
+        logger.debug(f"Filtering {table_name} categories to: {categories}")
+    values = [row[0] for row in conn.execute(f"""
+        SELECT DISTINCT {category_expr}
+        FROM {raw_table_name}
+        WHERE {timestamp_col} IS NOT NULL AND {category_expr} IS NOT NULL {filter_clause}
+        ORDER BY 1
+    """).fetchall()]
+
+    if not values:
+        logger.warning(f"No categories to pivot in {table_name}")
+        return None
 
     if has_converted_meds:
-        # Special pivot for medications with units
-        logger.info(f"           - Creating unit-aware pivot with columns: category_unit format")
-        logger.debug(f"           - Including both successful conversions and original units for failed conversions")
-        pivot_query = f"""
-        CREATE OR REPLACE TABLE {pivoted_table_name} AS
-        WITH pivot_data AS (
-            SELECT DISTINCT
-                {value_col} as value,
-                {category_col} || '_' ||
-                REPLACE(REPLACE(REPLACE(REPLACE({unit_col}, '/', '_'), '-', '_'), ' ', '_'), '.', '_')
-                AS category_for_pivot,
-                hospitalization_id || '_' || strftime({timestamp_col}, '%Y%m%d%H%M') AS combo_id
-            FROM {table_name}_raw
-            WHERE {timestamp_col} IS NOT NULL {filter_clause}
-        )
-        PIVOT pivot_data
-        ON category_for_pivot
-        USING first(value)
-        GROUP BY combo_id
-        """
+        logger.info(f"Planned {table_name} pivot: {len(values)} medication_unit columns")
     else:
-        # Original pivot query for other tables
-        pivot_query = f"""
-        CREATE OR REPLACE TABLE {pivoted_table_name} AS
-        WITH pivot_data AS (
-            SELECT DISTINCT
-                {value_col},
-                {category_col},
-                hospitalization_id || '_' || strftime({timestamp_col}, '%Y%m%d%H%M') AS combo_id
-            FROM {table_name}_raw
-            WHERE {timestamp_col} IS NOT NULL {filter_clause}
-        )
-        PIVOT pivot_data
-        ON {category_col}
-        USING first({value_col})
-        GROUP BY combo_id
-        """
-    
-    try:
-        conn.execute(pivot_query)
-        
-        # Get stats
-        count = conn.execute(f"SELECT COUNT(*) FROM {pivoted_table_name}").fetchone()[0]
-        cols = len(conn.execute(f"SELECT * FROM {pivoted_table_name} LIMIT 0").df().columns) - 1
+        logger.info(f"Planned {table_name} pivot: {len(values)} category columns")
+    return _PivotSpec(
+        raw_table=raw_table_name,
+        timestamp_col=timestamp_col,
+        category_expr=category_expr,
+        value_col=value_col,
+        columns=[(value, str(value)) for value in values],
+    )
 
-        if has_converted_meds:
-            logger.info(f"Pivoted {table_name}: {count} combo_ids with {cols} medication_unit columns")
-        else:
-            logger.info(f"Pivoted {table_name}: {count} combo_ids with {cols} category columns")
-        return pivoted_table_name
 
-    except Exception as e:
-        logger.error(f"Error pivoting {table_name}: {str(e)}")
-        return None
+def _fused_pivot_sql(plan: _WidePlan, time_resolution: str, taken: set) -> Tuple[Optional[str], List[str]]:
+    """One conditional aggregation over every long table, grouped on the event key.
+
+    The long tables are stacked (each keeps its own value column, as value
+    types differ between tables) and aggregated in a single ``GROUP BY``, so
+    each raw table is scanned once and no per-table pivot is materialized.
+    ``first(value) FILTER (WHERE category = ...)`` keeps DuckDB PIVOT's
+    ``first(value)`` semantics. Columns are listed with the last staged table
+    first, the order the former per-table joins produced; output names
+    already in ``taken`` are skipped.
+
+    Returns
+    -------
+    tuple of (str or None, list of str)
+        The ``pivoted`` subquery (None without long tables) and its value columns.
+    """
+    branches = []
+    aggregates = []
+    output_cols = []
+    for i, pivot in enumerate(plan.pivots):
+        categories = ', '.join(_sql_literal(category) for category, _ in pivot.columns)
+        branches.append(f"""
+            SELECT
+                hospitalization_id,
+                {_event_key_sql(pivot.timestamp_col, time_resolution)} AS _event_key,
+                {i} AS _source,
+                {pivot.category_expr} AS _category,
+                {pivot.value_col} AS _value_{i}
+            FROM {pivot.raw_table}
+            WHERE {pivot.timestamp_col} IS NOT NULL AND {pivot.category_expr} IN ({categories})
+        """)
+    for i, pivot in reversed(list(enumerate(plan.pivots))):
+        for category, name in pivot.columns:
+            if name in taken:
+                logger.debug(f"           - Skipping duplicate column {name} from {pivot.raw_table}")
+                continue
+            taken.add(name)
+            output_cols.append(name)
+            aggregates.append(
+                f"first(_value_{i}) FILTER (WHERE _source = {i} AND _category = {_sql_literal(category)}) "
+                f"AS {_sql_identifier(name)}"
+            )
+
+    if not aggregates:
+        return None, []
+    return f"""
+        SELECT hospitalization_id, _event_key, {', '.join(aggregates)}
+        FROM ({' UNION ALL BY NAME '.join(branches)}) long_values
+        GROUP BY hospitalization_id, _event_key
+    """, output_cols
 
 
 def _create_wide_dataset(
     conn: duckdb.DuckDBPyConnection,
-    base_cohort: pd.DataFrame,
     event_time_queries: List[str],
-    pivoted_table_names: Dict[str, str],
-    raw_table_names: Dict[str, str],
+    plan: _WidePlan,
     tables_to_load: List[str],
-    pivot_tables: List[str],
     category_filters: Dict[str, List[str]],
-    cohort_df: Optional[pd.DataFrame] = None
+    cohort_df: Optional[pd.DataFrame] = None,
+    time_resolution: str = 'minute'
 ) -> pd.DataFrame:
-    """Create the final wide dataset by joining all tables."""
-    
+    """Create the final wide dataset with a single query built from ``plan``.
+
+    Tables are joined on the typed ``(hospitalization_id, _event_key)`` pair
+    rather than a concatenated string, so DuckDB hashes a VARCHAR and a
+    TIMESTAMP instead of formatting and comparing one long string per row.
+    All output columns are known from the plan, so no catalog round-trips
+    are needed to assemble the query.
+    """
+
     # Create union of all event times
     union_query = " UNION ALL ".join(event_time_queries)
-    
-    # Build the main query
+    taken = set(plan.base_columns) | {'event_time', '_event_key'}
+
+    # Columns follow the former per-table joins: wide tables, then long
+    # tables (each group last staged first), then ADT; a name taken by an
+    # earlier column is dropped from later ones
+    select_cols = ["ec.*"]
+    joins = []
+
+    # Wide tables (respiratory_support, ...) joined as-is
+    for i, wide in reversed(list(enumerate(plan.wide))):
+        wide_cols = [col for col in wide.columns if col not in taken]
+        if not wide_cols:
+            continue
+        taken.update(wide_cols)
+        alias = f"wide_{i}"
+        select_cols += [f"{alias}.{_sql_identifier(col)}" for col in wide_cols]
+        joins.append(f"""
+        LEFT JOIN (
+            SELECT 
+                hospitalization_id,
+                {_event_key_sql(wide.timestamp_col, time_resolution)} AS _event_key,
+                {', '.join(_sql_identifier(col) for col in wide_cols)}
+            FROM {wide.raw_table}
+            WHERE {wide.timestamp_col} IS NOT NULL
+        ) {alias} USING (hospitalization_id, _event_key)
+        """)
+
+    # Every long table in one conditional aggregation
+    pivot_sql, pivot_cols = _fused_pivot_sql(plan, time_resolution, taken)
+    if pivot_sql:
+        select_cols += [f"pivoted.{_sql_identifier(col)}" for col in pivot_cols]
+        joins.append(f" LEFT JOIN ({pivot_sql}) pivoted USING (hospitalization_id, _event_key)")
+
+    # ADT columns
+    if plan.adt_columns:
+        adt_cols = [col for col in plan.adt_columns if col not in taken]
+        taken.update(adt_cols)
+        select_cols += [f"adt_combo.{_sql_identifier(col)}" for col in adt_cols]
+        joins.append(f"""
+        LEFT JOIN (
+            SELECT 
+                {_event_key_sql('in_dttm', time_resolution)} AS _event_key,
+                *
+            FROM adt
+            WHERE in_dttm IS NOT NULL
+        ) adt_combo USING (hospitalization_id, _event_key)
+        """)
+
     query = f"""
     WITH all_events AS (
         SELECT DISTINCT hospitalization_id, event_time
@@ -1298,83 +2246,15 @@ def _create_wide_dataset(
         SELECT 
             a.*,
             b.event_time,
-            a.hospitalization_id || '_' || strftime(b.event_time, '%Y%m%d%H%M') AS combo_id
+            {_event_key_sql('b.event_time', time_resolution)} AS _event_key
         FROM base_cohort a
         INNER JOIN all_events b ON a.hospitalization_id = b.hospitalization_id
     )
-    SELECT ec.*
+    SELECT {', '.join(select_cols)}
+    FROM expanded_cohort ec
+    {''.join(joins)}
     """
-    
-    # Add ADT columns
-    if 'adt' in conn.execute("SHOW TABLES").df()['name'].values:
-        adt_cols = [col for col in conn.execute("SELECT * FROM adt LIMIT 0").df().columns 
-                   if col not in ['hospitalization_id']]
-        if adt_cols:
-            adt_col_list = ', '.join([f"adt_combo.{col}" for col in adt_cols])
-            query = query.replace("SELECT ec.*", f"SELECT ec.*, {adt_col_list}")
-    
-    # Add pivoted table columns
-    for table_name, pivoted_table_name in pivoted_table_names.items():
-        pivot_cols = conn.execute(f"SELECT * FROM {pivoted_table_name} LIMIT 0").df().columns
-        pivot_cols = [col for col in pivot_cols if col != 'combo_id']
-        
-        if pivot_cols:
-            pivot_col_list = ', '.join([f"{pivoted_table_name}.{col}" for col in pivot_cols])
-            query = query.replace("SELECT ec.*", f"SELECT ec.*, {pivot_col_list}")
-    
-    # Add non-pivoted table columns (respiratory_support)
-    for table_name in tables_to_load:
-        if table_name not in pivot_tables and table_name in raw_table_names:
-            timestamp_col = _get_timestamp_column(table_name)
-            if not timestamp_col:
-                continue
-                
-            raw_cols = conn.execute(f"SELECT * FROM {raw_table_names[table_name]} LIMIT 0").df().columns
-            table_cols = [col for col in raw_cols if col not in ['hospitalization_id', timestamp_col]]
-            
-            if table_cols:
-                col_list = ', '.join([f"{table_name}_combo.{col}" for col in table_cols])
-                query = query.replace("SELECT ec.*", f"SELECT ec.*, {col_list}")
-    
-    # Add FROM clause
-    query += " FROM expanded_cohort ec"
-    
-    # Add ADT join
-    if 'adt' in conn.execute("SHOW TABLES").df()['name'].values:
-        query += """
-        LEFT JOIN (
-            SELECT 
-                hospitalization_id || '_' || strftime(in_dttm, '%Y%m%d%H%M') AS combo_id,
-                *
-            FROM adt
-            WHERE in_dttm IS NOT NULL
-        ) adt_combo USING (combo_id)
-        """
-    
-    # Add joins for pivoted tables
-    for table_name, pivoted_table_name in pivoted_table_names.items():
-        query += f" LEFT JOIN {pivoted_table_name} USING (combo_id)"
-    
-    # Add joins for non-pivoted tables
-    for table_name in tables_to_load:
-        if table_name not in pivot_tables and table_name in raw_table_names:
-            timestamp_col = _get_timestamp_column(table_name)
-            if timestamp_col:
-                raw_cols = conn.execute(f"SELECT * FROM {raw_table_names[table_name]} LIMIT 0").df().columns
-                if timestamp_col in raw_cols:
-                    table_cols = [col for col in raw_cols if col not in ['hospitalization_id', timestamp_col]]
-                    if table_cols:
-                        col_list = ', '.join(table_cols)
-                        query += f"""
-                        LEFT JOIN (
-                            SELECT 
-                                hospitalization_id || '_' || strftime({timestamp_col}, '%Y%m%d%H%M') AS combo_id,
-                                {col_list}
-                            FROM {raw_table_names[table_name]}
-                            WHERE {timestamp_col} IS NOT NULL
-                        ) {table_name}_combo USING (combo_id)
-                        """
-    
+
     # Execute query
     logger.debug("Executing join query")
     result_df = conn.execute(query).df()
@@ -1423,10 +2303,10 @@ def _create_wide_dataset(
 
     logger.info("    4.S.6: Final cleanup")
     # Clean up
-    columns_to_drop = ['combo_id', 'date']
+    columns_to_drop = ['_event_key', 'date']
     result_df = result_df.drop(columns=[col for col in columns_to_drop if col in result_df.columns])
     logger.debug("           - Removing duplicate columns")
-    logger.debug("           - Dropping temporary columns (combo_id, date)")
+    logger.debug("           - Dropping temporary columns (_event_key, date)")
 
     logger.info(f"           - Wide dataset created: {len(result_df)} records with {len(result_df.columns)} columns")
     
@@ -1472,6 +2352,112 @@ def _add_missing_columns(
                         logger.debug(f"           - Added missing column: {category}")
 
 
+class _TableSlice:
+    """Picklable stand-in for a table object holding one batch's rows.
+
+    Mirrors what `_process_hospitalizations` reads from a table: ``df``,
+    ``df_converted``, and ``is_materialized`` / ``to_arrow()`` for Arrow-backed
+    tables.
+    """
+
+    def __init__(self, df=None, df_converted=None, arrow=None):
+        self.df = df
+        self.df_converted = df_converted
+        self._arrow = arrow
+
+    @property
+    def is_materialized(self) -> bool:
+        return self._arrow is None
+
+    def to_arrow(self):
+        return self._arrow
+
+
+def _batch_positions(ids: pd.Series, id_to_batch: Dict[str, int]) -> Dict[int, np.ndarray]:
+    """Row positions of each batch, from one pass over the id column."""
+    codes = pd.Series(ids.map(id_to_batch).to_numpy())
+    return {int(k): v for k, v in codes.groupby(codes).indices.items()}
+
+
+class _WideBatchSlicer:
+    """Cut each batch's rows out of the loaded tables for a worker process.
+
+    Batch membership is computed once per table; the rows themselves are only
+    copied when a batch is submitted, so at most the in-flight batches exist
+    as copies.
+    """
+
+    def __init__(self, clif_instance, tables_to_load: List[str], batches: List[List[str]]):
+        id_to_batch = {str(hosp_id): i for i, ids in enumerate(batches) for hosp_id in ids}
+        self.sources = {}
+        for table_name in tables_to_load:
+            table_obj = getattr(clif_instance, table_name, None)
+            if table_obj is None:
+                continue
+            table_config = _get_table_config(table_name)
+            converted = getattr(table_obj, 'df_converted', None)
+            if table_config and table_config.get('supports_unit_conversion', False) and converted is not None:
+                self.sources[table_name] = ('df_converted', converted,
+                                            _batch_positions(converted['hospitalization_id'].astype(str), id_to_batch))
+            elif not getattr(table_obj, 'is_materialized', True):
+                arrow = table_obj.to_arrow()
+                ids = arrow.column('hospitalization_id').to_pandas().astype(str)
+                self.sources[table_name] = ('arrow', arrow, _batch_positions(ids, id_to_batch))
+            else:
+                df = table_obj.df
+                self.sources[table_name] = ('df', df,
+                                            _batch_positions(df['hospitalization_id'].astype(str), id_to_batch))
+
+    def tables(self, batch_idx: int) -> SimpleNamespace:
+        slices = {}
+        for table_name, (kind, data, positions) in self.sources.items():
+            pos = positions.get(batch_idx, np.array([], dtype=np.int64))
+            if kind == 'arrow':
+                slices[table_name] = _TableSlice(arrow=data.take(pos))
+            else:
+                rows = data.iloc[pos]
+                slices[table_name] = _TableSlice(df=rows, df_converted=rows if kind == 'df_converted' else None)
+        return SimpleNamespace(**slices)
+
+
+def _finish_wide_batch(
+    batch_result: Optional[pd.DataFrame],
+    batch_idx: int,
+    encounter_mapping: Optional[pd.DataFrame],
+    directory: Optional[str]
+):
+    """Partition-mode post-processing and write; returns the manifest entry or the frame."""
+    if batch_result is None or len(batch_result) == 0:
+        return None
+    if directory is None:
+        return batch_result
+    # Post-processing the orchestrator otherwise applies to the combined frame
+    if encounter_mapping is not None and 'encounter_block' not in batch_result.columns:
+        batch_result = batch_result.merge(
+            encounter_mapping[['hospitalization_id', 'encounter_block']],
+            on='hospitalization_id', how='left'
+        )
+        batch_result['encounter_block'] = batch_result['encounter_block'].astype('Int32')
+    return _write_partition(directory, batch_result, batch_idx)
+
+
+def _wide_batch_worker(payload: Dict):
+    """Build one wide-dataset batch in a worker process."""
+    with pooled_connection(
+        timezone=payload['timezone'],
+        settings={'preserve_insertion_order': 'false'},
+    ) as conn:
+        batch_result = _process_hospitalizations(
+            conn, payload['tables'], payload['hosp_ids'], payload['patient_df'],
+            payload['hospitalization_df'], payload['adt_df'],
+            payload['tables_to_load'], payload['category_filters'],
+            payload['pivot_tables'], payload['wide_tables'],
+            show_progress=False, cohort_df=payload['cohort_df'],
+            time_resolution=payload['time_resolution']
+        )
+    return _finish_wide_batch(batch_result, payload['batch_idx'], payload['encounter_mapping'], payload['directory'])
+
+
 def _process_in_batches(
     conn: duckdb.DuckDBPyConnection,
     clif_instance,
@@ -1489,31 +2475,69 @@ def _process_in_batches(
     output_filename: Optional[str],
     output_format: str,
     return_dataframe: bool,
-    cohort_df: Optional[pd.DataFrame] = None
-) -> Optional[pd.DataFrame]:
-    """Process hospitalizations in batches using the new approach."""
+    cohort_df: Optional[pd.DataFrame] = None,
+    writer: Optional[_WidePartitionWriter] = None,
+    max_workers: int = 1,
+    max_retries: int = 2,
+    resource_config: Optional[DuckDBResourceConfig] = None,
+    time_resolution: str = 'minute'
+) -> Optional[Union[pd.DataFrame, str]]:
+    """Process hospitalizations in batches using the new approach.
+
+    With a ``writer`` each batch result is written out as a partition and
+    dropped instead of being kept for the final concat; the manifest path is
+    returned. With ``max_workers > 1`` batches run in worker processes, each
+    given only its own rows. Failed batches are retried ``max_retries`` times
+    before the run fails; results are combined in batch order either way.
+    """
     
     # Split into batches
     batches = [all_hosp_ids[i:i + batch_size] for i in range(0, len(all_hosp_ids), batch_size)]
-    batch_results = []
-    
-    iterator = tqdm(batches, desc="Processing batches") if show_progress else batches
-    
-    for batch_idx, batch_hosp_ids in enumerate(iterator):
-        try:
-            logger.info(f"    4.B.{batch_idx + 1}: Processing batch {batch_idx + 1}/{len(batches)}")
-            logger.debug(f"             - {len(batch_hosp_ids)} hospitalizations in batch")
-            
-            # Filter base tables for this batch
-            batch_hosp_df = hospitalization_df[hospitalization_df['hospitalization_id'].isin(batch_hosp_ids)]
-            batch_adt_df = adt_df[adt_df['hospitalization_id'].isin(batch_hosp_ids)]
-            
-            # Filter cohort_df for this batch if provided
-            batch_cohort_df = None
-            if cohort_df is not None:
-                batch_cohort_df = cohort_df[cohort_df['hospitalization_id'].isin(batch_hosp_ids)].copy()
-            
-            # Clean up tables from previous batch
+    batch_results = {}
+    encounter_mapping = getattr(clif_instance, 'encounter_mapping', None) if writer is not None else None
+    directory = writer.directory if writer is not None else None
+
+    def batch_inputs(batch_idx, batch_hosp_ids):
+        logger.info(f"    4.B.{batch_idx + 1}: Processing batch {batch_idx + 1}/{len(batches)}")
+        logger.debug(f"             - {len(batch_hosp_ids)} hospitalizations in batch")
+
+        # Filter base tables (and cohort windows / encounter blocks) for this batch
+        batch_cohort_df = None
+        if cohort_df is not None:
+            batch_cohort_df = cohort_df[cohort_df['hospitalization_id'].isin(batch_hosp_ids)].copy()
+        batch_mapping = None
+        if encounter_mapping is not None:
+            batch_mapping = encounter_mapping[encounter_mapping['hospitalization_id'].isin(batch_hosp_ids)]
+        return {
+            'batch_idx': batch_idx,
+            'hosp_ids': batch_hosp_ids,
+            'hospitalization_df': hospitalization_df[hospitalization_df['hospitalization_id'].isin(batch_hosp_ids)],
+            'adt_df': adt_df[adt_df['hospitalization_id'].isin(batch_hosp_ids)],
+            'cohort_df': batch_cohort_df,
+            'encounter_mapping': batch_mapping,
+        }
+
+    if max_workers > 1:
+        slicer = _WideBatchSlicer(clif_instance, tables_to_load, batches)
+        shared = {
+            'timezone': clif_instance.timezone, 'patient_df': patient_df,
+            'tables_to_load': tables_to_load, 'category_filters': category_filters,
+            'pivot_tables': pivot_tables, 'wide_tables': wide_tables, 'directory': directory,
+            'time_resolution': time_resolution,
+        }
+        payloads = (
+            (batch_idx, {**shared, **batch_inputs(batch_idx, ids), 'tables': slicer.tables(batch_idx)})
+            for batch_idx, ids in enumerate(batches)
+        )
+        batch_func = _wide_batch_worker
+    else:
+        payloads = ((batch_idx, (batch_idx, ids)) for batch_idx, ids in enumerate(batches))
+
+        def batch_func(item):
+            batch_idx, batch_hosp_ids = item
+            inputs = batch_inputs(batch_idx, batch_hosp_ids)
+
+            # Clean up tables from previous batch (or a failed attempt)
             tables_df = conn.execute("SHOW TABLES").df()
             for idx, row in tables_df.iterrows():
                 table_name = row['name']
@@ -1530,27 +2554,36 @@ def _process_in_batches(
             
             # Process this batch
             batch_result = _process_hospitalizations(
-                conn, clif_instance, batch_hosp_ids, patient_df, batch_hosp_df, batch_adt_df,
+                conn, clif_instance, batch_hosp_ids, patient_df, inputs['hospitalization_df'], inputs['adt_df'],
                 tables_to_load, category_filters, pivot_tables, wide_tables,
-                show_progress=False, cohort_df=batch_cohort_df
+                show_progress=False, cohort_df=inputs['cohort_df'], time_resolution=time_resolution
             )
-            
-            if batch_result is not None and len(batch_result) > 0:
-                batch_results.append(batch_result)
-                logger.info(f"             - Batch {batch_idx + 1} completed: {len(batch_result)} records")
-            
-            # Clean up after batch
-            import gc
-            gc.collect()
-            
-        except Exception as e:
-            logger.error(f"Failed to process batch {batch_idx + 1}: {str(e)}")
+            return _finish_wide_batch(batch_result, batch_idx, inputs['encounter_mapping'], directory)
+
+    progress = tqdm(total=len(batches), desc="Processing batches") if show_progress else None
+    for batch_idx, result in run_batches(batch_func, payloads, max_workers, max_retries,
+                                         resource_config, label='Batch'):
+        if progress is not None:
+            progress.update(1)
+        if result is None:
             continue
+        if writer is not None:
+            writer.add(result)
+            logger.info(f"             - Batch {batch_idx + 1} completed: {result['rows']} records")
+        else:
+            batch_results[batch_idx] = result
+            logger.info(f"             - Batch {batch_idx + 1} completed: {len(result)} records")
+        del result
+    if progress is not None:
+        progress.close()
+
+    if writer is not None:
+        return writer.close()
 
-    # Combine results
+    # Combine results in batch order, whatever order they finished in
     if batch_results:
         logger.info(f"             - Combining {len(batch_results)} batch results")
-        final_df = pd.concat(batch_results, ignore_index=True)
+        final_df = pd.concat([batch_results[i] for i in sorted(batch_results)], ignore_index=True)
         logger.info(f"             - Final dataset: {len(final_df)} records with {len(final_df.columns)} columns")
         
         if save_to_data_location:
@@ -1559,4 +2592,4 @@ def _process_in_batches(
         return final_df if return_dataframe else None
     else:
         logger.error("No data processed successfully")
-        return None
\ No newline at end of file
+        return None
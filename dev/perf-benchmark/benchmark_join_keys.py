@@ -0,0 +1,144 @@
+"""Benchmark wide-dataset join keys: string combo_id vs typed (id, timestamp).
+
+The wide dataset used to join every pivoted table on
+``hospitalization_id || '_' || strftime(ts, '%Y%m%d%H%M')``. It now joins on
+``(hospitalization_id, date_trunc('minute', ts))``. This script replays both
+join shapes on the demo vitals and labs, replicated ``-scale`` times under
+new hospitalization ids, and reports pivot + join time and DuckDB memory.
+
+Usage:
+    python benchmark_join_keys.py                 # scale 200, 3 iterations
+    python benchmark_join_keys.py -scale 1000     # bigger replica
+    python benchmark_join_keys.py -iterations 5
+"""
+import sys
+import time
+from pathlib import Path
+
+import duckdb
+
+DEMO_DIR = Path(__file__).parent.parent.parent / 'clifpy' / 'data' / 'clif_demo'
+
+KEYS = {
+    'string': {
+        'select': "hospitalization_id || '_' || strftime({ts}, '%Y%m%d%H%M') AS combo_id",
+        'group': "combo_id",
+        'using': "combo_id",
+    },
+    'typed': {
+        'select': "hospitalization_id, date_trunc('minute', {ts}) AS _event_key",
+        'group': "hospitalization_id, _event_key",
+        'using': "hospitalization_id, _event_key",
+    },
+}
+
+
+def load_replica(conn: duckdb.DuckDBPyConnection, scale: int):
+    """Create vitals_raw / labs_raw / events tables holding ``scale`` copies of the demo data."""
+    for table, ts, cat, val in [
+        ('vitals', 'recorded_dttm', 'vital_category', 'vital_value'),
+        ('labs', 'lab_result_dttm', 'lab_category', 'lab_value_numeric'),
+    ]:
+        path = DEMO_DIR / f'clif_{table}.parquet'
+        conn.execute(f"""
+            CREATE OR REPLACE TABLE {table}_raw AS
+            SELECT hospitalization_id || '_' || r.range AS hospitalization_id,
+                   {ts} AS ts, {cat} AS category, {val} AS value
+            FROM read_parquet('{path}') CROSS JOIN range({scale}) r
+            WHERE {ts} IS NOT NULL
+        """)
+    conn.execute("""
+        CREATE OR REPLACE TABLE events AS
+        SELECT DISTINCT hospitalization_id, ts AS event_time FROM vitals_raw
+        UNION SELECT DISTINCT hospitalization_id, ts FROM labs_raw
+    """)
+    return conn.execute("SELECT COUNT(*) FROM events").fetchone()[0]
+
+
+def memory_mb(conn: duckdb.DuckDBPyConnection) -> float:
+    return conn.execute("SELECT SUM(memory_usage_bytes) FROM duckdb_memory()").fetchone()[0] / 1024 / 1024
+
+
+def run_once(conn: duckdb.DuckDBPyConnection, key: str):
+    """Pivot both tables on ``key`` and join them to the event spine; return (seconds, MB, rows)."""
+    spec = KEYS[key]
+    start = time.perf_counter()
+    for table in ('vitals', 'labs'):
+        conn.execute(f"""
+            CREATE OR REPLACE TABLE {table}_pivoted AS
+            WITH pivot_data AS (
+                SELECT DISTINCT value, category, {spec['select'].format(ts='ts')}
+                FROM {table}_raw
+            )
+            PIVOT pivot_data ON category USING first(value) GROUP BY {spec['group']}
+        """)
+    conn.execute(f"""
+        CREATE OR REPLACE TABLE wide AS
+        SELECT * FROM (
+            SELECT event_time, {spec['select'].format(ts='event_time')} FROM events
+        ) ec
+        LEFT JOIN vitals_pivoted USING ({spec['using']})
+        LEFT JOIN labs_pivoted USING ({spec['using']})
+    """)
+    elapsed = time.perf_counter() - start
+    rows = conn.execute("SELECT COUNT(*) FROM wide").fetchone()[0]
+    mem = memory_mb(conn)
+    for table in ('wide', 'vitals_pivoted', 'labs_pivoted'):
+        conn.execute(f"DROP TABLE {table}")
+    return elapsed, mem, rows
+
+
+def benchmark_join_keys(scale: int = 200, num_iterations: int = 3):
+    conn = duckdb.connect()
+    n_events = load_replica(conn, scale)
+    print(f"Replicated demo vitals/labs x{scale}: {n_events:,} (hospitalization, time) events")
+
+    results = {}
+    for key in KEYS:
+        times, mems = [], []
+        for i in range(num_iterations):
+            elapsed, mem, rows = run_once(conn, key)
+            times.append(elapsed)
+            mems.append(mem)
+            print(f"  {key:>6} iteration {i+1}: {elapsed:.3f}s, {mem:.1f} MB DuckDB memory, {rows:,} rows")
+        results[key] = (sum(times) / len(times), max(mems))
+
+    print(f"\n{'='*60}")
+    print("RESULTS")
+    print(f"{'='*60}")
+    for key, (avg_time, peak_mem) in results.items():
+        print(f"{key:>6} key: {avg_time:.3f}s average, {peak_mem:.1f} MB")
+    speedup = results['string'][0] / results['typed'][0]
+    print(f"\nTyped key speedup: {speedup:.2f}x")
+    print(f"{'='*60}")
+    conn.close()
+    return results
+
+
+if __name__ == "__main__":
+    scale = 200
+    iterations = 3
+
+    i = 1
+    while i < len(sys.argv):
+        arg = sys.argv[i]
+        if arg in ('-scale', '-iterations') and i + 1 < len(sys.argv):
+            try:
+                value = int(sys.argv[i + 1])
+            except ValueError:
+                print(f"Error: {arg} requires a numeric argument, got '{sys.argv[i + 1]}'")
+                sys.exit(1)
+            if arg == '-scale':
+                scale = value
+            else:
+                iterations = value
+            i += 2
+        else:
+            print(f"Error: Unknown argument '{arg}'")
+            print("\nUsage:")
+            print("  python benchmark_join_keys.py                 # scale 200, 3 iterations")
+            print("  python benchmark_join_keys.py -scale 1000     # bigger replica")
+            print("  python benchmark_join_keys.py -iterations 5")
+            sys.exit(1)
+
+    benchmark_join_keys(scale=scale, num_iterations=iterations)
@@ -0,0 +1,147 @@
+"""Benchmark encounter stitching: fixed-point loop vs single-pass engines.
+
+`stitch_encounters` used to propagate ``encounter_block`` with a ``while True``
+loop that shifted and compared the whole frame once per link in the longest
+chain, after joining hospitalization to every ADT row. It now numbers chains in
+one pass (gaps and islands over a cumulative sum) on the hospitalization rows
+alone, with 'pandas', 'duckdb' and 'polars' engines.
+
+This script builds synthetic cohorts of 10k, 100k and 1M hospitalizations
+(about 3 per patient, some readmitted within the stitching window, one ADT row
+each) and reports seconds and microseconds per hospitalization for each engine.
+Flat microseconds per hospitalization across sizes means linear scaling. The
+old loop only runs up to ``-legacy-max`` hospitalizations.
+
+Usage:
+    python benchmark_stitching.py                      # up to 1M, 3 iterations
+    python benchmark_stitching.py -max 100000          # smaller sizes only
+    python benchmark_stitching.py -legacy-max 0        # skip the old loop
+    python benchmark_stitching.py -iterations 5
+"""
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+from clifpy.utils.stitching_encounters import STITCH_ENGINES, stitch_encounters
+
+SIZES = [10_000, 100_000, 1_000_000]
+
+
+def make_cohort(n: int, seed: int = 0):
+    """``n`` hospitalizations for ~n/3 patients, ~30% readmitted within 6 hours."""
+    rng = np.random.default_rng(seed)
+    patient_id = np.sort(rng.integers(0, max(n // 3, 1), n))
+    length = pd.to_timedelta(rng.integers(4, 240, n), unit='h')
+    gap = pd.to_timedelta(np.where(rng.random(n) < 0.3, rng.integers(0, 6, n), rng.integers(24, 24 * 90, n)), unit='h')
+    # admissions follow each other per patient: cumulative (length + gap) within patient
+    step = (length + gap).to_numpy().astype('int64')
+    start = pd.Series(step).groupby(patient_id).cumsum().to_numpy() - step
+    admission = pd.Timestamp('2020-01-01', tz='UTC') + pd.to_timedelta(start, unit='ns')
+    hosp = pd.DataFrame({
+        'patient_id': patient_id.astype(str),
+        'hospitalization_id': np.char.add('H', np.arange(n).astype(str)),
+        'admission_dttm': admission,
+        'discharge_dttm': admission + length,
+        'age_at_admission': 60,
+        'admission_type_category': 'emergency',
+        'discharge_category': 'home',
+    })
+    adt = pd.DataFrame({
+        'hospitalization_id': hosp['hospitalization_id'],
+        'in_dttm': hosp['admission_dttm'],
+        'out_dttm': hosp['discharge_dttm'],
+        'location_category': 'ward',
+        'hospital_id': 'HOSP1',
+    })
+    return hosp, adt
+
+
+def legacy_encounter_blocks(hosp: pd.DataFrame, adt: pd.DataFrame, time_interval: int = 6) -> pd.DataFrame:
+    """The pre-vectorization algorithm: ADT join, then shift until convergence."""
+    join = pd.merge(hosp, adt[['hospitalization_id', 'in_dttm', 'out_dttm']], on='hospitalization_id', how='left')
+    block = join[['patient_id', 'hospitalization_id', 'admission_dttm', 'discharge_dttm']].drop_duplicates()
+    block = block.sort_values(by=['patient_id', 'admission_dttm']).reset_index(drop=True)
+    next_admission = block.groupby('patient_id')['admission_dttm'].shift(-1)
+    linked = ((next_admission - block['discharge_dttm']).dt.total_seconds() / 3600).le(time_interval + 1e-6)
+    block['encounter_block'] = block.index + 1
+    while True:
+        shifted = block['encounter_block'].shift(-1)
+        mask = linked & (block['patient_id'] == block['patient_id'].shift(-1))
+        old_values = block['encounter_block'].copy()
+        block.loc[mask, 'encounter_block'] = shifted[mask]
+        if block['encounter_block'].equals(old_values):
+            break
+    return block[['hospitalization_id', 'encounter_block']]
+
+
+def time_call(func, num_iterations: int) -> float:
+    times = []
+    for _ in range(num_iterations):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return sum(times) / len(times)
+
+
+def benchmark_stitching(max_size: int = 1_000_000, legacy_max: int = 100_000, num_iterations: int = 3):
+    results = {}
+    for n in [s for s in SIZES if s <= max_size]:
+        hosp, adt = make_cohort(n)
+        print(f"\n{n:,} hospitalizations ({hosp['patient_id'].nunique():,} patients)")
+        for engine in STITCH_ENGINES:
+            elapsed = time_call(lambda: stitch_encounters(hosp, adt, engine=engine), num_iterations)
+            results[(engine, n)] = elapsed
+            print(f"  {engine:>7}: {elapsed:.3f}s  ({elapsed / n * 1e6:.2f} us/hospitalization)")
+        if n <= legacy_max:
+            elapsed = time_call(lambda: legacy_encounter_blocks(hosp, adt), 1)
+            results[('legacy', n)] = elapsed
+            print(f"  {'legacy':>7}: {elapsed:.3f}s  ({elapsed / n * 1e6:.2f} us/hospitalization)")
+
+    print(f"\n{'='*60}")
+    print("RESULTS (us per hospitalization; flat across sizes = linear)")
+    print(f"{'='*60}")
+    sizes = sorted({n for _, n in results})
+    print(f"{'engine':>8} " + " ".join(f"{n:>12,}" for n in sizes))
+    for engine in list(STITCH_ENGINES) + ['legacy']:
+        row = [results.get((engine, n)) for n in sizes]
+        if any(r is not None for r in row):
+            print(f"{engine:>8} " + " ".join(
+                f"{r / n * 1e6:>12.2f}" if r is not None else f"{'-':>12}" for r, n in zip(row, sizes)
+            ))
+    print(f"{'='*60}")
+    return results
+
+
+if __name__ == "__main__":
+    max_size = 1_000_000
+    legacy_max = 100_000
+    iterations = 3
+
+    i = 1
+    while i < len(sys.argv):
+        arg = sys.argv[i]
+        if arg in ('-max', '-legacy-max', '-iterations') and i + 1 < len(sys.argv):
+            try:
+                value = int(sys.argv[i + 1])
+            except ValueError:
+                print(f"Error: {arg} requires a numeric argument, got '{sys.argv[i + 1]}'")
+                sys.exit(1)
+            if arg == '-max':
+                max_size = value
+            elif arg == '-legacy-max':
+                legacy_max = value
+            else:
+                iterations = value
+            i += 2
+        else:
+            print(f"Error: Unknown argument '{arg}'")
+            print("\nUsage:")
+            print("  python benchmark_stitching.py                      # up to 1M, 3 iterations")
+            print("  python benchmark_stitching.py -max 100000          # smaller sizes only")
+            print("  python benchmark_stitching.py -legacy-max 0        # skip the old loop")
+            print("  python benchmark_stitching.py -iterations 5")
+            sys.exit(1)
+
+    benchmark_stitching(max_size=max_size, legacy_max=legacy_max, num_iterations=iterations)
@@ -60,22 +60,25 @@ def _assert_admin_dttm_unchanged(converted_df, src_series):
     assert sorted(out.dropna().tolist()) == sorted(src_series.dropna().tolist())
 
 
+@pytest.mark.parametrize("backend", ["pandas", "arrow"])
 @pytest.mark.parametrize("timezone", ["UTC", "US/Eastern", "US/Central"])
 def test_orchestrator_continuous_conversion_respects_timezone(
-    timezone, hostile_default_tz, tmp_path
+    timezone, backend, hostile_default_tz, tmp_path
 ):
     """Configured ``timezone`` must survive continuous-med dose conversion end-to-end.
 
     Reproduces the #144 flow: ``ClifOrchestrator(timezone=X)`` ->
     ``convert_dose_units_for_continuous_meds`` -> assert the saved
     ``df_converted['admin_dttm']`` is still in ``X`` (equal to the loaded ``df``), not the
-    hostile Los Angeles default-connection zone.
+    hostile Los Angeles default-connection zone. With ``backend="arrow"`` the
+    converter reads a relation over the Arrow table instead of the pandas frame.
     """
     co = ClifOrchestrator(
         data_directory=_DEMO_DIR,
         filetype="parquet",
         timezone=timezone,
         output_directory=str(tmp_path),
+        backend=backend,
     )
     co.convert_dose_units_for_continuous_meds(
         preferred_units={"fentanyl": "mcg/min"}, override=True, save_to_table=True
@@ -100,3 +103,94 @@ def test_orchestrator_intermittent_conversion_respects_timezone(
     )
     src = co.medication_admin_intermittent.df["admin_dttm"]
     _assert_admin_dttm_unchanged(co.medication_admin_intermittent.df_converted, src)
+
+
+def test_arrow_backend_defers_pandas_until_df(tmp_path):
+    """``backend="arrow"`` keeps an Arrow table until ``.df`` is read, then matches the eager load."""
+    kwargs = dict(
+        data_directory=_DEMO_DIR,
+        filetype="parquet",
+        timezone="US/Central",
+        output_directory=str(tmp_path),
+    )
+    lazy = ClifOrchestrator(backend="arrow", **kwargs)
+    lazy.load_table("vitals")
+    assert not lazy.vitals.is_materialized
+    assert str(lazy.vitals.to_arrow().schema.field("hospitalization_id").type) == "string"
+    assert lazy.vitals.to_relation().shape[0] == lazy.vitals.to_arrow().num_rows
+
+    eager = ClifOrchestrator(**kwargs)
+    eager.load_table("vitals")
+
+    df = lazy.vitals.df
+    assert lazy.vitals.is_materialized
+    assert list(df.columns) == list(eager.vitals.df.columns)
+    assert len(df) == len(eager.vitals.df)
+    assert str(df["recorded_dttm"].dt.tz) == str(eager.vitals.df["recorded_dttm"].dt.tz)
+    assert df["hospitalization_id"].dtype == eager.vitals.df["hospitalization_id"].dtype
+
+
+def test_relation_backend_survives_other_pipelines(tmp_path):
+    """A filtered ``backend="relation"`` table still reads after another pipeline's temp-table cleanup."""
+    from clifpy.utils.unit_converter import convert_dose_units_by_med_category
+    kwargs = dict(
+        data_directory=_DEMO_DIR,
+        filetype="parquet",
+        timezone="US/Central",
+        output_directory=str(tmp_path),
+    )
+    eager = ClifOrchestrator(**kwargs)
+    eager.load_table("hospitalization")
+    cohort = eager.hospitalization.df[["hospitalization_id"]].head(20)
+    eager.load_table("labs", filters={"hospitalization_id": cohort})
+
+    lazy = ClifOrchestrator(backend="relation", **kwargs)
+    lazy.load_table("labs", filters={"hospitalization_id": cohort})
+    assert not lazy.labs.is_materialized
+    # pandas input: the converter ends with _cleanup_temp_tables(), which used
+    # to drop the semi-join view behind lazy.labs
+    eager.load_table("medication_admin_continuous")
+    convert_dose_units_by_med_category(
+        eager.medication_admin_continuous.df, preferred_units={"fentanyl": "mcg/min"}, override=True
+    )
+
+    df = lazy.labs.df
+    assert len(df) == len(eager.labs.df)
+    assert set(df["hospitalization_id"]) == set(eager.labs.df["hospitalization_id"])
+
+
+def test_unknown_backend_rejected(tmp_path):
+    co = ClifOrchestrator(
+        data_directory=_DEMO_DIR,
+        filetype="parquet",
+        timezone="UTC",
+        output_directory=str(tmp_path),
+        backend="spark",
+    )
+    with pytest.raises(ValueError, match="Unknown backend"):
+        co.load_table("patient")
+
+
+@pytest.mark.parametrize("memory_budget", [None, "1B"])
+def test_initialize_concurrent_matches_sequential(memory_budget, tmp_path):
+    """Thread-pool loading yields the same tables as the sequential loop and records timings.
+
+    A 1-byte budget forces one load at a time (a single table is always admitted).
+    """
+    tables = ["patient", "hospitalization", "adt", "labs", "vitals"]
+    kwargs = dict(
+        data_directory=_DEMO_DIR,
+        filetype="parquet",
+        timezone="US/Central",
+        output_directory=str(tmp_path),
+    )
+    sequential = ClifOrchestrator(**kwargs)
+    sequential.initialize(tables=tables)
+
+    concurrent = ClifOrchestrator(**kwargs)
+    concurrent.initialize(tables=tables, max_workers=3, memory_budget=memory_budget)
+
+    assert sorted(concurrent.get_loaded_tables()) == sorted(tables)
+    assert set(concurrent.load_timings) == set(tables)
+    for table in tables:
+        assert getattr(concurrent, table).df.shape == getattr(sequential, table).df.shape
@@ -5,6 +5,35 @@ from pathlib import Path
 import duckdb
 import numpy as np
 import pandas as pd
+import pytest
+
+DEMO_DIR = Path(__file__).parent.parent.parent.parent / 'clifpy' / 'data' / 'clif_demo'
+
+
+@pytest.fixture(scope='module')
+def clif_config_path(tmp_path_factory):
+    """CLIF config pointing at the bundled demo data."""
+    cfg = tmp_path_factory.mktemp('sofa2_demo') / 'config.yaml'
+    cfg.write_text(f"data_directory: {DEMO_DIR}\nfiletype: parquet\ntimezone: UTC\n")
+    return str(cfg)
+
+
+@pytest.fixture(scope='module')
+def cohort_df():
+    """First 24 hours of each of 10 demo hospitalizations."""
+    hosp = pd.read_parquet(DEMO_DIR / 'clif_hospitalization.parquet')
+    hosp = hosp.dropna(subset=['admission_dttm']).head(10)
+    start = pd.to_datetime(hosp['admission_dttm'], utc=True)
+    return pd.DataFrame({
+        'hospitalization_id': hosp['hospitalization_id'].to_numpy(),
+        'start_dttm': start.to_numpy(),
+        'end_dttm': (start + pd.Timedelta(hours=24)).to_numpy(),
+    })
+
+
+def ordered_windows(df, id_name='hospitalization_id'):
+    """Sort SOFA-2 output by (id, window start) for order-insensitive comparison."""
+    return df.sort_values([id_name, 'start_dttm']).reset_index(drop=True)
 
 
 def load_csv_fixture(path, datetime_cols):
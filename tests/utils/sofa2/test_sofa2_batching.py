@@ -0,0 +1,53 @@
+"""
+Batched calculate_sofa2 on the demo data.
+
+Batching, with or without the preloaded CLIF store, must score every window
+exactly as a single whole-cohort run does.
+"""
+import pandas as pd
+import pytest
+
+from clifpy.utils._duckdb_config import DuckDBResourceConfig
+from clifpy.utils.sofa2 import calculate_sofa2
+from tests.utils.sofa2.conftest import ordered_windows as _ordered
+
+
+@pytest.fixture(scope='module')
+def reference(cohort_df, clif_config_path):
+    return _ordered(calculate_sofa2(cohort_df, clif_config_path, duckdb_config=DuckDBResourceConfig()))
+
+
+@pytest.mark.parametrize('preload_clif', [False, True])
+def test_batched_matches_whole_cohort(cohort_df, clif_config_path, reference, preload_clif, tmp_path):
+    result = calculate_sofa2(
+        cohort_df, clif_config_path,
+        duckdb_config=DuckDBResourceConfig(batch_size=3, temp_directory=str(tmp_path)),
+        preload_clif=preload_clif,
+    )
+    pd.testing.assert_frame_equal(_ordered(result), reference)
+
+
+def test_preloaded_store_is_removed(cohort_df, clif_config_path, tmp_path):
+    calculate_sofa2(
+        cohort_df, clif_config_path,
+        duckdb_config=DuckDBResourceConfig(batch_size=4, temp_directory=str(tmp_path)),
+        preload_clif=True,
+    )
+    assert not list(tmp_path.glob('clifpy_sofa2_*'))
+
+
+def test_preload_with_alternative_id(cohort_df, clif_config_path, reference, tmp_path):
+    """The store is remapped to id_name once, from the whole cohort's mapping."""
+    cohort = cohort_df.assign(encounter_block=range(1, len(cohort_df) + 1))
+    result = calculate_sofa2(
+        cohort, clif_config_path, id_name='encounter_block',
+        duckdb_config=DuckDBResourceConfig(batch_size=3, temp_directory=str(tmp_path)),
+        preload_clif=True,
+    )
+    blocks = cohort.set_index('encounter_block')['hospitalization_id']
+    result = result.assign(hospitalization_id=result['encounter_block'].map(blocks))
+    pd.testing.assert_frame_equal(
+        _ordered(result)[reference.columns.drop('hospitalization_id')],
+        reference[reference.columns.drop('hospitalization_id')],
+        check_dtype=False,
+    )
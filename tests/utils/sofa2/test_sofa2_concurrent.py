@@ -0,0 +1,61 @@
+"""
+calculate_sofa2 with concurrent subscores on the demo data.
+
+Evaluating the six subscores on separate cursors must give the same scores as
+the sequential run, and leave no shared tables behind. A caller's own thread
+must be able to run calculate_sofa2 too.
+"""
+import threading
+
+import duckdb
+import pandas as pd
+
+from clifpy.utils._duckdb_config import DuckDBResourceConfig
+from clifpy.utils.sofa2 import calculate_sofa2
+from tests.utils.sofa2.conftest import ordered_windows
+
+
+def _run(cohort_df, clif_config_path, **kwargs):
+    return calculate_sofa2(cohort_df, clif_config_path, duckdb_config=DuckDBResourceConfig(), **kwargs)
+
+
+def test_concurrent_matches_sequential(cohort_df, clif_config_path):
+    sequential = _run(cohort_df, clif_config_path)
+    concurrent = _run(cohort_df, clif_config_path, concurrent_subscores=True)
+    pd.testing.assert_frame_equal(ordered_windows(concurrent), ordered_windows(sequential))
+
+
+def test_concurrent_drops_shared_tables(cohort_df, clif_config_path):
+    _run(cohort_df, clif_config_path, concurrent_subscores=True)
+    leftover = duckdb.sql("""
+        SELECT table_name FROM duckdb_tables()
+        WHERE table_name LIKE '\\_sofa2\\_%' ESCAPE '\\' OR table_name LIKE '\\_clif\\_%' ESCAPE '\\'
+    """).fetchall()
+    assert leftover == []
+
+
+def test_concurrent_timer_reports_wall_clock(cohort_df, clif_config_path):
+    _, timer, cv_timer = _run(cohort_df, clif_config_path, concurrent_subscores=True, perf_profile=True)
+    steps = {r['step']: r for r in timer.results}
+    assert 'subscores' in steps
+    for name in ['brain', 'resp', 'cv', 'liver', 'kidney', 'hemo']:
+        assert steps[name]['concurrent']
+        assert steps[name]['elapsed_s'] <= steps['subscores']['elapsed_s']
+    # subscore times overlap the 'subscores' step, so they are not added to the total
+    assert abs(timer.total - sum(r['elapsed_s'] for r in timer.results if not r.get('concurrent'))) < 1e-9
+    assert '| brain' in timer.report()
+    assert cv_timer.results
+
+
+def test_concurrent_with_dev_runs_sequentially(cohort_df, clif_config_path):
+    result, intermediates = _run(cohort_df, clif_config_path, dev=True, concurrent_subscores=True)
+    assert 'brain_score' in intermediates
+    assert len(result) == len(cohort_df)
+
+
+def test_runs_from_a_user_thread(cohort_df, clif_config_path):
+    result = []
+    thread = threading.Thread(target=lambda: result.append(_run(cohort_df, clif_config_path)))
+    thread.start()
+    thread.join()
+    pd.testing.assert_frame_equal(result[0], _run(cohort_df, clif_config_path))
@@ -0,0 +1,79 @@
+"""
+Incremental daily SOFA-2 on the demo data.
+
+Extending a stored daily result to a longer horizon must give the same rows
+as scoring the longer horizon from scratch.
+"""
+import pandas as pd
+import pytest
+
+from clifpy.utils._duckdb_config import DuckDBResourceConfig
+from clifpy.utils.sofa2 import calculate_sofa2_daily, calculate_sofa2_daily_incremental
+from clifpy.utils.sofa2._core import _incremental_resume_days
+from tests.utils.sofa2.conftest import ordered_windows as _ordered
+
+
+def _horizon(cohort_df, days):
+    return cohort_df.assign(end_dttm=cohort_df['start_dttm'] + pd.Timedelta(days=days))
+
+
+@pytest.fixture(scope='module')
+def previous(cohort_df, clif_config_path):
+    return calculate_sofa2_daily(_horizon(cohort_df, 3), clif_config_path, duckdb_config=DuckDBResourceConfig())
+
+
+@pytest.fixture(scope='module')
+def reference(cohort_df, clif_config_path):
+    return _ordered(calculate_sofa2_daily(
+        _horizon(cohort_df, 6), clif_config_path, duckdb_config=DuckDBResourceConfig()
+    ))
+
+
+@pytest.mark.parametrize('recompute_days', [0, 2])
+def test_incremental_matches_full_run(cohort_df, clif_config_path, previous, reference, recompute_days):
+    result = calculate_sofa2_daily_incremental(
+        previous, _horizon(cohort_df, 6), clif_config_path,
+        duckdb_config=DuckDBResourceConfig(), recompute_days=recompute_days,
+    )
+    pd.testing.assert_frame_equal(result, reference[result.columns], check_dtype=False)
+
+
+def test_without_previous_scores_everything(cohort_df, clif_config_path, reference):
+    result = calculate_sofa2_daily_incremental(
+        None, _horizon(cohort_df, 6), clif_config_path, duckdb_config=DuckDBResourceConfig()
+    )
+    pd.testing.assert_frame_equal(result, reference[result.columns], check_dtype=False)
+
+
+def test_negative_recompute_days(cohort_df, previous):
+    with pytest.raises(ValueError, match="recompute_days"):
+        calculate_sofa2_daily_incremental(previous, cohort_df, recompute_days=-1)
+
+
+def test_resume_moves_past_rrt_carryforward():
+    """Stored days inside an RRT carry-forward are rescored; the seed is the day before."""
+    start = pd.Timestamp('2024-01-01', tz='UTC')
+    days = pd.DataFrame({
+        'hospitalization_id': 'H1',
+        'start_dttm': [start + pd.Timedelta(days=d) for d in range(6)],
+        'nth_day': range(1, 7),
+    })
+    stored = days.iloc[:4].assign(
+        has_rrt=[0, 1, 0, 0],
+        sofa2_brain=1, sofa2_resp=2, sofa2_cv=0, sofa2_liver=0,
+        sofa2_kidney=[1, 4, 4, 4], sofa2_hemo=0,
+    )
+    kept, seed = _incremental_resume_days(
+        stored, days, id_name='hospitalization_id', recompute_days=0, rrt_carryforward_days=3,
+    )
+    # days 2-4 show the override, so scoring resumes at day 2 seeded from day 1
+    assert kept['nth_day'].tolist() == [1]
+    assert seed['resume_day'].tolist() == [2]
+    assert seed['seed_sofa2_kidney'].tolist() == [1]
+    assert seed['seed_last_rrt_day'].isna().all()
+
+    _, seed = _incremental_resume_days(
+        stored, days, id_name='hospitalization_id', recompute_days=0, rrt_carryforward_days=1,
+    )
+    assert seed['resume_day'].tolist() == [5]
+    assert seed['seed_last_rrt_day'].tolist() == [2]
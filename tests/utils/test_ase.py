@@ -0,0 +1,165 @@
+"""
+Tests for the ASE Repeat Infection Timeframe (RIT) post-processing.
+"""
+import os
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from clifpy.utils.ase import apply_rit_post_processing
+
+_DEMO_DIR = Path(__file__).parent.parent.parent / 'clifpy' / 'data' / 'clif_demo'
+
+
+def _loop_keep_mask(all_sepsis, rit_days):
+    """The original per-hospitalization iterrows() scan, as the reference."""
+    def filter_group(g):
+        g = g.sort_values(["ase_onset_w_lactate_dttm", "bc_id"])
+        keep_mask = []
+        last_onset = None
+        for _, row in g.iterrows():
+            onset = row["ase_onset_w_lactate_dttm"]
+            is_hospital = row["type"] == "hospital"
+            if pd.isna(onset) or not is_hospital:
+                keep_mask.append(True)
+                if not pd.isna(onset):
+                    last_onset = onset
+            else:
+                if last_onset is None or (onset - last_onset).days > rit_days:
+                    keep_mask.append(True)
+                    last_onset = onset
+                else:
+                    keep_mask.append(False)
+        return pd.Series(keep_mask, index=g.index)
+
+    return all_sepsis.groupby("hospitalization_id", group_keys=False).apply(filter_group)
+
+
+def _episodes(n_hosp, seed):
+    """Random sepsis / non-sepsis rows, several per hospitalization, some without onset."""
+    rng = np.random.default_rng(seed)
+    n = n_hosp * 6
+    onset = pd.Timestamp("2024-01-01", tz="UTC") + pd.to_timedelta(rng.integers(0, 60 * 24 * 3600, n), unit="s")
+    onset = pd.Series(onset).where(rng.random(n) > 0.05)
+    return pd.DataFrame({
+        "hospitalization_id": rng.integers(0, n_hosp, n).astype(str),
+        "bc_id": rng.integers(0, 4, n),
+        "ase_onset_w_lactate_dttm": onset,
+        "type": rng.choice(["hospital", "community"], n, p=[0.8, 0.2]),
+        "sepsis": rng.choice([1, 0], n, p=[0.7, 0.3]),
+    })
+
+
+class TestRitPostProcessing:
+
+    @pytest.mark.parametrize("rit_days", [0, 7, 14])
+    @pytest.mark.parametrize("seed", [0, 1, 2])
+    def test_matches_loop(self, rit_days, seed):
+        df = _episodes(200, seed)
+        sepsis = df[df["sepsis"] == 1].sort_values(["hospitalization_id", "ase_onset_w_lactate_dttm", "bc_id"])
+        expected = sepsis[_loop_keep_mask(sepsis, rit_days)]
+
+        result = apply_rit_post_processing(df, rit_days=rit_days)
+        kept = result[result["sepsis"] == 1]
+        assert len(kept) == len(expected)
+        pd.testing.assert_frame_equal(
+            kept[list(expected.columns)].reset_index(drop=True),
+            expected.reset_index(drop=True),
+            check_dtype=False,
+        )
+
+    def test_gap_is_measured_from_last_kept_onset(self):
+        df = pd.DataFrame({
+            "hospitalization_id": ["H1"] * 4,
+            "bc_id": [1, 2, 3, 4],
+            "ase_onset_w_lactate_dttm": pd.to_datetime(
+                ["2024-01-01", "2024-01-10", "2024-01-20", "2024-01-30"]).tz_localize("UTC"),
+            "type": ["hospital"] * 4,
+            "sepsis": [1] * 4,
+        })
+        result = apply_rit_post_processing(df, rit_days=14)
+        # Jan 20 is 10 days after Jan 10 but 19 after Jan 1, the last kept
+        # onset, so it is kept; Jan 30 is then 10 days after Jan 20
+        assert result["bc_id"].tolist() == [1, 3]
+        assert result["episode_id"].tolist() == [1, 2]
+
+    def test_community_onset_resets_the_timeframe(self):
+        df = pd.DataFrame({
+            "hospitalization_id": ["H1"] * 3,
+            "bc_id": [1, 2, 3],
+            "ase_onset_w_lactate_dttm": pd.to_datetime(
+                ["2024-01-01", "2024-01-20", "2024-01-25"]).tz_localize("UTC"),
+            "type": ["hospital", "community", "hospital"],
+            "sepsis": [1] * 3,
+        })
+        result = apply_rit_post_processing(df, rit_days=14)
+        assert result["bc_id"].tolist() == [1, 2]
+
+
+class TestBatchedComputeAse:
+    """Batching splits the cohort and concatenates per-batch results in order."""
+
+    def test_batches_cover_cohort_in_order(self, monkeypatch):
+        from clifpy import DuckDBResourceConfig
+        from clifpy.utils import ase
+
+        seen = []
+
+        def fake_batch(con, hospitalization_ids, config, *args, **kwargs):
+            seen.append(list(hospitalization_ids))
+            return pd.DataFrame({"hospitalization_id": hospitalization_ids, "sepsis": 0})
+
+        monkeypatch.setattr(ase, "_compute_ase_on_connection", fake_batch)
+        ids = [f"H{i:03d}" for i in range(10)]
+        result = ase.compute_ase(
+            hospitalization_ids=ids, data_directory="unused", verbose=False,
+            duckdb_config=DuckDBResourceConfig(batch_size=4),
+        )
+        assert seen == [ids[0:4], ids[4:8], ids[8:10]]
+        assert result["hospitalization_id"].tolist() == ids
+
+    def test_small_cohort_runs_unbatched(self, monkeypatch):
+        from clifpy import DuckDBResourceConfig
+        from clifpy.utils import ase
+
+        seen = []
+        monkeypatch.setattr(ase, "_compute_ase_on_connection",
+                            lambda con, ids, *args: seen.append(list(ids)) or pd.DataFrame({"hospitalization_id": ids, "sepsis": 0}))
+        ase.compute_ase(hospitalization_ids=["H1", "H2"], data_directory="unused", verbose=False,
+                        duckdb_config=DuckDBResourceConfig(batch_size=4))
+        assert seen == [["H1", "H2"]]
+
+    def test_parallel_matches_sequential(self, tmp_path):
+        """Worker processes give the same rows, in the same order, as one process."""
+        from clifpy import DuckDBResourceConfig
+        from clifpy.utils.ase import compute_ase
+
+        # The demo data has no microbiology; give a dozen hospitalizations a blood culture
+        for path in _DEMO_DIR.glob("clif_*.parquet"):
+            os.symlink(path, tmp_path / path.name)
+        hosp = pd.read_parquet(_DEMO_DIR / "clif_hospitalization.parquet").head(12)
+        collected = hosp["admission_dttm"] + pd.Timedelta(days=1)
+        pd.DataFrame({
+            "patient_id": hosp["patient_id"],
+            "hospitalization_id": hosp["hospitalization_id"],
+            "organism_id": range(len(hosp)),
+            "order_dttm": collected,
+            "collect_dttm": collected,
+            "result_dttm": collected + pd.Timedelta(days=2),
+            "fluid_name": "blood",
+            "fluid_category": "blood_buffy",
+            "method_name": "culture",
+            "method_category": "culture",
+            "organism_category": "no_growth",
+            "organism_group": "no_growth",
+        }).to_parquet(tmp_path / "clif_microbiology_culture.parquet", index=False)
+
+        ids = hosp["hospitalization_id"].astype(str).tolist()
+        config = DuckDBResourceConfig(batch_size=4)
+        sequential = compute_ase(ids, data_directory=str(tmp_path), verbose=False, duckdb_config=config)
+        parallel = compute_ase(ids, data_directory=str(tmp_path), verbose=False, duckdb_config=config,
+                               max_workers=2)
+        assert len(sequential) == len(ids)
+        pd.testing.assert_frame_equal(parallel, sequential)
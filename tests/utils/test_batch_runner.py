@@ -0,0 +1,86 @@
+"""Tests for the batch runner (clifpy.utils._batch_runner) and per-worker limits."""
+import os
+
+import pytest
+
+from clifpy.utils._batch_runner import run_batches
+from clifpy.utils._duckdb_config import DuckDBResourceConfig
+
+
+def _square(x):
+    return x * x
+
+
+def _fail_first_attempt(payload):
+    """Fails the first time a payload is seen (tracked with a marker file)."""
+    value, marker_dir = payload
+    marker = os.path.join(marker_dir, f'seen_{value}')
+    if not os.path.exists(marker):
+        open(marker, 'w').close()
+        raise ValueError(f'transient failure for {value}')
+    return value
+
+
+def _always_fail(payload):
+    raise ValueError('boom')
+
+
+def _duckdb_settings(_):
+    from clifpy.utils._duckdb_helpers import pooled_connection
+    with pooled_connection() as con:
+        return con.execute(
+            "SELECT current_setting('memory_limit'), current_setting('threads')"
+        ).fetchone()
+
+
+class TestRunBatches:
+    def test_sequential_in_order(self):
+        assert list(run_batches(_square, enumerate(range(5)))) == [(i, i * i) for i in range(5)]
+
+    def test_sequential_retries_then_succeeds(self, tmp_path):
+        payloads = [(i, (i, str(tmp_path))) for i in range(3)]
+        assert list(run_batches(_fail_first_attempt, payloads, max_retries=1)) == [(0, 0), (1, 1), (2, 2)]
+
+    def test_exhausted_retries_raise(self):
+        with pytest.raises(RuntimeError, match='Batch 1 failed after 3 attempts'):
+            list(run_batches(_always_fail, [(0, None)], max_retries=2))
+
+    def test_no_retries_raise_immediately(self, tmp_path):
+        with pytest.raises(RuntimeError):
+            list(run_batches(_fail_first_attempt, [(0, (0, str(tmp_path)))], max_retries=0))
+
+    def test_process_pool_results_and_retries(self, tmp_path):
+        payloads = [(i, (i, str(tmp_path))) for i in range(6)]
+        results = dict(run_batches(_fail_first_attempt, payloads, max_workers=2, max_retries=1))
+        assert results == {i: i for i in range(6)}
+
+    def test_process_pool_exhausted_retries_raise(self):
+        with pytest.raises(RuntimeError, match='failed after 2 attempts'):
+            list(run_batches(_always_fail, [(0, None), (1, None)], max_workers=2, max_retries=1))
+
+    def test_workers_get_their_share_of_limits(self):
+        config = DuckDBResourceConfig(memory_limit='2GB', threads=4)
+        results = dict(run_batches(_duckdb_settings, [(0, None)], max_workers=2, config=config))
+        memory_limit, threads = results[0]
+        assert int(threads) == 2
+        # 1024MB, reported by DuckDB in binary units
+        assert memory_limit.endswith('MiB')
+
+
+class TestPerWorker:
+    def test_splits_memory_threads_and_spill(self):
+        config = DuckDBResourceConfig(
+            memory_limit='16GB', threads=8, max_temp_directory_size='8GB', temp_directory='/tmp/x'
+        ).per_worker(4)
+        assert config.memory_limit == '4096MB'
+        assert config.threads == 2
+        assert config.max_temp_directory_size == '2048MB'
+        assert config.temp_directory == '/tmp/x'
+
+    def test_floor_of_one_thread(self):
+        assert DuckDBResourceConfig(memory_limit='1GB', threads=2).per_worker(8).threads == 1
+
+    def test_unset_limits_come_from_the_system(self):
+        config = DuckDBResourceConfig().per_worker(2)
+        assert config.memory_limit.endswith('MB')
+        assert config.threads >= 1
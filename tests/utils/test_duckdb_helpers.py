@@ -0,0 +1,106 @@
+"""Tests for the shared DuckDB connection manager in clifpy.utils._duckdb_helpers."""
+import threading
+
+import duckdb
+import pytest
+
+from clifpy.utils import _duckdb_helpers as helpers
+from clifpy.utils._duckdb_config import DuckDBResourceConfig
+
+
+@pytest.fixture(autouse=True)
+def reset_package_config():
+    """Leave no package-wide limits or pooled connections behind."""
+    yield
+    helpers.configure_duckdb(None)
+
+
+def _setting(con, name):
+    return con.execute(f"SELECT current_setting('{name}')").fetchone()[0]
+
+
+class TestConnectionPool:
+    def test_released_connection_is_reused_and_wiped(self):
+        """A released connection goes back to the pool with no user views/tables."""
+        con = helpers._acquire_connection(timezone='UTC')
+        con.execute("CREATE TABLE scratch AS SELECT 1 AS x")
+        con.execute("CREATE VIEW scratch_v AS SELECT * FROM scratch")
+        helpers._release_connection(con)
+
+        again = helpers._acquire_connection(timezone='UTC')
+        try:
+            assert again is con
+            names = {r[0] for r in again.execute(
+                "SELECT table_name FROM information_schema.tables"
+            ).fetchall()}
+            assert 'scratch' not in names
+            assert 'scratch_v' not in names
+        finally:
+            helpers._release_connection(again)
+
+    def test_double_release_pools_once(self):
+        con = helpers._acquire_connection(timezone='UTC')
+        helpers._release_connection(con)
+        helpers._release_connection(con)
+
+        first = helpers._acquire_connection(timezone='UTC')
+        second = helpers._acquire_connection(timezone='UTC')
+        try:
+            assert first is not second
+        finally:
+            helpers._release_connection(first)
+            helpers._release_connection(second)
+
+    def test_timezone_is_set_on_acquire(self):
+        with helpers.pooled_connection(timezone='America/Chicago') as con:
+            assert _setting(con, 'TimeZone') == 'America/Chicago'
+        with helpers.pooled_connection(timezone='UTC') as con:
+            assert _setting(con, 'TimeZone') == 'UTC'
+
+    def test_per_call_settings_do_not_leak(self):
+        """Per-call overrides are reset before the connection is pooled."""
+        with helpers.pooled_connection(settings={'preserve_insertion_order': 'false'}) as con:
+            assert _setting(con, 'preserve_insertion_order') is False
+        with helpers.pooled_connection() as con:
+            assert _setting(con, 'preserve_insertion_order') is True
+
+
+class TestConfigureDuckdb:
+    def test_package_config_applies_to_new_connections(self):
+        helpers.configure_duckdb(DuckDBResourceConfig(threads=2))
+        assert helpers.get_duckdb_config().threads == 2
+        with helpers.pooled_connection() as con:
+            assert int(_setting(con, 'threads')) == 2
+
+    def test_reconfigure_retires_idle_connections(self):
+        with helpers.pooled_connection() as con:
+            old = con
+        helpers.configure_duckdb(DuckDBResourceConfig(threads=1))
+        with helpers.pooled_connection() as con:
+            assert con is not old
+            assert int(_setting(con, 'threads')) == 1
+
+
+class TestDefaultCursor:
+    def _from_thread(self, func):
+        result = []
+        thread = threading.Thread(target=lambda: result.append(func()))
+        thread.start()
+        thread.join()
+        return result[0]
+
+    def test_threads_share_the_default_connection(self):
+        """Outside a scope, user threads get the same connection as the main thread."""
+        main = helpers._default_connection()
+        assert self._from_thread(helpers._default_connection) is main
+
+    def test_scope_routes_to_its_cursor_and_closes_it(self):
+        def scoped():
+            with helpers._default_cursor() as cursor:
+                assert helpers._default_connection() is cursor
+            assert helpers._default_connection() is not cursor
+            return cursor
+
+        cursor = self._from_thread(scoped)
+        with pytest.raises(duckdb.ConnectionException):
+            cursor.execute("SELECT 1")
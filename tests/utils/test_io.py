@@ -45,54 +45,56 @@ class TestCastIdColsToString:
 
 
 class TestLoadParquetWithTz:
-    @patch('clifpy.utils.io.duckdb')
-    def test_load_parquet_basic(self, mock_duckdb):
+    @patch('clifpy.utils.io._default_connection')
+    def test_load_parquet_basic(self, mock_default_connection):
         """Test basic loading of parquet file."""
+        mock_con = mock_default_connection.return_value
         # Setup mock
         mock_df = pd.DataFrame({"col1": [1, 2], "col2": ["a", "b"]})
         mock_rel = MagicMock()
         mock_rel.df.return_value = mock_df
-        mock_duckdb.sql.return_value = mock_rel
+        mock_con.sql.return_value = mock_rel
 
         # Call function
         result = load_parquet_with_tz("test.parquet")
 
-        # Verify settings were applied
-        mock_duckdb.execute.assert_any_call("SET timezone = 'UTC';")
-        mock_duckdb.execute.assert_any_call("SET pandas_analyze_sample=0;")
+        # Verify the shared default connection was requested at UTC
+        mock_default_connection.assert_called_once_with(timezone='UTC')
 
         # Verify SQL query
-        mock_duckdb.sql.assert_called_once_with("SELECT * FROM parquet_scan('test.parquet')")
+        mock_con.sql.assert_called_once_with("SELECT * FROM parquet_scan('test.parquet')")
 
         # Verify result
         pd.testing.assert_frame_equal(result, mock_df)
 
-    @patch('clifpy.utils.io.duckdb')
-    def test_load_parquet_with_columns(self, mock_duckdb):
+    @patch('clifpy.utils.io._default_connection')
+    def test_load_parquet_with_columns(self, mock_default_connection):
         """Test loading specific columns from parquet file."""
+        mock_con = mock_default_connection.return_value
         # Setup mock
         mock_df = pd.DataFrame({"col1": [1, 2]})
         mock_rel = MagicMock()
         mock_rel.df.return_value = mock_df
-        mock_duckdb.sql.return_value = mock_rel
+        mock_con.sql.return_value = mock_rel
 
         # Call function
         result = load_parquet_with_tz("test.parquet", columns=["col1"])
 
         # Verify SQL query
-        mock_duckdb.sql.assert_called_once_with("SELECT col1 FROM parquet_scan('test.parquet')")
+        mock_con.sql.assert_called_once_with("SELECT col1 FROM parquet_scan('test.parquet')")
 
         # Verify result
         pd.testing.assert_frame_equal(result, mock_df)
 
-    @patch('clifpy.utils.io.duckdb')
-    def test_load_parquet_with_filters(self, mock_duckdb):
+    @patch('clifpy.utils.io._default_connection')
+    def test_load_parquet_with_filters(self, mock_default_connection):
         """Test loading parquet file with filters."""
+        mock_con = mock_default_connection.return_value
         # Setup mock
         mock_df = pd.DataFrame({"col1": [1], "col2": ["a"]})
         mock_rel = MagicMock()
         mock_rel.df.return_value = mock_df
-        mock_duckdb.sql.return_value = mock_rel
+        mock_con.sql.return_value = mock_rel
 
         # Call function
         result = load_parquet_with_tz(
@@ -101,27 +103,28 @@ class TestLoadParquetWithTz:
         )
 
         # Verify SQL query
-        mock_duckdb.sql.assert_called_once_with(
+        mock_con.sql.assert_called_once_with(
             "SELECT * FROM parquet_scan('test.parquet') WHERE col1 = '1' AND col2 IN ('a', 'b')"
         )
 
         # Verify result
         pd.testing.assert_frame_equal(result, mock_df)
 
-    @patch('clifpy.utils.io.duckdb')
-    def test_load_parquet_with_sample_size(self, mock_duckdb):
+    @patch('clifpy.utils.io._default_connection')
+    def test_load_parquet_with_sample_size(self, mock_default_connection):
         """Test loading parquet file with sample size limit."""
+        mock_con = mock_default_connection.return_value
         # Setup mock
         mock_df = pd.DataFrame({"col1": [1], "col2": ["a"]})
         mock_rel = MagicMock()
         mock_rel.df.return_value = mock_df
-        mock_duckdb.sql.return_value = mock_rel
+        mock_con.sql.return_value = mock_rel
 
         # Call function
         result = load_parquet_with_tz("test.parquet", sample_size=100)
 
         # Verify SQL query
-        mock_duckdb.sql.assert_called_once_with(
+        mock_con.sql.assert_called_once_with(
             "SELECT * FROM parquet_scan('test.parquet') LIMIT 100"
         )
 
@@ -131,22 +134,23 @@ class TestLoadParquetWithTz:
 
 class TestLoadData:
     @patch('os.path.exists')
-    @patch('clifpy.utils.io.duckdb')
-    def test_load_data_csv(self, mock_duckdb, mock_exists):
+    @patch('clifpy.utils.io._default_connection')
+    def test_load_data_csv(self, mock_default_connection, mock_exists):
         """Test loading CSV data."""
+        mock_con = mock_default_connection.return_value
         # Setup mocks
         mock_exists.return_value = True
         mock_df = pd.DataFrame({"col1": [1, 2], "col2": ["a", "b"]})
         mock_rel = MagicMock()
         mock_rel.df.return_value = mock_df
-        mock_duckdb.sql.return_value = mock_rel
+        mock_con.sql.return_value = mock_rel
 
         # Call function
         result = load_data("test_table", "/path/to/dir", "csv")
 
         # Verify calls
         mock_exists.assert_called_with("/path/to/dir/clif_test_table.csv")
-        mock_duckdb.sql.assert_called_once_with("SELECT * FROM read_csv_auto('/path/to/dir/clif_test_table.csv')")
+        mock_con.sql.assert_called_once_with("SELECT * FROM read_csv_auto('/path/to/dir/clif_test_table.csv')")
 
         # Verify result
         pd.testing.assert_frame_equal(result, mock_df)
@@ -190,15 +194,16 @@ class TestLoadData:
             load_data("test_table", "/path/to/dir", "csv")
 
     @patch('os.path.exists')
-    @patch('clifpy.utils.io.duckdb')
-    def test_load_data_with_filters_and_columns(self, mock_duckdb, mock_exists):
+    @patch('clifpy.utils.io._default_connection')
+    def test_load_data_with_filters_and_columns(self, mock_default_connection, mock_exists):
         """Test loading CSV data with filters and columns."""
+        mock_con = mock_default_connection.return_value
         # Setup mocks
         mock_exists.return_value = True
         mock_df = pd.DataFrame({"col1": [1]})
         mock_rel = MagicMock()
         mock_rel.df.return_value = mock_df
-        mock_duckdb.sql.return_value = mock_rel
+        mock_con.sql.return_value = mock_rel
 
         # Call function
         result = load_data(
@@ -215,7 +220,7 @@ class TestLoadData:
             "SELECT col1 FROM read_csv_auto('/path/to/dir/clif_test_table.csv') "
             "WHERE status IN ('active', 'pending') AND type = 'urgent' LIMIT 10"
         )
-        mock_duckdb.sql.assert_called_once_with(expected_query)
+        mock_con.sql.assert_called_once_with(expected_query)
 
         # Verify result
         pd.testing.assert_frame_equal(result, mock_df)
@@ -309,3 +314,383 @@ class TestConvertDatetimeColumnsToSiteTz:
         # Check that both columns now have US/Central timezone
         assert result['utc_dttm'].dt.tz.zone == 'US/Central'
         assert result['est_dttm'].dt.tz.zone == 'US/Central'
+
+
+class TestPartitionedSources:
+    """Directories of parquet shards and hive-partitioned layouts."""
+
+    @pytest.fixture
+    def hive_vitals_dir(self, tmp_path):
+        """Write clif_vitals/ as a hive-partitioned dataset (partitioned by year)."""
+        import duckdb as _duckdb
+        df = pd.DataFrame({
+            "hospitalization_id": ["H1", "H1", "H2", "H3"],
+            "vital_category": ["map", "spo2", "map", "map"],
+            "vital_value": [65.0, 97.0, 70.0, 80.0],
+            "recorded_dttm": pd.to_datetime([
+                "2022-05-01 10:00", "2022-05-01 11:00",
+                "2023-06-01 12:00", "2023-07-01 08:00",
+            ]).tz_localize("UTC"),
+        })
+        df["year"] = df["recorded_dttm"].dt.year
+        dataset_dir = tmp_path / "clif_vitals"
+        con = _duckdb.connect()
+        con.register("df", df)
+        con.execute(
+            f"COPY df TO '{dataset_dir}' (FORMAT PARQUET, PARTITION_BY (year))"
+        )
+        con.close()
+        return tmp_path
+
+    def test_load_data_hive_directory(self, hive_vitals_dir):
+        result = load_data("vitals", str(hive_vitals_dir), "parquet", site_tz="UTC")
+        assert len(result) == 4
+        assert "year" in result.columns
+        assert result["hospitalization_id"].dtype == "string"
+
+    def test_load_data_filters_prune_partitions(self, hive_vitals_dir):
+        result = load_data(
+            "vitals", str(hive_vitals_dir), "parquet",
+            filters={"year": 2023, "hospitalization_id": ["H2", "H3"]},
+        )
+        assert sorted(result["hospitalization_id"].tolist()) == ["H2", "H3"]
+
+    def test_load_data_lazy_directory(self, hive_vitals_dir):
+        rel = load_data("vitals", str(hive_vitals_dir), "parquet", lazy=True,
+                        filters={"vital_category": "map"})
+        try:
+            assert len(rel.fetchdf()) == 3
+        finally:
+            rel.close()
+
+    def test_load_data_polars_directory(self, hive_vitals_dir):
+        from clifpy.utils.io_polars import load_data_polars
+        result = load_data_polars(
+            "vitals", hive_vitals_dir, "parquet",
+            filters={"hospitalization_id": ["H1"]}, lazy=False,
+        )
+        assert result.height == 2
+
+    def test_missing_table_raises(self, tmp_path):
+        with pytest.raises(FileNotFoundError):
+            load_data("labs", str(tmp_path), "parquet")
+
+
+class TestStructuredFilters:
+    """Range, comparison, null, NOT IN, semi-join and window filters."""
+
+    @pytest.fixture
+    def labs_dir(self, tmp_path):
+        df = pd.DataFrame({
+            "hospitalization_id": [1, 1, 2, 3, 4],
+            "lab_category": ["sodium", "creatinine", "sodium", "sodium", "creatinine"],
+            "lab_value_numeric": [140.0, 1.2, None, 150.0, 3.5],
+            "lab_result_dttm": pd.to_datetime([
+                "2023-01-01 08:00", "2023-01-02 08:00", "2023-01-03 08:00",
+                "2023-02-01 08:00", "2023-03-01 08:00",
+            ]).tz_localize("UTC"),
+        })
+        df.to_parquet(tmp_path / "clif_labs.parquet", index=False)
+        return tmp_path
+
+    def test_legacy_spec_sql_unchanged(self):
+        from clifpy.utils._filters import _compile_filters_sql
+        clauses = _compile_filters_sql({"a": "x", "b": ["p", "q'r"]})
+        assert clauses == ["a = 'x'", "b IN ('p', 'q''r')"]
+
+    def test_operator_spec_sql(self):
+        from clifpy.utils._filters import _compile_filters_sql
+        clauses = _compile_filters_sql({
+            "v": {">": 5, "<=": 10.5},
+            "d": {"between": ("2023-01-01", pd.Timestamp("2023-02-01"))},
+            "c": {"not_in": ["x"], "is_null": False},
+        })
+        assert clauses == [
+            "v > 5", "v <= 10.5",
+            "d BETWEEN '2023-01-01' AND '2023-02-01 00:00:00'",
+            "c NOT IN ('x')", "c IS NOT NULL",
+        ]
+
+    def test_unknown_operator_raises(self):
+        from clifpy.utils._filters import _compile_filters_sql
+        with pytest.raises(ValueError, match="Unsupported filter operator"):
+            _compile_filters_sql({"v": {"~": 1}})
+
+    def test_comparison_and_range(self, labs_dir):
+        result = load_data(
+            "labs", str(labs_dir), "parquet",
+            filters={
+                "lab_value_numeric": {">": 2},
+                "lab_result_dttm": {"between": ("2023-01-01", "2023-02-15")},
+            },
+        )
+        assert result["lab_value_numeric"].tolist() == [140.0, 150.0]
+
+    def test_not_in_and_is_null(self, labs_dir):
+        result = load_data(
+            "labs", str(labs_dir), "parquet",
+            filters={"lab_category": {"not_in": ["creatinine"]},
+                     "lab_value_numeric": {"is_null": True}},
+        )
+        assert result["hospitalization_id"].tolist() == ["2"]
+
+    def test_semi_join_string_cohort_against_int_ids(self, labs_dir):
+        cohort = pd.DataFrame({"hospitalization_id": ["1", "3"], "other": [0, 0]})
+        result = load_data(
+            "labs", str(labs_dir), "parquet",
+            filters={"hospitalization_id": cohort},
+        )
+        assert sorted(result["hospitalization_id"].unique()) == ["1", "3"]
+
+    def test_semi_join_lazy_and_csv(self, labs_dir):
+        pd.read_parquet(labs_dir / "clif_labs.parquet").to_csv(
+            labs_dir / "clif_labs.csv", index=False
+        )
+        cohort = pd.Series(["2", "4"])
+        df = load_data("labs", str(labs_dir), "csv",
+                       filters={"hospitalization_id": cohort})
+        assert sorted(df["hospitalization_id"].astype(str)) == ["2", "4"]
+
+        rel = load_data("labs", str(labs_dir), "parquet", lazy=True,
+                        columns=["lab_category"],
+                        filters={"hospitalization_id": {"not_in": cohort}})
+        try:
+            assert len(rel.fetchdf()) == 3
+        finally:
+            rel.close()
+
+    def test_within_windows(self, labs_dir):
+        windows = pd.DataFrame({
+            "hospitalization_id": ["1", "3"],
+            "start_dttm": pd.to_datetime(["2023-01-01", "2023-01-01"]).tz_localize("UTC"),
+            "end_dttm": pd.to_datetime(["2023-01-01 12:00", "2023-03-01 00:00"]).tz_localize("UTC"),
+        })
+        result = load_data(
+            "labs", str(labs_dir), "parquet",
+            filters={"lab_result_dttm": {"within": windows}},
+        )
+        assert sorted(result["hospitalization_id"].tolist()) == ["1", "3"]
+        assert len(result) == 2
+
+    def test_duckdb_relation_filters(self, labs_dir):
+        import duckdb
+        con = duckdb.connect()
+        try:
+            ids = con.sql("SELECT * FROM (VALUES ('1'), ('3')) t(hospitalization_id)")
+            windows = con.sql("""
+                SELECT * FROM (VALUES
+                    ('1', TIMESTAMPTZ '2023-01-01 00:00:00+00', TIMESTAMPTZ '2023-01-01 12:00:00+00'),
+                    ('3', TIMESTAMPTZ '2023-01-01 00:00:00+00', TIMESTAMPTZ '2023-03-01 00:00:00+00')
+                ) t(hospitalization_id, start_dttm, end_dttm)
+            """)
+            semi = load_data("labs", str(labs_dir), "parquet",
+                             filters={"hospitalization_id": ids})
+            within = load_data("labs", str(labs_dir), "parquet",
+                               filters={"lab_result_dttm": {"within": windows}})
+        finally:
+            con.close()
+        assert sorted(semi["hospitalization_id"].unique()) == ["1", "3"]
+        assert sorted(within["hospitalization_id"].tolist()) == ["1", "3"]
+
+    @pytest.mark.parametrize("filters", [
+        {"hospitalization_id": pd.DataFrame({"hospitalization_id": ["1", "3"]})},
+        {"hospitalization_id": {"not_in": pd.Series(["2", "4"])}, "lab_category": "sodium"},
+        {"hospitalization_id": [str(i) for i in range(1000)]},
+        {"lab_result_dttm": {"within": pd.DataFrame({
+            "hospitalization_id": ["1", "3"],
+            "start_dttm": pd.to_datetime(["2023-01-01", "2023-01-01"]).tz_localize("UTC"),
+            "end_dttm": pd.to_datetime(["2023-01-01 12:00", "2023-03-01 00:00"]).tz_localize("UTC"),
+        })}},
+    ])
+    def test_return_rel_outlives_temp_table_cleanup(self, labs_dir, filters):
+        from clifpy.utils.unit_converter import convert_dose_units_by_med_category
+        rel = load_data("labs", str(labs_dir), "parquet", return_rel=True, filters=filters)
+        # any pipeline that ends with _cleanup_temp_tables() runs in between
+        med_df = pd.DataFrame({
+            "hospitalization_id": ["1"],
+            "admin_dttm": pd.to_datetime(["2023-01-01"]).tz_localize("UTC"),
+            "med_category": ["propofol"], "med_dose": [10.0], "med_dose_unit": ["mg/hr"],
+        })
+        convert_dose_units_by_med_category(med_df, preferred_units={"propofol": "mg/hr"})
+        expected = load_data("labs", str(labs_dir), "parquet", filters=filters)
+        result = rel.df().sort_values("lab_result_dttm", ignore_index=True)
+        assert result["hospitalization_id"].astype(str).tolist() == expected["hospitalization_id"].tolist()
+
+    def test_return_rel_not_in_null_semantics(self, tmp_path):
+        pd.DataFrame({"hospitalization_id": ["1", None, "3"]}).to_parquet(
+            tmp_path / "clif_labs.parquet", index=False
+        )
+        for keys in (pd.DataFrame({"hospitalization_id": pd.Series([], dtype=object)}),
+                     pd.DataFrame({"hospitalization_id": ["3"]})):
+            filters = {"hospitalization_id": {"not_in": keys}}
+            rel = load_data("labs", str(tmp_path), "parquet", return_rel=True, filters=filters)
+            expected = load_data("labs", str(tmp_path), "parquet", filters=filters)
+            assert len(rel.df()) == len(expected)
+
+    def test_polars_spec(self, labs_dir):
+        from clifpy.utils.io_polars import load_data_polars
+        windows = pd.DataFrame({
+            "hospitalization_id": ["1", "3"],
+            "start_dttm": pd.to_datetime(["2023-01-01", "2023-01-01"]).tz_localize("UTC"),
+            "end_dttm": pd.to_datetime(["2023-01-01 12:00", "2023-03-01 00:00"]).tz_localize("UTC"),
+        })
+        result = load_data_polars(
+            "labs", labs_dir, "parquet", lazy=False,
+            filters={
+                "hospitalization_id": pd.Series(["1", "2", "3"]),
+                "lab_value_numeric": {">=": 100},
+                "lab_result_dttm": {"within": windows},
+            },
+        )
+        assert sorted(result["hospitalization_id"].to_list()) == ["1", "3"]
+
+        ranged = load_data_polars(
+            "labs", labs_dir, "parquet", lazy=False,
+            filters={"lab_result_dttm": {"between": ("2023-01-02", "2023-02-01 08:00")}},
+        )
+        assert ranged.height == 3
+
+
+class TestCohortLoading:
+    """Cohort ID sets registered once and semi-joined by every load."""
+
+    @pytest.fixture
+    def labs_dir(self, tmp_path):
+        df = pd.DataFrame({
+            "hospitalization_id": [1, 1, 2, 3, 4],
+            "lab_category": ["sodium", "creatinine", "sodium", "sodium", "creatinine"],
+            "lab_value_numeric": [140.0, 1.2, 135.0, 150.0, 3.5],
+        })
+        df.to_parquet(tmp_path / "clif_labs.parquet", index=False)
+        return tmp_path
+
+    def test_cohort_view_registered_once(self, labs_dir):
+        import duckdb
+        from clifpy.utils.io import Cohort
+        cohort = Cohort(["1", "3", "3"])
+        assert len(cohort) == 2
+        try:
+            first = load_data("labs", str(labs_dir), "parquet",
+                              filters={"hospitalization_id": cohort})
+            second = load_data("labs", str(labs_dir), "parquet",
+                               filters={"hospitalization_id": cohort,
+                                        "lab_category": ["sodium"]})
+            assert sorted(first["hospitalization_id"].unique()) == ["1", "3"]
+            assert len(second) == 2
+            assert len(cohort._views) == 1
+            view = next(iter(cohort._views.values()))[1]
+            assert duckdb.sql(f"SELECT COUNT(*) FROM {view}").fetchone()[0] == 2
+        finally:
+            cohort.release()
+        assert cohort._views == {}
+
+    def test_cohort_not_in_and_polars(self, labs_dir):
+        from clifpy.utils.io import Cohort
+        from clifpy.utils.io_polars import load_data_polars
+        cohort = Cohort(pd.DataFrame({"hospitalization_id": ["2", "4"]}))
+        try:
+            excluded = load_data("labs", str(labs_dir), "parquet",
+                                 filters={"hospitalization_id": {"not_in": cohort}})
+            assert sorted(excluded["hospitalization_id"].unique()) == ["1", "3"]
+        finally:
+            cohort.release()
+        result = load_data_polars("labs", labs_dir, "parquet", lazy=False,
+                                  filters={"hospitalization_id": cohort})
+        assert sorted(result["hospitalization_id"].to_list()) == ["2", "4"]
+
+    def test_long_in_list_compiles_to_semi_join(self, labs_dir):
+        from clifpy.utils._filters import _SEMI_JOIN_MIN_VALUES, _compile_filters_sql
+        ids = [str(i) for i in range(_SEMI_JOIN_MIN_VALUES)]
+        clauses = _compile_filters_sql({"hospitalization_id": ids},
+                                       register=lambda table: "ids_view")
+        assert clauses == ['hospitalization_id IN (SELECT "hospitalization_id" FROM ids_view)']
+
+        result = load_data("labs", str(labs_dir), "parquet",
+                           filters={"hospitalization_id": ids})
+        assert len(result) == 5
+
+
+class TestIpcFiletype:
+    """Arrow IPC tables written by convert_to_ipc and loaded memory-mapped."""
+
+    @pytest.fixture
+    def labs_dir(self, tmp_path):
+        df = pd.DataFrame({
+            "hospitalization_id": [1, 1, 2, 3],
+            "lab_category": ["sodium", "creatinine", "sodium", "sodium"],
+            "lab_value_numeric": [140.0, 1.2, None, 150.0],
+            "lab_result_dttm": pd.to_datetime([
+                "2023-01-01 08:00", "2023-01-02 08:00",
+                "2023-01-03 08:00", "2023-02-01 08:00",
+            ]).tz_localize("UTC"),
+        })
+        df.to_parquet(tmp_path / "clif_labs.parquet", index=False)
+        return tmp_path
+
+    def test_convert_and_load_matches_parquet(self, labs_dir):
+        from clifpy.utils.io import convert_to_ipc
+        written = convert_to_ipc(data_directory=str(labs_dir), filetype="parquet")
+        assert written == {"labs": str(labs_dir / "clif_labs.arrow")}
+
+        from_parquet = load_data("labs", str(labs_dir), "parquet", site_tz="US/Central")
+        from_ipc = load_data("labs", str(labs_dir), "arrow", site_tz="US/Central")
+        pd.testing.assert_frame_equal(from_ipc, from_parquet)
+
+    def test_filters_columns_and_lazy(self, labs_dir):
+        from clifpy.utils.io import convert_to_ipc
+        convert_to_ipc(["labs"], str(labs_dir), "parquet")
+
+        result = load_data(
+            "labs", str(labs_dir), "arrow",
+            columns=["hospitalization_id", "lab_value_numeric"],
+            filters={"lab_category": "sodium", "lab_value_numeric": {">": 145}},
+        )
+        assert list(result.columns) == ["hospitalization_id", "lab_value_numeric"]
+        assert result["hospitalization_id"].tolist() == ["3"]
+
+        rel = load_data("labs", str(labs_dir), "arrow", lazy=True)
+        try:
+            assert rel.filter("lab_category = 'sodium'").fetchdf().shape[0] == 3
+        finally:
+            rel.close()
+
+    def test_up_to_date_file_is_not_rewritten(self, labs_dir):
+        from clifpy.utils.io import convert_to_ipc
+        target = convert_to_ipc(["labs"], str(labs_dir), "parquet")["labs"]
+        mtime = os.path.getmtime(target)
+        convert_to_ipc(["labs"], str(labs_dir), "parquet")
+        assert os.path.getmtime(target) == mtime
+
+    def test_return_rel_outlives_temp_table_cleanup(self, labs_dir):
+        from clifpy.utils._duckdb_helpers import _cleanup_temp_tables
+        from clifpy.utils.io import convert_to_ipc
+        convert_to_ipc(["labs"], str(labs_dir), "parquet")
+
+        plain = load_data("labs", str(labs_dir), "arrow", return_rel=True)
+        cohort = pd.DataFrame({"hospitalization_id": ["1", "3"]})
+        filtered = load_data("labs", str(labs_dir), "arrow", return_rel=True,
+                             columns=["hospitalization_id"],
+                             filters={"hospitalization_id": cohort})
+        _cleanup_temp_tables()
+        assert len(plain.df()) == 4
+        assert sorted(filtered.df()["hospitalization_id"].astype(str)) == ["1", "1", "3"]
+
+    def test_changed_source_is_reconverted(self, labs_dir):
+        from clifpy.utils.io import convert_to_ipc
+        target = convert_to_ipc(["labs"], str(labs_dir), "parquet")["labs"]
+        source = labs_dir / "clif_labs.parquet"
+        pd.read_parquet(source).iloc[:2].to_parquet(source, index=False)
+        # An older source mtime alone must not hide the change
+        os.utime(source, (0, 0))
+        convert_to_ipc(["labs"], str(labs_dir), "parquet")
+        assert len(load_data("labs", str(labs_dir), "arrow")) == 2
+
+    def test_load_data_polars(self, labs_dir):
+        from clifpy.utils.io import convert_to_ipc
+        from clifpy.utils.io_polars import load_data_polars
+        convert_to_ipc(["labs"], str(labs_dir), "parquet")
+        result = load_data_polars(
+            "labs", str(labs_dir), "arrow",
+            filters={"lab_category": ["creatinine"]}, lazy=False,
+        )
+        assert result["hospitalization_id"].to_list() == ["1"]
@@ -0,0 +1,124 @@
+"""
+Tests for MDRO flag calculation.
+
+The set-based engine must reproduce the original per-isolate flag loop on
+randomized susceptibility data.
+"""
+from types import SimpleNamespace
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from clifpy.utils.mdro_flags import (
+    _load_mdro_config,
+    calculate_all_mdro_flags,
+    calculate_mdro_flags,
+)
+
+ORGANISM = 'pseudomonas_aeruginosa'
+
+
+def _loop_flags(merged, organism_config):
+    """The original groupby loop over (hospitalization_id, organism_id), as the reference."""
+    groups = organism_config['antimicrobial_groups']
+    resistant_categories = organism_config.get('resistant_categories', ['non_susceptible', 'intermediate'])
+    category_to_group = {c: g for g, cats in groups.items() for c in cats}
+    merged = merged[merged['antimicrobial_category'].notna()].copy()
+    merged['antimicrobial_group'] = merged['antimicrobial_category'].map(category_to_group)
+    merged = merged[merged['antimicrobial_group'].notna()]
+    merged['is_resistant'] = merged['susceptibility_category'].isin(resistant_categories)
+    all_defined_agents = {a for agents in groups.values() for a in agents}
+
+    rows = []
+    for (hosp_id, org_id), g in merged.groupby(['hospitalization_id', 'organism_id']):
+        resistant = g[g['is_resistant']]
+        n_groups = resistant['antimicrobial_group'].nunique()
+        tested = set(g['antimicrobial_category'])
+        resistant_agents = set(resistant['antimicrobial_category'])
+        flags = {'hospitalization_id': hosp_id, 'organism_id': org_id}
+        for flag_def in organism_config['resistance_definitions'].values():
+            criteria = flag_def['criteria']
+            if criteria['type'] == 'min_groups_resistant':
+                flag = n_groups >= criteria['min_groups']
+            elif criteria['type'] == 'max_groups_susceptible':
+                flag = n_groups >= len(groups) - criteria['max_groups_susceptible']
+            elif criteria['type'] == 'all_tested_resistant':
+                flag = all_defined_agents <= tested and all_defined_agents <= resistant_agents
+            else:
+                required = set(criteria['required_agents'])
+                flag = required <= tested and required <= resistant_agents
+            flags[flag_def['column_name']] = int(flag)
+        rows.append(flags)
+    return pd.DataFrame(rows)
+
+
+def _tables(n_isolates, seed, resistant_share=0.5):
+    """Random cultures with duplicate and unknown agents, plus one isolate without tests."""
+    rng = np.random.default_rng(seed)
+    agents = sorted({a for cats in _load_mdro_config()['organisms'][ORGANISM]['antimicrobial_groups'].values()
+                     for a in cats}) + ['vancomycin']
+    culture = pd.DataFrame({
+        'organism_id': [f'O{i}' for i in range(n_isolates)],
+        'hospitalization_id': [f'H{i // 3}' for i in range(n_isolates)],
+        'organism_category': np.where(rng.random(n_isolates) < 0.9, ORGANISM, 'escherichia_coli'),
+    })
+    rows = []
+    for org_id in culture['organism_id'][1:]:
+        tested = rng.choice(agents, size=rng.integers(1, len(agents) + 1), replace=False)
+        tested = np.concatenate([tested, rng.choice(tested, size=2)])
+        for agent in tested:
+            category = rng.choice(['non_susceptible', 'intermediate', 'susceptible', 'NA'],
+                                  p=[resistant_share, 0.1, 0.85 - resistant_share, 0.05])
+            rows.append((org_id, agent, category))
+    susceptibility = pd.DataFrame(rows, columns=['organism_id', 'antimicrobial_category', 'susceptibility_category'])
+    return SimpleNamespace(df=culture), SimpleNamespace(df=susceptibility)
+
+
+@pytest.mark.parametrize('seed,resistant_share', [(0, 0.5), (1, 0.8), (2, 0.2)])
+def test_flags_match_loop(seed, resistant_share):
+    culture, susceptibility = _tables(300, seed, resistant_share)
+    result = calculate_mdro_flags(culture, susceptibility, ORGANISM)
+
+    config = _load_mdro_config()['organisms'][ORGANISM]
+    merged = culture.df[culture.df['organism_category'] == ORGANISM].merge(
+        susceptibility.df, on='organism_id', how='left'
+    )
+    expected = _loop_flags(merged, config)
+    pd.testing.assert_frame_equal(result[expected.columns].reset_index(drop=True), expected)
+    assert result[['MDR', 'XDR', 'PDR', 'DTR']].to_numpy().any()
+
+
+def test_column_layout():
+    culture, susceptibility = _tables(50, 3)
+    result = calculate_mdro_flags(culture, susceptibility, ORGANISM)
+    agent_cols = [c for c in result.columns if c.endswith('_agent')]
+    group_cols = [c for c in result.columns if c.endswith('_group')]
+    assert list(result.columns) == (['hospitalization_id', 'organism_id'] + sorted(agent_cols)
+                                    + sorted(group_cols) + ['DTR', 'MDR', 'PDR', 'XDR'])
+    assert 'vancomycin_agent' not in result.columns
+    # the isolate without susceptibility data is dropped
+    assert 'O0' not in set(result['organism_id'])
+
+
+def test_all_organisms_matches_single():
+    culture, susceptibility = _tables(120, 4)
+    all_flags = calculate_all_mdro_flags(culture, susceptibility)
+    assert set(all_flags) == set(_load_mdro_config()['organisms'])
+    pd.testing.assert_frame_equal(
+        all_flags[ORGANISM], calculate_mdro_flags(culture, susceptibility, ORGANISM)
+    )
+
+
+def test_unknown_organism():
+    culture, susceptibility = _tables(10, 5)
+    with pytest.raises(ValueError, match='not found in configuration'):
+        calculate_all_mdro_flags(culture, susceptibility, organisms=['acinetobacter'])
+
+
+def test_no_matching_cultures():
+    culture, susceptibility = _tables(10, 6)
+    culture.df['organism_category'] = 'escherichia_coli'
+    result = calculate_mdro_flags(culture, susceptibility, ORGANISM)
+    assert list(result.columns) == ['hospitalization_id', 'organism_id']
+    assert result.empty
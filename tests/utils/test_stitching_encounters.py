@@ -494,6 +494,103 @@ class TestStitchingEncounters:
         for i in range(1, len(results)):
             assert results[i] == results[0], "Encounter block assignment should be deterministic"
 
+    def test_duplicate_rows_differing_outside_stitch_keys(self, sample_hospitalization_data, sample_adt_data):
+        """A repeated stay with a different non-key column is still one stay."""
+        _, _, expected = stitch_encounters(sample_hospitalization_data, sample_adt_data, time_interval=6)
+
+        duplicated = pd.concat([
+            sample_hospitalization_data,
+            sample_hospitalization_data.iloc[[0]].assign(discharge_category='expired'),
+        ], ignore_index=True)
+        _, _, mapping = stitch_encounters(duplicated, sample_adt_data, time_interval=6)
+        pd.testing.assert_frame_equal(mapping, expected)
+
+
+def _fixed_point_blocks(hosp: pd.DataFrame, time_interval: int) -> pd.DataFrame:
+    """The original shift-until-convergence propagation, as a reference."""
+    block = hosp.sort_values(by=["patient_id", "admission_dttm"]).reset_index(drop=True)
+    next_admission = block.groupby("patient_id")["admission_dttm"].shift(-1)
+    gap_hrs = (next_admission - block["discharge_dttm"]).dt.total_seconds() / 3600
+    linked = gap_hrs.le(time_interval + 1e-6).fillna(False)
+    block['encounter_block'] = block.index + 1
+    while True:
+        shifted = block['encounter_block'].shift(-1)
+        mask = linked & (block['patient_id'] == block['patient_id'].shift(-1))
+        old_values = block['encounter_block'].copy()
+        block.loc[mask, 'encounter_block'] = shifted[mask]
+        if block['encounter_block'].equals(old_values):
+            break
+    return block[['hospitalization_id', 'encounter_block']].astype({'encounter_block': 'int32'})
+
+
+class TestStitchingEngines:
+    """The vectorized engines against the original fixed-point loop."""
+
+    @pytest.fixture
+    def random_cohort(self):
+        rng = np.random.default_rng(7)
+        n = 2000
+        patient_id = np.sort(rng.integers(0, 300, n)).astype(str)
+        admission = pd.Timestamp('2023-01-01', tz='UTC') + pd.to_timedelta(rng.integers(0, 24 * 365, n), unit='h')
+        length = pd.to_timedelta(rng.integers(1, 72, n), unit='h')
+        hosp = pd.DataFrame({
+            'patient_id': patient_id,
+            'hospitalization_id': [f'H{i:05d}' for i in range(n)],
+            'admission_dttm': admission,
+            'discharge_dttm': admission + length,
+            'age_at_admission': 60,
+            'admission_type_category': 'emergency',
+            'discharge_category': 'home',
+        })
+        adt = pd.DataFrame({
+            'hospitalization_id': hosp['hospitalization_id'],
+            'in_dttm': hosp['admission_dttm'],
+            'out_dttm': hosp['discharge_dttm'],
+            'location_category': 'ward',
+            'hospital_id': 'HOSP1',
+        })
+        return hosp, adt
+
+    @pytest.mark.parametrize('engine', ['pandas', 'duckdb', 'polars'])
+    @pytest.mark.parametrize('time_interval', [0, 6, 48])
+    def test_engines_match_fixed_point(self, random_cohort, engine, time_interval):
+        hosp, adt = random_cohort
+        _, adt_stitched, mapping = stitch_encounters(hosp, adt, time_interval=time_interval, engine=engine)
+        expected = _fixed_point_blocks(hosp, time_interval)
+        pd.testing.assert_frame_equal(
+            mapping.sort_values('hospitalization_id').reset_index(drop=True),
+            expected.sort_values('hospitalization_id').reset_index(drop=True),
+        )
+        assert len(adt_stitched) == len(adt)
+
+    @pytest.mark.parametrize('engine', ['pandas', 'duckdb', 'polars'])
+    def test_long_chain(self, engine):
+        n = 500
+        admission = pd.date_range('2023-01-01', periods=n, freq='D')
+        hosp = pd.DataFrame({
+            'patient_id': 'P001',
+            'hospitalization_id': [f'H{i:04d}' for i in range(n)],
+            'admission_dttm': admission,
+            'discharge_dttm': admission + pd.Timedelta(hours=20),
+            'age_at_admission': 65,
+            'admission_type_category': 'emergency',
+            'discharge_category': 'home',
+        })
+        adt = pd.DataFrame({
+            'hospitalization_id': hosp['hospitalization_id'],
+            'in_dttm': hosp['admission_dttm'],
+            'out_dttm': hosp['discharge_dttm'],
+            'location_category': 'ward',
+            'hospital_id': 'HOSP1',
+        })
+        _, _, mapping = stitch_encounters(hosp, adt, time_interval=6, engine=engine)
+        assert mapping['encounter_block'].unique().tolist() == [n]
+
+    def test_invalid_engine(self, random_cohort):
+        hosp, adt = random_cohort
+        with pytest.raises(ValueError, match='engine'):
+            stitch_encounters(hosp, adt, engine='spark')
+
 
 class TestClifOrchestratorStitching:
     """Test ClifOrchestrator's stitch_encounters method."""
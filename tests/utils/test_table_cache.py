@@ -0,0 +1,91 @@
+"""Tests for the on-disk table cache (clifpy.utils.table_cache)."""
+import os
+import shutil
+from pathlib import Path
+
+import pandas as pd
+import pyarrow as pa
+import pytest
+
+from clifpy.tables.vitals import Vitals
+from clifpy.utils.io import Cohort
+from clifpy.utils.table_cache import TableCache
+
+_DEMO_DIR = Path(__file__).parent.parent.parent / 'clifpy' / 'data' / 'clif_demo'
+
+
+@pytest.fixture
+def data_dir(tmp_path):
+    """Private copy of the demo vitals so tests can touch the source file."""
+    target = tmp_path / 'data'
+    target.mkdir()
+    shutil.copy(_DEMO_DIR / 'clif_vitals.parquet', target / 'clif_vitals.parquet')
+    return target
+
+
+def _load(data_dir, cache, **kwargs):
+    return Vitals.from_file(
+        data_directory=str(data_dir),
+        filetype='parquet',
+        timezone='US/Central',
+        output_directory=str(data_dir.parent / 'output'),
+        cache=cache,
+        **kwargs,
+    )
+
+
+class TestTableCache:
+    def test_hit_matches_fresh_load(self, data_dir):
+        cache = TableCache(str(data_dir.parent / 'cache'))
+        first = _load(data_dir, cache)
+        assert len(cache.entries()) == 1
+
+        second = _load(data_dir, cache)
+        assert len(cache.entries()) == 1
+        pd.testing.assert_frame_equal(second.df, first.df)
+
+    def test_arrow_backend_hit_is_arrow(self, data_dir):
+        cache = TableCache(str(data_dir.parent / 'cache'))
+        _load(data_dir, cache, backend='arrow')
+        table = _load(data_dir, cache, backend='arrow')
+        assert not table.is_materialized
+        assert isinstance(table.to_arrow(), pa.Table)
+
+    def test_load_arguments_are_part_of_the_key(self, data_dir):
+        cache = TableCache(str(data_dir.parent / 'cache'))
+        _load(data_dir, cache)
+        _load(data_dir, cache, filters={'vital_category': ['heart_rate']})
+        _load(data_dir, cache, filters={'hospitalization_id': Cohort(['23559586'])})
+        assert len(cache.entries()) == 3
+
+    def test_source_change_invalidates(self, data_dir):
+        cache = TableCache(str(data_dir.parent / 'cache'))
+        source = data_dir / 'clif_vitals.parquet'
+        first = _load(data_dir, cache)
+
+        # rewrite the source with fewer rows and a new mtime
+        first.df.head(5).to_parquet(source)
+        stat = os.stat(source)
+        os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        second = _load(data_dir, cache)
+        assert len(second.df) == 5
+
+    def test_lru_eviction_respects_cap(self, data_dir):
+        cache = TableCache(str(data_dir.parent / 'cache'))
+        _load(data_dir, cache, columns=['hospitalization_id', 'recorded_dttm'])
+        one_entry = cache.size()
+
+        small = TableCache(cache.cache_dir, max_size=int(one_entry * 1.5))
+        _load(data_dir, small, columns=['hospitalization_id', 'vital_category'])
+        _load(data_dir, small, columns=['hospitalization_id', 'vital_value'])
+        assert small.size() <= small.max_bytes
+        assert len(small.entries()) < 3
+
+    def test_uncacheable_filter_bypasses_cache(self, data_dir):
+        duckdb = pytest.importorskip('duckdb')
+        cache = TableCache(str(data_dir.parent / 'cache'))
+        ids = duckdb.sql("SELECT '23559586' AS hospitalization_id")
+        table = _load(data_dir, cache, filters={'hospitalization_id': ids})
+        assert table.df is not None
+        assert cache.entries() == []
@@ -20,6 +20,7 @@ from clifpy.utils.validator import (
     _load_schema,
     _load_validation_rules,
     _get_default_conditions,
+    _normalize_for_validation,
     # Result containers
     DQAConformanceResult,
     DQACompletenessResult,
@@ -398,6 +399,23 @@ class TestCheckColumnDtypes:
         result = check_column_dtypes_duckdb(df, patient_schema, "patient")
         assert result.passed is True
 
+    def test_failed_duckdb_check_returns_its_connection(self):
+        from clifpy.utils import _duckdb_helpers as helpers
+        con = helpers._acquire_connection(timezone=None)
+        helpers._release_connection(con)
+
+        # a column spec without 'name' makes the check raise after acquiring
+        schema = {"columns": [{"data_type": "INTEGER"}]}
+        result = check_column_dtypes_duckdb(pd.DataFrame({"val": [1]}), schema, "test")
+        assert result.errors
+
+        again = helpers._acquire_connection(timezone=None)
+        try:
+            assert again is con
+            assert again.execute("SELECT COUNT(*) FROM duckdb_views() WHERE NOT internal").fetchone()[0] == 0
+        finally:
+            helpers._release_connection(again)
+
     def test_dispatcher(self, patient_schema):
         lf = pl.LazyFrame({"patient_id": ["p1"], "sex_category": ["Male"], "age": [1]})
         result = check_column_dtypes(lf, patient_schema, "patient")
@@ -1305,6 +1323,60 @@ class TestRunFullDqa:
         assert "patient_id" in result_with["relational"]
 
 
+@pytest.mark.skipif(_ACTIVE_BACKEND != 'polars', reason="fused scan is Polars-only")
+class TestFusedScan:
+    """run_full_dqa's fused scan gives the same results as the checks run alone."""
+
+    @pytest.fixture
+    def vitals(self):
+        return pl.LazyFrame({
+            "hospitalization_id": ["H1", "H1", "H1", "H2", "H2", "H2"],
+            "recorded_dttm": pd.to_datetime([
+                "2024-01-01 10:00", "2024-01-01 10:00", "2024-01-01 11:00",
+                "2024-01-02 08:00", "2024-01-02 09:00", "2024-01-02 09:00",
+            ]).tz_localize("UTC"),
+            "vital_category": ["heart_rate", "heart_rate", "Temp_C", "sbp", "bogus", None],
+            "vital_name": ["HR", "HR", "Temp", "SBP", "X", None],
+            "vital_value": [80.0, 400.0, 50.0, None, 1.0, 120.0],
+        })
+
+    @staticmethod
+    def _strip(result):
+        return {k: v for k, v in result.to_dict().items() if k != "clif_version"}
+
+    def test_fused_checks_match_standalone(self, vitals):
+        schema = _load_schema("vitals")
+        full = run_full_dqa(vitals, schema, "vitals")
+        # the family runners normalize before running their checks
+        lf = _normalize_for_validation(vitals)
+        standalone = {
+            ("conformance", "table_presence"): check_table_presence(lf, "vitals"),
+            ("conformance", "categorical_values"): check_categorical_values(lf, schema, "vitals"),
+            ("completeness", "missingness"): check_missingness(lf, schema, "vitals"),
+            ("completeness", "mcide_value_coverage"): check_mcide_value_coverage(lf, schema, "vitals"),
+            ("plausibility", "numeric_range_plausibility"): check_numeric_range_plausibility(lf, "vitals"),
+            ("plausibility", "duplicate_composite_keys"): check_duplicate_composite_keys(
+                lf, "vitals", schema=schema),
+        }
+        for (family, check), result in standalone.items():
+            fused = {k: v for k, v in full[family][check].items() if k != "clif_version"}
+            assert fused == self._strip(result), check
+
+    def test_one_fused_collect(self, vitals, monkeypatch):
+        """All fusable aggregates come from a single collect_all call."""
+        calls = []
+        collect_all = pl.collect_all
+
+        def counting_collect_all(frames, **kwargs):
+            calls.append(len(frames))
+            return collect_all(frames, **kwargs)
+
+        monkeypatch.setattr(pl, "collect_all", counting_collect_all)
+        run_full_dqa(vitals, _load_schema("vitals"), "vitals")
+        assert len(calls) == 1
+        assert calls[0] > 1
+
+
 # ---------------------------------------------------------------------------
 # 14c. Table presence check (DataFrame-level)
 # ---------------------------------------------------------------------------
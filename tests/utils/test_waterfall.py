@@ -0,0 +1,146 @@
+"""
+Equivalence tests for the respiratory-support waterfall engines.
+
+The pandas engine is the reference; the DuckDB engine must reproduce its
+output exactly (same rows, order, index, dtypes and values).
+"""
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from clifpy.utils.waterfall import (
+    WATERFALL_ENGINES,
+    process_resp_support_waterfall,
+    process_resp_support_waterfall_sharded,
+    waterfall_table_stats,
+)
+from clifpy.utils.wide_dataset import iter_wide_partitions, load_wide_dataset
+
+_DEMO_DIR = Path(__file__).parent.parent.parent / 'clifpy' / 'data' / 'clif_demo'
+
+
+@pytest.fixture(scope='module')
+def demo_resp_support():
+    """Demo respiratory_support table with UTC timestamps, as RespiratorySupport.waterfall passes it."""
+    df = pd.read_parquet(_DEMO_DIR / 'clif_respiratory_support.parquet')
+    df['recorded_dttm'] = pd.to_datetime(df['recorded_dttm'], utc=True)
+    return df
+
+
+@pytest.fixture
+def trach_collar_data():
+    """One encounter whose ventilator block is interrupted by trach-collar rows."""
+    return pd.DataFrame({
+        'hospitalization_id': ['H001'] * 6 + ['H002'] * 3,
+        'recorded_dttm': pd.to_datetime([
+            '2023-01-01 10:00', '2023-01-01 10:30', '2023-01-01 11:00',
+            '2023-01-01 11:30', '2023-01-01 12:00', '2023-01-01 12:30',
+            '2023-01-02 08:00', '2023-01-02 08:20', '2023-01-02 08:40',
+        ]).tz_localize('UTC'),
+        'device_category': ['imv', 'imv', 'trach collar', 'trach collar', None, 'imv', 'nippv', None, 'nippv'],
+        'device_name': ['vent', 'vent', None, None, None, 'vent', None, 'bipap', None],
+        'mode_category': ['simv', None, None, None, None, 'simv', None, None, None],
+        'mode_name': ['SIMV', None, None, None, None, None, None, None, None],
+        'tracheostomy': [None, None, 1, None, None, None, 0, None, None],
+        'fio2_set': [0.4, None, 0.3, None, None, 0.5, None, 0.35, None],
+        'lpm_set': [None, None, 10.0, None, None, None, None, None, None],
+        'peep_set': [5.0, None, None, None, None, 8.0, None, 6.0, None],
+        'tidal_volume_set': [450.0, None, None, None, None, None, None, None, None],
+        'resp_rate_set': [14.0, None, None, None, None, 16.0, None, None, None],
+        'resp_rate_obs': [None] * 9,
+        'pressure_support_set': [None] * 9,
+        'peak_inspiratory_pressure_set': [None] * 9,
+    })
+
+
+def _run(df, engine, bfill):
+    return process_resp_support_waterfall(df.copy(), bfill=bfill, verbose=False, engine=engine)
+
+
+@pytest.mark.parametrize('bfill', [False, True])
+def test_engines_match_on_demo_data(demo_resp_support, bfill):
+    """Every engine reproduces the pandas reference on the demo data."""
+    reference = _run(demo_resp_support, 'pandas', bfill)
+    for engine in WATERFALL_ENGINES:
+        result = _run(demo_resp_support, engine, bfill)
+        pd.testing.assert_frame_equal(result, reference, check_exact=True, obj=f'{engine} waterfall')
+
+
+@pytest.mark.parametrize('bfill', [False, True])
+def test_engines_match_with_trach_collar(trach_collar_data, bfill):
+    """Trach-collar breakers and per-encounter tracheostomy fill agree across engines."""
+    reference = _run(trach_collar_data, 'pandas', bfill)
+    result = _run(trach_collar_data, 'duckdb', bfill)
+    pd.testing.assert_frame_equal(result, reference, check_exact=True)
+
+
+def test_trach_collar_block_keeps_values(trach_collar_data):
+    """Numeric settings survive inside blocks split by trach collar rows."""
+    out = _run(trach_collar_data, 'pandas', False)
+    h1 = out[(out['hospitalization_id'] == 'H001') & ~out['is_scaffold']].set_index('recorded_dttm')
+    # each trach-collar row starts a new fill segment and keeps its own settings
+    assert h1.loc[pd.Timestamp('2023-01-01 11:00', tz='UTC'), 'lpm_set'] == 10.0
+    assert h1.loc[pd.Timestamp('2023-01-01 11:00', tz='UTC'), 'fio2_set'] == 0.3
+    assert h1.loc[pd.Timestamp('2023-01-01 11:30', tz='UTC'), 'tracheostomy'] == 1
+    assert np.isclose(h1.loc[pd.Timestamp('2023-01-01 10:30', tz='UTC'), 'peep_set'], 5.0)
+
+
+def test_invalid_engine(trach_collar_data):
+    """Unknown engine names are rejected up front."""
+    with pytest.raises(ValueError, match="engine must be one of"):
+        process_resp_support_waterfall(trach_collar_data, verbose=False, engine='spark')
+
+
+class TestShardedWaterfall:
+    """Sharded runs write the same rows as one whole-table run."""
+
+    @staticmethod
+    def _ordered(df):
+        return df.sort_values(['hospitalization_id', 'recorded_dttm']).reset_index(drop=True)
+
+    @pytest.mark.parametrize('engine', WATERFALL_ENGINES)
+    def test_sharded_matches_whole_table(self, demo_resp_support, tmp_path, engine):
+        reference = _run(demo_resp_support, 'pandas', False)
+        manifest = process_resp_support_waterfall_sharded(
+            demo_resp_support, tmp_path / 'wf', n_shards=4, engine=engine, verbose=False
+        )
+        result = load_wide_dataset(manifest)
+        pd.testing.assert_frame_equal(
+            self._ordered(result), self._ordered(reference[result.columns]), check_dtype=False
+        )
+
+    def test_parquet_source_matches_dataframe(self, demo_resp_support, tmp_path):
+        source = tmp_path / 'resp_support.parquet'
+        demo_resp_support.to_parquet(source, index=False)
+        from_frame = load_wide_dataset(process_resp_support_waterfall_sharded(
+            demo_resp_support, tmp_path / 'a', n_shards=3, verbose=False))
+        from_file = load_wide_dataset(process_resp_support_waterfall_sharded(
+            source, tmp_path / 'b', n_shards=3, verbose=False))
+        pd.testing.assert_frame_equal(self._ordered(from_file), self._ordered(from_frame), check_dtype=False)
+
+    def test_shards_hold_disjoint_encounters(self, demo_resp_support, tmp_path):
+        manifest = process_resp_support_waterfall_sharded(
+            demo_resp_support, tmp_path / 'wf', n_shards=4, verbose=False
+        )
+        seen = set()
+        for part in iter_wide_partitions(manifest, columns=['hospitalization_id']):
+            ids = set(part['hospitalization_id'])
+            assert not ids & seen
+            seen |= ids
+        assert seen == set(demo_resp_support['hospitalization_id'])
+
+    def test_table_stats_are_table_wide(self, trach_collar_data):
+        """A subset run with the full table's stats labels devices as the full run does."""
+        stats = waterfall_table_stats(trach_collar_data)
+        assert stats['imv_device_name'] == 'vent'
+        subset = trach_collar_data[trach_collar_data['hospitalization_id'] == 'H002']
+        assert waterfall_table_stats(subset)['imv_device_name'] == 'ventilator'
+        full = _run(trach_collar_data, 'pandas', False)
+        part = process_resp_support_waterfall(subset.copy(), verbose=False, table_stats=stats)
+        pd.testing.assert_frame_equal(
+            part.reset_index(drop=True),
+            full[full['hospitalization_id'] == 'H002'].reset_index(drop=True),
+            check_dtype=False,
+        )
@@ -0,0 +1,457 @@
+"""Tests for wide dataset batching: partitioned output, incremental refresh, process-pool batches, SOFA on partitions."""
+import json
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from clifpy import ClifOrchestrator
+from clifpy.utils.sofa import MAX_ITEMS, MIN_ITEMS, compute_sofa
+from clifpy.utils.wide_dataset import (
+    WIDE_MANIFEST_FILENAME,
+    WIDE_WATERMARKS_FILENAME,
+    _WidePartitionWriter,
+    convert_wide_to_hourly,
+    iter_wide_partitions,
+    load_wide_dataset,
+    read_wide_manifest,
+    refresh_wide_dataset,
+)
+
+_DEMO_DIR = str(Path(__file__).parents[2] / 'clifpy' / 'data' / 'clif_demo')
+
+_CATEGORY_FILTERS = {
+    'vitals': ['heart_rate', 'sbp', 'spo2'],
+    'labs': ['sodium', 'creatinine'],
+}
+
+
+@pytest.fixture(scope='module')
+def orchestrator(tmp_path_factory):
+    co = ClifOrchestrator(
+        data_directory=_DEMO_DIR,
+        filetype='parquet',
+        timezone='US/Central',
+        output_directory=str(tmp_path_factory.mktemp('output')),
+    )
+    co.initialize(tables=['patient', 'hospitalization', 'adt', 'vitals', 'labs'])
+    return co
+
+
+@pytest.fixture(scope='module')
+def hosp_ids(orchestrator):
+    return sorted(orchestrator.hospitalization.df['hospitalization_id'].unique())[:6]
+
+
+def _sorted(df, keys):
+    return df.sort_values(keys).reset_index(drop=True)
+
+
+class TestPartitionedWideDataset:
+    def test_partitions_match_in_memory(self, orchestrator, hosp_ids):
+        orchestrator.create_wide_dataset(
+            category_filters=_CATEGORY_FILTERS, hospitalization_ids=hosp_ids,
+            batch_size=2, show_progress=False,
+        )
+        in_memory = orchestrator.wide_df
+
+        orchestrator.create_wide_dataset(
+            category_filters=_CATEGORY_FILTERS, hospitalization_ids=hosp_ids,
+            batch_size=2, show_progress=False,
+            output_format='parquet_dataset', output_filename='wide_parts',
+        )
+        assert orchestrator.wide_df is None
+        manifest = read_wide_manifest(orchestrator.wide_dataset_path)
+        assert len(manifest['partitions']) == 3
+        assert manifest['total_rows'] == len(in_memory)
+
+        # every partition holds its own hospitalizations
+        seen = set()
+        for part in iter_wide_partitions(manifest['directory']):
+            ids = set(part['hospitalization_id'])
+            assert not ids & seen
+            seen |= ids
+
+        streamed = load_wide_dataset(manifest['directory'], columns=list(in_memory.columns))
+        keys = ['hospitalization_id', 'event_time']
+        pd.testing.assert_frame_equal(
+            _sorted(streamed, keys), _sorted(in_memory, keys), check_dtype=False
+        )
+
+    def test_rerun_replaces_previous_partitions(self, orchestrator, hosp_ids):
+        for batch_size in (1, 3):
+            orchestrator.create_wide_dataset(
+                category_filters=_CATEGORY_FILTERS, hospitalization_ids=hosp_ids,
+                batch_size=batch_size, show_progress=False,
+                output_format='parquet_dataset', output_filename='wide_rerun',
+            )
+        directory = Path(orchestrator.wide_dataset_path).parent
+        assert len(list(directory.glob('part-*.parquet'))) == 2
+
+    def test_hourly_reads_partitions(self, orchestrator, hosp_ids):
+        orchestrator.create_wide_dataset(
+            category_filters=_CATEGORY_FILTERS, hospitalization_ids=hosp_ids,
+            batch_size=2, show_progress=False,
+            output_format='parquet_dataset', output_filename='wide_hourly',
+        )
+        config = {'mean': ['heart_rate', 'sbp'], 'max': ['sodium'], 'min': ['spo2']}
+        streamed = convert_wide_to_hourly(orchestrator.wide_dataset_path, config)
+        in_memory = convert_wide_to_hourly(load_wide_dataset(orchestrator.wide_dataset_path), config)
+
+        keys = ['hospitalization_id', 'window_number']
+        pd.testing.assert_frame_equal(
+            _sorted(streamed, keys), _sorted(in_memory[streamed.columns], keys), check_dtype=False
+        )
+
+
+
+class TestIncrementalRefresh:
+    def _build(self, orchestrator, hosp_ids, name):
+        orchestrator.create_wide_dataset(
+            category_filters=_CATEGORY_FILTERS, hospitalization_ids=hosp_ids,
+            batch_size=2, show_progress=False,
+            output_format='parquet_dataset', output_filename=name,
+        )
+        return orchestrator.wide_dataset_path
+
+    def test_watermarks_recorded(self, orchestrator, hosp_ids):
+        manifest = read_wide_manifest(self._build(orchestrator, hosp_ids, 'wide_watermarks'))
+        assert manifest['build']['category_filters'] == _CATEGORY_FILTERS
+        assert manifest['build']['scope'] == 'subset'
+        assert set(manifest['watermarks']['tables']) == {'adt', 'vitals', 'labs'}
+
+        watermarks = pd.read_parquet(Path(manifest['directory']) / WIDE_WATERMARKS_FILENAME)
+        assert sorted(watermarks['hospitalization_id']) == hosp_ids
+        vitals = orchestrator.vitals.df
+        latest = vitals[vitals['hospitalization_id'] == hosp_ids[0]]['recorded_dttm'].max()
+        assert watermarks.set_index('hospitalization_id').loc[hosp_ids[0], 'vitals'] == latest
+
+    def test_unchanged_data_is_not_rebuilt(self, orchestrator, hosp_ids):
+        path = self._build(orchestrator, hosp_ids, 'wide_unchanged')
+        before = read_wide_manifest(path)['partitions']
+        assert refresh_wide_dataset(orchestrator, path, show_progress=False) == []
+        assert read_wide_manifest(path)['partitions'] == before
+
+    def test_new_rows_rebuild_only_their_hospitalization(self, orchestrator, hosp_ids):
+        path = self._build(orchestrator, hosp_ids, 'wide_refresh')
+        vitals = orchestrator.vitals.df
+        new_row = vitals[vitals['hospitalization_id'] == hosp_ids[0]].sort_values('recorded_dttm').iloc[[-1]].copy()
+        new_row['recorded_dttm'] += pd.Timedelta(hours=1)
+        new_row['vital_category'] = 'heart_rate'
+        new_row['vital_value'] = 250.0
+        orchestrator.vitals.df = pd.concat([vitals, new_row], ignore_index=True)
+        try:
+            refreshed = orchestrator.refresh_wide_dataset(show_progress=False)
+            assert refresh_wide_dataset(orchestrator, path, show_progress=False) == []
+            orchestrator.create_wide_dataset(
+                category_filters=_CATEGORY_FILTERS, hospitalization_ids=hosp_ids,
+                batch_size=2, show_progress=False,
+            )
+            expected = orchestrator.wide_df
+        finally:
+            orchestrator.vitals.df = vitals
+        assert refreshed == [hosp_ids[0]]
+
+        # batch 0 is rewritten without hosp_ids[0], which gets a partition of its own
+        manifest = read_wide_manifest(path)
+        directory = Path(manifest['directory'])
+        assert [p['batch'] for p in manifest['partitions']] == [1, 2, 3, 4]
+        assert not (directory / 'part-00000.parquet').exists()
+        assert not (directory / '_refresh').exists()
+        assert manifest['total_rows'] == len(expected)
+
+        keys = ['hospitalization_id', 'event_time']
+        streamed = load_wide_dataset(path, columns=list(expected.columns))
+        pd.testing.assert_frame_equal(
+            _sorted(streamed, keys), _sorted(expected, keys), check_dtype=False
+        )
+        changed = load_wide_dataset(path, ids=refreshed)
+        assert set(changed['hospitalization_id']) == {hosp_ids[0]}
+        assert 250.0 in changed['heart_rate'].values
+
+    def test_dataset_without_watermarks(self, tmp_path, orchestrator):
+        writer = _WidePartitionWriter(str(tmp_path / 'wide'))
+        writer.write(pd.DataFrame({'hospitalization_id': ['h1'], 'event_time': [pd.Timestamp('2024-01-01')]}), 0)
+        with pytest.raises(ValueError, match='no watermarks'):
+            refresh_wide_dataset(orchestrator, writer.close())
+
+
+class TestParallelBatches:
+    def test_process_pool_matches_sequential(self, orchestrator, hosp_ids):
+        kwargs = dict(category_filters=_CATEGORY_FILTERS, hospitalization_ids=hosp_ids,
+                      batch_size=2, show_progress=False)
+        orchestrator.create_wide_dataset(**kwargs)
+        sequential = orchestrator.wide_df
+        orchestrator.create_wide_dataset(**kwargs, max_workers=2, memory_limit='1GB')
+        # batches are combined in batch order, not completion order
+        pd.testing.assert_frame_equal(orchestrator.wide_df, sequential)
+
+    def test_process_pool_partitions(self, orchestrator, hosp_ids):
+        orchestrator.create_wide_dataset(
+            category_filters=_CATEGORY_FILTERS, hospitalization_ids=hosp_ids,
+            batch_size=2, show_progress=False, max_workers=3,
+            output_format='parquet_dataset', output_filename='wide_parallel',
+        )
+        manifest = read_wide_manifest(orchestrator.wide_dataset_path)
+        assert [p['batch'] for p in manifest['partitions']] == [0, 1, 2]
+
+    def test_hourly_process_pool_matches_sequential(self, orchestrator, hosp_ids):
+        orchestrator.create_wide_dataset(
+            category_filters=_CATEGORY_FILTERS, hospitalization_ids=hosp_ids, show_progress=False,
+        )
+        config = {'mean': ['heart_rate'], 'max': ['sodium']}
+        sequential = convert_wide_to_hourly(orchestrator.wide_df, config, batch_size=2)
+        parallel = convert_wide_to_hourly(orchestrator.wide_df, config, batch_size=2, max_workers=2)
+        pd.testing.assert_frame_equal(parallel, sequential)
+
+
+class TestFusedPivot:
+    def test_values_come_from_their_category(self, orchestrator, hosp_ids):
+        orchestrator.create_wide_dataset(
+            category_filters=_CATEGORY_FILTERS, hospitalization_ids=hosp_ids, show_progress=False,
+        )
+        wide = orchestrator.wide_df
+        labs = orchestrator.labs.df
+        for category in _CATEGORY_FILTERS['labs']:
+            raw = labs[labs['hospitalization_id'].isin(hosp_ids) & (labs['lab_category'] == category)]
+            expected = set(zip(raw['hospitalization_id'], raw['lab_result_dttm'].dt.floor('min'),
+                               raw['lab_value_numeric']))
+            rows = wide[wide[category].notna()]
+            found = set(zip(rows['hospitalization_id'], rows['event_time'].dt.floor('min'), rows[category]))
+            assert found and found <= expected
+
+    def test_unfiltered_table_pivots_every_category(self, orchestrator, hosp_ids):
+        orchestrator.create_wide_dataset(
+            category_filters={'labs': []}, hospitalization_ids=hosp_ids, show_progress=False,
+        )
+        labs = orchestrator.labs.df
+        present = labs.loc[labs['hospitalization_id'].isin(hosp_ids), 'lab_category'].dropna().unique()
+        assert set(present) <= set(orchestrator.wide_df.columns)
+
+    def test_column_order_matches_per_table_pivots(self, orchestrator, hosp_ids):
+        filters = {'vitals': ['spo2', 'heart_rate', 'no_such_vital', 'sbp'], 'labs': ['sodium', 'creatinine']}
+        orchestrator.create_wide_dataset(
+            category_filters=filters, hospitalization_ids=hosp_ids, show_progress=False,
+        )
+        columns = list(orchestrator.wide_df.columns)
+        # last staged table first, categories sorted as PIVOT sorts them, then ADT;
+        # requested categories without rows come last
+        pivoted = columns[columns.index('event_time') + 1:columns.index('hospital_id')]
+        assert pivoted == ['creatinine', 'sodium', 'heart_rate', 'sbp', 'spo2']
+        assert columns[-3:] == ['day_number', 'hosp_id_day_key', 'no_such_vital']
+
+
+class TestTimeResolution:
+    def test_minute_resolution_joins_within_the_minute(self, orchestrator, hosp_ids):
+        orchestrator.create_wide_dataset(
+            category_filters=_CATEGORY_FILTERS, hospitalization_ids=hosp_ids, show_progress=False,
+        )
+        wide = orchestrator.wide_df
+        assert '_event_key' not in wide.columns and 'combo_id' not in wide.columns
+
+        # every vitals value lands on an event in the same hospitalization and minute
+        vitals = orchestrator.vitals.df
+        vitals = vitals[vitals['hospitalization_id'].isin(hosp_ids)
+                        & (vitals['vital_category'] == 'heart_rate')]
+        minutes = set(zip(vitals['hospitalization_id'], vitals['recorded_dttm'].dt.floor('min')))
+        rows = wide[wide['heart_rate'].notna()]
+        assert set(zip(rows['hospitalization_id'], rows['event_time'].dt.floor('min'))) <= minutes
+
+    def test_second_resolution_keeps_sub_minute_events_apart(self, orchestrator):
+        wide = {}
+        vitals_df = orchestrator.vitals.df
+        hosp_id = vitals_df['hospitalization_id'].iloc[0]
+        base = vitals_df.loc[vitals_df['hospitalization_id'] == hosp_id, 'recorded_dttm'].min().floor('min')
+        extra = pd.DataFrame({
+            'hospitalization_id': [hosp_id, hosp_id],
+            'recorded_dttm': [base + pd.Timedelta(seconds=10), base + pd.Timedelta(seconds=40)],
+            'vital_category': ['temp_c', 'temp_c'],
+            'vital_value': [36.0, 39.0],
+        })
+        orchestrator.vitals.df = pd.concat([vitals_df, extra], ignore_index=True)
+        try:
+            for resolution in ('minute', 'second'):
+                orchestrator.create_wide_dataset(
+                    category_filters={'vitals': ['temp_c']}, hospitalization_ids=[hosp_id],
+                    show_progress=False, time_resolution=resolution,
+                )
+                wide[resolution] = orchestrator.wide_df.set_index('event_time')['temp_c']
+        finally:
+            orchestrator.vitals.df = vitals_df
+
+        times = extra['recorded_dttm'].dt.tz_convert(wide['second'].index.tz)
+        assert list(wide['second'].loc[times]) == [36.0, 39.0]
+        # at minute resolution both events share one (first) value
+        assert wide['minute'].loc[times].nunique() == 1
+
+    def test_invalid_resolution(self, orchestrator, hosp_ids):
+        with pytest.raises(ValueError, match='time_resolution'):
+            orchestrator.create_wide_dataset(
+                category_filters=_CATEGORY_FILTERS, hospitalization_ids=hosp_ids,
+                show_progress=False, time_resolution='hour',
+            )
+
+
+@pytest.fixture
+def wide():
+    """Two hospitalizations with hand-checkable events for the hourly tests."""
+    return pd.DataFrame({
+        'hospitalization_id': ['a'] * 4 + ['b'] * 2,
+        'patient_id': ['p1'] * 4 + ['p2'] * 2,
+        'day_number': [1] * 6,
+        'event_time': pd.to_datetime([
+            '2024-01-01 00:10', '2024-01-01 00:40', '2024-01-01 03:15', '2024-01-01 03:20',
+            '2024-01-02 12:00', '2024-01-02 12:30',
+        ]),
+        'heart_rate': [80.0, 100.0, np.nan, 90.0, 70.0, 75.0],
+        'device_category': ['IMV', None, 'IMV', 'Room Air', None, None],
+    })
+
+
+class TestFusedHourly:
+    def test_every_method_in_one_query(self, wide):
+        config = {
+            'max': ['heart_rate'], 'min': ['heart_rate'], 'mean': ['heart_rate'],
+            'first': ['heart_rate'], 'last': ['heart_rate'], 'boolean': ['device_category'],
+            'one_hot_encode': ['device_category'],
+        }
+        hourly = convert_wide_to_hourly(wide, config)
+        assert list(hourly.columns[:6]) == [
+            'hospitalization_id', 'window_number', 'window_start_dttm', 'window_end_dttm',
+            'patient_id', 'day_number',
+        ]
+        assert list(hourly['window_number']) == [0, 3, 0]
+
+        a0 = hourly.iloc[0]
+        assert (a0['heart_rate_max'], a0['heart_rate_min'], a0['heart_rate_mean']) == (100.0, 80.0, 90.0)
+        assert (a0['heart_rate_first'], a0['heart_rate_last']) == (80.0, 100.0)
+        assert a0['device_category_boolean'] == 1
+        assert (a0['device_category_IMV'], a0['device_category_Room_Air']) == (1, 0)
+        assert hourly.iloc[2]['device_category_boolean'] == 0
+        assert a0['window_start_dttm'] == pd.Timestamp('2024-01-01 00:10')
+        # the caller's config is not extended with the default 'first' columns
+        assert config['first'] == ['heart_rate']
+
+    def test_fill_gaps(self, wide):
+        hourly = convert_wide_to_hourly(wide, {'max': ['heart_rate']}, fill_gaps=True)
+        a = hourly[hourly['hospitalization_id'] == 'a']
+        assert list(a['window_number']) == [0, 1, 2, 3]
+        assert a['heart_rate_max'].isna().tolist() == [False, True, True, False]
+        assert a.iloc[2]['window_start_dttm'] == pd.Timestamp('2024-01-01 02:10')
+
+    def test_arrow_backend(self, wide):
+        pa = pytest.importorskip('pyarrow')
+        config = {'mean': ['heart_rate'], 'one_hot_encode': ['device_category']}
+        table = convert_wide_to_hourly(wide, config, backend='arrow')
+        assert isinstance(table, pa.Table)
+        pd.testing.assert_frame_equal(
+            table.to_pandas(), convert_wide_to_hourly(wide, config), check_dtype=False
+        )
+        batched = convert_wide_to_hourly(wide, config, batch_size=1, backend='arrow')
+        assert batched.num_rows == table.num_rows
+
+    def test_unknown_backend(self, wide):
+        with pytest.raises(ValueError, match='backend'):
+            convert_wide_to_hourly(wide, {'max': ['heart_rate']}, backend='relation')
+
+
+class TestWindowModes:
+    def test_calendar_alignment(self, wide):
+        hourly = convert_wide_to_hourly(wide, {'max': ['heart_rate']}, window_alignment='calendar')
+        a = hourly[hourly['hospitalization_id'] == 'a']
+        assert list(a['window_number']) == [0, 3]
+        assert list(a['window_start_dttm']) == [pd.Timestamp('2024-01-01 00:00'), pd.Timestamp('2024-01-01 03:00')]
+
+        daily = convert_wide_to_hourly(wide, {'max': ['heart_rate']}, hourly_window=24,
+                                       window_alignment='calendar')
+        assert list(daily['window_start_dttm']) == [pd.Timestamp('2024-01-01'), pd.Timestamp('2024-01-02')]
+
+    def test_sliding_windows(self, wide):
+        hourly = convert_wide_to_hourly(
+            wide, {'max': ['heart_rate'], 'mean': ['heart_rate']}, hourly_window=2, window_step=1
+        )
+        a = hourly[hourly['hospitalization_id'] == 'a']
+        # window 2 ([01:10, 03:10)) has no events
+        assert list(a['window_number']) == [0, 1, 3]
+        assert list(a['heart_rate_max']) == [100.0, 100.0, 90.0]
+        assert list(a['heart_rate_mean']) == [90.0, 90.0, 90.0]
+        assert a.iloc[0]['window_start_dttm'] == pd.Timestamp('2023-12-31 23:10')
+        assert (a['window_end_dttm'] - a['window_start_dttm'] == pd.Timedelta(hours=2)).all()
+
+        dense = convert_wide_to_hourly(wide, {'max': ['heart_rate']}, hourly_window=2, window_step=1,
+                                       fill_gaps=True)
+        assert list(dense.loc[dense['hospitalization_id'] == 'a', 'window_number']) == [0, 1, 2, 3]
+
+    @pytest.mark.parametrize('alignment', ['event', 'calendar'])
+    def test_sliding_matches_brute_force(self, wide, alignment):
+        config = {'max': ['heart_rate'], 'min': ['heart_rate'], 'mean': ['heart_rate'],
+                  'median': ['heart_rate'], 'boolean': ['device_category'],
+                  'one_hot_encode': ['device_category']}
+        hourly = convert_wide_to_hourly(wide, config, hourly_window=24, window_step=1,
+                                        window_alignment=alignment)
+        for _, row in hourly.iterrows():
+            events = wide[(wide['hospitalization_id'] == row['hospitalization_id'])
+                          & (wide['event_time'] >= row['window_start_dttm'])
+                          & (wide['event_time'] < row['window_end_dttm'])]
+            assert len(events) > 0
+            hr = events['heart_rate'].dropna()
+            assert row['heart_rate_max'] == hr.max()
+            assert row['heart_rate_min'] == hr.min()
+            assert row['heart_rate_mean'] == pytest.approx(hr.mean())
+            assert row['heart_rate_median'] == pytest.approx(hr.median())
+            assert row['device_category_boolean'] == int(events['device_category'].notna().any())
+            assert row['device_category_IMV'] == int((events['device_category'] == 'IMV').any())
+
+    def test_invalid_window_parameters(self, wide):
+        with pytest.raises(ValueError, match='divide'):
+            convert_wide_to_hourly(wide, {'max': ['heart_rate']}, hourly_window=24, window_step=5)
+        with pytest.raises(ValueError, match='window_step'):
+            convert_wide_to_hourly(wide, {'max': ['heart_rate']}, hourly_window=2, window_step=3)
+        with pytest.raises(ValueError, match='window_alignment'):
+            convert_wide_to_hourly(wide, {'max': ['heart_rate']}, window_alignment='midnight')
+
+
+class TestSofaOnPartitions:
+    @pytest.fixture
+    def wide(self):
+        rng = np.random.default_rng(0)
+        n = 40
+        df = pd.DataFrame({
+            'hospitalization_id': np.repeat([f'h{i}' for i in range(8)], 5),
+            'event_time': pd.date_range('2024-01-01', periods=n, freq='h', tz='UTC'),
+            'device_category': rng.choice(['IMV', 'Nasal Cannula', None], n),
+        })
+        # two hospitalizations per encounter block, so blocks span partitions below
+        df['encounter_block'] = df['hospitalization_id'].str[1:].astype(int) % 4
+        for col in MAX_ITEMS + MIN_ITEMS:
+            if col != 'pao2_imputed':
+                df[col] = rng.uniform(0, 100, n)
+        df['fio2_set'] = rng.uniform(0.21, 1, n)
+        return df
+
+    def _write(self, df, directory, n_parts):
+        writer = _WidePartitionWriter(str(directory))
+        for i, ids in enumerate(np.array_split(df['hospitalization_id'].unique(), n_parts)):
+            part = df[df['hospitalization_id'].isin(ids)]
+            if i == 0:
+                part = part.drop(columns=['dopamine_mcg_kg_min'])
+            writer.write(part, i)
+        return writer.close()
+
+    @pytest.mark.parametrize('id_name', ['hospitalization_id', 'encounter_block'])
+    def test_matches_in_memory(self, wide, tmp_path, id_name):
+        manifest_path = self._write(wide, tmp_path / 'wide', 4)
+        assert Path(manifest_path).name == WIDE_MANIFEST_FILENAME
+        assert json.loads(Path(manifest_path).read_text())['partition_key'] == 'hospitalization_id'
+
+        expected = compute_sofa(load_wide_dataset(manifest_path), id_name=id_name)
+        result = compute_sofa(str(tmp_path / 'wide'), id_name=id_name)
+        pd.testing.assert_frame_equal(
+            _sorted(result, [id_name]), _sorted(expected[result.columns], [id_name]),
+            check_dtype=False,
+        )
+
+    def test_missing_manifest(self, tmp_path):
+        with pytest.raises(FileNotFoundError):
+            compute_sofa(str(tmp_path), id_name='hospitalization_id')